@@ -0,0 +1,167 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Contains the Baseline object."""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from RepoAuditor.Module import EvaluateResult, Module
+
+
+# ----------------------------------------------------------------------
+class Baseline:
+    """Outcomes of each requirement from a previous audit, used to report only the outcomes that have changed.
+
+    The baseline is read from the JSON Lines results written by a previous audit (see `JsonOutput`).
+    An outcome is a regression when it is more severe than the outcome in the baseline (for example,
+    a requirement that was successful and is now an error), and a fix when it is less severe.
+    Requirements that are not in the baseline are reported (as regressions) only when they are not
+    successful.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class Change:
+        """A requirement whose outcome is different from the outcome in the baseline."""
+
+        result: Module.EvaluateInfo
+        baseline_result: Optional[EvaluateResult]  # None if the requirement is not in the baseline
+
+        # ----------------------------------------------------------------------
+        @property
+        def is_regression(self) -> bool:
+            """True if the outcome is more severe than the outcome in the baseline."""
+            return _GetSeverity(self.result.result) > _GetSeverity(self.baseline_result)
+
+        # ----------------------------------------------------------------------
+        @property
+        def is_fix(self) -> bool:
+            """True if the outcome is less severe than the outcome in the baseline."""
+            return _GetSeverity(self.result.result) < _GetSeverity(self.baseline_result)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        outcomes: Optional[dict[tuple[Optional[str], str, str, str], EvaluateResult]] = None,
+    ) -> None:
+        # Outcome of each requirement, keyed by (repository, module name, query name, requirement name)
+        self._outcomes = dict(outcomes or {})
+
+        self._num_regressions = 0
+        self._num_fixes = 0
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Load(
+        cls,
+        filename: Path,
+    ) -> "Baseline":
+        """Load the baseline from a JSON Lines results file (files written by multiple shards can be concatenated)."""
+        outcomes: dict[tuple[Optional[str], str, str, str], EvaluateResult] = {}
+
+        with filename.open(encoding="UTF-8") as f:
+            for line_index, line in enumerate(f):
+                line = line.strip()  # noqa: PLW2901
+                if not line:
+                    continue
+
+                try:
+                    record = json.loads(line)
+
+                    for requirement in record["requirements"]:
+                        outcomes[
+                            (
+                                record.get("repository"),
+                                record["module"],
+                                requirement["query"],
+                                requirement["requirement"],
+                            )
+                        ] = EvaluateResult[requirement["result"]]
+
+                except (KeyError, TypeError, ValueError) as ex:
+                    msg = f"'{filename}' does not contain valid results (line {line_index + 1})."
+                    raise ValueError(msg) from ex
+
+        return cls(outcomes)
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_regressions(self) -> int:
+        """Number of regressions found by `Compare`."""
+        return self._num_regressions
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_fixes(self) -> int:
+        """Number of fixes found by `Compare`."""
+        return self._num_fixes
+
+    # ----------------------------------------------------------------------
+    def Add(
+        self,
+        results: list[Module.EvaluateInfo],
+    ) -> None:
+        """Add the outcomes of a module to the baseline (for example, so that a later audit can be compared to the current one)."""
+        for result in results:
+            self._outcomes[
+                (result.repository, result.module.name, result.query.name, result.requirement.name)
+            ] = result.result
+
+    # ----------------------------------------------------------------------
+    def Compare(
+        self,
+        results: list[Module.EvaluateInfo],
+    ) -> list["Baseline.Change"]:
+        """Return the results of a module whose outcomes are different from the outcomes in the baseline."""
+        changes: list[Baseline.Change] = []
+
+        for result in results:
+            baseline_result = self._outcomes.get(
+                (result.repository, result.module.name, result.query.name, result.requirement.name),
+            )
+
+            if result.result == baseline_result:
+                continue
+
+            change = Baseline.Change(result, baseline_result)
+
+            if baseline_result is None and not change.is_regression:
+                continue
+
+            if change.is_regression:
+                self._num_regressions += 1
+            elif change.is_fix:
+                self._num_fixes += 1
+
+            changes.append(change)
+
+        return changes
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _GetSeverity(
+    result: Optional[EvaluateResult],
+) -> int:
+    if result in (EvaluateResult.Error, EvaluateResult.Timeout):
+        return 2
+
+    if result == EvaluateResult.Warning:
+        return 1
+
+    return 0
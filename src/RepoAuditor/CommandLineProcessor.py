@@ -6,12 +6,22 @@
 # -------------------------------------------------------------------------------
 """Contains the CommandLineProcessor object."""
 
-from dataclasses import dataclass, field
-from typing import Any, Protocol
-
+import contextlib
+import itertools
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Optional, cast
+
+from dbrownell_Common.InflectEx import inflect  # type: ignore[import-untyped]
 from dbrownell_Common.Streams.DoneManager import DoneManager  # type: ignore[import-untyped]
 
-from RepoAuditor.ExecuteModules import Execute, Module, ModuleInfo
+from RepoAuditor.AuditPlan import AuditPlan
+from RepoAuditor.ExecuteModules import Execute, ExecuteIter, Module, ModuleInfo, ModuleResult
+from RepoAuditor.Impl.Shard import Shard
+from RepoAuditor.IncrementalState import IncrementalState
+from RepoAuditor.Journal import Journal
 
 
 # ----------------------------------------------------------------------
@@ -28,178 +38,67 @@ class CommandLineProcessor:
     # |  Public Types
     # |
     # ----------------------------------------------------------------------
-    class GetDynamicArgsFunc(Protocol):
-        def __call__(  # noqa: D102
-            self,
-            dynamic_arg_definitions: dict[
-                str, Any
-            ],  # actual type is dict[str, TyperEx.TypeDefinitionItemType]
-        ) -> dict[str, Any]: ...
-
-    @staticmethod
-    def _GetModuleMap(
-        modules: list[Module],
-        argument_separator: str,
-    ) -> dict[str, Module]:
-        """Convert modules into a lookup map.
-
-        Returns a dict of module names mapped to the corresponding module.
-        """
-        module_map: dict[str, Module] = {}
-
-        for module in modules:
-            if argument_separator in module.name:
-                msg = f"The module name '{module.name}' contains '{argument_separator}', which should be used as an argument separator."
-                raise ValueError(msg)
-
-            prev_added_module = module_map.get(module.name, None)
-            if prev_added_module is not None:
-                msg = f"The module '{module.name}' has already been defined."
-                raise ValueError(msg)
+    GetDynamicArgsFunc = AuditPlan.GetDynamicArgsFunc
 
-            module_map[module.name] = module
-
-        return module_map
-
-    @staticmethod
-    def _ProcessIncludes(
-        module_map: dict[str, Module],
-        includes: list[str],
-        argument_separator: str,
-    ) -> tuple[set[str], dict[str, set[str]]]:
-        """Process the modules and requirements to include.
-
-        Returns both the set of names of the included modules as well as
-        the dictionary of module names mapped to the set of included requirement names.
-        """
-        included_modules: set[str] = set()
-        included_requirements: dict[str, set[str]] = {}
-
-        for include in includes:
-            parts = include.split(argument_separator)
-
-            this_module = module_map.get(parts[0], None)
-            if this_module is None:
-                msg = f"'{parts[0]}' is not a recognized module name."
-                raise ValueError(msg)
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True, kw_only=True)
+    class Options:
+        """Options that control how the modules are evaluated and how their results are recorded.
 
-            if len(parts) == 1:
-                included_modules.add(parts[0])
-            else:
-                included_requirements.setdefault(this_module.name, set()).add(
-                    argument_separator.join(parts[1:])
-                )
+        See `ExecuteModules.Execute` for information about the options used to evaluate the modules.
 
-        return included_modules, included_requirements
+        When `shard` is provided (in the form '<index>/<count>'), only the repositories assigned to
+        that shard are evaluated.
 
-    @staticmethod
-    def _ProcessExcludes(
-        module_map: dict[str, Module],
-        excludes: list[str],
-        argument_separator: str,
-    ) -> dict[str, set[str]]:
-        """Process the modules and requirements to exclude.
+        The results of each module are recorded in the journal at `journal_filename` as soon as the
+        module completes. `resume_journal_filename` is used to continue an audit that was
+        interrupted: modules recorded in that journal are not evaluated again, and new results are
+        appended to it.
 
-        Returns both the set of names of the excluded modules as well as
-        the dictionary of module names mapped to the set of excluded requirement names.
+        The state of each repository (and the results of its audit) is recorded in
+        `incremental_filename`; repositories that have not changed since they were last audited are
+        not evaluated again unless `full` is True or their results are older than `max_staleness`
+        seconds.
         """
-        excluded_requirements: dict[str, set[str]] = {}
 
-        for exclude in excludes:
-            parts = exclude.split(argument_separator)
-
-            this_module = module_map.get(parts[0], None)
-            if this_module is None:
-                msg = f"'{parts[0]}' is not a recognized module name."
+        single_threaded: bool = False
+        timeout: Optional[float] = None
+        query_timeout: Optional[float] = None
+        max_threads: Optional[int] = None
+        max_http_concurrency: Optional[int] = None
+        max_clones: Optional[int] = None
+        duration_history_filename: Optional[Path] = None
+        num_processes: Optional[int] = None
+        result_cache_filename: Optional[Path] = None
+        shard: Optional[str] = None
+        journal_filename: Optional[Path] = None
+        resume_journal_filename: Optional[Path] = None
+        incremental_filename: Optional[Path] = None
+        full: bool = False
+        max_staleness: Optional[float] = None
+
+        # ----------------------------------------------------------------------
+        def __post_init__(self) -> None:
+            """Validate the options."""
+            if self.journal_filename is not None and self.resume_journal_filename is not None:
+                msg = "A journal can be created or resumed, but not both."
                 raise ValueError(msg)
 
-            if len(parts) == 1:
-                module_map.pop(parts[0])
-            else:
-                excluded_requirements.setdefault(this_module.name, set()).add(
-                    argument_separator.join(parts[1:])
-                )
-
-        return excluded_requirements
-
-    @staticmethod
-    def _ProcessDynamicArguments(
-        module_map: dict[str, Module],
-        argument_separator: str,
-        get_dynamic_args_func: "CommandLineProcessor.GetDynamicArgsFunc",
-    ) -> dict[str, dict[str, Any]]:
-        """Process the passed in dynamic arguments.
-
-        Returns a dictionary of module names to a corresponding dictionary
-        of argument names to values.
-        """
-        # First we create the type definitions
-        dynamic_arg_definitions: dict[str, Any] = {}
-
-        for module in module_map.values():
-            # Module-level args
-            for key, value in module.GetDynamicArgDefinitions().items():
-                dynamic_arg_definitions[f"{module.name}{argument_separator}{key}"] = value
-
-            # Requirement-level args
-            for query in module.queries:
-                for requirement in query.requirements:
-                    for key, value in requirement.GetDynamicArgDefinitions(argument_separator).items():
-                        dynamic_arg_definitions[f"{module.name}{argument_separator}{key}"] = value
-
-        # Now we process the definitions to get the dynamic arguments
-        dynamic_args: dict[str, dict[str, Any]] = {}
-
-        for key, value in get_dynamic_args_func(dynamic_arg_definitions).items():
-            import re
-
-            pattern = rf"(?P<module>[A-Za-z]+){argument_separator}(?P<has_no>no{argument_separator})?(?P<requirement_or_arg>[A-Za-z0-9]+)(?P<value>{argument_separator}[\S]+)?"
-            groups = re.match(
-                pattern,
-                key,
-            ).groupdict()
-
-            # Assert that module and requirement/arg are specified
-            assert groups["module"]
-            assert groups["requirement_or_arg"]
-
-            module_name = groups["module"]
-            requirement_or_arg = groups["requirement_or_arg"]
-            has_no = groups["has_no"]
-
-            if module_name not in module_map:
-                msg = f"'{module_name}' is not a recognized module name."
-                raise ValueError(msg)
-
-            # The following if-elif block works as follows:
-            # First we check if `requirement_or_arg` is all lower case. If it is, then it is a module arg, else it is a requirement.
-            # If the flag has a requirement, we first check for a value (e.g. GitHub-License-value), in which case, we assign the value.
-            # Else, we check if the flag has a `no` in it, in which case it is a boolean flag with `no`, else (finally) a `yes`.
-            if requirement_or_arg.islower():
-                dynamic_args.setdefault(module_name, {})[requirement_or_arg] = value
-            else:
-                if groups["value"]:
-                    value_key = groups["value"][1:]
-                elif has_no:
-                    value_key = "no"
-                else:
-                    value_key = "yes"
-
-                dynamic_args.setdefault(module_name, {}).setdefault(None, {}).setdefault(
-                    requirement_or_arg, {}
-                )[value_key] = value
-
-        return dynamic_args
-
     # ----------------------------------------------------------------------
     # |
     # |  Public Data
     # |
     # ----------------------------------------------------------------------
-    module_infos: list[ModuleInfo]
+    module_infos: Iterable[ModuleInfo]  # An iterator when repositories are discovered during evaluation
     warnings_as_error_module_names: set[str]
     ignore_warnings_module_names: set[str]
-    single_threaded: bool = field(kw_only=True)
+    options: Options = field(kw_only=True, default_factory=Options)
+
+    # The dynamic arguments and requirement arguments of each module
+    module_arguments: list[tuple[Module, dict[str, Any], dict[str, Any]]] = field(
+        kw_only=True,
+        default_factory=list,
+    )
 
     # ----------------------------------------------------------------------
     # |
@@ -215,80 +114,423 @@ class CommandLineProcessor:
         excludes: list[str],
         warnings_as_error_module_names: set[str],
         ignore_warnings_module_names: set[str],
+        options: Optional["CommandLineProcessor.Options"] = None,
         *,
         all_warnings_as_error: bool = False,
         ignore_all_warnings: bool = False,
-        single_threaded: bool = False,
         argument_separator: str = "-",
     ) -> "CommandLineProcessor":
         """Factor method to construct a CommandLineProcessor object."""
-        # Convert modules into a lookup map
-        module_map: dict[str, Module] = cls._GetModuleMap(modules, argument_separator)
+        plan = AuditPlan.Compile(
+            get_dynamic_args_func,
+            modules,
+            includes,
+            excludes,
+            warnings_as_error_module_names,
+            ignore_warnings_module_names,
+            all_warnings_as_error=all_warnings_as_error,
+            ignore_all_warnings=ignore_all_warnings,
+            argument_separator=argument_separator,
+        )
 
-        del modules
+        return cls.FromPlan(plan, modules, options)
 
-        # Process includes
-        included_modules, included_requirements = cls._ProcessIncludes(
-            module_map, includes, argument_separator
-        )
+    # ----------------------------------------------------------------------
+    @classmethod
+    def FromPlan(
+        cls,
+        plan: AuditPlan,
+        modules: list[Module],
+        options: Optional["CommandLineProcessor.Options"] = None,
+    ) -> "CommandLineProcessor":
+        """Construct a CommandLineProcessor object that evaluates a compiled plan.
 
-        del includes
+        The modules are not modified, so the same plan and modules can be used to create any number
+        of objects (for example, one for each audit when watching repositories).
+        """
+        options = options or CommandLineProcessor.Options()
 
-        for module_name, module in list(module_map.items()):
-            if module.requires_explicit_include and module_name not in included_modules:
-                module_map.pop(module_name)
-                continue
+        shard_info = None if options.shard is None else Shard.FromString(options.shard)
 
-        del included_modules
+        # Get the repositories that each module should evaluate
+        module_arguments: list[tuple[Module, dict[str, Any], dict[str, Any]]] = []
+        module_repositories: list[tuple[Module, Iterable[Module.RepositoryInfo], dict[str, Any]]] = []
 
-        # Process excludes
-        excluded_requirements: dict[str, set[str]] = cls._ProcessExcludes(
-            module_map, excludes, argument_separator
-        )
+        for module, module_plan in zip(plan.CreateModules(modules), plan.modules, strict=True):
+            # Modules may augment the dynamic arguments, so provide a copy to ensure that the plan is
+            # not modified.
+            module_args = dict(module_plan.dynamic_args)
 
-        del excludes
+            # The plan does not contain requirement arguments if none of the requirements have arguments
+            requirement_args = module_plan.requirement_args or {}
 
-        # Add / Remove the requirements for each module
-        for module_name, module in list(module_map.items()):
-            module.ProcessRequirements(
-                included_requirements.get(module_name, set()),
-                excluded_requirements.get(module_name, set()),
-            )
+            module_arguments.append((module, module_args, requirement_args))
+
+            if shard_info is None:
+                repositories = module.GetRepositories(module_args)
+            else:
+                # The module can use the filter to avoid retrieving information about repositories
+                # assigned to other shards (for example, the branches of those repositories)
+                repositories = cls._FilterRepositories(
+                    module.GetRepositories(module_args, repository_filter=shard_info.Contains),
+                    shard_info,
+                )
 
-            if module.GetNumRequirements() == 0:
-                module_map.pop(module_name)
+            module_repositories.append((module, repositories, requirement_args))
 
-        del included_requirements
-        del excluded_requirements
+        module_infos: Iterable[ModuleInfo]
 
-        if all_warnings_as_error:
-            warnings_as_error_module_names = {module.name for module in module_map.values()}
-        if ignore_all_warnings:
-            ignore_warnings_module_names = {module.name for module in module_map.values()}
+        if not all(isinstance(repositories, Sequence) for _, repositories, _ in module_repositories):
+            # Repositories are discovered lazily; evaluate each one as soon as it is discovered
+            module_infos = cls._GenerateModuleInfos(module_repositories)
+        else:
+            module_infos = cls._CreateModuleInfos(
+                cast(
+                    list[tuple[Module, Sequence[Module.RepositoryInfo], dict[str, Any]]], module_repositories
+                ),
+            )
 
-        # Process the dynamic info
-        dynamic_args: dict[str, dict[str, Any]] = cls._ProcessDynamicArguments(
-            module_map, argument_separator, get_dynamic_args_func
+        return cls(
+            module_infos,
+            set(plan.warnings_as_error_module_names),
+            set(plan.ignore_warnings_module_names),
+            options=options,
+            module_arguments=module_arguments,
         )
 
+    # ----------------------------------------------------------------------
+    def __call__(  # noqa: D102
+        self,
+        dm: DoneManager,
+    ) -> list[list[Module.EvaluateInfo]]:
+        if self._journal_filename is not None or self.options.incremental_filename is not None:
+            # Results must be recorded as each module completes
+            return [
+                module_result.results
+                for module_result in sorted(
+                    self.Iterate(dm),
+                    key=lambda module_result: module_result.index,
+                )
+            ]
+
+        return Execute(
+            dm,
+            self.module_infos,
+            self.warnings_as_error_module_names,
+            self.ignore_warnings_module_names,
+            single_threaded=self.options.single_threaded,
+            timeout=self.options.timeout,
+            query_timeout=self.options.query_timeout,
+            max_threads=self.options.max_threads,
+            max_http_concurrency=self.options.max_http_concurrency,
+            max_clones=self.options.max_clones,
+            duration_history_filename=self.options.duration_history_filename,
+            num_processes=self.options.num_processes,
+            result_cache_filename=self.options.result_cache_filename,
+        )
+
+    # ----------------------------------------------------------------------
+    def Iterate(
+        self,
+        dm: DoneManager,
+    ) -> Iterator[ModuleResult]:
+        """Yield the results of each module as soon as its evaluation completes."""
+        if self._journal_filename is not None or self.options.incremental_filename is not None:
+            return self._IterateWithRecords(dm)
+
+        return self._ExecuteIter(dm, self.module_infos)
+
+    # ----------------------------------------------------------------------
+    def CreateEventModuleInfos(
+        self,
+        event: str,
+        payload: dict[str, Any],
+    ) -> list[ModuleInfo]:
+        """Return information about the modules that must be evaluated again because of a webhook event; only the queries affected by the event are evaluated."""
         module_infos: list[ModuleInfo] = []
 
-        for module_name, module in module_map.items():
-            module_args = dynamic_args.get(module_name, {})
-            requirement_args = module_args.pop(None, None)  # type: ignore[call-overload]
+        for module, module_args, requirement_args in self.module_arguments:
+            queries = module.GetEventQueries(event)
+            if not queries:
+                continue
 
-            module_infos.append(ModuleInfo(module, module_args, requirement_args))
+            repository = module.GetEventRepository(module_args, event, payload)
+            if repository is None:
+                continue
 
-        return cls(
+            query_names = frozenset(query.name for query in queries)
+
+            if repository.query_names is not None:
+                query_names &= repository.query_names
+                if not query_names:
+                    continue
+
+            module_infos.append(
+                ModuleInfo(
+                    module,
+                    repository.dynamic_args,
+                    requirement_args,
+                    repository=repository.name,
+                    query_names=query_names,
+                ),
+            )
+
+        return module_infos
+
+    # ----------------------------------------------------------------------
+    def IterateModules(
+        self,
+        dm: DoneManager,
+        module_infos: Iterable[ModuleInfo],
+    ) -> Iterator[ModuleResult]:
+        """Yield the results of evaluating the provided modules (for example, modules affected by a webhook event) as soon as each evaluation completes.
+
+        The journal and incremental state are not used, as these modules must be evaluated.
+        """
+        return self._ExecuteIter(dm, module_infos)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    @property
+    def _journal_filename(self) -> Optional[Path]:
+        """The journal that is created or resumed (if any)."""
+        return self.options.resume_journal_filename or self.options.journal_filename
+
+    # ----------------------------------------------------------------------
+    def _ExecuteIter(
+        self,
+        dm: DoneManager,
+        module_infos: Iterable[ModuleInfo],
+    ) -> Iterator[ModuleResult]:
+        return ExecuteIter(
+            dm,
             module_infos,
-            warnings_as_error_module_names,
-            ignore_warnings_module_names,
-            single_threaded=single_threaded,
+            self.warnings_as_error_module_names,
+            self.ignore_warnings_module_names,
+            single_threaded=self.options.single_threaded,
+            timeout=self.options.timeout,
+            query_timeout=self.options.query_timeout,
+            max_threads=self.options.max_threads,
+            max_http_concurrency=self.options.max_http_concurrency,
+            max_clones=self.options.max_clones,
+            duration_history_filename=self.options.duration_history_filename,
+            num_processes=self.options.num_processes,
+            result_cache_filename=self.options.result_cache_filename,
         )
 
     # ----------------------------------------------------------------------
-    def __call__(  # noqa: D102
+    def _IterateWithRecords(
         self,
         dm: DoneManager,
-    ) -> list[list[Module.EvaluateInfo]]:
-        return Execute(dm, self.module_infos)
+    ) -> Iterator[ModuleResult]:
+        """Yield results restored from the journal and incremental state, and the results of evaluating the remaining modules."""
+        journal, incremental_state = self._LoadRecords()
+
+        # Results restored from the journal or incremental state, waiting to be yielded
+        restored_results: deque[ModuleResult] = deque()
+        num_restored = 0
+        num_unchanged = 0
+
+        # The index of each module to be evaluated within `self.module_infos`
+        module_info_indexes: list[int] = []
+
+        # ----------------------------------------------------------------------
+        def FilterModuleInfos() -> Iterator[ModuleInfo]:
+            nonlocal num_restored, num_unchanged
+
+            for index, module_info in enumerate(self.module_infos):
+                results, is_unchanged = self._GetRecordedResults(module_info, journal, incremental_state)
+
+                if results is None:
+                    module_info_indexes.append(index)
+                    yield module_info
+                    continue
+
+                restored_results.append(ModuleResult(index, module_info, results))
+
+                if is_unchanged:
+                    num_unchanged += 1
+                else:
+                    num_restored += 1
+
+        # ----------------------------------------------------------------------
+
+        module_infos: Iterable[ModuleInfo] = FilterModuleInfos()
+
+        if isinstance(self.module_infos, Sequence):
+            module_infos = list(module_infos)
+
+        with contextlib.nullcontext() if journal is None else journal.Open():
+            while restored_results:
+                yield restored_results.popleft()
+
+            if not isinstance(module_infos, Sequence) or module_infos:
+                for module_result in self._ExecuteIter(dm, module_infos):
+                    module_result = replace(  # noqa: PLW2901
+                        module_result,
+                        index=module_info_indexes[module_result.index],
+                    )
+
+                    for records in [journal, incremental_state]:
+                        if records is not None:
+                            records.Record(module_result)
+
+                    yield module_result
+
+                    while restored_results:
+                        yield restored_results.popleft()
+
+            while restored_results:
+                yield restored_results.popleft()  # pragma: no cover
+
+        if incremental_state is not None:
+            incremental_state.Save()
+
+        self._WriteRecordedResultsInfo(dm, num_restored, num_unchanged)
+
+    # ----------------------------------------------------------------------
+    def _LoadRecords(self) -> tuple[Optional[Journal], Optional[IncrementalState]]:
+        """Load the journal and incremental state (if any)."""
+        journal: Optional[Journal] = None
+        incremental_state: Optional[IncrementalState] = None
+
+        if self.options.resume_journal_filename is not None:
+            journal = Journal.Load(self.options.resume_journal_filename)
+        elif self.options.journal_filename is not None:
+            journal = Journal.Create(self.options.journal_filename)
+
+        if self.options.incremental_filename is not None:
+            incremental_state = IncrementalState.Load(self.options.incremental_filename)
+
+        return journal, incremental_state
+
+    # ----------------------------------------------------------------------
+    def _GetRecordedResults(
+        self,
+        module_info: ModuleInfo,
+        journal: Optional[Journal],
+        incremental_state: Optional[IncrementalState],
+    ) -> tuple[Optional[list[Module.EvaluateInfo]], bool]:
+        """Return the results recorded for the module (if any) and whether they were recorded for an unchanged repository."""
+        if journal is not None:
+            results = journal.GetResults(module_info)
+            if results is not None:
+                return results, False
+
+        if incremental_state is not None:
+            results = incremental_state.GetUnchangedResults(
+                module_info,
+                max_staleness=self.options.max_staleness,
+                full=self.options.full,
+            )
+            if results is not None:
+                return results, True
+
+        return None, False
+
+    # ----------------------------------------------------------------------
+    def _WriteRecordedResultsInfo(
+        self,
+        dm: DoneManager,
+        num_restored: int,
+        num_unchanged: int,
+    ) -> None:
+        """Write information about the recorded results that were used rather than evaluating modules."""
+        if num_restored:
+            dm.WriteInfo(
+                "Results for {} were restored from '{}'.\n".format(
+                    inflect.no("module", num_restored),
+                    self._journal_filename,
+                ),
+            )
+
+        if num_unchanged:
+            dm.WriteInfo(
+                "Results for {} were reused from '{}' because the repositories have not changed.\n".format(
+                    inflect.no("module", num_unchanged),
+                    self.options.incremental_filename,
+                ),
+            )
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateModuleInfos(
+        module_repositories: list[tuple[Module, Sequence[Module.RepositoryInfo], dict[str, Any]]],
+    ) -> list[ModuleInfo]:
+        """Create module information for repositories that are known up front."""
+        if all(len(repositories) <= 1 for _, repositories, _ in module_repositories):
+            return [
+                ModuleInfo(
+                    module,
+                    repository.dynamic_args,
+                    requirement_args,
+                    query_names=repository.query_names,
+                )
+                for module, repositories, requirement_args in module_repositories
+                for repository in repositories
+            ]
+
+        # Multiple repositories are being audited; group the modules by repository so that the
+        # results for each repository are displayed together.
+        repository_module_infos: dict[Optional[str], list[ModuleInfo]] = {}
+
+        for module, repositories, requirement_args in module_repositories:
+            for repository in repositories:
+                repository_module_infos.setdefault(repository.name, []).append(
+                    ModuleInfo(
+                        module,
+                        repository.dynamic_args,
+                        requirement_args,
+                        repository=repository.name,
+                        query_names=repository.query_names,
+                    ),
+                )
+
+        return list(itertools.chain.from_iterable(repository_module_infos.values()))
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _FilterRepositories(
+        repositories: Iterable[Module.RepositoryInfo],
+        shard: Shard,
+    ) -> Iterable[Module.RepositoryInfo]:
+        """Filter the repositories to those assigned to the shard, preserving lazy discovery."""
+        if isinstance(repositories, Sequence):
+            return [repository for repository in repositories if shard.Contains(repository.name)]
+
+        return (repository for repository in repositories if shard.Contains(repository.name))
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GenerateModuleInfos(
+        module_repositories: list[tuple[Module, Iterable[Module.RepositoryInfo], dict[str, Any]]],
+    ) -> Iterator[ModuleInfo]:
+        """Generate module information as repositories are discovered.
+
+        Repositories are consumed from each module in turn so that modules that discover the same
+        repositories (in the same order) produce module information for a repository together.
+        """
+        sentinel = object()
+
+        for repositories in itertools.zip_longest(
+            *(repositories for _, repositories, _ in module_repositories),
+            fillvalue=sentinel,
+        ):
+            for (module, _, requirement_args), repository in zip(
+                module_repositories, repositories, strict=True
+            ):
+                if repository is sentinel:
+                    continue
+
+                assert isinstance(repository, Module.RepositoryInfo), repository
+
+                yield ModuleInfo(
+                    module,
+                    repository.dynamic_args,
+                    requirement_args,
+                    repository=repository.name,
+                    query_names=repository.query_names,
+                )
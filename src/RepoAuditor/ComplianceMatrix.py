@@ -0,0 +1,169 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Contains the ComplianceMatrix object."""
+
+import csv
+import heapq
+from dataclasses import dataclass
+from typing import IO, Optional
+
+from RepoAuditor.Module import EvaluateResult, Module
+
+
+# ----------------------------------------------------------------------
+class ComplianceMatrix:
+    """Outcome of each requirement for each repository, accumulated as results become available.
+
+    Counters are updated as the results of each module are added, so aggregate information (such as
+    the pass rate of each requirement and the repositories with the most errors) is available at any
+    time without retaining the results themselves.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class RequirementSummary:
+        """Outcomes of a requirement across all repositories."""
+
+        module_name: str
+        requirement_name: str
+        num_results: dict[EvaluateResult, int]
+
+        # ----------------------------------------------------------------------
+        @property
+        def num_applicable(self) -> int:
+            """Number of repositories where the requirement applies."""
+            return sum(self.num_results.values()) - self.num_results[EvaluateResult.DoesNotApply]
+
+        # ----------------------------------------------------------------------
+        @property
+        def pass_rate(self) -> Optional[float]:
+            """Percentage of repositories where the requirement applies that are successful, or None if it never applies."""
+            num_applicable = self.num_applicable
+            if num_applicable == 0:
+                return None
+
+            return self.num_results[EvaluateResult.Success] / num_applicable
+
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class RepositorySummary:
+        """Outcomes of all requirements for a repository."""
+
+        repository: Optional[str]
+        num_errors: int  # Includes requirements that timed out
+        num_warnings: int
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(self) -> None:
+        # Results for each requirement, keyed by (module name, requirement name)
+        self._requirement_results: dict[tuple[str, str], dict[EvaluateResult, int]] = {}
+
+        # Outcome of each requirement for each repository
+        self._repository_outcomes: dict[Optional[str], dict[tuple[str, str], EvaluateResult]] = {}
+
+        # Number of errors and warnings for each repository
+        self._repository_counts: dict[Optional[str], list[int]] = {}
+
+    # ----------------------------------------------------------------------
+    @property
+    def repositories(self) -> list[Optional[str]]:
+        """Repositories with results, in the order in which their results were added."""
+        return list(self._repository_outcomes)
+
+    # ----------------------------------------------------------------------
+    def Add(
+        self,
+        results: list[Module.EvaluateInfo],
+    ) -> None:
+        """Add the results of a module evaluated for a repository."""
+        for result in results:
+            key = (result.module.name, result.requirement.name)
+
+            requirement_results = self._requirement_results.get(key)
+            if requirement_results is None:
+                requirement_results = dict.fromkeys(EvaluateResult, 0)
+                self._requirement_results[key] = requirement_results
+
+            requirement_results[result.result] += 1
+
+            self._repository_outcomes.setdefault(result.repository, {})[key] = result.result
+
+            repository_counts = self._repository_counts.setdefault(result.repository, [0, 0])
+
+            if result.result in (EvaluateResult.Error, EvaluateResult.Timeout):
+                repository_counts[0] += 1
+            elif result.result == EvaluateResult.Warning:
+                repository_counts[1] += 1
+
+    # ----------------------------------------------------------------------
+    def GetRequirementSummaries(self) -> list["ComplianceMatrix.RequirementSummary"]:
+        """Return summaries of each requirement, ordered from the lowest pass rate to the highest."""
+        summaries = [
+            ComplianceMatrix.RequirementSummary(module_name, requirement_name, dict(num_results))
+            for (module_name, requirement_name), num_results in self._requirement_results.items()
+        ]
+
+        # Requirements that never apply are displayed last
+        summaries.sort(
+            key=lambda summary: (
+                summary.pass_rate is None,
+                summary.pass_rate or 0.0,
+                summary.module_name,
+                summary.requirement_name,
+            ),
+        )
+
+        return summaries
+
+    # ----------------------------------------------------------------------
+    def GetWorstOffenders(
+        self,
+        max_num_repositories: int,
+    ) -> list["ComplianceMatrix.RepositorySummary"]:
+        """Return the repositories with the most errors (and then warnings), excluding those without either."""
+        return [
+            ComplianceMatrix.RepositorySummary(repository, num_errors, num_warnings)
+            for (num_errors, num_warnings), repository in heapq.nlargest(
+                max_num_repositories,
+                (
+                    ((num_errors, num_warnings), repository)
+                    for repository, (num_errors, num_warnings) in self._repository_counts.items()
+                    if num_errors or num_warnings
+                ),
+                key=lambda value: value[0],
+            )
+        ]
+
+    # ----------------------------------------------------------------------
+    def WriteCsv(
+        self,
+        file: IO[str],
+    ) -> None:
+        """Write the matrix as CSV, with a row for each repository and a column for each requirement."""
+        keys = sorted(self._requirement_results)
+
+        writer = csv.writer(file)
+
+        writer.writerow(
+            ["Repository", *(f"{module_name}/{requirement_name}" for module_name, requirement_name in keys)]
+        )
+
+        for repository, outcomes in self._repository_outcomes.items():
+            writer.writerow(
+                [
+                    repository or "",
+                    *(outcomes[key].name if key in outcomes else "" for key in keys),
+                ],
+            )
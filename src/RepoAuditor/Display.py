@@ -14,8 +14,12 @@ from dbrownell_Common.Streams.DoneManager import DoneManager  # type: ignore[imp
 from rich import print as rich_print
 from rich.console import Group
 from rich.panel import Panel
+from rich.table import Table
 
+from RepoAuditor.Baseline import Baseline
+from RepoAuditor.ComplianceMatrix import ComplianceMatrix
 from RepoAuditor.Module import EvaluateResult, Module
+from RepoAuditor.ResultStore import ResultStore
 
 
 def GetInternalPanelContent(
@@ -28,6 +32,7 @@ def GetInternalPanelContent(
     num_error: int,
     num_does_not_apply: int,
     num_requirements: int,
+    num_timeout: int = 0,
 ) -> list[Panel | str]:
     """Get the content for each result to be displayed inside the internal panel."""
     internal_content: list[Panel | str] = []
@@ -46,6 +51,9 @@ def GetInternalPanelContent(
             Skipped:        {num_does_not_apply} ({(num_does_not_apply / num_requirements):.02%})
         """,
     )
+
+    if num_timeout:
+        metrics_display += f"Timed out:      {num_timeout} ({(num_timeout / num_requirements):.02%})\n"
     internal_content.append(metrics_display)
 
     for result in results:
@@ -63,13 +71,17 @@ def GetInternalPanelContent(
             border_color = "red"
         elif result.result == EvaluateResult.DoesNotApply:
             border_color = ""
+        elif result.result == EvaluateResult.Timeout:
+            border_color = "magenta"
         else:
             raise RuntimeError(result.result)  # pragma: no cover
 
         content: list[str] = []
 
-        if result.requirement.description:
-            content.append(f"{result.requirement.description.strip()}\n")
+        description = result.description or result.requirement.description
+
+        if description:
+            content.append(f"{description.strip()}\n")
 
         if result.context:
             content.append(f"{result.result.name.upper()}: {result.context.strip()}\n")
@@ -144,48 +156,393 @@ def DisplayResults(
         RuntimeError: Exception if printing or writing to file encounters any issue.
 
     """
+    # Results are grouped by repository when multiple repositories are audited (the results for a
+    # repository may not be contiguous when repositories are evaluated as they are discovered).
+    grouped_results: dict[Optional[str], list[list[Module.EvaluateInfo]]] = {}
+
     for results in all_results:
-        assert results
-        module = results[0].module
-
-        num_success = 0
-        num_warning = 0
-        num_error = 0
-        num_does_not_apply = 0
-
-        for result in results:
-            if result.result == EvaluateResult.Success:
-                num_success += 1
-            elif result.result == EvaluateResult.Warning:
-                num_warning += 1
-            elif result.result == EvaluateResult.Error:
-                num_error += 1
-            elif result.result == EvaluateResult.DoesNotApply:
-                num_does_not_apply += 1
-            else:
-                raise RuntimeError(result.result)  # pragma: no cover
-
-        num_requirements = module.GetNumRequirements()
-        assert num_requirements
-
-        internal_content: list[Panel | str] = GetInternalPanelContent(
-            dm,
-            results,
-            display_resolution,
-            display_rationale,
-            num_success=num_success,
-            num_warning=num_warning,
-            num_error=num_error,
-            num_does_not_apply=num_does_not_apply,
-            num_requirements=num_requirements,
+        grouped_results.setdefault(results[0].repository if results else None, []).append(results)
+
+    for repository, repository_results in grouped_results.items():
+        panels = [
+            _CreateModulePanel(
+                dm,
+                results,
+                display_resolution=display_resolution,
+                display_rationale=display_rationale,
+                panel_width=panel_width if repository is None else None,
+            )
+            for results in repository_results
+        ]
+
+        if repository is None:
+            for panel in panels:
+                rich_print(panel, file=file)
+        else:
+            rich_print(
+                Panel(
+                    Group(*panels),
+                    padding=1,
+                    title=repository,
+                    title_align="left",
+                    width=panel_width,
+                ),
+                file=file,
+            )
+
+
+# ----------------------------------------------------------------------
+def DisplayModuleResults(
+    dm: DoneManager,
+    results: list[Module.EvaluateInfo],
+    *,
+    display_resolution: bool,
+    display_rationale: bool,
+    panel_width: Optional[int] = None,
+    file: Optional[IO[str]] = None,
+) -> None:
+    """Display the results of executing a single module.
+
+    This is used to display results as soon as a module completes (rather than once all modules have
+    completed, as is the case with `DisplayResults`). The results of a module evaluated for a
+    repository are displayed within a panel titled with the name of the repository.
+
+    Args:
+        dm (DoneManager): Manager of all the tasks that need to be executed.
+        results (list[Module.EvaluateInfo]): Results of executing the module.
+        display_resolution (bool): Flag indicating if the resolution steps should be displayed in the output.
+        display_rationale (bool): Flag indicating if the rationale for the error should be displayed in the output.
+        panel_width (Optional[int], optional): The width of the output panel. Defaults to None.
+        file (Optional[IO[str]], optional): File to write to, or None for stdout. Defaults to None.
+
+    """
+    if not results:
+        return
+
+    repository = results[0].repository
+
+    panel = _CreateModulePanel(
+        dm,
+        results,
+        display_resolution=display_resolution,
+        display_rationale=display_rationale,
+        panel_width=panel_width if repository is None else None,
+    )
+
+    if repository is not None:
+        panel = Panel(
+            panel,
+            padding=1,
+            title=repository,
+            title_align="left",
+            width=panel_width,
+        )
+
+    rich_print(panel, file=file)
+
+
+# ----------------------------------------------------------------------
+def DisplayComplianceMatrix(
+    matrix: ComplianceMatrix,
+    *,
+    max_num_offenders: int = 10,
+    panel_width: Optional[int] = None,
+    file: Optional[IO[str]] = None,
+) -> None:
+    """Display the pass rate of each requirement across all repositories and the repositories with the most errors.
+
+    Args:
+        matrix (ComplianceMatrix): Outcomes of each requirement for each repository.
+        max_num_offenders (int, optional): Maximum number of repositories with errors or warnings to display. Defaults to 10.
+        panel_width (Optional[int], optional): The width of the output panel. Defaults to None.
+        file (Optional[IO[str]], optional): File to write to, or None for stdout. Defaults to None.
+
+    """
+    requirements_table = Table(title_justify="left", expand=True)
+
+    requirements_table.add_column("Requirement")
+    requirements_table.add_column("Pass Rate", justify="right")
+    requirements_table.add_column("✅", justify="right")
+    requirements_table.add_column("❌", justify="right")
+    requirements_table.add_column("⚠️", justify="right")
+    requirements_table.add_column("🚫", justify="right")
+
+    for summary in matrix.GetRequirementSummaries():
+        if summary.pass_rate is None:
+            rate_display = "N/A"
+        else:
+            color = "green" if summary.pass_rate == 1.0 else "yellow" if summary.pass_rate >= 0.5 else "red"  # noqa: PLR2004
+            rate_display = f"[{color}]{summary.pass_rate:.02%}[/]"
+
+        requirements_table.add_row(
+            f"{summary.module_name} / {summary.requirement_name}",
+            rate_display,
+            str(summary.num_results[EvaluateResult.Success]),
+            str(summary.num_results[EvaluateResult.Error] + summary.num_results[EvaluateResult.Timeout]),
+            str(summary.num_results[EvaluateResult.Warning]),
+            str(summary.num_results[EvaluateResult.DoesNotApply]),
+        )
+
+    content: list[Panel | Table | str] = [requirements_table]
+
+    offenders = matrix.GetWorstOffenders(max_num_offenders)
+
+    if offenders:
+        offenders_table = Table(expand=True)
+
+        offenders_table.add_column("Repository")
+        offenders_table.add_column("❌", justify="right")
+        offenders_table.add_column("⚠️", justify="right")
+
+        for offender in offenders:
+            offenders_table.add_row(
+                offender.repository or "",
+                str(offender.num_errors),
+                str(offender.num_warnings),
+            )
+
+        content += ["", "[bold]Repositories with the most errors[/]", offenders_table]
+
+    rich_print(
+        Panel(
+            Group(*content),
+            padding=1,
+            title=f"Compliance Summary ({len(matrix.repositories)} repositories)",
+            title_align="left",
+            width=panel_width,
+        ),
+        file=file,
+    )
+
+
+# ----------------------------------------------------------------------
+def DisplayBaselineChanges(
+    changes: list[Baseline.Change],
+    *,
+    title: str = "Changes from Baseline",
+    panel_width: Optional[int] = None,
+    file: Optional[IO[str]] = None,
+) -> None:
+    """Display the requirements whose outcomes are different from the outcomes in the baseline, starting with regressions.
+
+    Args:
+        changes (list[Baseline.Change]): Changes found by comparing the results of each module to the baseline.
+        title (str, optional): The title of the output panel, followed by the number of regressions and fixes. Defaults to "Changes from Baseline".
+        panel_width (Optional[int], optional): The width of the output panel. Defaults to None.
+        file (Optional[IO[str]], optional): File to write to, or None for stdout. Defaults to None.
+
+    """
+    num_regressions = sum(change.is_regression for change in changes)
+    num_fixes = sum(change.is_fix for change in changes)
+
+    title = f"{title} ({num_regressions} regressions, {num_fixes} fixed)"
+
+    if not changes:
+        rich_print(
+            Panel(
+                "The outcomes of all requirements are unchanged.",
+                padding=1,
+                title=title,
+                title_align="left",
+                width=panel_width,
+            ),
+            file=file,
         )
+        return
+
+    table = Table(expand=True)
+
+    table.add_column("Repository")
+    table.add_column("Requirement")
+    table.add_column("Baseline")
+    table.add_column("Result")
+    table.add_column("Context")
+
+    for change in sorted(
+        changes,
+        key=lambda change: (
+            not change.is_regression,
+            not change.is_fix,
+            change.result.repository or "",
+            change.result.module.name,
+            change.result.requirement.name,
+        ),
+    ):
+        if change.is_regression:
+            style = "red"
+        elif change.is_fix:
+            style = "green"
+        else:
+            style = ""
+
+        table.add_row(
+            change.result.repository or "",
+            f"{change.result.module.name} / {change.result.requirement.name}",
+            "N/A" if change.baseline_result is None else change.baseline_result.name,
+            change.result.result.name,
+            (change.result.context or "").strip(),
+            style=style,
+        )
+
+    rich_print(
+        Panel(table, padding=1, title=title, title_align="left", width=panel_width),
+        file=file,
+    )
+
+
+# ----------------------------------------------------------------------
+def DisplayHistory(
+    summaries: list[ResultStore.RunSummary],
+    regressions: list[ResultStore.Regression],
+    *,
+    panel_width: Optional[int] = None,
+    file: Optional[IO[str]] = None,
+) -> None:
+    """Display the outcomes recorded by each run and the requirements that regressed.
 
+    Args:
+        summaries (list[ResultStore.RunSummary]): Summaries of the runs to display, in the order in which they were started.
+        regressions (list[ResultStore.Regression]): Requirements that regressed in the runs, most recent first.
+        panel_width (Optional[int], optional): The width of the output panel. Defaults to None.
+        file (Optional[IO[str]], optional): File to write to, or None for stdout. Defaults to None.
+
+    """
+    if not summaries:
         rich_print(
             Panel(
-                Group(*internal_content),
-                padding=1 if internal_content else 0,
-                title=results[0].module.name,
+                "No results have been recorded.",
+                padding=1,
+                title="History",
+                title_align="left",
                 width=panel_width,
             ),
             file=file,
         )
+        return
+
+    runs_table = Table(expand=True)
+
+    runs_table.add_column("Run", justify="right")
+    runs_table.add_column("Started")
+    runs_table.add_column("Repositories", justify="right")
+    runs_table.add_column("Pass Rate", justify="right")
+    runs_table.add_column("✅", justify="right")
+    runs_table.add_column("❌", justify="right")
+    runs_table.add_column("⚠️", justify="right")
+    runs_table.add_column("🚫", justify="right")
+
+    for summary in summaries:
+        if summary.pass_rate is None:
+            rate_display = "N/A"
+        else:
+            color = "green" if summary.pass_rate == 1.0 else "yellow" if summary.pass_rate >= 0.5 else "red"  # noqa: PLR2004
+            rate_display = f"[{color}]{summary.pass_rate:.02%}[/]"
+
+        started = summary.started.astimezone().strftime("%Y-%m-%d %H:%M:%S")
+        if summary.completed is None:
+            started += " (incomplete)"
+
+        runs_table.add_row(
+            str(summary.run_id),
+            started,
+            str(summary.num_repositories),
+            rate_display,
+            str(summary.num_results[EvaluateResult.Success]),
+            str(summary.num_results[EvaluateResult.Error] + summary.num_results[EvaluateResult.Timeout]),
+            str(summary.num_results[EvaluateResult.Warning]),
+            str(summary.num_results[EvaluateResult.DoesNotApply]),
+        )
+
+    content: list[Panel | Table | str] = [runs_table]
+
+    if regressions:
+        regressions_table = Table(expand=True)
+
+        regressions_table.add_column("Run", justify="right")
+        regressions_table.add_column("Repository")
+        regressions_table.add_column("Requirement")
+        regressions_table.add_column("Previous")
+        regressions_table.add_column("Result")
+        regressions_table.add_column("Context")
+
+        for regression in regressions:
+            regressions_table.add_row(
+                str(regression.run_id),
+                regression.repository or "",
+                f"{regression.module_name} / {regression.requirement_name}",
+                regression.previous_result.name,
+                regression.result.name,
+                (regression.context or "").strip(),
+                style="red",
+            )
+
+        content += ["", f"[bold]Regressions ({len(regressions)})[/]", regressions_table]
+
+    rich_print(
+        Panel(
+            Group(*content),
+            padding=1,
+            title=f"History ({len(summaries)} runs)",
+            title_align="left",
+            width=panel_width,
+        ),
+        file=file,
+    )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CreateModulePanel(
+    dm: DoneManager,
+    results: list[Module.EvaluateInfo],
+    *,
+    display_resolution: bool,
+    display_rationale: bool,
+    panel_width: Optional[int],
+) -> Panel:
+    assert results
+    module = results[0].module
+
+    num_success = 0
+    num_warning = 0
+    num_error = 0
+    num_does_not_apply = 0
+    num_timeout = 0
+
+    for result in results:
+        if result.result == EvaluateResult.Success:
+            num_success += 1
+        elif result.result == EvaluateResult.Warning:
+            num_warning += 1
+        elif result.result == EvaluateResult.Error:
+            num_error += 1
+        elif result.result == EvaluateResult.DoesNotApply:
+            num_does_not_apply += 1
+        elif result.result == EvaluateResult.Timeout:
+            num_timeout += 1
+        else:
+            raise RuntimeError(result.result)  # pragma: no cover
+
+    num_requirements = module.GetNumRequirements()
+    assert num_requirements
+
+    internal_content: list[Panel | str] = GetInternalPanelContent(
+        dm,
+        results,
+        display_resolution,
+        display_rationale,
+        num_success=num_success,
+        num_warning=num_warning,
+        num_error=num_error,
+        num_does_not_apply=num_does_not_apply,
+        num_requirements=num_requirements,
+        num_timeout=num_timeout,
+    )
+
+    return Panel(
+        Group(*internal_content),
+        padding=1 if internal_content else 0,
+        title=module.name,
+        width=panel_width,
+    )
@@ -7,12 +7,18 @@
 """Audits a repository against a set of requirements."""
 
 import contextlib
+import itertools
 import os
 import sys
 import textwrap
+import threading
+import time
 import traceback
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import IO, Annotated, Optional, cast
 
 import click
 import pluggy
@@ -28,8 +34,24 @@ from typer.core import TyperGroup  # type: ignore [import-untyped]
 from typer_config.decorators import use_yaml_config
 
 from RepoAuditor import APP_NAME, Plugin, __version__
+from RepoAuditor.AuditPlan import AuditPlan
+from RepoAuditor.Baseline import Baseline
 from RepoAuditor.CommandLineProcessor import CommandLineProcessor, Module
-from RepoAuditor.Display import DisplayResults
+from RepoAuditor.ComplianceMatrix import ComplianceMatrix
+from RepoAuditor.Display import (
+    DisplayBaselineChanges,
+    DisplayComplianceMatrix,
+    DisplayHistory,
+    DisplayModuleResults,
+    DisplayResults,
+)
+from RepoAuditor.ExecuteModules import ModuleInfo, ModuleResult
+from RepoAuditor.Impl.ConditionalRequestCache import ConditionalRequestCache
+from RepoAuditor.Impl.ResultCache import ResultCache
+from RepoAuditor.JsonOutput import WriteRecord
+from RepoAuditor.Requirement import ReturnCode
+from RepoAuditor.ResultStore import ResultStore
+from RepoAuditor.WebhookReceiver import WebhookReceiver
 
 # ----------------------------------------------------------------------
 ARGUMENT_SEPARATOR = "-"
@@ -199,7 +221,8 @@ def _VersionCallback(value: bool) -> None:  # noqa: FBT001
 @use_yaml_config()
 def EntryPoint(  # noqa: PLR0913  # pragma: no cover
     ctx: typer.Context,
-    version: Annotated[  # noqa: ARG001, FBT002
+    *,
+    version: Annotated[  # noqa: ARG001
         bool,
         typer.Option(
             "--version",
@@ -236,35 +259,151 @@ def EntryPoint(  # noqa: PLR0913  # pragma: no cover
             help="Name of a module whose warnings should be ignored. This value can be provided multiple times.",
         ),
     ] = None,
-    all_warnings_as_error: Annotated[  # noqa: FBT002
+    all_warnings_as_error: Annotated[
         bool,
         typer.Option("--all-warnings-as-error", help="Treat all warnings as errors."),
     ] = False,
-    ignore_all_warnings: Annotated[  # noqa: FBT002
+    ignore_all_warnings: Annotated[
         bool, typer.Option("--ignore-all-warnings", help="Ignore all warnings.")
     ] = False,
-    single_threaded: Annotated[  # noqa: FBT002
+    single_threaded: Annotated[
         bool,
         typer.Option(
             "--single-threaded",
-            help="Do not use multiple threads when evaluating requirements.",
+            help="Do not use multiple threads when evaluating requirements; this is equivalent to '--max-threads-per-level 1'.",
+        ),
+    ] = False,
+    max_threads: Annotated[
+        Optional[int],
+        typer.Option(
+            "--max-threads-per-level",
+            "--max-threads",
+            min=1,
+            help="Maximum number of threads used at each level of evaluation (the modules, the queries of each module, and the requirements of each query) and the maximum number of queries that retrieve data concurrently. Each level has its own threads, so the total number of threads may exceed this value. '--max-threads' is an alias of this option.",
+        ),
+    ] = None,
+    max_http_concurrency: Annotated[
+        Optional[int],
+        typer.Option(
+            "--max-http-concurrency",
+            min=1,
+            help="Maximum number of concurrent HTTP requests sent to a single host; the number of concurrent requests is adjusted below this value based on the latency of responses and whether requests are throttled (default: 32).",
+        ),
+    ] = None,
+    max_clones: Annotated[
+        Optional[int],
+        typer.Option(
+            "--max-clones",
+            min=1,
+            help="Maximum number of repositories cloned concurrently.",
+        ),
+    ] = None,
+    processes: Annotated[
+        Optional[int],
+        typer.Option(
+            "--processes",
+            min=1,
+            help="Number of processes used to evaluate modules; each process has its own threads and HTTP connections, and the limits above apply to each process. Use more than one process to use multiple cores when auditing many repositories.",
+        ),
+    ] = None,
+    duration_history: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--duration-history",
+            dir_okay=False,
+            resolve_path=True,
+            help="JSON file used to record the time required to evaluate each module and query; when provided, work that has historically taken the longest is started first.",
+        ),
+    ] = None,
+    result_cache: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--result-cache",
+            dir_okay=False,
+            resolve_path=True,
+            help="JSON file used to cache the results of requirements; cached results are reused when the data retrieved for a requirement (and its arguments) have not changed since a previous run.",
+        ),
+    ] = None,
+    shard: Annotated[
+        Optional[str],
+        typer.Option(
+            "--shard",
+            help="Evaluate only the repositories assigned to this shard, specified as '<index>/<count>' (for example, '2/4'); repositories are assigned to shards based on a stable hash of their owner and name, so an audit can be split across multiple jobs without coordination.",
+        ),
+    ] = None,
+    journal: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--journal",
+            dir_okay=False,
+            resolve_path=True,
+            help="Append-only file used to record the results of each module as soon as it completes; provide the file to '--resume' to continue an audit that was interrupted.",
+        ),
+    ] = None,
+    resume: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--resume",
+            dir_okay=False,
+            resolve_path=True,
+            help="Journal written by a previous audit that was interrupted; modules recorded in the journal are not evaluated again, and new results are appended to it.",
+        ),
+    ] = None,
+    incremental: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--incremental",
+            dir_okay=False,
+            resolve_path=True,
+            help="JSON file used to record the state of each repository (and the results of its audit); repositories that have not changed since they were last audited are not evaluated again, and their previous results are displayed. Changes are detected for repositories enumerated from an organization.",
+        ),
+    ] = None,
+    full: Annotated[
+        bool,
+        typer.Option(
+            "--full",
+            help="Evaluate all repositories, even those that have not changed since they were last audited; the state of each repository is still recorded in the '--incremental' file.",
         ),
     ] = False,
-    no_resolution: Annotated[  # noqa: FBT002
+    max_staleness: Annotated[
+        float,
+        typer.Option(
+            "--max-staleness",
+            min=0,
+            help="Maximum number of days that the results of an unchanged repository are reused when '--incremental' is provided; some changes (for example, to branch protection rules or rulesets) are not reflected in the state of a repository.",
+        ),
+    ] = 7.0,
+    timeout: Annotated[
+        Optional[float],
+        typer.Option(
+            "--timeout",
+            min=0,
+            help="Maximum number of seconds available to evaluate all modules; requirements that cannot be evaluated in time are reported as timed out.",
+        ),
+    ] = None,
+    query_timeout: Annotated[
+        Optional[float],
+        typer.Option(
+            "--query-timeout",
+            min=0,
+            help="Maximum number of seconds available to each query to retrieve its data (for example, via HTTP requests or repository clones).",
+        ),
+    ] = None,
+    no_resolution: Annotated[
         bool,
         typer.Option(
             "--no-resolution",
             help="Do not display resolution information for requirements that are not successful.",
         ),
     ] = False,
-    no_rationale: Annotated[  # noqa: FBT002
+    no_rationale: Annotated[
         bool,
         typer.Option(
             "--no-rationale",
             help="Do not display rationale information for requirements that are not successful.",
         ),
     ] = False,
-    verbose: Annotated[  # noqa: FBT002
+    verbose: Annotated[
         bool,
         typer.Option(
             "--verbose",
@@ -275,10 +414,116 @@ def EntryPoint(  # noqa: PLR0913  # pragma: no cover
         Optional[str],
         typer.Option(
             "--output",
-            help="File name to save the output to.",
+            help="File name to save the output to; the results of each module are written as soon as they are available.",
+        ),
+    ] = None,
+    json_output: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--json-output",
+            dir_okay=False,
+            resolve_path=True,
+            help="JSON Lines file to save the results to, with one line for each module evaluated for each repository; files written by different shards can be merged by concatenating them.",
         ),
     ] = None,
-    debug: Annotated[  # noqa: FBT002
+    matrix_output: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--matrix-output",
+            dir_okay=False,
+            resolve_path=True,
+            help="CSV file to save the outcome of each requirement for each repository to, with a row for each repository and a column for each requirement.",
+        ),
+    ] = None,
+    baseline: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--baseline",
+            exists=True,
+            dir_okay=False,
+            resolve_path=True,
+            help="JSON Lines file written by '--json-output' in a previous audit; only requirements whose outcomes have changed since that audit are displayed, and the exit code is an error only if outcomes have regressed.",
+        ),
+    ] = None,
+    results_db: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--results-db",
+            dir_okay=False,
+            resolve_path=True,
+            help="SQLite database to record the results of the audit in, along with the results of previous audits; the history of the audits is displayed with '--history'.",
+        ),
+    ] = None,
+    history: Annotated[
+        bool,
+        typer.Option(
+            "--history",
+            help="Display the outcomes of the audits recorded in '--results-db' and the requirements that regressed, rather than auditing repositories.",
+        ),
+    ] = False,
+    history_runs: Annotated[
+        int,
+        typer.Option(
+            "--history-runs",
+            min=1,
+            help="Number of the most recent audits to display with '--history'.",
+        ),
+    ] = 10,
+    history_repository: Annotated[
+        Optional[str],
+        typer.Option(
+            "--history-repository",
+            help="Glob pattern that limits '--history' to the matching repositories (for example, 'https://github.com/<organization>/*').",
+        ),
+    ] = None,
+    history_requirement: Annotated[
+        Optional[str],
+        typer.Option(
+            "--history-requirement",
+            help="Glob pattern that limits '--history' to the matching requirements.",
+        ),
+    ] = None,
+    watch: Annotated[
+        Optional[float],
+        typer.Option(
+            "--watch",
+            min=0,
+            help="Audit the repositories continuously, waiting this number of minutes between audits (press Ctrl+C to stop); after the initial audit, only requirements whose outcomes have changed since the previous audit are displayed. Modules, HTTP connections, and results are retained between audits, and GitHub requests are conditional so that data that has not changed is not retrieved again.",
+        ),
+    ] = None,
+    webhook_port: Annotated[
+        Optional[int],
+        typer.Option(
+            "--webhook-port",
+            min=0,
+            max=65535,
+            help="Receive GitHub webhook deliveries on this port after the initial audit (press Ctrl+C to stop); repositories affected by 'repository', 'branch_protection_rule', 'repository_ruleset', 'security_and_analysis', and 'push' events are audited again, evaluating only the queries affected by the events, and requirements whose outcomes have changed are displayed.",
+        ),
+    ] = None,
+    webhook_host: Annotated[
+        str,
+        typer.Option(
+            "--webhook-host",
+            help="Host name or address that the webhook server listens on.",
+        ),
+    ] = "127.0.0.1",
+    webhook_secret: Annotated[
+        Optional[str],
+        typer.Option(
+            "--webhook-secret",
+            envvar="REPOAUDITOR_WEBHOOK_SECRET",
+            help="Secret used to validate the signatures of webhook deliveries; deliveries that are not signed with this secret are rejected.",
+        ),
+    ] = None,
+    webhook_debounce: Annotated[
+        float,
+        typer.Option(
+            "--webhook-debounce",
+            min=0,
+            help="Number of seconds without webhook deliveries for a repository before it is audited again, so that a burst of events results in a single audit.",
+        ),
+    ] = 10.0,
+    debug: Annotated[
         bool,
         typer.Option(
             "--debug",
@@ -297,8 +542,57 @@ def EntryPoint(  # noqa: PLR0913  # pragma: no cover
         sys.stdout,
         flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
     ) as dm:
+        # ----------------------------------------------------------------------
+        def CreateExecutor() -> CommandLineProcessor:
+            return CommandLineProcessor.FromPlan(
+                plan,
+                _all_modules,
+                CommandLineProcessor.Options(
+                    single_threaded=single_threaded,
+                    timeout=timeout,
+                    query_timeout=query_timeout,
+                    max_threads=max_threads,
+                    max_http_concurrency=max_http_concurrency,
+                    max_clones=max_clones,
+                    duration_history_filename=duration_history,
+                    num_processes=processes,
+                    result_cache_filename=result_cache,
+                    shard=shard,
+                    journal_filename=journal,
+                    resume_journal_filename=resume,
+                    incremental_filename=incremental,
+                    full=full,
+                    max_staleness=max_staleness * 24 * 60 * 60,
+                ),
+            )
+
+        # ----------------------------------------------------------------------
+
+        history_options = (
+            _HistoryOptions(results_db, history_runs, history_repository, history_requirement)
+            if history
+            else None
+        )
+
+        webhook_options = (
+            None
+            if webhook_port is None
+            else _WebhookOptions(webhook_port, webhook_host, webhook_secret, webhook_debounce)
+        )
+
+        _ValidateOptions(
+            watch=watch,
+            webhook_options=webhook_options,
+            history_options=history_options,
+        )
+
+        if history_options is not None:
+            _DisplayHistory(dm, history_options)
+            return
+
         try:
-            executor = CommandLineProcessor.Create(
+            # The plan is compiled once and used by every audit (when watching repositories)
+            plan = AuditPlan.Compile(
                 lambda dynamic_arg_definitions: TyperEx.ProcessDynamicArgs(ctx, dynamic_arg_definitions),
                 _all_modules,
                 includes,
@@ -307,10 +601,12 @@ def EntryPoint(  # noqa: PLR0913  # pragma: no cover
                 set(ignore_warnings),
                 all_warnings_as_error=all_warnings_as_error,
                 ignore_all_warnings=ignore_all_warnings,
-                single_threaded=single_threaded,
                 argument_separator=ARGUMENT_SEPARATOR,
             )
 
+            executor = CreateExecutor()
+            baseline_info = None if baseline is None else Baseline.Load(baseline)
+
         except Exception as ex:
             if dm.is_debug:
                 raise
@@ -318,39 +614,508 @@ def EntryPoint(  # noqa: PLR0913  # pragma: no cover
             raise UsageError(str(ex)) from ex
 
         try:
-            all_results = executor(dm)
+            # Aggregate information across repositories is accumulated as results become available
+            matrix = ComplianceMatrix()
 
-            dm.WriteLine("\n\n")
+            # The outcomes of this audit are compared to subsequent audits when watching or receiving webhooks
+            audit_outcomes = None if watch is None and webhook_options is None else Baseline()
 
-            # Try to set panel width
-            try:
-                panel_width = min(
-                    os.get_terminal_size().columns,
-                    dm.capabilities.DEFAULT_COLUMNS,
+            with contextlib.ExitStack() as exit_stack:
+                if audit_outcomes is not None:
+                    _ActivateMemoryCaches(exit_stack, include_result_cache=result_cache is None)
+
+                output_file = (
+                    exit_stack.enter_context(Path(output).open(mode="w+", encoding="UTF-8"))
+                    if output
+                    else None
                 )
-            except OSError:
-                # Exception if not connected to a terminal
-                # in which case default to None
-                panel_width = None
-
-            # Since `output` can be None, we use the nullcontext manager to represent None
-            with (
-                Path(output).open(mode="w+", encoding="UTF-8") if output else contextlib.nullcontext()
-            ) as file:
-                DisplayResults(
-                    dm,
-                    all_results,
+
+                json_output_file = (
+                    exit_stack.enter_context(json_output.open(mode="w", encoding="UTF-8"))
+                    if json_output
+                    else None
+                )
+
+                result_store = exit_stack.enter_context(ResultStore.Open(results_db)) if results_db else None
+
+                output_options = _OutputOptions(
+                    output_file,
+                    json_output_file,
+                    matrix_output,
+                    result_store,
                     display_resolution=not no_resolution,
                     display_rationale=not no_rationale,
-                    panel_width=panel_width,
-                    file=file,
+                    panel_width=_GetPanelWidth(dm),
+                )
+
+                all_results: Optional[list[list[Module.EvaluateInfo]]] = None
+                baseline_changes: list[Baseline.Change] = []
+
+                if (
+                    output_file is not None
+                    or json_output_file is not None
+                    or baseline_info is not None
+                    or audit_outcomes is not None
+                    or result_store is not None
+                ):
+                    # Write the results of each module as soon as they are available so that the output
+                    # is not lost if the process is interrupted (and so that the results for thousands of
+                    # repositories don't need to be held in memory).
+                    terminal_results = _IterateResults(
+                        dm,
+                        executor,
+                        matrix,
+                        baseline_info,
+                        baseline_changes,
+                        audit_outcomes,
+                        output_options,
+                    )
+
+                    if output_file is None and baseline_info is None:
+                        terminal_results.sort(key=lambda module_result: module_result.index)
+                        all_results = [module_result.results for module_result in terminal_results]
+                else:
+                    all_results = executor(dm)
+
+                    for results in all_results:
+                        matrix.Add(results)
+
+                _DisplayAuditResults(
+                    dm,
+                    all_results,
+                    matrix,
+                    None if baseline_info is None else baseline_changes,
+                    output_options,
                 )
 
+                if baseline_info is not None:
+                    # Outcomes that were already errors in the baseline do not cause the audit to fail
+                    dm.result = ReturnCode.ERROR if baseline_info.num_regressions else ReturnCode.SUCCESS
+
+                _WriteMatrix(matrix, output_options)
+
+                if audit_outcomes is not None:
+                    _ContinueAuditing(
+                        dm,
+                        CreateExecutor,
+                        executor,
+                        audit_outcomes,
+                        output_options,
+                        watch=watch,
+                        webhook_options=webhook_options,
+                    )
+
         except Exception as ex:
             error = traceback.format_exc() if dm.is_debug else str(ex)
             dm.WriteError(error)
 
 
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _HistoryOptions:
+    """Options used to display the audits recorded in the results database ('--history')."""
+
+    results_db: Optional[Path]
+    num_runs: int
+    repository: Optional[str]
+    requirement: Optional[str]
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _WebhookOptions:
+    """Options used to receive webhook deliveries ('--webhook-port')."""
+
+    port: int
+    host: str
+    secret: Optional[str]
+    debounce: float  # Seconds
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _OutputOptions:
+    """Destinations for the results of each audit and the options used to display them."""
+
+    output_file: Optional[IO[str]]
+    json_output_file: Optional[IO[str]]
+    matrix_output: Optional[Path]
+    result_store: Optional[ResultStore]
+    display_resolution: bool
+    display_rationale: bool
+    panel_width: Optional[int]
+
+
+# ----------------------------------------------------------------------
+def _ValidateOptions(
+    *,
+    watch: Optional[float],
+    webhook_options: Optional[_WebhookOptions],
+    history_options: Optional[_HistoryOptions],
+) -> None:
+    """Raise an exception if the options are not valid."""
+    if watch is not None and webhook_options is not None:
+        msg = "'--watch' and '--webhook-port' cannot be used together."
+        raise UsageError(msg)
+
+    if history_options is not None and (
+        history_options.results_db is None or not history_options.results_db.is_file()
+    ):
+        msg = "'--history' requires an existing database provided by '--results-db'."
+        raise UsageError(msg)
+
+
+# ----------------------------------------------------------------------
+def _GetPanelWidth(
+    dm: DoneManager,
+) -> Optional[int]:
+    """Return the width of output panels."""
+    # Try to set panel width
+    try:
+        return min(
+            os.get_terminal_size().columns,
+            dm.capabilities.DEFAULT_COLUMNS,
+        )
+    except OSError:  # pragma: no cover
+        # Exception if not connected to a terminal
+        # in which case default to None
+        return None
+
+
+# ----------------------------------------------------------------------
+def _IterateResults(
+    dm: DoneManager,
+    executor: CommandLineProcessor,
+    matrix: ComplianceMatrix,
+    baseline: Optional[Baseline],
+    baseline_changes: list[Baseline.Change],
+    outcomes: Optional[Baseline],  # Outcomes of the audit, used to find changes in the next audit
+    output_options: _OutputOptions,
+) -> list[ModuleResult]:
+    """Process the results of each module as soon as they are available; returns the results that must be displayed in the terminal once all modules have completed."""
+    output_file = output_options.output_file
+    json_output_file = output_options.json_output_file
+    result_store = output_options.result_store
+
+    terminal_results: list[ModuleResult] = []
+
+    with contextlib.nullcontext() if result_store is None else result_store.Run():
+        for module_result in executor.Iterate(dm):
+            matrix.Add(module_result.results)
+
+            if outcomes is not None:
+                outcomes.Add(module_result.results)
+
+            if json_output_file is not None:
+                WriteRecord(json_output_file, module_result)
+                json_output_file.flush()
+
+            if result_store is not None:
+                result_store.Record(module_result)
+
+            if baseline is not None:
+                # Only changes are displayed, once all of the results are available
+                baseline_changes += baseline.Compare(module_result.results)
+                continue
+
+            if output_file is None:
+                terminal_results.append(module_result)
+                continue
+
+            DisplayModuleResults(
+                dm,
+                module_result.results,
+                display_resolution=output_options.display_resolution,
+                display_rationale=output_options.display_rationale,
+                panel_width=output_options.panel_width,
+                file=output_file,
+            )
+
+            output_file.flush()
+
+    return terminal_results
+
+
+# ----------------------------------------------------------------------
+def _DisplayAuditResults(
+    dm: DoneManager,
+    all_results: Optional[list[list[Module.EvaluateInfo]]],
+    matrix: ComplianceMatrix,
+    baseline_changes: Optional[list[Baseline.Change]],
+    output_options: _OutputOptions,
+) -> None:
+    """Display the information that is available once all modules have completed."""
+    output_file = output_options.output_file
+    panel_width = output_options.panel_width
+
+    if all_results is not None:
+        dm.WriteLine("\n\n")
+
+        DisplayResults(
+            dm,
+            all_results,
+            display_resolution=output_options.display_resolution,
+            display_rationale=output_options.display_rationale,
+            panel_width=panel_width,
+        )
+
+    if baseline_changes is not None:
+        if output_file is None:
+            dm.WriteLine("\n\n")
+
+        DisplayBaselineChanges(
+            baseline_changes,
+            panel_width=panel_width,
+            file=output_file,
+        )
+
+    if len(matrix.repositories) > 1:
+        DisplayComplianceMatrix(matrix, panel_width=panel_width, file=output_file)
+
+
+# ----------------------------------------------------------------------
+def _WriteMatrix(
+    matrix: ComplianceMatrix,
+    output_options: _OutputOptions,
+) -> None:
+    """Write the compliance matrix to the matrix output (if any)."""
+    if output_options.matrix_output:
+        with output_options.matrix_output.open(mode="w", encoding="UTF-8", newline="") as f:
+            matrix.WriteCsv(f)
+
+
+# ----------------------------------------------------------------------
+def _ActivateMemoryCaches(
+    exit_stack: contextlib.ExitStack,
+    *,
+    include_result_cache: bool,
+) -> None:
+    """Retain responses (and results) in memory so that they can be reused by subsequent audits."""
+    exit_stack.enter_context(ConditionalRequestCache().Activate())
+
+    if include_result_cache:
+        exit_stack.enter_context(ResultCache().Activate())
+
+
+# ----------------------------------------------------------------------
+def _ContinueAuditing(
+    dm: DoneManager,
+    create_executor_func: Callable[[], CommandLineProcessor],
+    executor: CommandLineProcessor,
+    outcomes: Baseline,
+    output_options: _OutputOptions,
+    *,
+    watch: Optional[float],  # Minutes
+    webhook_options: Optional[_WebhookOptions],
+) -> None:
+    """Audit the repositories again, periodically or as webhook deliveries are received, once the initial audit is complete."""
+    if watch is not None:
+        _Watch(dm, create_executor_func, outcomes, watch * 60, output_options)
+
+    if webhook_options is not None:
+        _ReceiveWebhooks(dm, executor, outcomes, webhook_options, output_options)
+
+
+# ----------------------------------------------------------------------
+def _Watch(
+    dm: DoneManager,
+    create_executor_func: Callable[[], CommandLineProcessor],
+    previous_outcomes: Baseline,
+    interval: float,
+    output_options: _OutputOptions,
+    *,
+    num_audits: Optional[int] = None,  # Audit until interrupted if None
+) -> None:
+    """Audit the repositories repeatedly, displaying the requirements whose outcomes have changed since the previous audit.
+
+    The repositories are discovered again for each audit so that new repositories are audited. The
+    JSON and matrix outputs are overwritten with the results of each audit.
+    """
+    json_output_file = output_options.json_output_file
+    result_store = output_options.result_store
+
+    try:
+        for _ in itertools.count() if num_audits is None else range(num_audits):
+            dm.WriteVerbose(f"Waiting {interval / 60:g} minutes before the next audit...\n")
+            time.sleep(interval)
+
+            audit_time = datetime.now()  # noqa: DTZ005
+
+            outcomes = Baseline()
+            matrix = ComplianceMatrix()
+            changes: list[Baseline.Change] = []
+
+            try:
+                if json_output_file is not None:
+                    json_output_file.seek(0)
+                    json_output_file.truncate()
+
+                with contextlib.nullcontext() if result_store is None else result_store.Run():
+                    for module_result in create_executor_func().Iterate(dm):
+                        matrix.Add(module_result.results)
+                        outcomes.Add(module_result.results)
+
+                        if json_output_file is not None:
+                            WriteRecord(json_output_file, module_result)
+                            json_output_file.flush()
+
+                        if result_store is not None:
+                            result_store.Record(module_result)
+
+                        changes += previous_outcomes.Compare(module_result.results)
+
+            except Exception as ex:
+                # An audit that fails (for example, because a server is unavailable) does not end the
+                # watch; the next audit is compared to the last audit that completed.
+                dm.WriteError(traceback.format_exc() if dm.is_debug else str(ex))
+                continue
+
+            _WriteMatrix(matrix, output_options)
+
+            _DisplayChanges(dm, changes, audit_time, output_options)
+
+            previous_outcomes = outcomes
+
+    except KeyboardInterrupt:
+        pass
+
+
+# ----------------------------------------------------------------------
+def _ReceiveWebhooks(
+    dm: DoneManager,
+    executor: CommandLineProcessor,
+    outcomes: Baseline,
+    webhook_options: _WebhookOptions,
+    output_options: _OutputOptions,
+) -> None:
+    """Receive webhook deliveries until interrupted, auditing the repositories that they affect (see `_AuditDeliveries`)."""
+    receiver = WebhookReceiver(
+        executor.CreateEventModuleInfos,
+        secret=webhook_options.secret,
+        debounce=webhook_options.debounce,
+    )
+
+    host = webhook_options.host
+    server = receiver.CreateServer(host, webhook_options.port)
+
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+
+    dm.WriteInfo(f"Receiving webhook deliveries at http://{host}:{server.server_port}/.\n")
+
+    try:
+        _AuditDeliveries(dm, executor, outcomes, receiver, output_options)
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+# ----------------------------------------------------------------------
+def _AuditDeliveries(
+    dm: DoneManager,
+    executor: CommandLineProcessor,
+    outcomes: Baseline,
+    receiver: WebhookReceiver,
+    output_options: _OutputOptions,
+    *,
+    num_audits: Optional[int] = None,  # Audit until interrupted if None
+) -> None:
+    """Audit repositories again as webhook deliveries are received, displaying the requirements whose outcomes have changed.
+
+    The results of each audit are appended to the JSON output; when the output is used as a
+    baseline, the most recent results of each requirement are used.
+    """
+    json_output_file = output_options.json_output_file
+    result_store = output_options.result_store
+
+    for _ in itertools.count() if num_audits is None else range(num_audits):
+        module_infos: list[ModuleInfo] = []
+
+        while not module_infos:
+            # A timeout is used so that the wait can be interrupted on all platforms
+            module_infos = receiver.WaitForModuleInfos(timeout=1.0)
+
+        audit_time = datetime.now()  # noqa: DTZ005
+        changes: list[Baseline.Change] = []
+
+        try:
+            with contextlib.nullcontext() if result_store is None else result_store.Run():
+                for module_result in executor.IterateModules(dm, module_infos):
+                    if json_output_file is not None:
+                        WriteRecord(json_output_file, module_result)
+                        json_output_file.flush()
+
+                    if result_store is not None:
+                        result_store.Record(module_result)
+
+                    changes += outcomes.Compare(module_result.results)
+                    outcomes.Add(module_result.results)
+
+        except Exception as ex:
+            dm.WriteError(traceback.format_exc() if dm.is_debug else str(ex))
+            continue
+
+        _DisplayChanges(dm, changes, audit_time, output_options)
+
+
+# ----------------------------------------------------------------------
+def _DisplayHistory(
+    dm: DoneManager,
+    history_options: _HistoryOptions,
+) -> None:
+    """Display the outcomes of the most recent audits recorded in the database and the requirements that regressed."""
+    with ResultStore.Open(
+        cast(Path, history_options.results_db),  # Validated by `_ValidateOptions`
+    ) as result_store:
+        summaries = result_store.GetRunSummaries(
+            history_options.num_runs,
+            repository=history_options.repository,
+            requirement=history_options.requirement,
+        )
+
+        regressions = result_store.GetRegressions(
+            history_options.num_runs,
+            repository=history_options.repository,
+            requirement=history_options.requirement,
+        )
+
+    DisplayHistory(summaries, regressions, panel_width=_GetPanelWidth(dm))
+
+
+# ----------------------------------------------------------------------
+def _DisplayChanges(
+    dm: DoneManager,
+    changes: list[Baseline.Change],
+    audit_time: datetime,
+    output_options: _OutputOptions,
+) -> None:
+    """Display the requirements whose outcomes have changed since the previous audit (if any)."""
+    output_file = output_options.output_file
+
+    if not changes:
+        dm.WriteVerbose("The outcomes of all requirements are unchanged.\n")
+        return
+
+    if output_file is None:
+        dm.WriteLine("\n")
+
+    DisplayBaselineChanges(
+        changes,
+        title=f"Changes at {audit_time:%Y-%m-%d %H:%M:%S}",
+        panel_width=output_options.panel_width,
+        file=output_file,
+    )
+
+    if output_file is not None:
+        output_file.flush()
+
+
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
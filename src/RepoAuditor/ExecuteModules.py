@@ -6,11 +6,24 @@
 # -------------------------------------------------------------------------------
 """Contains functionality to execute multiple Modules."""
 
+import contextlib
 import itertools
+import multiprocessing
+import os
+import pickle
+import queue
 import sys
-from collections.abc import Callable
-from dataclasses import dataclass
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, Optional, cast
+from urllib.parse import urlparse
 
 from dbrownell_Common import ExecuteTasks  # type: ignore[import-untyped]
 from dbrownell_Common.InflectEx import inflect  # type: ignore[import-untyped]
@@ -18,6 +31,11 @@ from dbrownell_Common.Streams.Capabilities import Capabilities  # type: ignore[i
 from dbrownell_Common.Streams.DoneManager import DoneManager  # type: ignore[import-untyped]
 from rich.progress import Progress, TimeElapsedColumn
 
+from RepoAuditor.Impl.ConditionalRequestCache import ConditionalRequestCache
+from RepoAuditor.Impl.Deadline import Deadline
+from RepoAuditor.Impl.DurationHistory import DurationHistory
+from RepoAuditor.Impl.ResultCache import ResultCache
+from RepoAuditor.Impl.ResourceLimits import ResourceLimits
 from RepoAuditor.Module import EvaluateResult, ExecutionStyle, Module, OnStatusFunc
 from RepoAuditor.Requirement import ReturnCode
 
@@ -35,6 +53,87 @@ class ModuleInfo:
     dynamic_args: dict[str, Any]
     requirement_args: dict[str, Any]
 
+    # The repository evaluated by the module when auditing multiple repositories
+    repository: Optional[str] = field(kw_only=True, default=None)
+
+    # The queries to evaluate (for example, those affected by a webhook event); None to evaluate all queries
+    query_names: Optional[frozenset[str]] = field(kw_only=True, default=None)
+
+    # ----------------------------------------------------------------------
+    @property
+    def display_name(self) -> str:
+        """Name used when displaying information about the module."""
+        if self.repository is None:
+            return self.module.name
+
+        return f"{self.module.name} ({self.repository})"
+
+    # ----------------------------------------------------------------------
+    @property
+    def host(self) -> Optional[str]:
+        """Host of the repository evaluated by the module, or None if the repository isn't a URL."""
+        if self.repository is None:
+            return None
+
+        return urlparse(self.repository).netloc.lower() or None
+
+    # ----------------------------------------------------------------------
+    def EstimateCost(self) -> float:
+        """Estimate the number of seconds required to evaluate the module for the repository."""
+        if self.repository is not None:
+            estimate = DurationHistory.GetActive().GetEstimate(self._GetHistoryKey())
+            if estimate is not None:
+                return estimate
+
+        return self.module.EstimateCost()
+
+    # ----------------------------------------------------------------------
+    def RecordDuration(
+        self,
+        seconds: float,
+    ) -> None:
+        """Record the time required to evaluate the module for the repository."""
+        history = DurationHistory.GetActive()
+
+        history.Record(self.module.name, seconds)
+
+        if self.repository is not None:
+            history.Record(self._GetHistoryKey(), seconds)
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _GetHistoryKey(self) -> str:
+        return f"{self.module.name}@{self.repository}"
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class ModuleResult:
+    """Results of evaluating a module, available as soon as the module's evaluation completes."""
+
+    index: int  # Position of the module within the module information provided to `ExecuteIter`
+    module_info: ModuleInfo
+    results: list[Module.EvaluateInfo]
+
+    # Seconds from the start of the module's evaluation until its completion (None if the results
+    # were restored rather than evaluated, for example from a journal)
+    duration: Optional[float] = field(kw_only=True, default=None)
+
+    # Description of the exception raised while evaluating the module (if any); each requirement of
+    # the module is reported as an error when an exception is raised
+    error: Optional[str] = field(kw_only=True, default=None)
+
+    # ----------------------------------------------------------------------
+    @property
+    def is_complete(self) -> bool:
+        """True if the module was evaluated without exceptions or timeouts.
+
+        The results of modules that are not complete do not reflect the state of the repository and
+        should not be reused by later audits.
+        """
+        return self.error is None and all(result.result != EvaluateResult.Timeout for result in self.results)
+
 
 # ----------------------------------------------------------------------
 # |
@@ -48,23 +147,50 @@ def Evaluate(
     module_info: ModuleInfo,
     on_status_func: OnStatusFunc,
     max_num_threads: Optional[int],
+    *,
+    deadline: Optional[Deadline] = None,
+    query_timeout: Optional[float] = None,
 ) -> list[list[Module.EvaluateInfo]]:
     """Evaluate the module given the dynamic arguments.
 
     Returns a list of information pertaining to module evaluation,
     with it subgrouped as lists themselves, hence a list of lists.
     """
-    module_data = module_info.module.GenerateInitialData(module_info.dynamic_args)
+    start_time = time.perf_counter()
+
+    # Modules may augment the dynamic arguments, so provide a copy to ensure that arguments shared by
+    # multiple repositories are not modified.
+    module_data = module_info.module.GenerateInitialData(dict(module_info.dynamic_args))
     if module_data is None:
         return []
 
-    return module_info.module.Evaluate(
+    results = module_info.module.Evaluate(
         module_data,
         module_info.requirement_args,
         on_status_func,
         max_num_threads=max_num_threads,
+        deadline=deadline,
+        query_timeout=query_timeout,
+        query_names=module_info.query_names,
     )
 
+    if module_info.query_names is None:
+        # The durations of modules that evaluate a subset of their queries are not representative
+        module_info.RecordDuration(time.perf_counter() - start_time)
+
+    if module_info.repository is not None:
+        results = [
+            # `replace` is not used, as it would render resolutions and rationales that may never be
+            # accessed
+            [
+                Module.EvaluateInfo(**(result.__dict__ | {"repository": module_info.repository}))
+                for result in query_results
+            ]
+            for query_results in results
+        ]
+
+    return results
+
 
 # ----------------------------------------------------------------------
 def CalcResultInfo(
@@ -99,188 +225,1272 @@ def CalcResultInfo(
             if result == EvaluateResult.Error:
                 return ReturnCode.ERROR, "errors were encountered"
 
+            if result == EvaluateResult.Timeout:
+                return ReturnCode.ERROR, "timeouts were encountered"
+
             if result == EvaluateResult.Warning:
                 return_code, return_msg = ReturnCode.WARNING, "warnings were encountered"
 
     return return_code, return_msg
 
 
-def Execute(
+# ----------------------------------------------------------------------
+def Execute(  # noqa: PLR0913
     dm: DoneManager,
-    module_infos: list[ModuleInfo],
+    module_infos: Iterable[ModuleInfo],
     warnings_as_errors_module_names: Optional[set[str]] = None,
     ignore_warnings_module_names: Optional[set[str]] = None,
     *,
     single_threaded: bool = False,
+    timeout: Optional[float] = None,
+    query_timeout: Optional[float] = None,
+    max_threads: Optional[int] = None,
+    max_http_concurrency: Optional[int] = None,
+    max_clones: Optional[int] = None,
+    duration_history_filename: Optional[Path] = None,
+    num_processes: Optional[int] = None,
+    result_cache_filename: Optional[Path] = None,
 ) -> list[list[Module.EvaluateInfo]]:
-    """Execute the modules in parallel and/or sequentially."""
-    if not module_infos:
+    """Execute the modules in parallel and/or sequentially.
+
+    `timeout` is the number of seconds available to execute all of the modules, while `query_timeout`
+    is the number of seconds available to each query to retrieve its data.
+
+    `max_threads` limits the number of threads used at each level of evaluation (the modules, the
+    queries of each module, and the requirements of each query) and the number of queries that
+    retrieve data concurrently across all modules (`single_threaded` is equivalent to a value of 1).
+    Each level has its own threads, so the total number of threads may exceed `max_threads`.
+    `max_http_concurrency` limits the number of concurrent HTTP requests sent to each host, and
+    `max_clones` limits the number of repositories cloned concurrently.
+
+    Modules and queries that can be run in parallel are started in order of decreasing estimated
+    duration. Estimates are based on the durations observed in previous runs (persisted to
+    `duration_history_filename`, if provided) or the cost hints provided by each query.
+
+    When `module_infos` is an iterator (rather than a sequence), modules are evaluated as they are
+    generated (for example, as repositories are discovered) rather than waiting for all of them.
+
+    When repositories on multiple hosts are evaluated (for example, github.com and GitHub Enterprise
+    Server instances), each host receives a share of the threads so that a slow or throttled host
+    does not prevent the evaluation of repositories on other hosts.
+
+    When `num_processes` is greater than 1, modules are evaluated by that many worker processes so
+    that CPU-bound work (such as evaluating requirements and decoding responses) is not limited to a
+    single core. Each process has its own threads, resource limits, and HTTP connections; the
+    `max_threads`, `max_http_concurrency`, and `max_clones` limits apply to each process. Modules
+    are pickled and sent to the worker processes; modules that cannot be pickled are evaluated by
+    this process.
+
+    When `result_cache_filename` is provided, the results of requirements are cached in that file and
+    reused by subsequent runs when the data retrieved by their query (and the requirement's
+    arguments) have not changed; see `Query.GetFingerprintData` for the queries that support caching.
+    Results cached by worker processes are not persisted.
+
+    An exception raised while evaluating a module does not end the evaluation of other modules; each
+    of the module's requirements is reported as an error.
+
+    All of the results are returned once all of the modules have been evaluated; use `ExecuteIter`
+    to process the results of each module as soon as they are available.
+    """
+    _ValidateNumProcesses(num_processes)
+
+    if isinstance(module_infos, Sequence) and not module_infos:
         dm.WriteWarning("There are no modules to process.\n")
         return []
 
-    warnings_as_errors_module_names = warnings_as_errors_module_names or set()
-    ignore_warnings_module_names = ignore_warnings_module_names or set()
-    max_num_threads = 1 if single_threaded else None
-
-    with dm.Nested("Processing {}...".format(inflect.no("module", len(module_infos)))) as modules_dm:
-        # Organize the modules into those that can be run in parallel and those that must be run
-        # sequentially.
-        parallel: list[tuple[int, ModuleInfo]] = []
-        sequential: list[tuple[int, ModuleInfo]] = []
-
-        for index, module_info in enumerate(module_infos):
-            if module_info.module.style == ExecutionStyle.Parallel:
-                parallel.append((index, module_info))
-            elif module_info.module.style == ExecutionStyle.Sequential:
-                sequential.append((index, module_info))
-            else:
-                raise RuntimeError(module_info.module.style)  # pragma: no cover
+    with _ExecutionContext(
+        dm,
+        module_infos,
+        single_threaded=single_threaded,
+        timeout=timeout,
+        max_threads=max_threads,
+        max_http_concurrency=max_http_concurrency,
+        max_clones=max_clones,
+        duration_history_filename=duration_history_filename,
+        result_cache_filename=result_cache_filename,
+    ) as (modules_dm, max_num_threads, deadline):
+        if (
+            isinstance(module_infos, Sequence)
+            and len({module_info.host for module_info in module_infos}) <= 1
+            and (num_processes or 1) == 1
+        ):
+            all_results = _ExecuteSequence(
+                modules_dm,
+                module_infos,
+                warnings_as_errors_module_names or set(),
+                ignore_warnings_module_names or set(),
+                max_num_threads=max_num_threads,
+                deadline=deadline,
+                query_timeout=query_timeout,
+            )
+        else:
+            all_results = [
+                module_result.results
+                for module_result in sorted(
+                    _ExecuteIterator(
+                        modules_dm,
+                        module_infos,
+                        warnings_as_errors_module_names or set(),
+                        ignore_warnings_module_names or set(),
+                        max_num_threads=max_num_threads,
+                        deadline=deadline,
+                        query_timeout=query_timeout,
+                        num_processes=num_processes,
+                    ),
+                    key=lambda module_result: module_result.index,
+                )
+            ]
+
+    final_results: list[list[Module.EvaluateInfo]] = []
+
+    for results in all_results:
+        if results is None:
+            continue  # pragma: no cover
+
+        final_results.append(results)
+
+    return final_results
+
+
+# ----------------------------------------------------------------------
+def ExecuteIter(  # noqa: PLR0913
+    dm: DoneManager,
+    module_infos: Iterable[ModuleInfo],
+    warnings_as_errors_module_names: Optional[set[str]] = None,
+    ignore_warnings_module_names: Optional[set[str]] = None,
+    *,
+    single_threaded: bool = False,
+    timeout: Optional[float] = None,
+    query_timeout: Optional[float] = None,
+    max_threads: Optional[int] = None,
+    max_http_concurrency: Optional[int] = None,
+    max_clones: Optional[int] = None,
+    duration_history_filename: Optional[Path] = None,
+    num_processes: Optional[int] = None,
+    result_cache_filename: Optional[Path] = None,
+    max_pending: Optional[int] = None,
+) -> Iterator[ModuleResult]:
+    """Execute the modules, yielding the results of each module as soon as its evaluation completes.
+
+    Results are yielded in the order in which modules complete; `ModuleResult.index` can be used to
+    restore the order of `module_infos`. Results are not retained once they have been yielded, and
+    modules are retrieved from `module_infos` only as capacity becomes available: at most
+    `max_pending` modules (by default, twice the number of threads across all processes) are being evaluated or waiting
+    for their results to be consumed at any time. This bounds the memory required to audit a large
+    number of repositories and allows results to be written as they become available.
+
+    An exception raised while evaluating a module does not end the evaluation of other modules; the
+    exception is described by `ModuleResult.error` and each of the module's requirements is reported
+    as an error.
+
+    See `Execute` for a description of the other arguments.
+    """
+    _ValidateNumProcesses(num_processes)
+
+    if isinstance(module_infos, Sequence) and not module_infos:
+        dm.WriteWarning("There are no modules to process.\n")
+        return
+
+    with _ExecutionContext(
+        dm,
+        module_infos,
+        single_threaded=single_threaded,
+        timeout=timeout,
+        max_threads=max_threads,
+        max_http_concurrency=max_http_concurrency,
+        max_clones=max_clones,
+        duration_history_filename=duration_history_filename,
+        result_cache_filename=result_cache_filename,
+    ) as (modules_dm, max_num_threads, deadline):
+        yield from _ExecuteIterator(
+            modules_dm,
+            module_infos,
+            warnings_as_errors_module_names or set(),
+            ignore_warnings_module_names or set(),
+            max_num_threads=max_num_threads,
+            deadline=deadline,
+            query_timeout=query_timeout,
+            num_processes=num_processes,
+            max_pending=max_pending,
+        )
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+@contextmanager
+def _ExecutionContext(
+    dm: DoneManager,
+    module_infos: Iterable[ModuleInfo],
+    *,
+    single_threaded: bool,
+    timeout: Optional[float],
+    max_threads: Optional[int],
+    max_http_concurrency: Optional[int],
+    max_clones: Optional[int],
+    duration_history_filename: Optional[Path],
+    result_cache_filename: Optional[Path],
+) -> Iterator[tuple[DoneManager, Optional[int], Deadline]]:
+    """Activate the resources used while evaluating modules; yields the DoneManager used to display progress, the maximum number of threads, and the deadline."""
+    max_num_threads = 1 if single_threaded else max_threads
+    deadline = Deadline.Create(timeout)
+
+    resource_limits = ResourceLimits(
+        max_threads=max_num_threads,
+        max_http_concurrency=max_http_concurrency,
+        max_clones=max_clones,
+    )
+
+    dm.WriteVerbose(f"Resource limits: {resource_limits.GetDescription()}\n")
+
+    duration_history = (
+        DurationHistory.GetActive()
+        if duration_history_filename is None
+        else DurationHistory.Load(duration_history_filename)
+    )
+
+    result_cache = (
+        ResultCache.GetActive() if result_cache_filename is None else ResultCache.Load(result_cache_filename)
+    )
+
+    if isinstance(module_infos, Sequence):
+        heading = "Processing {}".format(inflect.no("module", len(module_infos)))
+
+        repositories = {
+            module_info.repository for module_info in module_infos if module_info.repository is not None
+        }
+        if repositories:
+            heading += " across {}".format(inflect.no("repository", len(repositories)))
+    else:
+        heading = "Processing modules as repositories are discovered"
+
+    with (
+        resource_limits.Activate(),
+        duration_history.Activate(),
+        contextlib.nullcontext() if result_cache is None else result_cache.Activate(),
+        dm.Nested(f"{heading}...") as modules_dm,
+    ):
+        yield modules_dm, max_num_threads, deadline
+
+    duration_history.Save()
 
-        if len(parallel) == 1:
-            sequential.append(parallel[0])
-            parallel = []
+    if result_cache is not None:
+        result_cache.Save()
+
+        dm.WriteVerbose(
+            "Cached results used: {}\n".format(inflect.no("requirement", result_cache.num_hits)),
+        )
+
+    # Report the concurrency chosen for each host that received HTTP requests
+    for host, http_summary in resource_limits.GetHttpSummaries().items():
+        dm.WriteInfo(
+            f"HTTP concurrency for '{host}': {http_summary.limit} "
+            f"(maximum in flight: {http_summary.max_in_flight}, "
+            f"requests: {http_summary.num_operations}, "
+            f"throttled: {http_summary.num_throttled}"
+            + (
+                ""
+                if http_summary.rate_limit_remaining is None
+                else f", rate limit remaining: {http_summary.rate_limit_remaining}"
+            )
+            + (f", paused: {http_summary.num_paused}" if http_summary.num_paused else "")
+            + ")\n",
+        )
+
+
+# ----------------------------------------------------------------------
+def _ExecuteSequence(
+    modules_dm: DoneManager,
+    module_infos: Sequence[ModuleInfo],
+    warnings_as_errors_module_names: set[str],
+    ignore_warnings_module_names: set[str],
+    *,
+    max_num_threads: Optional[int],
+    deadline: Deadline,
+    query_timeout: Optional[float],
+) -> list[Optional[list[Module.EvaluateInfo]]]:
+    """Evaluate modules that are known up front, displaying the progress of each one."""
+    # Organize the modules into those that can be run in parallel and those that must be run
+    # sequentially.
+    parallel: list[tuple[int, ModuleInfo]] = []
+    sequential: list[tuple[int, ModuleInfo]] = []
+
+    for index, module_info in enumerate(module_infos):
+        if module_info.module.style == ExecutionStyle.Parallel:
+            parallel.append((index, module_info))
+        elif module_info.module.style == ExecutionStyle.Sequential:
+            sequential.append((index, module_info))
+        else:
+            raise RuntimeError(module_info.module.style)  # pragma: no cover
+
+    if len(parallel) == 1:
+        sequential.append(parallel[0])
+        parallel = []
+
+    # Start the modules expected to take the longest first
+    parallel.sort(key=lambda value: value[1].EstimateCost(), reverse=True)
+
+    # Calculate the results
+    # ----------------------------------------------------------------------
+    all_results: list[Optional[list[Module.EvaluateInfo]]] = [None] * len(module_infos)
+
+    if parallel:
+        # Errors are written once the progress of the parallel modules is no longer displayed
+        errors: dict[int, str] = {}
 
-        # Calculate the results
         # ----------------------------------------------------------------------
-        all_results: list[Optional[list[list[Module.EvaluateInfo]]]] = [None] * len(module_infos)
+        def Prepare(
+            context: Any,  # noqa: ANN401
+            on_simple_status_func: Callable[[str], None],  # noqa: ARG001
+        ) -> tuple[int, ExecuteTasks.TransformTasksExTypes.TransformFuncType]:
+            all_results_index, module_info = cast(tuple[int, ModuleInfo], context)
+            del context
 
-        if parallel:
             # ----------------------------------------------------------------------
-            def Prepare(
-                context: Any,  # noqa: ANN401
-                on_simple_status_func: Callable[[str], None],  # noqa: ARG001
-            ) -> tuple[int, ExecuteTasks.TransformTasksExTypes.TransformFuncType]:
-                module_info = cast(ModuleInfo, context)
-                del context
-
+            def Transform(
+                status: ExecuteTasks.Status,
+            ) -> ExecuteTasks.CompleteTransformResult:
                 # ----------------------------------------------------------------------
-                def Transform(
-                    status: ExecuteTasks.Status,
-                ) -> ExecuteTasks.CompleteTransformResult:
-                    # ----------------------------------------------------------------------
-                    def OnStatus(num_completed: int, *args, **kwargs) -> None:
-                        status.OnProgress(
-                            num_completed,
-                            _CreateStatusString(*args, **kwargs),
-                        )
-
-                    # ----------------------------------------------------------------------
-
-                    evaluate_results = Evaluate(module_info, OnStatus, max_num_threads=max_num_threads)
-
-                    result_code, result_status = CalcResultInfo(
-                        evaluate_results,
-                        warnings_as_errors_module_names=warnings_as_errors_module_names,
-                        ignore_warnings_module_names=ignore_warnings_module_names,
+                def OnStatus(num_completed: int, *args, **kwargs) -> None:
+                    status.OnProgress(
+                        num_completed,
+                        _CreateStatusString(*args, **kwargs),
                     )
 
-                    return ExecuteTasks.CompleteTransformResult(evaluate_results, result_code, result_status)
-
                 # ----------------------------------------------------------------------
 
-                return module_info.module.GetNumRequirements(), Transform
+                evaluate_results, error = _EvaluateWithErrorResults(
+                    module_info,
+                    OnStatus,
+                    max_num_threads=max_num_threads,
+                    deadline=deadline,
+                    query_timeout=query_timeout,
+                )
+
+                if error is not None:
+                    errors[all_results_index] = f"{module_info.display_name}: {error}"
+
+                result_code, result_status = CalcResultInfo(
+                    evaluate_results,
+                    warnings_as_errors_module_names=warnings_as_errors_module_names,
+                    ignore_warnings_module_names=ignore_warnings_module_names,
+                )
+
+                return ExecuteTasks.CompleteTransformResult(evaluate_results, result_code, result_status)
 
             # ----------------------------------------------------------------------
 
-            for (all_results_index, _), transformed_results in zip(
-                parallel,
-                ExecuteTasks.TransformTasksEx(
-                    modules_dm,
-                    "Processing parallel modules...",
-                    [
-                        ExecuteTasks.TaskData(module_info.module.name, module_info)
-                        for _, module_info in parallel
-                    ],
-                    Prepare,
+            return module_info.module.GetNumRequirements(), Transform
+
+        # ----------------------------------------------------------------------
+
+        for (all_results_index, _), transformed_results in zip(
+            parallel,
+            ExecuteTasks.TransformTasksEx(
+                modules_dm,
+                "Processing parallel modules...",
+                [
+                    ExecuteTasks.TaskData(module_info.display_name, (index, module_info))
+                    for index, module_info in parallel
+                ],
+                Prepare,
+                max_num_threads=max_num_threads,
+            ),
+            strict=True,
+        ):
+            assert all_results[all_results_index] is None
+            assert isinstance(transformed_results, list), transformed_results
+
+            all_results[all_results_index] = list(itertools.chain(*transformed_results))
+
+        for all_results_index in sorted(errors):
+            modules_dm.WriteError(f"{errors[all_results_index]}\n")
+
+    for index, (all_results_index, module_info) in enumerate(sequential):
+        with (
+            modules_dm.Nested(
+                f"Processing '{module_info.display_name}' ({index + 1 + len(parallel)} of {len(module_infos)})...",
+            ) as this_module_dm,
+            # rich.progress needs to output to sys.stdout
+            this_module_dm.YieldStdout() as stdout_context,
+        ):
+            stdout_context.persist_content = False
+
+            # Technically speaking, it would be more correct to use `stdout_context.stream` here
+            # rather than referencing `sys.stdout` directly, but it is really hard to work with mocked
+            # stream as mocks will create mocks for everything called on the mock. Use sys.stdout
+            # directly to avoid that particular problem.
+            from unittest.mock import MagicMock, Mock
+
+            assert stdout_context.stream is sys.stdout or isinstance(
+                stdout_context.stream, (Mock, MagicMock)
+            ), stdout_context.stream
+
+            with Progress(
+                *Progress.get_default_columns(),
+                TimeElapsedColumn(),
+                "{task.fields[status]}",
+                console=Capabilities.Get(sys.stdout).CreateRichConsole(sys.stdout),
+                transient=True,
+                refresh_per_second=10,
+            ) as progress_bar:
+                progress_bar_task_id = progress_bar.add_task(
+                    stdout_context.line_prefix,
+                    status="",
+                    total=module_info.module.GetNumRequirements(),
+                    visible=True,
+                )
+
+                # ----------------------------------------------------------------------
+                def OnStatus(
+                    num_completed: int,
+                    num_success: int,
+                    num_error: int,
+                    num_warning: int,
+                    num_does_not_apply: int,
+                ) -> None:
+                    progress_bar.update(
+                        progress_bar_task_id,  # noqa: B023
+                        completed=num_completed,
+                        status=_CreateStatusString(
+                            num_success,
+                            num_error,
+                            num_warning,
+                            num_does_not_apply,
+                        ),
+                    )
+
+                # ----------------------------------------------------------------------
+
+                evaluate_results, error = _EvaluateWithErrorResults(
+                    module_info,
+                    OnStatus,
                     max_num_threads=max_num_threads,
-                ),
-                strict=True,
-            ):
+                    deadline=deadline,
+                    query_timeout=query_timeout,
+                )
+
+                if error is not None:
+                    this_module_dm.WriteError(f"{error}\n")
+
                 assert all_results[all_results_index] is None
-                assert isinstance(transformed_results, list), transformed_results
-
-                all_results[all_results_index] = transformed_results
-
-        for index, (all_results_index, module_info) in enumerate(sequential):
-            with (
-                modules_dm.Nested(
-                    f"Processing '{module_info.module.name}' ({index + 1 + len(parallel)} of {len(module_infos)})...",
-                ) as this_module_dm,
-                # rich.progress needs to output to sys.stdout
-                this_module_dm.YieldStdout() as stdout_context,
-            ):
-                stdout_context.persist_content = False
-
-                # Technically speaking, it would be more correct to use `stdout_context.stream` here
-                # rather than referencing `sys.stdout` directly, but it is really hard to work with mocked
-                # stream as mocks will create mocks for everything called on the mock. Use sys.stdout
-                # directly to avoid that particular problem.
-                from unittest.mock import MagicMock, Mock
-
-                assert stdout_context.stream is sys.stdout or isinstance(
-                    stdout_context.stream, (Mock, MagicMock)
-                ), stdout_context.stream
-
-                with Progress(
-                    *Progress.get_default_columns(),
-                    TimeElapsedColumn(),
-                    "{task.fields[status]}",
-                    console=Capabilities.Get(sys.stdout).CreateRichConsole(sys.stdout),
-                    transient=True,
-                    refresh_per_second=10,
-                ) as progress_bar:
-                    progress_bar_task_id = progress_bar.add_task(
-                        stdout_context.line_prefix,
-                        status="",
-                        total=module_info.module.GetNumRequirements(),
-                        visible=True,
-                    )
+                all_results[all_results_index] = list(itertools.chain(*evaluate_results))
 
-                    # ----------------------------------------------------------------------
-                    def OnStatus(
-                        num_completed: int,
-                        num_success: int,
-                        num_error: int,
-                        num_warning: int,
-                        num_does_not_apply: int,
-                    ) -> None:
-                        progress_bar.update(
-                            progress_bar_task_id,  # noqa: B023
-                            completed=num_completed,
-                            status=_CreateStatusString(
-                                num_success,
-                                num_error,
-                                num_warning,
-                                num_does_not_apply,
-                            ),
-                        )
-
-                    # ----------------------------------------------------------------------
-
-                    evaluate_results = Evaluate(module_info, OnStatus, max_num_threads=max_num_threads)
-
-                    assert all_results[all_results_index] is None
-                    all_results[all_results_index] = evaluate_results
-
-                    this_module_dm.result = CalcResultInfo(
-                        evaluate_results,
-                        warnings_as_errors_module_names=warnings_as_errors_module_names,
-                        ignore_warnings_module_names=ignore_warnings_module_names,
-                    )[0]
+                this_module_dm.result = CalcResultInfo(
+                    evaluate_results,
+                    warnings_as_errors_module_names=warnings_as_errors_module_names,
+                    ignore_warnings_module_names=ignore_warnings_module_names,
+                )[0]
 
-    final_results: list[list[Module.EvaluateInfo]] = []
+    return all_results
 
-    for results in all_results:
-        if results is None:
-            continue  # pragma: no cover
 
-        final_results.append(list(itertools.chain(*results)))
+# ----------------------------------------------------------------------
+def _ExecuteIterator(
+    modules_dm: DoneManager,
+    module_infos: Iterable[ModuleInfo],
+    warnings_as_errors_module_names: set[str],
+    ignore_warnings_module_names: set[str],
+    *,
+    max_num_threads: Optional[int],
+    deadline: Deadline,
+    query_timeout: Optional[float],
+    num_processes: Optional[int] = None,
+    max_pending: Optional[int] = None,
+) -> Iterator[ModuleResult]:
+    """Evaluate modules as they are generated, displaying a summary and yielding the results as each one completes.
 
-    return final_results
+    Modules that must be run sequentially are not run concurrently with one another, but may be run
+    concurrently with modules that can be run in parallel.
+    """
+    # Use the same default number of workers as ThreadPoolExecutor
+    num_threads = max_num_threads or min(32, (os.cpu_count() or 1) + 4)
+    num_workers = num_threads * (num_processes or 1)
+    max_pending = max_pending or 2 * num_workers
+
+    evaluate_options = _EvaluateOptions(max_num_threads, deadline, query_timeout)
+    sequential_lock = threading.Lock()
+
+    enumerated_module_infos = enumerate(module_infos)
+    scheduler = _HostScheduler(num_workers)
+    pending: dict[Future[list[list[Module.EvaluateInfo]]], tuple[int, ModuleInfo, float]] = {}
+    is_exhausted = False
+    has_modules = False
+
+    executor, submit_func = _CreateExecutor(
+        num_processes,
+        num_threads,
+        evaluate_options,
+        sequential_lock,
+        # Processes are started once the first modules are known, as the modules are sent to the
+        # processes when they are started.
+        lambda: (
+            module_info.module
+            for module_info in itertools.chain(
+                module_infos if isinstance(module_infos, Sequence) else [],
+                scheduler.waiting_module_infos,
+            )
+        ),
+    )
+
+    try:
+        while True:
+            # Modules are evaluated as they are generated, so evaluation begins before all of the
+            # modules are known; modules are not generated until there is capacity to evaluate them.
+            while not is_exhausted and len(pending) + scheduler.num_waiting < max_pending:
+                item = next(enumerated_module_infos, None)
+                if item is None:
+                    is_exhausted = True
+                    break
+
+                scheduler.Add(*item)
+                has_modules = True
+
+            while len(pending) < num_workers:
+                item = scheduler.GetNext()
+
+                if item is None:
+                    # Workers are idle because every waiting module is for a host that is already
+                    # using its share of the workers; look further ahead for modules for other hosts.
+                    if is_exhausted or scheduler.num_waiting >= max_pending:
+                        break
+
+                    item = next(enumerated_module_infos, None)
+                    if item is None:
+                        is_exhausted = True
+                        break
+
+                    scheduler.Add(*item)
+                    has_modules = True
+
+                    continue
+
+                pending[submit_func(item[1])] = (*item, time.perf_counter())
+
+            if not pending:
+                assert scheduler.num_waiting == 0, scheduler.num_waiting
+                break
+
+            completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+            completion_time = time.perf_counter()
+
+            for future in sorted(completed, key=lambda future: pending[future][0]):
+                index, module_info, start_time = pending.pop(future)
+                scheduler.OnComplete(module_info)
+
+                evaluate_results, error = _GetFutureResults(modules_dm, module_info, future)
+
+                results = _WriteModuleStatus(
+                    modules_dm,
+                    module_info,
+                    evaluate_results,
+                    warnings_as_errors_module_names,
+                    ignore_warnings_module_names,
+                )
+
+                yield ModuleResult(
+                    index,
+                    module_info,
+                    results,
+                    duration=completion_time - start_time,
+                    error=error,
+                )
+
+    finally:
+        # Don't start modules whose results will never be consumed (for example, because an
+        # exception was raised or the caller stopped iterating).
+        executor.shutdown(cancel_futures=True)
+
+    if not has_modules:
+        modules_dm.WriteWarning("There are no modules to process.\n")
 
 
 # ----------------------------------------------------------------------
+class _HostScheduler:
+    """Modules waiting to be evaluated, grouped by the host of the repository that they evaluate.
+
+    Modules are started in round-robin order across hosts. While multiple hosts have modules that are
+    running or waiting, each host is limited to its share of the workers; modules for a slow or
+    throttled host occupy workers for longer, and would otherwise gradually occupy all of them.
+    """
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        num_workers: int,
+    ) -> None:
+        self.num_workers = num_workers
+
+        self._waiting: dict[Optional[str], deque[tuple[int, ModuleInfo]]] = {}
+        self._num_running: dict[Optional[str], int] = {}
+        self._num_waiting = 0
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_waiting(self) -> int:
+        """Number of modules waiting to be started."""
+        return self._num_waiting
+
+    # ----------------------------------------------------------------------
+    @property
+    def waiting_module_infos(self) -> Iterator[ModuleInfo]:
+        """Modules waiting to be started."""
+        for waiting in self._waiting.values():
+            for _, module_info in waiting:
+                yield module_info
+
+    # ----------------------------------------------------------------------
+    def Add(
+        self,
+        index: int,
+        module_info: ModuleInfo,
+    ) -> None:
+        """Add a module that is waiting to be started."""
+        self._waiting.setdefault(module_info.host, deque()).append((index, module_info))
+        self._num_waiting += 1
+
+    # ----------------------------------------------------------------------
+    def GetNext(self) -> Optional[tuple[int, ModuleInfo]]:
+        """Return the next module to start, or None if no modules can be started."""
+        active_hosts = set(self._waiting)
+        active_hosts.update(host for host, num_running in self._num_running.items() if num_running)
+
+        max_num_running = (
+            self.num_workers if len(active_hosts) <= 1 else max(1, self.num_workers // len(active_hosts))
+        )
+
+        for host in list(self._waiting):
+            if self._num_running.get(host, 0) >= max_num_running:
+                continue
+
+            # Move the host to the end of the round-robin order
+            waiting = self._waiting.pop(host)
+
+            item = waiting.popleft()
+            if waiting:
+                self._waiting[host] = waiting
+
+            self._num_waiting -= 1
+            self._num_running[host] = self._num_running.get(host, 0) + 1
+
+            return item
+
+        return None
+
+    # ----------------------------------------------------------------------
+    def OnComplete(
+        self,
+        module_info: ModuleInfo,
+    ) -> None:
+        """Indicate that a module started via `GetNext` has completed."""
+        self._num_running[module_info.host] -= 1
+
+
+# ----------------------------------------------------------------------
+def _WriteModuleStatus(
+    modules_dm: DoneManager,
+    module_info: ModuleInfo,
+    evaluate_results: list[list[Module.EvaluateInfo]],
+    warnings_as_errors_module_names: set[str],
+    ignore_warnings_module_names: set[str],
+) -> list[Module.EvaluateInfo]:
+    """Display the status of a module that has completed and update the result; returns the module's results."""
+    result_code, _ = CalcResultInfo(
+        evaluate_results,
+        warnings_as_errors_module_names=warnings_as_errors_module_names,
+        ignore_warnings_module_names=ignore_warnings_module_names,
+    )
+
+    results = list(itertools.chain(*evaluate_results))
+    num_results = dict.fromkeys(EvaluateResult, 0)
+
+    for result in results:
+        num_results[result.result] += 1
+
+    modules_dm.WriteLine(
+        "{}: {}\n".format(
+            module_info.display_name,
+            _CreateStatusString(
+                num_results[EvaluateResult.Success],
+                num_results[EvaluateResult.Error] + num_results[EvaluateResult.Timeout],
+                num_results[EvaluateResult.Warning],
+                num_results[EvaluateResult.DoesNotApply],
+            ),
+        ),
+    )
+
+    if result_code == ReturnCode.ERROR or (
+        result_code == ReturnCode.WARNING and modules_dm.result == ReturnCode.SUCCESS
+    ):
+        modules_dm.result = result_code
+
+    return results
+
+
+# ----------------------------------------------------------------------
+def _GetFutureResults(
+    modules_dm: DoneManager,
+    module_info: ModuleInfo,
+    future: Future[list[list[Module.EvaluateInfo]]],
+) -> tuple[list[list[Module.EvaluateInfo]], Optional[str]]:
+    """Return the results of a module that has completed and a description of the exception raised while evaluating it (if any)."""
+    try:
+        return future.result(), None
+    except Exception as ex:
+        # An exception raised while evaluating one repository should not prevent the evaluation of
+        # the others.
+        error = str(ex) or type(ex).__name__
+
+        modules_dm.WriteError(f"{module_info.display_name}: {error}\n")
+
+        return _CreateErrorResults(module_info, error), error
+
+
+# ----------------------------------------------------------------------
+def _EvaluateWithErrorResults(
+    module_info: ModuleInfo,
+    on_status_func: OnStatusFunc,
+    *,
+    max_num_threads: Optional[int],
+    deadline: Deadline,
+    query_timeout: Optional[float],
+) -> tuple[list[list[Module.EvaluateInfo]], Optional[str]]:
+    """Evaluate the module, returning its results and a description of the exception raised while evaluating it (if any)."""
+    try:
+        return Evaluate(
+            module_info,
+            on_status_func,
+            max_num_threads=max_num_threads,
+            deadline=deadline,
+            query_timeout=query_timeout,
+        ), None
+    except Exception as ex:
+        # An exception raised while evaluating one repository should not prevent the evaluation of
+        # the others.
+        error = str(ex) or type(ex).__name__
+
+        return _CreateErrorResults(module_info, error), error
+
+
+# ----------------------------------------------------------------------
+def _CreateErrorResults(
+    module_info: ModuleInfo,
+    error: str,
+) -> list[list[Module.EvaluateInfo]]:
+    """Create results that report an exception raised while evaluating the module as an error for each of its requirements."""
+    module = module_info.module
+
+    return [
+        [
+            Module.EvaluateInfo(
+                result=EvaluateResult.Error,
+                context=error,
+                resolution="",
+                rationale="",
+                requirement=requirement,
+                query=query,
+                module=module,
+                repository=module_info.repository,
+            )
+            for requirement in query.requirements
+        ]
+        for query in module.queries
+        if module_info.query_names is None or query.name in module_info.query_names
+    ]
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _EvaluateOptions:
+    """Values used to evaluate each module; sent to worker processes along with the modules."""
+
+    max_num_threads: Optional[int]
+    deadline: Deadline
+    query_timeout: Optional[float]
+
+
+# ----------------------------------------------------------------------
+def _EvaluateModule(
+    module_info: ModuleInfo,
+    evaluate_options: _EvaluateOptions,
+    sequential_lock: threading.Lock,
+) -> list[list[Module.EvaluateInfo]]:
+    """Evaluate the module; modules that must be run sequentially are not evaluated concurrently with one another."""
+    with (
+        sequential_lock if module_info.module.style == ExecutionStyle.Sequential else contextlib.nullcontext()
+    ):
+        return Evaluate(
+            module_info,
+            lambda *args, **kwargs: None,  # noqa: ARG005
+            max_num_threads=evaluate_options.max_num_threads,
+            deadline=evaluate_options.deadline,
+            query_timeout=evaluate_options.query_timeout,
+        )
+
+
+# ----------------------------------------------------------------------
+def _CreateExecutor(
+    num_processes: Optional[int],
+    num_threads: int,
+    evaluate_options: _EvaluateOptions,
+    sequential_lock: threading.Lock,
+    get_modules_func: Callable[[], Iterable[Module]],
+) -> tuple[
+    "ThreadPoolExecutor | _ProcessPool",
+    Callable[[ModuleInfo], Future[list[list[Module.EvaluateInfo]]]],
+]:
+    """Create the executor used to evaluate modules and the function used to submit modules to it."""
+    if (num_processes or 1) == 1:
+        thread_pool = ThreadPoolExecutor(max_workers=num_threads)
+
+        return thread_pool, lambda module_info: thread_pool.submit(
+            _EvaluateModule,
+            module_info,
+            evaluate_options,
+            sequential_lock,
+        )
+
+    assert num_processes is not None
+
+    process_pool = _ProcessPool(
+        num_processes, num_threads, evaluate_options, sequential_lock, get_modules_func
+    )
+
+    return process_pool, process_pool.Submit
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _ProcessContext:
+    """Values that a worker process uses to recreate the state that is active in this process."""
+
+    num_threads: int
+    evaluate_options: _EvaluateOptions
+    max_threads: Optional[int]
+    max_http_concurrency: Optional[int]
+    max_clones: Optional[int]
+    duration_history: DurationHistory
+    result_cache: Optional[ResultCache]
+    use_conditional_request_cache: bool
+
+
+# ----------------------------------------------------------------------
+class _ProcessPool:
+    """Worker processes that evaluate modules, each with its own threads, resource limits, and HTTP connections.
+
+    This process has other threads by the time that the processes are started, and forking a process
+    with multiple threads can deadlock the child process; the processes are therefore started with
+    the `forkserver` start method (or `spawn`, where `forkserver` is not available). The modules are
+    pickled and sent to each process when it is started, along with the values used to recreate the
+    active resource limits, duration history, result cache, and deadline; modules that cannot be
+    pickled are evaluated by this process instead. After that, only the arguments used to evaluate
+    each module and the results of its evaluation are exchanged with the processes.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        num_processes: int,
+        num_threads: int,  # Number of threads used by each process
+        evaluate_options: _EvaluateOptions,
+        sequential_lock: threading.Lock,  # Used by modules evaluated in this process
+        get_modules_func: Callable[[], Iterable[Module]],  # Modules that will be evaluated
+    ) -> None:
+        self.num_processes = num_processes
+        self.num_threads = num_threads
+        self.evaluate_options = evaluate_options
+
+        self._sequential_lock = sequential_lock
+        self._get_modules_func = get_modules_func
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            self._context: multiprocessing.context.BaseContext = multiprocessing.get_context("forkserver")
+
+            # Import the modules used by every process once (in the server) rather than in each
+            # process that it starts
+            self._context.set_forkserver_preload([__name__])
+        else:
+            self._context = multiprocessing.get_context("spawn")  # pragma: no cover
+
+        self._output_queue = self._context.Queue()
+
+        self._is_started = False
+        self._processes: list[multiprocessing.process.BaseProcess] = []
+        self._input_queues: list[multiprocessing.SimpleQueue[Optional[bytes]]] = []
+        self._module_names: set[str] = set()
+        self._reader_thread: Optional[threading.Thread] = None
+
+        # Modules that were not known when the processes were started (or that cannot be pickled)
+        # are evaluated in this process
+        self._fallback_executor: Optional[ThreadPoolExecutor] = None
+
+        self._lock = threading.Lock()
+        self._next_token = 0
+        self._pending: dict[int, tuple[Future[list[list[Module.EvaluateInfo]]], ModuleInfo, int]] = {}
+        self._num_pending = [0] * num_processes
+
+    # ----------------------------------------------------------------------
+    def Submit(
+        self,
+        module_info: ModuleInfo,
+    ) -> Future[list[list[Module.EvaluateInfo]]]:
+        """Evaluate the module in one of the processes."""
+        if not self._is_started:
+            self._Start(itertools.chain(self._get_modules_func(), [module_info.module]))
+
+        if module_info.module.name not in self._module_names:
+            if self._fallback_executor is None:
+                self._fallback_executor = ThreadPoolExecutor(max_workers=self.num_threads)
+
+            return self._fallback_executor.submit(
+                _EvaluateModule,
+                module_info,
+                self.evaluate_options,
+                self._sequential_lock,
+            )
+
+        future: Future[list[list[Module.EvaluateInfo]]] = Future()
+
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+
+            # Modules that must be run sequentially are evaluated by the same process (which
+            # prevents them from running concurrently); other modules are evaluated by the process
+            # with the least work.
+            if module_info.module.style == ExecutionStyle.Sequential:
+                process_index = 0
+            else:
+                process_index = min(range(self.num_processes), key=self._num_pending.__getitem__)
+
+            self._pending[token] = (future, module_info, process_index)
+            self._num_pending[process_index] += 1
+
+        # Pickle here rather than when the value is sent so that errors are raised to the caller
+        self._input_queues[process_index].put(
+            pickle.dumps(
+                (
+                    token,
+                    module_info.module.name,
+                    module_info.dynamic_args,
+                    module_info.requirement_args,
+                    module_info.repository,
+                    module_info.query_names,
+                ),
+            ),
+        )
+
+        return future
+
+    # ----------------------------------------------------------------------
+    def shutdown(
+        self,
+        *,
+        cancel_futures: bool = False,
+    ) -> None:
+        """Stop the processes; modules that are being evaluated are abandoned if `cancel_futures` is True."""
+        with self._lock:
+            is_abandoned = cancel_futures and bool(self._pending)
+
+            if cancel_futures:
+                for future, _, _ in self._pending.values():
+                    future.cancel()
+
+        for input_queue in self._input_queues:
+            input_queue.put(None)
+
+        for process in self._processes:
+            if is_abandoned:
+                process.terminate()
+
+            process.join()
+
+        if self._reader_thread is not None:
+            self._output_queue.put(None)
+            self._reader_thread.join()
+
+        if self._fallback_executor is not None:
+            self._fallback_executor.shutdown(cancel_futures=cancel_futures)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _Start(
+        self,
+        modules: Iterable[Module],
+    ) -> None:
+        self._is_started = True
+
+        module_contents: dict[str, bytes] = {}
+
+        for module in modules:
+            if module.name in module_contents:
+                continue
+
+            # Pickle the modules once (rather than once for each process) and detect the modules that
+            # cannot be pickled before the processes are started.
+            with contextlib.suppress(pickle.PicklingError, AttributeError, TypeError):
+                module_contents[module.name] = pickle.dumps(module)
+
+        if not module_contents:
+            return
+
+        resource_limits = ResourceLimits.GetActive()
+
+        process_context = _ProcessContext(
+            self.num_threads,
+            self.evaluate_options,
+            resource_limits.max_threads,
+            resource_limits.max_http_concurrency,
+            resource_limits.max_clones,
+            DurationHistory.GetActive(),
+            ResultCache.GetActive(),
+            use_conditional_request_cache=ConditionalRequestCache.GetActive() is not None,
+        )
+
+        for _ in range(self.num_processes):
+            input_queue = self._context.SimpleQueue()
+
+            process = self._context.Process(
+                target=_EvaluateInProcess,
+                args=(module_contents, process_context, input_queue, self._output_queue),
+                daemon=True,
+            )
+
+            process.start()
+
+            self._input_queues.append(input_queue)
+            self._processes.append(process)
+
+        self._module_names = set(module_contents)
+
+        self._reader_thread = threading.Thread(target=self._ReadResults, daemon=True)
+        self._reader_thread.start()
+
+    # ----------------------------------------------------------------------
+    def _ReadResults(self) -> None:
+        while True:
+            try:
+                item = self._output_queue.get(timeout=1.0)
+            except queue.Empty:
+                self._OnProcessExit()
+                continue
+
+            if item is None:
+                break
+
+            token, serialized_results, duration, error = item
+
+            with self._lock:
+                pending_info = self._pending.pop(token, None)
+                if pending_info is None:
+                    continue  # pragma: no cover
+
+                future, module_info, process_index = pending_info
+                self._num_pending[process_index] -= 1
+
+            if future.cancelled():
+                continue
+
+            if error is not None:
+                msg = f"An error was encountered while evaluating {module_info.display_name} in a worker process.\n\n{error}"
+                future.set_exception(RuntimeError(msg))
+                continue
+
+            # Durations recorded by the process are not visible to this process
+            module_info.RecordDuration(duration)
+
+            future.set_result(_DeserializeResults(module_info, serialized_results))
+
+    # ----------------------------------------------------------------------
+    def _OnProcessExit(self) -> None:
+        """Fail the modules sent to processes that exited unexpectedly (for example, because they were killed)."""
+        with self._lock:
+            for token, (future, module_info, process_index) in list(self._pending.items()):
+                exitcode = self._processes[process_index].exitcode
+                if exitcode is None:
+                    continue
+
+                del self._pending[token]
+                self._num_pending[process_index] -= 1
+
+                if not future.cancelled():
+                    msg = f"The worker process evaluating {module_info.display_name} exited unexpectedly ({exitcode})."
+                    future.set_exception(RuntimeError(msg))
+
+
 # ----------------------------------------------------------------------
+def _EvaluateInProcess(
+    module_contents: dict[str, bytes],  # Pickled modules, keyed by name
+    process_context: _ProcessContext,
+    input_queue: "multiprocessing.SimpleQueue[Optional[bytes]]",
+    output_queue: "multiprocessing.Queue[Optional[tuple[Any, ...]]]",
+) -> None:
+    """Evaluate the modules sent by a `_ProcessPool`; invoked in the worker process."""
+    module_map: dict[str, Module] = {
+        module_name: pickle.loads(content)  # noqa: S301
+        for module_name, content in module_contents.items()
+    }
+
+    sequential_lock = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    def Evaluate(
+        token: int,
+        module_name: str,
+        dynamic_args: dict[str, Any],
+        requirement_args: dict[str, Any],
+        repository: Optional[str],
+        query_names: Optional[frozenset[str]],
+    ) -> None:
+        try:
+            module = module_map[module_name]
+
+            start_time = time.perf_counter()
+
+            results = _EvaluateModule(
+                ModuleInfo(
+                    module,
+                    dynamic_args,
+                    requirement_args,
+                    repository=repository,
+                    query_names=query_names,
+                ),
+                process_context.evaluate_options,
+                sequential_lock,
+            )
+
+            output_queue.put(
+                (token, _SerializeResults(module, results), time.perf_counter() - start_time, None),
+            )
+        except Exception:
+            output_queue.put((token, None, None, traceback.format_exc()))
+
+    # ----------------------------------------------------------------------
+
+    resource_limits = ResourceLimits(
+        max_threads=process_context.max_threads,
+        max_http_concurrency=process_context.max_http_concurrency,
+        max_clones=process_context.max_clones,
+    )
+
+    result_cache = process_context.result_cache
+
+    with (
+        resource_limits.Activate(),
+        process_context.duration_history.Activate(),
+        contextlib.nullcontext() if result_cache is None else result_cache.Activate(),
+        (
+            ConditionalRequestCache().Activate()
+            if process_context.use_conditional_request_cache
+            else contextlib.nullcontext()
+        ),
+        ThreadPoolExecutor(max_workers=process_context.num_threads) as executor,
+    ):
+        for content in iter(input_queue.get, None):
+            executor.submit(Evaluate, *pickle.loads(content))  # noqa: S301
+
+
+# ----------------------------------------------------------------------
+def _SerializeResults(
+    module: Module,
+    results: list[list[Module.EvaluateInfo]],
+) -> list[list[tuple[Any, ...]]]:
+    """Convert results to values that can be sent to another process.
+
+    Queries and requirements are identified by their position within the module, which is the same
+    in every process.
+    """
+    serialized_results: list[list[tuple[Any, ...]]] = []
+
+    for query_results in results:
+        serialized_query_results: list[tuple[Any, ...]] = []
+
+        for result in query_results:
+            query_index = next(index for index, query in enumerate(module.queries) if query is result.query)
+            requirement_index = next(
+                index
+                for index, requirement in enumerate(result.query.requirements)
+                if requirement is result.requirement
+            )
+
+            serialized_query_results.append(
+                (
+                    query_index,
+                    requirement_index,
+                    result.result,
+                    result.context,
+                    result.resolution,
+                    result.rationale,
+                    result.description,
+                ),
+            )
+
+        serialized_results.append(serialized_query_results)
+
+    return serialized_results
+
+
+# ----------------------------------------------------------------------
+def _DeserializeResults(
+    module_info: ModuleInfo,
+    serialized_results: list[list[tuple[Any, ...]]],
+) -> list[list[Module.EvaluateInfo]]:
+    """Convert values created by `_SerializeResults` to results."""
+    module = module_info.module
+
+    results: list[list[Module.EvaluateInfo]] = []
+
+    for serialized_query_results in serialized_results:
+        query_results: list[Module.EvaluateInfo] = []
+
+        for (
+            query_index,
+            requirement_index,
+            result,
+            context,
+            resolution,
+            rationale,
+            description,
+        ) in serialized_query_results:
+            query = module.queries[query_index]
+
+            query_results.append(
+                Module.EvaluateInfo(
+                    result,
+                    context,
+                    resolution,
+                    rationale,
+                    query.requirements[requirement_index],
+                    query,
+                    module,
+                    description=description,
+                    repository=module_info.repository,
+                ),
+            )
+
+        results.append(query_results)
+
+    return results
+
+
+# ----------------------------------------------------------------------
+def _ValidateNumProcesses(
+    num_processes: Optional[int],
+) -> None:
+    if num_processes is None:
+        return
+
+    if num_processes < 1:
+        msg = f"The number of processes must be greater than 0 ({num_processes})."
+        raise ValueError(msg)
+
+
 # ----------------------------------------------------------------------
 def _CreateStatusString(
     num_success: int,
@@ -0,0 +1,155 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Contains the ConditionalRequestCache object."""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+# ----------------------------------------------------------------------
+class ConditionalRequestCache:
+    """Responses to GET requests that are revalidated with the server using their ETags.
+
+    When a request is sent again, the ETag of the cached response is sent in the `If-None-Match`
+    header; if the content has not changed, the server responds with 304 (Not Modified) and the
+    cached response is used. GitHub does not count these responses against the rate limit (see
+    https://docs.github.com/en/rest/using-the-rest-api/best-practices-for-using-the-rest-api#use-conditional-requests-if-appropriate).
+
+    Responses are held in memory, so the cache is only useful when the same requests are sent
+    multiple times within a process (for example, when repositories are audited repeatedly).
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, Optional[str]], _Entry] = {}
+        self._num_not_modified = 0
+        self._lock = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_not_modified(self) -> int:
+        """Number of requests whose cached responses were used because their content had not changed."""
+        with self._lock:
+            return self._num_not_modified
+
+    # ----------------------------------------------------------------------
+    def GetRequestHeaders(
+        self,
+        key: tuple[str, Optional[str]],  # (URL, including query parameters; credentials)
+    ) -> dict[str, str]:
+        """Return the headers that make the request conditional on the content having changed since it was cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None:
+            return {}
+
+        return {"If-None-Match": entry.etag}
+
+    # ----------------------------------------------------------------------
+    def ProcessResponse(
+        self,
+        key: tuple[str, Optional[str]],  # (URL, including query parameters; credentials)
+        response: requests.Response,
+    ) -> requests.Response:
+        """Return the cached response if the content has not changed, otherwise cache the response (if possible) and return it."""
+        with self._lock:
+            if response.status_code == requests.codes.NOT_MODIFIED:
+                entry = self._entries.get(key)
+
+                if entry is not None:
+                    self._num_not_modified += 1
+                    return entry.CreateResponse(response)
+
+            etag = response.headers.get("etag")
+
+            if response.status_code == requests.codes.OK and etag:
+                self._entries[key] = _Entry(
+                    etag,
+                    response.status_code,
+                    dict(response.headers),
+                    response.content,
+                    response.encoding,
+                    response.url,
+                )
+            else:
+                self._entries.pop(key, None)
+
+        return response
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def Activate(self) -> Iterator["ConditionalRequestCache"]:
+        """Make this cache the active cache for the process."""
+        global _active_cache  # noqa: PLW0603
+
+        prev_cache = _active_cache
+        _active_cache = self
+
+        try:
+            yield self
+        finally:
+            _active_cache = prev_cache
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def GetActive() -> Optional["ConditionalRequestCache"]:
+        """Return the active cache, or None if requests are not conditional."""
+        return _active_cache
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _Entry:
+    """A cached response."""
+
+    etag: str
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    encoding: Optional[str]
+    url: str
+
+    # ----------------------------------------------------------------------
+    def CreateResponse(
+        self,
+        not_modified_response: requests.Response,
+    ) -> requests.Response:
+        """Create a response with the cached content for a request that was not modified."""
+        response = requests.Response()
+
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content  # noqa: SLF001
+        response.encoding = self.encoding
+        response.url = self.url
+        response.request = not_modified_response.request
+        response.elapsed = not_modified_response.elapsed
+
+        return response
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_active_cache: Optional[ConditionalRequestCache] = None
@@ -0,0 +1,130 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Contains the Deadline object and types used in its definition."""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Optional
+
+
+# ----------------------------------------------------------------------
+class DeadlineExceededError(TimeoutError):
+    """Exception raised when work could not be completed before its deadline."""
+
+
+# ----------------------------------------------------------------------
+class Deadline:
+    """Point in time by which work must be complete.
+
+    A deadline without an expiration never expires. Deadlines can be activated for the current
+    thread so that code deep within a Query (for example, HTTP requests or subprocesses) can
+    bound the time it waits without the deadline being passed explicitly.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        expiration: Optional[float],  # Value compatible with `time.monotonic()`; None to never expire
+    ) -> None:
+        self.expiration = expiration
+
+    # ----------------------------------------------------------------------
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Recreate the deadline when it is sent to another process (for example, when `--processes` is used).
+
+        The expiration is relative to a clock that may not be shared with the other process, so the
+        deadline is recreated from the number of seconds remaining when it is sent.
+        """
+        return Deadline.Create, (self.remaining,)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Create(
+        cls,
+        seconds: Optional[float],
+    ) -> "Deadline":
+        """Create a deadline that expires `seconds` from now (or never if `seconds` is None)."""
+        if seconds is None:
+            return cls(None)
+
+        return cls(time.monotonic() + seconds)
+
+    # ----------------------------------------------------------------------
+    def CreateChild(
+        self,
+        seconds: Optional[float],
+    ) -> "Deadline":
+        """Create a deadline that expires `seconds` from now or when this deadline expires, whichever is first."""
+        child = Deadline.Create(seconds)
+
+        if child.expiration is None:
+            return Deadline(self.expiration)
+        if self.expiration is None:
+            return child
+
+        return Deadline(min(self.expiration, child.expiration))
+
+    # ----------------------------------------------------------------------
+    @property
+    def remaining(self) -> Optional[float]:
+        """Seconds remaining before the deadline expires, or None if the deadline never expires."""
+        if self.expiration is None:
+            return None
+
+        return max(0.0, self.expiration - time.monotonic())
+
+    # ----------------------------------------------------------------------
+    @property
+    def is_expired(self) -> bool:
+        """True if the deadline has expired."""
+        return self.expiration is not None and time.monotonic() >= self.expiration
+
+    # ----------------------------------------------------------------------
+    def GetTimeout(self) -> Optional[float]:
+        """Return the timeout value to use for a blocking operation, or None if the operation may wait indefinitely.
+
+        Raises DeadlineExceededError if the deadline has already expired.
+        """
+        remaining = self.remaining
+
+        if remaining is not None and remaining <= 0:
+            msg = "The deadline expired before the operation could be started."
+            raise DeadlineExceededError(msg)
+
+        return remaining
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def Activate(self) -> Iterator["Deadline"]:
+        """Make this deadline the active deadline for the current thread."""
+        prev_deadline = getattr(_thread_data, "deadline", None)
+        _thread_data.deadline = self
+
+        try:
+            yield self
+        finally:
+            _thread_data.deadline = prev_deadline
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def GetActive() -> Optional["Deadline"]:
+        """Return the deadline active for the current thread (if any)."""
+        return getattr(_thread_data, "deadline", None)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_thread_data = threading.local()
@@ -0,0 +1,151 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Contains the DurationHistory object."""
+
+import json
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional
+
+
+# ----------------------------------------------------------------------
+class DurationHistory:
+    """Durations observed when evaluating modules and queries, used to schedule the slowest work first.
+
+    Durations are smoothed with an exponential moving average so that a single slow (or fast) run
+    does not dominate the estimate. The history is optionally persisted to a JSON file so that
+    estimates are available across invocations.
+    """
+
+    SMOOTHING_FACTOR = 0.5
+    VERSION = 1
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        durations: Optional[dict[str, float]] = None,
+        filename: Optional[Path] = None,  # File used to persist the durations; None to keep them in memory
+    ) -> None:
+        self.filename = filename
+
+        self._durations: dict[str, float] = dict(durations or {})
+        self._lock = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Copy the durations when the history is sent to another process (for example, when `--processes` is used).
+
+        The copy is not associated with the file, as only this process saves the history.
+        """
+        with self._lock:
+            return DurationHistory, (dict(self._durations),)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Load(
+        cls,
+        filename: Path,
+    ) -> "DurationHistory":
+        """Load the history from the file; an empty history is returned if the file does not exist or is not valid."""
+        durations: dict[str, float] = {}
+
+        if filename.is_file():
+            try:
+                content = json.loads(filename.read_text(encoding="UTF-8"))
+
+                if isinstance(content, dict) and content.get("version") == cls.VERSION:
+                    durations = {
+                        key: float(value)
+                        for key, value in content.get("durations", {}).items()
+                        if isinstance(value, (int, float)) and value >= 0
+                    }
+            except (OSError, ValueError):
+                # A history that cannot be read is not an error; the history is only used as an
+                # optimization and will be overwritten when saved.
+                pass
+
+        return cls(durations, filename)
+
+    # ----------------------------------------------------------------------
+    def Save(self) -> None:
+        """Persist the history to its file (if any)."""
+        if self.filename is None:
+            return
+
+        with self._lock:
+            content = {
+                "version": self.VERSION,
+                "durations": dict(sorted(self._durations.items())),
+            }
+
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+        self.filename.write_text(json.dumps(content, indent=2) + "\n", encoding="UTF-8")
+
+    # ----------------------------------------------------------------------
+    def Record(
+        self,
+        key: str,
+        seconds: float,
+    ) -> None:
+        """Record the duration observed for the key."""
+        with self._lock:
+            prev_seconds = self._durations.get(key)
+
+            if prev_seconds is None:
+                self._durations[key] = seconds
+            else:
+                self._durations[key] = (
+                    self.SMOOTHING_FACTOR * seconds + (1 - self.SMOOTHING_FACTOR) * prev_seconds
+                )
+
+    # ----------------------------------------------------------------------
+    def GetEstimate(
+        self,
+        *keys: str,
+    ) -> Optional[float]:
+        """Return the estimated duration of the first key with a history (if any)."""
+        with self._lock:
+            for key in keys:
+                seconds = self._durations.get(key)
+                if seconds is not None:
+                    return seconds
+
+        return None
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def Activate(self) -> Iterator["DurationHistory"]:
+        """Make this history the active history for the process."""
+        global _active_history  # noqa: PLW0603
+
+        prev_history = _active_history
+        _active_history = self
+
+        try:
+            yield self
+        finally:
+            _active_history = prev_history
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def GetActive() -> "DurationHistory":
+        """Return the active history; an empty history is returned if none is active."""
+        return _active_history
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_active_history = DurationHistory()
@@ -34,8 +34,14 @@ def ParallelSequentialProcessor(
     dm: Optional[DoneManager] = None,
     *,
     max_num_threads: Optional[int] = None,
+    cost_func: Optional[Callable[[ItemType], float]] = None,
 ) -> list[OutputType]:
-    """Process a list of items in parallel and/or sequentially."""
+    """Process a list of items in parallel and/or sequentially.
+
+    When `cost_func` is provided, items that can be run in parallel are started in order of
+    decreasing estimated cost (longest-processing-time-first) so that the most expensive items do
+    not delay completion by starting last. Results are always returned in the original order.
+    """
     if dm is None:
         with DoneManager.Create(StreamDecorator(None), "", line_prefix="") as _dm:
             return _Impl(
@@ -43,6 +49,7 @@ def ParallelSequentialProcessor(
                 items,
                 calculate_result_func,
                 max_num_threads,
+                cost_func,
             )
 
     return _Impl(
@@ -50,6 +57,7 @@ def ParallelSequentialProcessor(
         items,
         calculate_result_func,
         max_num_threads,
+        cost_func,
     )
 
 
@@ -61,6 +69,7 @@ def _Impl(
     items: list[ItemType],
     calculate_result_func: Callable[[ItemType], tuple[int, OutputType]],
     max_num_threads: Optional[int],
+    cost_func: Optional[Callable[[ItemType], float]],
 ) -> list[OutputType]:
     # Divide the items into those that can be run in parallel and those that must be run sequentially
     parallel: list[tuple[int, ItemType]] = []
@@ -80,6 +89,9 @@ def _Impl(
         sequential.append(parallel[0])
         parallel = []
 
+    if cost_func is not None:
+        parallel.sort(key=lambda value: cost_func(value[1]), reverse=True)
+
     # Calculate the results
     results: list[Optional[OutputType]] = [None] * len(items)
 
@@ -0,0 +1,481 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Contains the ResourceLimits object and types used in its definition."""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
+from typing import Optional
+
+from RepoAuditor.Impl.Deadline import Deadline, DeadlineExceededError
+
+
+# ----------------------------------------------------------------------
+class Limiter:
+    """Limits the number of concurrent operations; a limiter without a maximum value never blocks."""
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        name: str,
+        max_value: Optional[int],  # None to allow an unlimited number of concurrent operations
+    ) -> None:
+        if max_value is not None and max_value < 1:
+            msg = f"The maximum value for '{name}' must be greater than 0."
+            raise ValueError(msg)
+
+        self.name = name
+        self.max_value = max_value
+
+        self._semaphore = None if max_value is None else threading.BoundedSemaphore(max_value)
+
+        # The number of slots held by each thread
+        self._thread_data = threading.local()
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def Acquire(self) -> Iterator[None]:
+        """Wait for an available slot, bounded by the deadline active for the current thread (if any)."""
+        if self._semaphore is None:
+            yield
+            return
+
+        self._AcquireSlot()
+
+        try:
+            yield
+        finally:
+            # The slot is not held if it could not be acquired again after being suspended
+            if self._GetNumHeld():
+                self._thread_data.num_held -= 1
+                self._semaphore.release()
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def Suspend(self) -> Iterator[None]:
+        """Release the slots held by the current thread while it waits for something else (so that other threads can use them), and wait for them again afterwards."""
+        num_held = self._GetNumHeld()
+
+        if self._semaphore is None or num_held == 0:
+            yield
+            return
+
+        self._thread_data.num_held = 0
+
+        for _ in range(num_held):
+            self._semaphore.release()
+
+        try:
+            yield
+        finally:
+            for _ in range(num_held):
+                self._AcquireSlot()
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _GetNumHeld(self) -> int:
+        return getattr(self._thread_data, "num_held", 0)
+
+    # ----------------------------------------------------------------------
+    def _AcquireSlot(self) -> None:
+        assert self._semaphore is not None
+
+        deadline = Deadline.GetActive()
+        timeout = None if deadline is None else deadline.GetTimeout()
+
+        if not self._semaphore.acquire(timeout=timeout):
+            msg = f"A slot for '{self.name}' was not available before the deadline expired."
+            raise DeadlineExceededError(msg)
+
+        self._thread_data.num_held = self._GetNumHeld() + 1
+
+
+# ----------------------------------------------------------------------
+class AdaptiveLimiter:
+    """Limits the number of concurrent operations, adjusting the limit based on observed behavior.
+
+    The limit is adjusted using additive-increase/multiplicative-decrease (AIMD): it grows by
+    roughly one slot for each limit's worth of operations that complete without incident, and is
+    halved when an operation is throttled or its latency spikes well above the typical latency.
+    Congestion signals from operations started before the most recent decrease are ignored, as
+    those operations were started under the previous (higher) limit.
+
+    Operations can also indicate that the server's rate limit has been exhausted, in which case new
+    operations are paused until the server indicates that the limit will be reset.
+    """
+
+    INITIAL_VALUE = 4
+    DEFAULT_MAX_VALUE = 32
+
+    DECREASE_FACTOR = 0.5
+    LATENCY_SPIKE_FACTOR = 3.0
+    LATENCY_SMOOTHING_FACTOR = 0.1
+    MIN_LATENCY_SAMPLES = 5
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class Summary:
+        """Summary of the limiter's behavior."""
+
+        limit: int
+        max_in_flight: int
+        num_operations: int
+        num_throttled: int
+
+        # Number of requests remaining before the server's rate limit is exhausted (if reported)
+        rate_limit_remaining: Optional[int] = field(kw_only=True, default=None)
+
+        # Number of times that operations were paused because the server's rate limit was exhausted
+        num_paused: int = field(kw_only=True, default=0)
+
+    # ----------------------------------------------------------------------
+    class Operation:
+        """Operation performed while holding a slot."""
+
+        # ----------------------------------------------------------------------
+        def __init__(self) -> None:
+            self.start_time = time.monotonic()
+            self.is_throttled = False
+            self.rate_limit_remaining: Optional[int] = None
+            self.pause_seconds: Optional[float] = None
+
+        # ----------------------------------------------------------------------
+        def MarkThrottled(self) -> None:
+            """Indicate that the operation was throttled by the server."""
+            self.is_throttled = True
+
+        # ----------------------------------------------------------------------
+        def SetRateLimitRemaining(
+            self,
+            value: int,
+        ) -> None:
+            """Indicate the number of operations that the server will accept before its rate limit is exhausted."""
+            self.rate_limit_remaining = value
+
+        # ----------------------------------------------------------------------
+        def PauseFor(
+            self,
+            seconds: float,
+        ) -> None:
+            """Indicate that the server will not accept operations for the provided number of seconds."""
+            self.pause_seconds = max(self.pause_seconds or 0.0, seconds)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        name: str,
+        max_value: Optional[int],  # None to use DEFAULT_MAX_VALUE
+    ) -> None:
+        if max_value is not None and max_value < 1:
+            msg = f"The maximum value for '{name}' must be greater than 0."
+            raise ValueError(msg)
+
+        self.name = name
+        self.max_value = max_value or self.DEFAULT_MAX_VALUE
+
+        self._condition = threading.Condition()
+
+        self._limit = float(min(self.INITIAL_VALUE, self.max_value))
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._num_operations = 0
+        self._num_throttled = 0
+        self._latency: Optional[float] = None
+        self._num_latency_samples = 0
+        self._last_decrease_time: Optional[float] = None
+        self._rate_limit_remaining: Optional[int] = None
+        self._paused_until: Optional[float] = None
+        self._num_paused = 0
+
+    # ----------------------------------------------------------------------
+    @property
+    def limit(self) -> int:
+        """Number of operations currently allowed to run concurrently."""
+        with self._condition:
+            return int(self._limit)
+
+    # ----------------------------------------------------------------------
+    def GetSummary(self) -> "AdaptiveLimiter.Summary":
+        """Return a summary of the limiter's behavior."""
+        with self._condition:
+            return AdaptiveLimiter.Summary(
+                int(self._limit),
+                self._max_in_flight,
+                self._num_operations,
+                self._num_throttled,
+                rate_limit_remaining=self._rate_limit_remaining,
+                num_paused=self._num_paused,
+            )
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def Acquire(
+        self,
+        *,
+        pause_context_func: Optional[Callable[[], AbstractContextManager[None]]] = None,
+    ) -> Iterator["AdaptiveLimiter.Operation"]:
+        """Wait for an available slot, bounded by the deadline active for the current thread (if any).
+
+        The context returned by `pause_context_func` (if provided) is active while waiting for a pause
+        to end; it can be used to release other resources held by the thread (for example, a worker
+        slot) so that they can be used for operations that are not paused.
+        """
+        deadline = Deadline.GetActive()
+
+        with self._condition:
+            while True:
+                pause_seconds = self._GetPauseSeconds()
+
+                if pause_seconds is None and self._in_flight < int(self._limit):
+                    break
+
+                timeout = None if deadline is None else deadline.GetTimeout()
+
+                if pause_seconds is not None:
+                    timeout = pause_seconds if timeout is None else min(timeout, pause_seconds)
+
+                    if pause_context_func is not None:
+                        # Other resources may not be available immediately once the pause ends, so
+                        # the lock is not held while they are released and acquired again.
+                        self._condition.release()
+
+                        try:
+                            with pause_context_func():
+                                time.sleep(timeout)
+                        finally:
+                            self._condition.acquire()
+
+                        if deadline is not None and deadline.is_expired:
+                            msg = f"A slot for '{self.name}' was not available before the deadline expired."
+                            raise DeadlineExceededError(msg)
+
+                        continue
+
+                if not self._condition.wait(timeout) and deadline is not None and deadline.is_expired:
+                    msg = f"A slot for '{self.name}' was not available before the deadline expired."
+                    raise DeadlineExceededError(msg)
+
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+
+        operation = AdaptiveLimiter.Operation()
+        succeeded = False
+
+        try:
+            yield operation
+            succeeded = True
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+
+                if succeeded:
+                    self._OnComplete(operation, time.monotonic() - operation.start_time)
+
+                self._condition.notify_all()
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _GetPauseSeconds(self) -> Optional[float]:
+        """Return the number of seconds remaining before operations can resume, or None if operations are not paused."""
+        # The lock is held by the caller
+        if self._paused_until is None:
+            return None
+
+        pause_seconds = self._paused_until - time.monotonic()
+        if pause_seconds <= 0:
+            self._paused_until = None
+            return None
+
+        return pause_seconds
+
+    # ----------------------------------------------------------------------
+    def _OnComplete(
+        self,
+        operation: "AdaptiveLimiter.Operation",
+        latency: float,
+    ) -> None:
+        # The lock is held by the caller
+        self._num_operations += 1
+
+        if operation.rate_limit_remaining is not None:
+            self._rate_limit_remaining = operation.rate_limit_remaining
+
+        if operation.pause_seconds is not None and operation.pause_seconds > 0:
+            paused_until = time.monotonic() + operation.pause_seconds
+
+            if self._paused_until is None or paused_until > self._paused_until:
+                if self._paused_until is None:
+                    self._num_paused += 1
+
+                self._paused_until = paused_until
+
+        is_latency_spike = (
+            self._latency is not None
+            and self._num_latency_samples >= self.MIN_LATENCY_SAMPLES
+            and latency > self._latency * self.LATENCY_SPIKE_FACTOR
+        )
+
+        if operation.is_throttled:
+            self._num_throttled += 1
+
+        if operation.is_throttled or is_latency_spike:
+            if self._last_decrease_time is None or operation.start_time >= self._last_decrease_time:
+                self._limit = max(1.0, self._limit * self.DECREASE_FACTOR)
+                self._last_decrease_time = time.monotonic()
+
+            return
+
+        # Only latencies of operations that were not throttled contribute to the typical latency
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += self.LATENCY_SMOOTHING_FACTOR * (latency - self._latency)
+
+        self._num_latency_samples += 1
+
+        self._limit = min(float(self.max_value), self._limit + 1.0 / self._limit)
+
+
+# ----------------------------------------------------------------------
+class ResourceLimits:
+    """Limits on the resources consumed while evaluating modules.
+
+    Limits are activated for the entire process (rather than for a single thread) so that they are
+    honored by work performed in any of the threads created while evaluating modules, queries, and
+    requirements.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        *,
+        max_threads: Optional[int] = None,
+        max_http_concurrency: Optional[int] = None,
+        max_clones: Optional[int] = None,
+    ) -> None:
+        if max_http_concurrency is not None and max_http_concurrency < 1:
+            msg = "The maximum value for 'HTTP requests' must be greater than 0."
+            raise ValueError(msg)
+
+        self.max_threads = max_threads
+        self.max_http_concurrency = max_http_concurrency
+        self.max_clones = max_clones
+
+        self._worker_limiter = Limiter("threads", max_threads)
+        self._clone_limiter = Limiter("clones", max_clones)
+
+        # HTTP limiters are created on demand for each host
+        self._http_limiters: dict[str, AdaptiveLimiter] = {}
+        self._http_limiters_lock = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    def GetDescription(self) -> str:
+        """Return a description of the limits suitable for display."""
+
+        # ----------------------------------------------------------------------
+        def ToString(value: Optional[int]) -> str:
+            return "unlimited" if value is None else str(value)
+
+        # ----------------------------------------------------------------------
+
+        return "Threads per level: {}, HTTP requests per host: adaptive (maximum of {}), Clones: {}".format(
+            ToString(self.max_threads),
+            self.max_http_concurrency or AdaptiveLimiter.DEFAULT_MAX_VALUE,
+            ToString(self.max_clones),
+        )
+
+    # ----------------------------------------------------------------------
+    def AcquireWorker(self) -> AbstractContextManager[None]:
+        """Wait for a worker slot; used when retrieving data so that the number of threads retrieving data across the process is bounded."""
+        return self._worker_limiter.Acquire()
+
+    # ----------------------------------------------------------------------
+    def AcquireHttp(
+        self,
+        host: str,
+    ) -> AbstractContextManager[AdaptiveLimiter.Operation]:
+        """Wait for a slot to send an HTTP request to the host.
+
+        The number of concurrent requests sent to the host is adjusted based on the latency of
+        previous requests and whether they were throttled (as indicated by calling `MarkThrottled`
+        on the returned operation). While requests to the host are paused because its rate limit was
+        exhausted, the worker slot held by the thread (if any) is released so that a throttled host
+        does not prevent data from being retrieved from other hosts.
+        """
+        host = host.lower()
+
+        with self._http_limiters_lock:
+            limiter = self._http_limiters.get(host)
+
+            if limiter is None:
+                limiter = AdaptiveLimiter(f"HTTP requests to {host}", self.max_http_concurrency)
+                self._http_limiters[host] = limiter
+
+        return limiter.Acquire(pause_context_func=self._worker_limiter.Suspend)
+
+    # ----------------------------------------------------------------------
+    def GetHttpSummaries(self) -> dict[str, AdaptiveLimiter.Summary]:
+        """Return a summary of the HTTP requests sent to each host."""
+        with self._http_limiters_lock:
+            return {host: limiter.GetSummary() for host, limiter in self._http_limiters.items()}
+
+    # ----------------------------------------------------------------------
+    def AcquireClone(self) -> AbstractContextManager[None]:
+        """Wait for a slot to clone a repository."""
+        return self._clone_limiter.Acquire()
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def Activate(self) -> Iterator["ResourceLimits"]:
+        """Make these limits the active limits for the process."""
+        global _active_limits  # noqa: PLW0603
+
+        prev_limits = _active_limits
+        _active_limits = self
+
+        try:
+            yield self
+        finally:
+            _active_limits = prev_limits
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def GetActive() -> "ResourceLimits":
+        """Return the active limits; limits that do not restrict any resources are returned if none are active."""
+        return _active_limits
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_active_limits = ResourceLimits()
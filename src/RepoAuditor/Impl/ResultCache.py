@@ -0,0 +1,188 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Contains the ResultCache object."""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional
+
+
+# ----------------------------------------------------------------------
+class ResultCache:
+    """Results of evaluating requirements, keyed by a fingerprint of the values that determined them.
+
+    A requirement whose fingerprint matches a cached result does not need to be evaluated again. The
+    cache is optionally persisted to a JSON file so that results are reused across invocations;
+    results that have not been used within `MAX_UNUSED_SECONDS` are discarded when it is saved.
+    """
+
+    MAX_UNUSED_SECONDS = 30 * 24 * 60 * 60
+    VERSION = 1
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        entries: Optional[dict[str, dict[str, Any]]] = None,
+        filename: Optional[Path] = None,  # File used to persist the results; None to keep them in memory
+    ) -> None:
+        self.filename = filename
+
+        # Each entry contains the cached values and the time at which they were last used
+        self._entries: dict[str, dict[str, Any]] = dict(entries or {})
+        self._num_hits = 0
+        self._lock = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Copy the entries when the cache is sent to another process (for example, when `--processes` is used).
+
+        The copy is not associated with the file, so results cached by the other process are not persisted.
+        """
+        return ResultCache, (self._CopyEntries(),)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Load(
+        cls,
+        filename: Path,
+    ) -> "ResultCache":
+        """Load the cache from the file; an empty cache is returned if the file does not exist or is not valid."""
+        entries: dict[str, dict[str, Any]] = {}
+
+        if filename.is_file():
+            try:
+                content = json.loads(filename.read_text(encoding="UTF-8"))
+
+                if isinstance(content, dict) and content.get("version") == cls.VERSION:
+                    entries = {
+                        fingerprint: entry
+                        for fingerprint, entry in content.get("entries", {}).items()
+                        if isinstance(entry, dict)
+                        and isinstance(entry.get("values"), dict)
+                        and isinstance(entry.get("last_used"), (int, float))
+                    }
+            except (OSError, ValueError):
+                # A cache that cannot be read is not an error; the cache is only used as an
+                # optimization and will be overwritten when saved.
+                pass
+
+        return cls(entries, filename)
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_hits(self) -> int:
+        """Number of times that cached values were returned."""
+        with self._lock:
+            return self._num_hits
+
+    # ----------------------------------------------------------------------
+    def Save(self) -> None:
+        """Persist the cache to its file (if any)."""
+        if self.filename is None:
+            return
+
+        content = {
+            "version": self.VERSION,
+            "entries": dict(sorted(self._CopyEntries(time.time() - self.MAX_UNUSED_SECONDS).items())),
+        }
+
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+        self.filename.write_text(json.dumps(content, indent=2) + "\n", encoding="UTF-8")
+
+    # ----------------------------------------------------------------------
+    def Get(
+        self,
+        fingerprint: str,
+    ) -> Optional[dict[str, Any]]:
+        """Return the values cached for the fingerprint (if any); values recorded as functions are returned as functions."""
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is None:
+                return None
+
+            entry["last_used"] = time.time()
+            self._num_hits += 1
+
+            return entry["values"]
+
+    # ----------------------------------------------------------------------
+    def Record(
+        self,
+        fingerprint: str,
+        values: dict[str, Any],  # Must be serializable as JSON or functions that return such values
+    ) -> None:
+        """Cache the values for the fingerprint.
+
+        Values that are expensive to create (and may not be needed) can be provided as functions;
+        the functions are called when the cache is saved or sent to another process.
+        """
+        with self._lock:
+            self._entries[fingerprint] = {
+                "values": values,
+                "last_used": time.time(),
+            }
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def Activate(self) -> Iterator["ResultCache"]:
+        """Make this cache the active cache for the process."""
+        global _active_cache  # noqa: PLW0603
+
+        prev_cache = _active_cache
+        _active_cache = self
+
+        try:
+            yield self
+        finally:
+            _active_cache = prev_cache
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def GetActive() -> Optional["ResultCache"]:
+        """Return the active cache, or None if results are not cached."""
+        return _active_cache
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _CopyEntries(
+        self,
+        min_last_used: Optional[float] = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Return a copy of the entries (used since `min_last_used`, if provided) whose values recorded as functions have been created."""
+        with self._lock:
+            entries = {
+                fingerprint: dict(entry)
+                for fingerprint, entry in self._entries.items()
+                if min_last_used is None or entry["last_used"] >= min_last_used
+            }
+
+        # Create the values outside of the lock, as doing so may be expensive
+        for entry in entries.values():
+            entry["values"] = {
+                key: value() if callable(value) else value for key, value in entry["values"].items()
+            }
+
+        return entries
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_active_cache: Optional[ResultCache] = None
@@ -0,0 +1,101 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Contains the Shard object."""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urlparse
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class Shard:
+    """Portion of the repositories being audited, used to split an audit across independent processes.
+
+    Repositories are assigned to shards based on a stable hash of their owner and name, so every
+    process that audits a shard of the same set of repositories agrees on the assignment without any
+    coordination.
+    """
+
+    index: int  # 1-based
+    count: int
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __post_init__(self) -> None:
+        """Validate the shard."""
+        if self.count < 1:
+            msg = f"The number of shards must be greater than 0 ({self.count})."
+            raise ValueError(msg)
+
+        if not 1 <= self.index <= self.count:
+            msg = f"The shard index must be between 1 and {self.count} ({self.index})."
+            raise ValueError(msg)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def FromString(
+        cls,
+        value: str,
+    ) -> "Shard":
+        """Create a shard from a string in the form '<index>/<count>' (for example, '2/4')."""
+        match = _SHARD_REGEX.fullmatch(value.strip())
+        if match is None:
+            msg = f"'{value}' is not a valid shard; shards are specified as '<index>/<count>' (for example, '1/4')."
+            raise ValueError(msg)
+
+        return cls(int(match.group("index")), int(match.group("count")))
+
+    # ----------------------------------------------------------------------
+    def Contains(
+        self,
+        repository: Optional[str],
+    ) -> bool:
+        """Return True if the repository is assigned to this shard.
+
+        Modules that do not evaluate a named repository are assigned to the first shard so that they
+        are evaluated exactly once across all of the shards.
+        """
+        if repository is None:
+            return self.index == 1
+
+        digest = hashlib.sha256(GetShardKey(repository).encode("UTF-8")).digest()
+
+        return int.from_bytes(digest[:8], "big") % self.count == self.index - 1
+
+
+# ----------------------------------------------------------------------
+def GetShardKey(
+    repository: str,
+) -> str:
+    """Return the value used to assign the repository to a shard.
+
+    The key is the lowercase '<owner>/<name>' portion of a repository URL (or the repository itself
+    if it isn't a URL), so the assignment does not depend on the URL scheme, a trailing '.git', or
+    the case used when the repository was specified. The branches of a repository (for example,
+    '<url>/tree/<branch>') have the same key as the repository, so that a repository and its branches
+    are assigned to the same shard.
+    """
+    parse_result = urlparse(repository)
+
+    key = parse_result.path if parse_result.netloc else repository
+    key = key.strip("/").split("/tree/", 1)[0].removesuffix(".git")
+
+    return key.lower()
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_SHARD_REGEX = re.compile(r"(?P<index>\d+)\s*/\s*(?P<count>\d+)")
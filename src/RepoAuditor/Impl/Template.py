@@ -0,0 +1,145 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Contains the Template object."""
+
+import re
+import string
+from collections.abc import Callable, Mapping
+from functools import partial
+from typing import Any
+
+
+# ----------------------------------------------------------------------
+class Template:
+    """A `str.format` template that is parsed once and rendered from only the values that it references.
+
+    Rendered strings are memoized on the referenced values when they are all simple (str, int,
+    bool, or None) values, so rendering the same template with the same values (for example,
+    a description that references the name of the organization for each repository in that
+    organization) formats the string once.
+    """
+
+    MAX_NUM_RENDERED = 1024
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        text: str,
+    ) -> None:
+        field_names: list[str] = []
+
+        _Parse(text, field_names)
+
+        root_names: list[str] = []
+
+        for field_name in field_names:
+            root_name = _ROOT_NAME_REGEX.match(field_name).group()  # type: ignore[union-attr]
+
+            if not root_name or root_name.isdigit():
+                msg = f"The template '{text}' contains positional fields."
+                raise ValueError(msg)
+
+            if root_name not in root_names:
+                root_names.append(root_name)
+
+        self.text = text
+
+        # The fields referenced by the template (for example, "repo.name" or "items[0]"), in the
+        # order in which they appear
+        self.field_names: tuple[str, ...] = tuple(field_names)
+
+        # The names of the values used to render the template (for example, "repo" or "items")
+        self.root_names: tuple[str, ...] = tuple(root_names)
+
+        self._rendered: dict[tuple[Any, ...], str] = {}
+
+    # ----------------------------------------------------------------------
+    def Render(
+        self,
+        values: Mapping[str, Any],
+    ) -> str:
+        """Render the template; raises the same exceptions as `str.format_map` when values are missing or invalid."""
+        return self.Bind(values)()
+
+    # ----------------------------------------------------------------------
+    def Bind(
+        self,
+        values: Mapping[str, Any],
+    ) -> Callable[[], str]:
+        """Return a function that renders the template when called.
+
+        The referenced values are retrieved immediately (so that missing values are detected and
+        other values are not kept alive), but the string is not formatted until it is needed.
+        """
+        # KeyError is raised for missing values, as it is by `str.format_map`
+        return partial(self._Render, {name: values[name] for name in self.root_names})
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _Render(
+        self,
+        template_values: dict[str, Any],
+    ) -> str:
+        key: Any = tuple((type(value), value) for value in template_values.values())
+
+        if not all(key_type in _MEMOIZED_TYPES for key_type, _ in key):
+            key = None
+        else:
+            result = self._rendered.get(key)
+            if result is not None:
+                return result
+
+        result = self.text.format_map(template_values)
+
+        if key is not None:
+            if len(self._rendered) >= self.MAX_NUM_RENDERED:
+                self._rendered.clear()
+
+            self._rendered[key] = result
+
+        return result
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Parse(
+    text: str,
+    field_names: list[str],
+) -> None:
+    """Append the names of the fields referenced by the text (including fields nested in format specifications) that have not been seen."""
+    for _, field_name, format_spec, _ in _FORMATTER.parse(text):
+        if field_name is None:
+            continue
+
+        if field_name not in field_names:
+            field_names.append(field_name)
+
+        if format_spec and "{" in format_spec:
+            _Parse(format_spec, field_names)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_ROOT_NAME_REGEX = re.compile(r"[^.\[]*")
+
+# Types whose values are formatted the same way whenever they compare as equal. The type is part of
+# the key, as `1` and `True` compare as equal but are formatted differently; floats are not memoized,
+# as `0.0` and `-0.0` compare as equal but are formatted differently.
+_MEMOIZED_TYPES = frozenset([str, int, bool, type(None)])
+
+_FORMATTER = string.Formatter()
@@ -0,0 +1,196 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Contains the IncrementalState object."""
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from RepoAuditor import __version__
+from RepoAuditor.ExecuteModules import ModuleInfo, ModuleResult
+from RepoAuditor.JsonOutput import CreateRecord, CreateResults
+from RepoAuditor.Module import Module
+
+
+# ----------------------------------------------------------------------
+class IncrementalState:
+    """State of each repository when it was last audited, used to skip repositories that have not changed.
+
+    The state of a repository is provided by `Module.GetRepositoryState`. When the state of a
+    repository matches the state recorded by a previous audit (and the module's arguments have not
+    changed), the results recorded by that audit are used rather than evaluating the module again.
+    Repositories whose results are older than the maximum staleness are always evaluated, as some
+    changes (for example, to branch protection rules) are not reflected in the state.
+    """
+
+    MAX_UNSEEN_SECONDS = 30 * 24 * 60 * 60
+    VERSION = 1
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        filename: Path,
+        entries: Optional[dict[tuple[str, Optional[str]], dict[str, Any]]] = None,
+    ) -> None:
+        self.filename = filename
+
+        # Each entry contains the state of the repository, a fingerprint of the module's arguments,
+        # the time at which the repository was audited and last seen, and the results of the audit.
+        self._entries: dict[tuple[str, Optional[str]], dict[str, Any]] = dict(entries or {})
+
+        # The current state of repositories that are being evaluated
+        self._pending_states: dict[tuple[str, Optional[str]], dict[str, Any]] = {}
+
+        self._lock = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Load(
+        cls,
+        filename: Path,
+    ) -> "IncrementalState":
+        """Load the state from the file; an empty state is returned if the file does not exist or is not valid."""
+        entries: dict[tuple[str, Optional[str]], dict[str, Any]] = {}
+
+        if filename.is_file():
+            try:
+                content = json.loads(filename.read_text(encoding="UTF-8"))
+
+                if isinstance(content, dict) and content.get("version") == cls.VERSION:
+                    for entry in content.get("repositories", []):
+                        if (
+                            isinstance(entry, dict)
+                            and isinstance(entry.get("module"), str)
+                            and isinstance(entry.get("state"), dict)
+                            and isinstance(entry.get("audited"), (int, float))
+                            and isinstance(entry.get("record"), dict)
+                        ):
+                            entries[(entry["module"], entry.get("repository"))] = entry
+            except (OSError, ValueError):
+                # A state that cannot be read is not an error; all repositories will be evaluated
+                # and the file will be overwritten when saved.
+                pass
+
+        return cls(filename, entries)
+
+    # ----------------------------------------------------------------------
+    def GetUnchangedResults(
+        self,
+        module_info: ModuleInfo,
+        *,
+        max_staleness: Optional[float] = None,  # Maximum number of seconds since the results were recorded
+        full: bool = False,  # Return None for all repositories while still recording their state
+    ) -> Optional[list[Module.EvaluateInfo]]:
+        """Return the recorded results of the module, or None if the module must be evaluated."""
+        key = (module_info.module.name, module_info.repository)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                entry["last_seen"] = time.time()
+
+        try:
+            state = module_info.module.GetRepositoryState(
+                module_info.dynamic_args,
+                None if entry is None else entry["state"],
+            )
+        except Exception:
+            # The repository must be evaluated if its state cannot be determined
+            state = None
+
+        if state is None:
+            return None
+
+        with self._lock:
+            self._pending_states[key] = state
+
+        if (
+            full
+            or entry is None
+            or entry["state"] != state
+            or entry.get("args") != _CalcArgsFingerprint(module_info)
+            or (max_staleness is not None and time.time() - entry["audited"] > max_staleness)
+        ):
+            return None
+
+        return CreateResults(module_info, entry["record"])
+
+    # ----------------------------------------------------------------------
+    def Record(
+        self,
+        module_result: ModuleResult,
+    ) -> None:
+        """Record the results of a module that was evaluated.
+
+        Results that are not complete (for example, because a query timed out) are not recorded, so
+        the repository is evaluated again by the next audit even if it has not changed.
+        """
+        module_info = module_result.module_info
+        key = (module_info.module.name, module_info.repository)
+
+        with self._lock:
+            state = self._pending_states.pop(key, None)
+
+            if state is None or not module_result.is_complete:
+                # Changes to the repository cannot be detected or the results do not reflect the
+                # repository, so the results cannot be reused
+                self._entries.pop(key, None)
+                return
+
+            now = time.time()
+
+            self._entries[key] = {
+                "module": key[0],
+                "repository": key[1],
+                "state": state,
+                "args": _CalcArgsFingerprint(module_info),
+                "audited": now,
+                "last_seen": now,
+                "record": CreateRecord(module_result),
+            }
+
+    # ----------------------------------------------------------------------
+    def Save(self) -> None:
+        """Persist the state to its file, removing repositories that have not been seen recently (for example, because they were deleted)."""
+        min_last_seen = time.time() - self.MAX_UNSEEN_SECONDS
+
+        with self._lock:
+            content = {
+                "version": self.VERSION,
+                "repositories": [
+                    entry
+                    for entry in self._entries.values()
+                    if entry.get("last_seen", entry["audited"]) >= min_last_seen
+                ],
+            }
+
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+        self.filename.write_text(json.dumps(content) + "\n", encoding="UTF-8")
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _CalcArgsFingerprint(
+    module_info: ModuleInfo,
+) -> str:
+    """Return a fingerprint of the values (other than the repository's state) that determine the results of the module."""
+    content = json.dumps(
+        [__version__, module_info.requirement_args],
+        sort_keys=True,
+        default=str,
+    )
+
+    return hashlib.sha256(content.encode("UTF-8")).hexdigest()
@@ -0,0 +1,160 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Contains the Journal object."""
+
+import json
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Optional
+
+from RepoAuditor.ExecuteModules import ModuleInfo, ModuleResult
+from RepoAuditor.JsonOutput import CreateRecord, CreateResults
+from RepoAuditor.Module import Module
+
+
+# ----------------------------------------------------------------------
+class Journal:
+    """Append-only record of the modules that have been evaluated, used to resume an interrupted audit.
+
+    Each line of the journal is a JSON record (in the format written by `JsonOutput.WriteRecord`) for
+    a module evaluated for a repository. Records are written to disk as soon as each module completes,
+    so only the modules that were being evaluated when the audit was interrupted are evaluated again
+    when it is resumed. Modules whose evaluation did not complete (for example, because a query timed
+    out) are not recorded, so they are also evaluated again.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        filename: Path,
+        records: Optional[dict[tuple[str, Optional[str]], dict[str, Any]]] = None,
+    ) -> None:
+        self.filename = filename
+
+        self._records: dict[tuple[str, Optional[str]], dict[str, Any]] = dict(records or {})
+        self._file: Optional[IO[str]] = None
+        self._lock = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Create(
+        cls,
+        filename: Path,
+    ) -> "Journal":
+        """Create an empty journal, replacing the content of the file if it exists."""
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        filename.write_text("", encoding="UTF-8")
+
+        return cls(filename)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Load(
+        cls,
+        filename: Path,
+    ) -> "Journal":
+        """Load the journal from the file; an empty journal is returned if the file does not exist.
+
+        A partially written record at the end of the file (for example, because the process was
+        terminated while writing it) is removed so that new records can be appended to the file.
+        """
+        if not filename.is_file():
+            return cls.Create(filename)
+
+        content = filename.read_bytes()
+
+        # Only complete lines contain valid records
+        complete_length = content.rfind(b"\n") + 1
+
+        if complete_length != len(content):
+            with filename.open("r+b") as f:
+                f.truncate(complete_length)
+
+        records: dict[tuple[str, Optional[str]], dict[str, Any]] = {}
+
+        for line in content[:complete_length].decode("UTF-8").splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+
+            if not isinstance(record, dict) or "module" not in record:
+                continue
+
+            # Later records replace earlier records for the same module and repository
+            records[(record["module"], record.get("repository"))] = record
+
+        return cls(filename, records)
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_records(self) -> int:
+        """Number of modules recorded in the journal."""
+        with self._lock:
+            return len(self._records)
+
+    # ----------------------------------------------------------------------
+    def GetResults(
+        self,
+        module_info: ModuleInfo,
+    ) -> Optional[list[Module.EvaluateInfo]]:
+        """Return the recorded results of the module, or None if the module must be evaluated.
+
+        A module must be evaluated if it is not in the journal or if its requirements have changed
+        since the journal was written (for example, because different requirements were included).
+        """
+        with self._lock:
+            record = self._records.get((module_info.module.name, module_info.repository))
+
+        if record is None:
+            return None
+
+        return CreateResults(module_info, record)
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def Open(self) -> Iterator["Journal"]:
+        """Open the journal so that records can be appended to it."""
+        with self.filename.open("a", encoding="UTF-8") as f:
+            self._file = f
+
+            try:
+                yield self
+            finally:
+                self._file = None
+
+    # ----------------------------------------------------------------------
+    def Record(
+        self,
+        module_result: ModuleResult,
+    ) -> None:
+        """Append the results of the module to the journal, ensuring that they are written to disk.
+
+        Results that are not complete are not recorded, so the module is evaluated again when the
+        audit is resumed.
+        """
+        if not module_result.is_complete:
+            return
+
+        record = CreateRecord(module_result)
+
+        with self._lock:
+            assert self._file is not None, "The journal must be opened before records are written."
+
+            self._file.write(json.dumps(record, separators=(",", ":")))
+            self._file.write("\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+            self._records[(record["module"], record["repository"])] = record
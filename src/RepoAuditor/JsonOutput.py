@@ -0,0 +1,109 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Contains functionality to write the results of executing modules as JSON.
+
+Results are written as JSON Lines: one JSON object per line for each module evaluated (for each
+repository). Files written by separate invocations (for example, by each shard of an audit that has
+been split across multiple CI jobs) can be merged by concatenating them.
+"""
+
+import json
+from typing import IO, Any, Optional
+
+from RepoAuditor.ExecuteModules import ModuleInfo, ModuleResult
+from RepoAuditor.Module import EvaluateResult, Module
+
+
+# ----------------------------------------------------------------------
+def CreateRecord(
+    module_result: ModuleResult,
+) -> dict[str, Any]:
+    """Create the JSON-serializable record for the results of a module."""
+    return {
+        "repository": module_result.module_info.repository,
+        "module": module_result.module_info.module.name,
+        "requirements": [
+            {
+                "query": result.query.name,
+                "requirement": result.requirement.name,
+                "result": result.result.name,
+                "description": result.description,
+                "context": result.context,
+                "resolution": result.resolution,
+                "rationale": result.rationale,
+            }
+            for result in module_result.results
+        ],
+    }
+
+
+# ----------------------------------------------------------------------
+def WriteRecord(
+    file: IO[str],
+    module_result: ModuleResult,
+) -> None:
+    """Write the record for the results of a module as a single line of JSON."""
+    file.write(json.dumps(CreateRecord(module_result), separators=(",", ":")))
+    file.write("\n")
+
+
+# ----------------------------------------------------------------------
+def CreateResults(
+    module_info: ModuleInfo,
+    record: dict[str, Any],
+) -> Optional[list[Module.EvaluateInfo]]:
+    """Create the results of a module from its record, or return None if the record does not match the module.
+
+    A record does not match the module if the module's requirements have changed since the record
+    was written (for example, because different requirements were included).
+    """
+    module = module_info.module
+
+    if module_info.query_names is None:
+        num_requirements = module.GetNumRequirements()
+    else:
+        num_requirements = sum(
+            len(query.requirements) for query in module.queries if query.name in module_info.query_names
+        )
+
+    record_results = record.get("requirements") or []
+    if record_results and len(record_results) != num_requirements:
+        return None
+
+    results: list[Module.EvaluateInfo] = []
+
+    for record_result in record_results:
+        query = next((query for query in module.queries if query.name == record_result["query"]), None)
+        if query is None:
+            return None
+
+        requirement = next(
+            (
+                requirement
+                for requirement in query.requirements
+                if requirement.name == record_result["requirement"]
+            ),
+            None,
+        )
+        if requirement is None:
+            return None
+
+        results.append(
+            Module.EvaluateInfo(
+                EvaluateResult[record_result["result"]],
+                record_result.get("context"),
+                record_result.get("resolution"),
+                record_result.get("rationale"),
+                requirement,
+                query,
+                module,
+                description=record_result.get("description"),
+                repository=module_info.repository,
+            ),
+        )
+
+    return results
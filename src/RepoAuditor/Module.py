@@ -6,14 +6,21 @@
 # -------------------------------------------------------------------------------
 """Contains the Module object and types used in its definition."""
 
+import copy
 import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Callable, Collection, Iterable, Mapping
+from dataclasses import dataclass, field
 from typing import Any, Optional
 
 from dbrownell_Common.TyperEx import TypeDefinitionItemType  # type: ignore[import-untyped]
+from dbrownell_Common.Types import extension  # type: ignore[import-untyped]
 
+from RepoAuditor.Impl.Deadline import Deadline, DeadlineExceededError
+from RepoAuditor.Impl.DurationHistory import DurationHistory
 from RepoAuditor.Impl.ParallelSequentialProcessor import ParallelSequentialProcessor
+from RepoAuditor.Impl.ResourceLimits import ResourceLimits
 from RepoAuditor.Query import EvaluateResult, ExecutionStyle, OnStatusFunc, Query, StatusInfo
 from RepoAuditor.Requirement import ReturnCode
 
@@ -33,6 +40,21 @@ class Module(ABC):
 
         module: "Module"
 
+        # The repository evaluated when auditing multiple repositories (None when auditing a single repository)
+        repository: Optional[str] = field(kw_only=True, default=None)
+
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class RepositoryInfo:
+        """A repository to evaluate and the dynamic arguments used to evaluate it."""
+
+        name: Optional[str]
+        dynamic_args: dict[str, Any]
+
+        # The queries to evaluate (for example, only the queries that depend on the branch when a
+        # repository is evaluated for multiple branches); None to evaluate all queries
+        query_names: Optional[frozenset[str]] = field(kw_only=True, default=None)
+
     # ----------------------------------------------------------------------
     # |
     # |  Public Methods
@@ -59,35 +81,96 @@ class Module(ABC):
         return sum(len(query.requirements) for query in self.queries)
 
     # ----------------------------------------------------------------------
-    def ProcessRequirements(
+    def EstimateQueryCost(
+        self,
+        query: Query,
+    ) -> float:
+        """Estimate the number of seconds required to retrieve the query's data, based on previous durations when available."""
+        estimate = DurationHistory.GetActive().GetEstimate(self._GetQueryHistoryKey(query))
+        return query.cost_hint if estimate is None else estimate
+
+    # ----------------------------------------------------------------------
+    def EstimateCost(self) -> float:
+        """Estimate the number of seconds required to evaluate the module, based on previous durations when available."""
+        estimate = DurationHistory.GetActive().GetEstimate(self.name)
+        if estimate is not None:
+            return estimate
+
+        return sum(self.EstimateQueryCost(query) for query in self.queries)
+
+    # ----------------------------------------------------------------------
+    def SelectRequirements(
         self,
         included_names: set[str],
         excluded_names: set[str],
-    ) -> None:
-        """Process the requirements to remove invalid requirements and queries."""
-        query_index = 0
+    ) -> dict[str, tuple[str, ...]]:
+        """Return the names of the requirements to evaluate, keyed by the name of their query (in the order in which they are defined).
 
-        while query_index < len(self.queries):
-            query = self.queries[query_index]
+        Requirements that must be explicitly included and have not been, and requirements that are
+        excluded, are omitted; queries without requirements are omitted.
+        """
+        selection: dict[str, tuple[str, ...]] = {}
+
+        for query in self.queries:
+            requirement_names = tuple(
+                requirement.name
+                for requirement in query.requirements
+                if not (
+                    (requirement.requires_explicit_include and requirement.name not in included_names)
+                    or requirement.name in excluded_names
+                )
+            )
 
-            requirement_index = 0
+            if requirement_names:
+                selection[query.name] = requirement_names
 
-            while requirement_index < len(query.requirements):
-                requirement = query.requirements[requirement_index]
+        return selection
 
-                if (requirement.requires_explicit_include and requirement.name not in included_names) or (
-                    requirement.name in excluded_names
-                ):
-                    query.requirements.pop(requirement_index)
-                    continue
+    # ----------------------------------------------------------------------
+    def CreateView(
+        self,
+        selection: Mapping[str, Collection[str]],  # Requirement names keyed by query name
+    ) -> "Module":
+        """Return a copy of the module that contains only the selected queries and requirements; this module is not modified.
 
-                requirement_index += 1
+        The copy shares everything else (including the requirements themselves) with this module.
+        """
+        view = copy.copy(self)
+        view.queries = []
 
-            if not query.requirements:
-                self.queries.pop(query_index)
+        for query in self.queries:
+            requirement_names = selection.get(query.name)
+            if not requirement_names:
                 continue
 
-            query_index += 1
+            query_view = copy.copy(query)
+            query_view.requirements = [
+                requirement for requirement in query.requirements if requirement.name in requirement_names
+            ]
+
+            view.queries.append(query_view)
+
+        return view
+
+    # ----------------------------------------------------------------------
+    def ProcessRequirements(
+        self,
+        included_names: set[str],
+        excluded_names: set[str],
+    ) -> None:
+        """Process the requirements to remove invalid requirements and queries.
+
+        This modifies the module (and its queries); use `SelectRequirements` and `CreateView` to
+        evaluate a subset of the requirements without doing so.
+        """
+        selection = self.SelectRequirements(included_names, excluded_names)
+
+        self.queries[:] = [query for query in self.queries if query.name in selection]
+
+        for query in self.queries:
+            query.requirements[:] = [  # type: ignore[index]
+                requirement for requirement in query.requirements if requirement.name in selection[query.name]
+            ]
 
     # ----------------------------------------------------------------------
     @abstractmethod
@@ -96,6 +179,78 @@ class Module(ABC):
 
         raise NotImplementedError("Abstract method")  # pragma: no cover # noqa: EM101
 
+    # ----------------------------------------------------------------------
+    @extension
+    def GetRepositories(
+        self,
+        dynamic_args: dict[str, Any],
+        *,
+        repository_filter: Optional[Callable[[Optional[str]], bool]] = None,
+    ) -> Iterable["Module.RepositoryInfo"]:
+        """Return the repositories to evaluate given the dynamic arguments (often from the command line).
+
+        Modules that are able to evaluate multiple repositories in a single invocation should return
+        information about each one; by default, the module evaluates a single repository. Return a
+        list when all of the repositories are known up front, or an iterator to provide repositories
+        as they are discovered (for example, as pages of results are received from a server); the
+        evaluation of each repository begins as soon as it is provided.
+
+        `repository_filter` (when provided) returns False for the names of repositories that will not
+        be evaluated (for example, because they are assigned to another shard). Modules can use it to
+        avoid retrieving information about those repositories; the repositories returned are filtered
+        regardless.
+        """
+        del repository_filter
+
+        return [Module.RepositoryInfo(None, dynamic_args)]
+
+    # ----------------------------------------------------------------------
+    @extension
+    def GetRepositoryState(
+        self,
+        dynamic_args: dict[str, Any],
+        previous_state: Optional[dict[str, Any]],
+    ) -> Optional[dict[str, Any]]:
+        """Return values that change when the repository changes, or None if changes cannot be detected.
+
+        The state is used to skip the evaluation of repositories that have not changed since a
+        previous audit. The state must be serializable as JSON; `previous_state` (if any) is the
+        state returned for the repository by the previous audit, which can be used to avoid
+        retrieving values that are known to be unchanged. By default, changes cannot be detected and
+        the repository is always evaluated.
+        """
+        del dynamic_args
+        del previous_state
+
+        return None
+
+    # ----------------------------------------------------------------------
+    @extension
+    def GetEventRepository(
+        self,
+        dynamic_args: dict[str, Any],
+        event: str,
+        payload: dict[str, Any],
+    ) -> Optional["Module.RepositoryInfo"]:
+        """Return the repository affected by a webhook event, or None if the event does not affect a repository evaluated with the dynamic arguments.
+
+        The repository is evaluated again when the event is received (see `Query.events` for the
+        queries that are evaluated). By default, events are ignored.
+        """
+        del dynamic_args
+        del event
+        del payload
+
+        return None
+
+    # ----------------------------------------------------------------------
+    def GetEventQueries(
+        self,
+        event: str,
+    ) -> list[Query]:
+        """Return the queries whose data may be changed by a webhook event."""
+        return [query for query in self.queries if query.events is None or event in query.events]
+
     # ----------------------------------------------------------------------
     @abstractmethod
     def GenerateInitialData(
@@ -118,35 +273,90 @@ class Module(ABC):
         status_func: OnStatusFunc,
         *,
         max_num_threads: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
+        query_timeout: Optional[float] = None,
+        query_names: Optional[Collection[str]] = None,
     ) -> list[list["Module.EvaluateInfo"]]:
-        """Evaluate the module using the module data and requirement data."""
+        """Evaluate the module using the module data and requirement data.
+
+        Each query must retrieve its data before `query_timeout` seconds have elapsed or `deadline`
+        expires (whichever happens first); requirements associated with queries that are not able to
+        do so are reported as timed out. When `query_names` is provided, only those queries are
+        evaluated.
+        """
         status_info = StatusInfo()
         status_info_lock = threading.Lock()
 
+        if deadline is None:
+            deadline = Deadline.Create(None)
+
         # ----------------------------------------------------------------------
-        def EvaluateQuery(
+        def CreateQueryResults(
             query: Query,
-        ) -> tuple[int, list[Module.EvaluateInfo]]:
-            query_data = query.GetData(dict(module_data))
-            if query_data is None:
-                with status_info_lock:
-                    status_info.num_completed += len(query.requirements)
+            result: EvaluateResult,
+            context: str,
+        ) -> list[Module.EvaluateInfo]:
+            with status_info_lock:
+                status_info.num_completed += len(query.requirements)
+
+                if result == EvaluateResult.Timeout:
+                    status_info.num_error += len(query.requirements)
+                else:
                     status_info.num_does_not_apply += len(query.requirements)
 
-                    status_func(*status_info.__dict__.values())
-                    # Since query returned None, it means it was not valid.
-                    return 2, [
-                        Module.EvaluateInfo(
-                            result=EvaluateResult.DoesNotApply,
-                            context=f"{query.name} did not return valid data.",
-                            resolution="",
-                            rationale="",
-                            requirement=requirement,
-                            query=query,
-                            module=self,
+                status_func(*status_info.__dict__.values())
+
+            return [
+                Module.EvaluateInfo(
+                    result=result,
+                    context=context,
+                    resolution="",
+                    rationale="",
+                    requirement=requirement,
+                    query=query,
+                    module=self,
+                )
+                for requirement in query.requirements
+            ]
+
+        # ----------------------------------------------------------------------
+        def EvaluateQuery(
+            query: Query,
+        ) -> tuple[int, list[Module.EvaluateInfo]]:
+            query_deadline = deadline.CreateChild(query_timeout)
+
+            if query_deadline.is_expired:
+                return ReturnCode.ERROR, CreateQueryResults(
+                    query,
+                    EvaluateResult.Timeout,
+                    f"{query.name} was not started before the deadline expired.",
+                )
+
+            try:
+                with query_deadline.Activate(), ResourceLimits.GetActive().AcquireWorker():
+                    start_time = time.perf_counter()
+
+                    try:
+                        query_data = query.GetData(dict(module_data))
+                    finally:
+                        DurationHistory.GetActive().Record(
+                            self._GetQueryHistoryKey(query),
+                            time.perf_counter() - start_time,
                         )
-                        for requirement in query.requirements
-                    ]
+            except DeadlineExceededError as ex:
+                return ReturnCode.ERROR, CreateQueryResults(
+                    query,
+                    EvaluateResult.Timeout,
+                    f"{query.name} did not complete before the deadline expired ({ex}).",
+                )
+
+            if query_data is None:
+                # Since query returned None, it means it was not valid.
+                return ReturnCode.DOESNOTAPPLY, CreateQueryResults(
+                    query,
+                    EvaluateResult.DoesNotApply,
+                    f"{query.name} did not return valid data.",
+                )
 
             prev_query_status_info = StatusInfo()
 
@@ -216,7 +426,21 @@ class Module(ABC):
         # ----------------------------------------------------------------------
 
         return ParallelSequentialProcessor(
-            self.queries,
+            self.queries
+            if query_names is None
+            else [query for query in self.queries if query.name in query_names],
             EvaluateQuery,
             max_num_threads=max_num_threads,
+            cost_func=self.EstimateQueryCost,
         )
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _GetQueryHistoryKey(
+        self,
+        query: Query,
+    ) -> str:
+        return f"{self.name}/{query.name}"
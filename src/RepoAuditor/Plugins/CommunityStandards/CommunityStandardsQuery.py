@@ -6,12 +6,15 @@
 # -------------------------------------------------------------------------------
 """Contains the CommunityStandardsQuery object."""
 
+import sys
 from tempfile import TemporaryDirectory
 from typing import Any, Optional
 from urllib.parse import urlparse
 
 from dbrownell_Common.Types import override  # type: ignore[import-untyped]
 
+from RepoAuditor.Impl.Deadline import Deadline, DeadlineExceededError
+from RepoAuditor.Impl.ResourceLimits import ResourceLimits
 from RepoAuditor.Plugins.CommunityStandards.Requirements.CodeOfConduct import CodeOfConduct
 from RepoAuditor.Plugins.CommunityStandards.Requirements.CodeOwners import CodeOwners
 from RepoAuditor.Plugins.CommunityStandards.Requirements.Contributing import Contributing
@@ -26,6 +29,9 @@ from RepoAuditor.Query import ExecutionStyle, Query
 class CloneRepositoryMixin:
     """A mixin class to clone a repository to a temporary directory."""
 
+    # Cloning a repository is significantly more expensive than retrieving data via an API
+    CLONE_COST_HINT = 30.0
+
     # ----------------------------------------------------------------------
     @override
     def GetData(
@@ -34,6 +40,12 @@ class CloneRepositoryMixin:
     ) -> Optional[dict[str, Any]]:
         """Get the repo data."""
 
+        # Bound the time spent cloning by the deadline of the active query (if any)
+        deadline = Deadline.GetActive()
+
+        if deadline is not None:
+            deadline.GetTimeout()  # Raises if the deadline has already expired
+
         # Clone the git repository to a temp directory
         branch = module_data.get("branch", "main")
         temp_repo_dir = TemporaryDirectory()
@@ -45,13 +57,28 @@ class CloneRepositoryMixin:
             parsed_url = urlparse(url)
             url = f"https://{pat}@{parsed_url.netloc}{parsed_url.path}"
 
-        # Import git.Repo here so that it is only imported
+        # Import git here so that it is only imported
         # if the CommunityStandards plugin is requested.
-        from git import Repo
+        from git import Git, Repo
 
         try:
-            Repo.clone_from(url, temp_repo_dir.name, branch=branch)
+            # Limit the number of concurrent clones; the time spent waiting counts against the deadline
+            with ResourceLimits.GetActive().AcquireClone():
+                timeout = None if deadline is None else deadline.GetTimeout()
+
+                if timeout is None or sys.platform == "win32":
+                    Repo.clone_from(url, temp_repo_dir.name, branch=branch)
+                else:
+                    # `Repo.clone_from` does not honor `kill_after_timeout`, so invoke the clone
+                    # command directly to ensure that the subprocess is terminated on timeout.
+                    Git().clone(url, temp_repo_dir.name, branch=branch, kill_after_timeout=timeout)
         except Exception as e:
+            if deadline is not None and deadline.is_expired:
+                temp_repo_dir.cleanup()
+
+                msg = "The repository could not be cloned before the deadline expired."
+                raise DeadlineExceededError(msg) from e
+
             error_msg = f"""
             An error occurred while attempting to clone the target repository.
             If you are auditing a private repository, {
@@ -94,4 +121,6 @@ class CommunityStandardsQuery(CloneRepositoryMixin, Query):
                 PullRequestTemplate(),
                 CodeOwners(),
             ],
+            cost_hint=self.CLONE_COST_HINT,
+            events=("repository", "push"),
         )
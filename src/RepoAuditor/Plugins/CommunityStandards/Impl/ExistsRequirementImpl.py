@@ -6,7 +6,7 @@
 # -------------------------------------------------------------------------------
 """Contains the ExistsRequirementImpl object."""
 
-from collections.abc import Sequence
+from collections.abc import MutableMapping, Sequence
 from pathlib import Path
 from typing import Any
 
@@ -79,7 +79,7 @@ class ExistsRequirementImpl(Requirement):
     @override
     def _EvaluateImpl(
         self,
-        query_data: dict[str, Any],
+        query_data: MutableMapping[str, Any],
         requirement_args: dict[str, Any],
     ) -> Requirement.EvaluateImplResult:
         # Flag to check if required file exists
@@ -102,6 +102,7 @@ from RepoAuditor.Plugins.GitHub.ClassicBranchProtectionRequirements.RequireStatu
 from RepoAuditor.Plugins.GitHub.ClassicBranchProtectionRequirements.RequireUpToDateBranches import (
     RequireUpToDateBranches,
 )
+from RepoAuditor.Plugins.GitHub.Impl.Common import CreateFingerprintData
 from RepoAuditor.Query import ExecutionStyle, Query
 
 
@@ -130,6 +131,7 @@ class ClassicBranchProtectionQuery(Query):
                 AllowDeletions(),
                 AllowMainlineForcePushes(),
             ],
+            events=("repository", "branch_protection_rule"),
         )
 
     # ----------------------------------------------------------------------
@@ -192,3 +194,12 @@ class ClassicBranchProtectionQuery(Query):
         module_data["branch_protection_data"] = response
 
         return module_data
+
+    # ----------------------------------------------------------------------
+    @override
+    def GetFingerprintData(
+        self,
+        query_data: dict[str, Any],
+    ) -> Optional[dict[str, Any]]:
+        """Return the values that determine the results of the requirements."""
+        return CreateFingerprintData(query_data, "branch", "branch_data", "branch_protection_data")
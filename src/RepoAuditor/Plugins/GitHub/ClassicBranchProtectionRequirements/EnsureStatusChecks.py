@@ -7,6 +7,7 @@
 """Contains the EnsureStatusChecks object."""
 
 import textwrap
+from collections.abc import MutableMapping
 from typing import Any
 
 import typer
@@ -70,7 +71,7 @@ class EnsureStatusChecks(Requirement):
     @override
     def _EvaluateImpl(
         self,
-        query_data: dict[str, Any],
+        query_data: MutableMapping[str, Any],
         requirement_args: dict[str, Any],
     ) -> Requirement.EvaluateImplResult:
         if requirement_args["no"]:
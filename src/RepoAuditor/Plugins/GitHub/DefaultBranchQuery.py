@@ -11,6 +11,7 @@ from typing import Any, Optional
 from dbrownell_Common.Types import override  # type: ignore[import-untyped]
 
 from RepoAuditor.Plugins.GitHub.DefaultBranchRequirements.Protected import Protected
+from RepoAuditor.Plugins.GitHub.Impl.Common import CreateFingerprintData
 from RepoAuditor.Query import ExecutionStyle, Query
 
 
@@ -26,6 +27,7 @@ class DefaultBranchQuery(Query):
             [
                 Protected(),
             ],
+            events=("repository", "branch_protection_rule", "repository_ruleset"),
         )
 
     # ----------------------------------------------------------------------
@@ -52,3 +54,12 @@ class DefaultBranchQuery(Query):
         module_data["default_branch_data"] = response
 
         return module_data
+
+    # ----------------------------------------------------------------------
+    @override
+    def GetFingerprintData(
+        self,
+        query_data: dict[str, Any],
+    ) -> Optional[dict[str, Any]]:
+        """Return the values that determine the results of the requirements."""
+        return CreateFingerprintData(query_data, "default_branch", "default_branch_data")
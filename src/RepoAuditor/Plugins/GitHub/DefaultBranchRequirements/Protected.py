@@ -7,6 +7,7 @@
 """Contains the Protected object."""
 
 import textwrap
+from collections.abc import MutableMapping
 from typing import Any
 
 import typer
@@ -71,7 +72,7 @@ class Protected(Requirement):
     @override
     def _EvaluateImpl(
         self,
-        query_data: dict[str, Any],
+        query_data: MutableMapping[str, Any],
         requirement_args: dict[str, Any],
     ) -> Requirement.EvaluateImplResult:
         is_protected = query_data["default_branch_data"].get("protected", None)
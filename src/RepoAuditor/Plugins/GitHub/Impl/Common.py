@@ -6,6 +6,8 @@
 # -------------------------------------------------------------------------------
 """Contains common functionality that is used across different components."""
 
+from typing import Any
+
 from RepoAuditor.Requirement import EvaluateResult, Requirement
 
 
@@ -32,3 +34,28 @@ def CreateIncompleteDataResult(pat_value_exists: bool) -> Requirement.EvaluateIm
         EvaluateResult.Warning,
         error_message,
     )
+
+
+# ----------------------------------------------------------------------
+def CreateFingerprintData(
+    query_data: dict[str, Any],
+    *keys: str,
+) -> dict[str, Any]:
+    """Create the data used to fingerprint the results of a query's requirements.
+
+    In addition to the values of the specified keys, requirements produce different results based on
+    the availability of a PAT and the type of GitHub server.
+
+    Args:
+        query_data (dict[str, Any]): The data returned by the query.
+        *keys (str): The keys of the values read by the query's requirements.
+
+    Returns:
+        dict[str, Any]: Values that determine the results of the query's requirements.
+
+    """
+    return {
+        "has_pat": query_data.get("pat") is not None,
+        "is_enterprise": getattr(query_data.get("session"), "is_enterprise", False),
+        **{key: query_data.get(key) for key in keys},
+    }
@@ -6,7 +6,7 @@
 # -------------------------------------------------------------------------------
 """Contains the EnableRequirementImpl object."""
 
-from collections.abc import Callable
+from collections.abc import Callable, MutableMapping
 from typing import Any, Optional
 
 import typer
@@ -58,6 +58,20 @@ class EnableRequirementImpl(Requirement):
         self.unset_set_terminology = unset_set_terminology
         self.missing_value_is_warning = missing_value_is_warning
 
+    # ----------------------------------------------------------------------
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Recreate the requirement when it is sent to another process (for example, when `--processes` is used).
+
+        `get_configuration_value_func` is typically a lambda that cannot be pickled, so the requirement
+        is created again by its derived class (which must not take any arguments) and then receives
+        the other attributes of this requirement.
+        """
+        return (
+            type(self),
+            (),
+            {key: value for key, value in self.__dict__.items() if key != "get_configuration_value_func"},
+        )
+
     # ----------------------------------------------------------------------
     @override
     def GetDynamicArgDefinitions(self, argument_separator: str) -> dict[str, TypeDefinitionItemType]:
@@ -77,7 +91,7 @@ class EnableRequirementImpl(Requirement):
     @override
     def _EvaluateImpl(
         self,
-        query_data: dict[str, Any],
+        query_data: MutableMapping[str, Any],
         requirement_args: dict[str, Any],
     ) -> Requirement.EvaluateImplResult:
         expected_value = self.enabled_by_default
@@ -7,7 +7,7 @@
 """Contains the EnableRequirementImpl object."""
 
 import textwrap
-from collections.abc import Callable
+from collections.abc import Callable, MutableMapping
 from typing import Any, Optional
 
 from dbrownell_Common.Types import override  # type: ignore[import-untyped]
@@ -78,7 +78,7 @@ class EnableRulesetRequirementImpl(EnableRequirementImpl):
     @override
     def _EvaluateImpl(
         self,
-        query_data: dict[str, Any],
+        query_data: MutableMapping[str, Any],
         requirement_args: dict[str, Any],
     ) -> Requirement.EvaluateImplResult:
         expected_rule_enabled = self.enabled_by_default
@@ -0,0 +1,356 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Contains functionality to determine which rulesets apply to a branch without asking GitHub.
+
+GitHub returns the active rules for a branch via `rules/branches/{branch}`, but then requires a
+request for each rule's ruleset. When auditing the repositories of an organization, organization
+rulesets are retrieved once and their conditions are evaluated locally for each repository and
+branch (see https://docs.github.com/en/rest/orgs/rules).
+"""
+
+import re
+import threading
+import weakref
+from collections.abc import Callable
+from typing import Any, Optional
+
+import requests
+
+
+# ----------------------------------------------------------------------
+class CompiledRuleset:
+    """Ruleset whose conditions have been compiled into matchers."""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        ruleset: dict[str, Any],
+    ) -> None:
+        conditions = ruleset.get("conditions") or {}
+
+        self.ruleset = ruleset
+        self.is_active = (
+            ruleset.get("enforcement") == "active" and ruleset.get("target", "branch") == "branch"
+        )
+
+        self._ref_name_matcher = _CreateIncludeExcludeMatcher(
+            conditions.get("ref_name"),
+            _CompileRefNamePattern,
+        )
+
+        self._repository_name_matcher = _CreateIncludeExcludeMatcher(
+            conditions.get("repository_name"),
+            _CompileRepositoryNamePattern,
+        )
+
+        repository_id_condition = conditions.get("repository_id")
+        self._repository_ids: Optional[set[int]] = (
+            None
+            if repository_id_condition is None
+            else set(repository_id_condition.get("repository_ids", []))
+        )
+
+        self._repository_property_condition: Optional[dict[str, Any]] = conditions.get("repository_property")
+
+    # ----------------------------------------------------------------------
+    def AppliesTo(
+        self,
+        repository: dict[str, Any],  # Repository information, as returned when listing repositories
+        branch: str,
+    ) -> Optional[bool]:
+        """Return True if the ruleset applies to the repository's branch, or None if it cannot be determined locally."""
+        if not self.is_active:
+            return False
+
+        default_branch = repository.get("default_branch")
+        if default_branch is None:
+            return None
+
+        if self._ref_name_matcher is not None and not self._ref_name_matcher(
+            f"refs/heads/{branch}",
+            f"refs/heads/{default_branch}",
+        ):
+            return False
+
+        if self._repository_name_matcher is not None and not self._repository_name_matcher(
+            repository["name"],
+            None,
+        ):
+            return False
+
+        if self._repository_ids is not None and repository.get("id") not in self._repository_ids:
+            return False
+
+        if self._repository_property_condition is not None:
+            return _MatchesRepositoryProperties(self._repository_property_condition, repository)
+
+        return True
+
+    # ----------------------------------------------------------------------
+    def CreateRules(self) -> list[dict[str, Any]]:
+        """Create rules in the form returned by `rules/branches/{branch}`."""
+        return [
+            {
+                **rule,
+                "ruleset_source_type": self.ruleset.get("source_type"),
+                "ruleset_source": self.ruleset.get("source"),
+                "ruleset_id": self.ruleset["id"],
+                "ruleset": self.ruleset,
+            }
+            for rule in self.ruleset.get("rules") or []
+        ]
+
+
+# ----------------------------------------------------------------------
+def GetOrganizationRulesets(
+    organization_session: requests.Session,
+) -> Optional[list[CompiledRuleset]]:
+    """Return the compiled rulesets of the organization, or None if they are not available.
+
+    Rulesets are retrieved once for each organization session (which is shared by all of the
+    repositories enumerated from the organization) and reused for each repository.
+    """
+    return _GetCachedRulesets(
+        _organization_rulesets,
+        organization_session,
+        f"/orgs/{organization_session.org_name}/rulesets",  # type: ignore[attr-defined]
+    )
+
+
+# ----------------------------------------------------------------------
+def GetRepositoryRulesets(
+    session: requests.Session,
+) -> Optional[list[CompiledRuleset]]:
+    """Return the compiled rulesets defined by the repository itself (excluding those of the organization), or None if they are not available.
+
+    Rulesets are retrieved once for each repository session (which is shared by the branches of the
+    repository when multiple branches are evaluated).
+    """
+    return _GetCachedRulesets(_repository_rulesets, session, "rulesets", {"includes_parents": "false"})
+
+
+# ----------------------------------------------------------------------
+def GetRuleset(
+    session: requests.Session,
+    ruleset_id: int,
+) -> dict[str, Any]:
+    """Return a ruleset that applies to the repository, retrieving it once for each repository session."""
+    with _rulesets_lock:
+        rulesets = _rulesets.setdefault(session, {})
+
+        ruleset = rulesets.get(ruleset_id)
+        if ruleset is not None:
+            return ruleset
+
+    response = session.get(f"rulesets/{ruleset_id}")
+    response.raise_for_status()
+
+    ruleset = response.json()
+
+    with _rulesets_lock:
+        return _rulesets[session].setdefault(ruleset_id, ruleset)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+class _RulesetsCacheInfo:
+    # ----------------------------------------------------------------------
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.is_populated = False
+        self.rulesets: Optional[list[CompiledRuleset]] = None
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _GetCachedRulesets(
+    cache: "weakref.WeakKeyDictionary[requests.Session, _RulesetsCacheInfo]",
+    session: requests.Session,
+    list_url: str,
+    params: Optional[dict[str, Any]] = None,
+) -> Optional[list[CompiledRuleset]]:
+    """Retrieve and compile the rulesets once for each session."""
+    with _rulesets_lock:
+        cache_info = cache.get(session)
+
+        if cache_info is None:
+            cache_info = _RulesetsCacheInfo()
+            cache[session] = cache_info
+
+    with cache_info.lock:
+        if not cache_info.is_populated:
+            cache_info.rulesets = _GetRulesets(session, list_url, params)
+            cache_info.is_populated = True
+
+        return cache_info.rulesets
+
+
+# ----------------------------------------------------------------------
+def _GetRulesets(
+    session: requests.Session,
+    list_url: str,
+    params: Optional[dict[str, Any]] = None,
+) -> Optional[list[CompiledRuleset]]:
+    """Retrieve and compile the rulesets; None is returned if the rulesets cannot be retrieved (for example, due to permissions)."""
+    try:
+        ruleset_summaries = list(session.GetAll(list_url, params))  # type: ignore[attr-defined]
+    except requests.HTTPError:
+        return None
+
+    rulesets: list[CompiledRuleset] = []
+
+    for ruleset_summary in ruleset_summaries:
+        # The list does not include the conditions and rules, so retrieve the complete ruleset
+        response = session.get(f"{list_url}/{ruleset_summary['id']}")
+        if response.status_code != 200:  # noqa: PLR2004
+            return None
+
+        rulesets.append(CompiledRuleset(response.json()))
+
+    return rulesets
+
+
+# ----------------------------------------------------------------------
+def _CreateIncludeExcludeMatcher(
+    condition: Optional[dict[str, Any]],
+    compile_func: Callable[[str], Callable[[str, Optional[str]], bool]],
+) -> Optional[Callable[[str, Optional[str]], bool]]:
+    """Create a matcher for a condition with `include` and `exclude` patterns."""
+    if condition is None:
+        return None
+
+    include_matchers = [compile_func(pattern) for pattern in condition.get("include") or []]
+    exclude_matchers = [compile_func(pattern) for pattern in condition.get("exclude") or []]
+
+    # ----------------------------------------------------------------------
+    def Matches(
+        value: str,
+        default_value: Optional[str],
+    ) -> bool:
+        return any(matcher(value, default_value) for matcher in include_matchers) and not any(
+            matcher(value, default_value) for matcher in exclude_matchers
+        )
+
+    # ----------------------------------------------------------------------
+
+    return Matches
+
+
+# ----------------------------------------------------------------------
+def _CompileRefNamePattern(
+    pattern: str,
+) -> Callable[[str, Optional[str]], bool]:
+    if pattern == "~ALL":
+        return lambda value, default_value: True  # noqa: ARG005
+    if pattern == "~DEFAULT_BRANCH":
+        return lambda value, default_value: value == default_value
+
+    if not pattern.startswith("refs/"):
+        pattern = f"refs/heads/{pattern}"
+
+    regex = _CompileGlob(pattern)
+    return lambda value, default_value: regex.fullmatch(value) is not None  # noqa: ARG005
+
+
+# ----------------------------------------------------------------------
+def _CompileRepositoryNamePattern(
+    pattern: str,
+) -> Callable[[str, Optional[str]], bool]:
+    if pattern == "~ALL":
+        return lambda value, default_value: True  # noqa: ARG005
+
+    regex = _CompileGlob(pattern, re.IGNORECASE)
+    return lambda value, default_value: regex.fullmatch(value) is not None  # noqa: ARG005
+
+
+# ----------------------------------------------------------------------
+def _CompileGlob(
+    pattern: str,
+    flags: int = 0,
+) -> re.Pattern:
+    """Compile an fnmatch-style pattern where `*` does not match `/` and `**` matches anything."""
+    regex_parts: list[str] = []
+
+    index = 0
+    while index < len(pattern):
+        if pattern.startswith("**", index):
+            regex_parts.append(".*")
+            index += 2
+        elif pattern[index] == "*":
+            regex_parts.append("[^/]*")
+            index += 1
+        elif pattern[index] == "?":
+            regex_parts.append("[^/]")
+            index += 1
+        else:
+            regex_parts.append(re.escape(pattern[index]))
+            index += 1
+
+    return re.compile("".join(regex_parts), flags)
+
+
+# ----------------------------------------------------------------------
+def _MatchesRepositoryProperties(
+    condition: dict[str, Any],
+    repository: dict[str, Any],
+) -> Optional[bool]:
+    """Return True if the repository's properties match the condition, or None if the properties are not available."""
+    custom_properties = repository.get("custom_properties")
+    if custom_properties is None:
+        return None
+
+    # ----------------------------------------------------------------------
+    def Matches(
+        property_info: dict[str, Any],
+    ) -> Optional[bool]:
+        if property_info.get("source", "custom") != "custom":
+            return None
+
+        value = custom_properties.get(property_info["name"])
+        if value is None:
+            return False
+
+        values = value if isinstance(value, list) else [value]
+        return any(value in property_info.get("property_values", []) for value in values)
+
+    # ----------------------------------------------------------------------
+
+    for property_info in condition.get("include") or []:
+        result = Matches(property_info)
+        if result is not True:
+            return result
+
+    for property_info in condition.get("exclude") or []:
+        result = Matches(property_info)
+        if result is not False:
+            return None if result is None else False
+
+    return True
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_organization_rulesets: weakref.WeakKeyDictionary[requests.Session, _RulesetsCacheInfo] = (
+    weakref.WeakKeyDictionary()
+)
+_repository_rulesets: weakref.WeakKeyDictionary[requests.Session, _RulesetsCacheInfo] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Rulesets retrieved for each repository session, keyed by ruleset id
+_rulesets: weakref.WeakKeyDictionary[requests.Session, dict[int, dict[str, Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+_rulesets_lock = threading.Lock()
@@ -6,7 +6,7 @@
 # -------------------------------------------------------------------------------
 """Contains the ValueRequirementImpl object."""
 
-from collections.abc import Callable
+from collections.abc import Callable, MutableMapping
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -63,6 +63,20 @@ class ValueRequirementImpl(Requirement):
         self.get_configuration_value_func = get_configuration_value_func
         self.missing_value_is_warning = missing_value_is_warning
 
+    # ----------------------------------------------------------------------
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Recreate the requirement when it is sent to another process (for example, when `--processes` is used).
+
+        `get_configuration_value_func` is typically a lambda that cannot be pickled, so the requirement
+        is created again by its derived class (which must not take any arguments) and then receives
+        the other attributes of this requirement.
+        """
+        return (
+            type(self),
+            (),
+            {key: value for key, value in self.__dict__.items() if key != "get_configuration_value_func"},
+        )
+
     # ----------------------------------------------------------------------
     @override
     def GetDynamicArgDefinitions(self, argument_separator: str) -> dict[str, TypeDefinitionItemType]:
@@ -81,7 +95,7 @@ class ValueRequirementImpl(Requirement):
     @override
     def _EvaluateImpl(
         self,
-        query_data: dict[str, Any],
+        query_data: MutableMapping[str, Any],
         requirement_args: dict[str, Any],
     ) -> Requirement.EvaluateImplResult:
         expected_value = requirement_args.get("value", self.default_value)
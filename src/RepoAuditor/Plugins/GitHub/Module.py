@@ -18,6 +18,8 @@ from RepoAuditor.Plugins.GitHubBase.Module import GitHubBaseModule
 class GitHubModule(GitHubBaseModule):
     """Module for validating GitHub repository configuration settings."""
 
+    REPOSITORY_QUERY_NAMES = frozenset(["StandardQuery", "DefaultBranchQuery"])
+
     # ----------------------------------------------------------------------
     def __init__(self) -> None:
         super().__init__(
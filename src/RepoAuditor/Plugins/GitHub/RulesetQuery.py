@@ -11,6 +11,12 @@ from typing import Any, Optional
 from dbrownell_Common.Types import override
 
 from RepoAuditor.Impl.ParallelSequentialProcessor import ExecutionStyle
+from RepoAuditor.Plugins.GitHub.Impl.Common import CreateFingerprintData
+from RepoAuditor.Plugins.GitHub.Impl.Rulesets import (
+    GetOrganizationRulesets,
+    GetRepositoryRulesets,
+    GetRuleset,
+)
 from RepoAuditor.Plugins.GitHub.RulesetRequirements.BlockMainlineForcePushes import (
     BlockMainlineForcePushesRule,
 )
@@ -71,6 +77,7 @@ class RulesetQuery(Query):
                 BlockMainlineForcePushesRule(),
                 RequireCodeScanningResultsRule(),
             ],
+            events=("repository", "repository_ruleset"),
         )
 
     @override
@@ -88,7 +95,12 @@ class RulesetQuery(Query):
             data, or None if an error occurs.
 
         """
+        repository_listing = module_data.get("repository_listing")
+
         branch = module_data.get("branch")
+        if branch is None and repository_listing is not None:
+            branch = repository_listing.get("default_branch")
+
         if branch is None:
             # Get the default branch name
             response = module_data["session"].get("")
@@ -101,6 +113,13 @@ class RulesetQuery(Query):
         # Record the branch name
         module_data["branch"] = branch
 
+        # When auditing the repositories of an organization, determine which rules apply locally
+        if repository_listing is not None and "organization_session" in module_data:
+            rules = self._GetRulesFromRulesets(module_data, repository_listing, branch)
+            if rules is not None:
+                module_data["rules"] = rules
+                return module_data
+
         # Fetch ruleset data for a specific branch.
         # This only returns active rules on the branch
         rules_response = module_data["session"].get(f"rules/branches/{branch}")
@@ -110,11 +129,53 @@ class RulesetQuery(Query):
         # Add ruleset data to module_data
         module_data["rules"] = rules_response.json()
 
-        # Also get the associated ruleset for each rule
+        # Also get the associated ruleset for each rule (rules from the same ruleset, including
+        # those of other branches of the repository, share the ruleset)
         for rule in module_data["rules"]:
-            ruleset_response = module_data["session"].get(f"rulesets/{rule['ruleset_id']}")
-            ruleset_response.raise_for_status()
-            ruleset = ruleset_response.json()
-            rule["ruleset"] = ruleset
+            rule["ruleset"] = GetRuleset(module_data["session"], rule["ruleset_id"])
 
         return module_data
+
+    # ----------------------------------------------------------------------
+    @override
+    def GetFingerprintData(
+        self,
+        query_data: dict[str, Any],
+    ) -> Optional[dict[str, Any]]:
+        """Return the values that determine the results of the requirements."""
+        return CreateFingerprintData(query_data, "branch", "rules")
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetRulesFromRulesets(
+        module_data: dict[str, Any],
+        repository_listing: dict[str, Any],
+        branch: str,
+    ) -> Optional[list[dict[str, Any]]]:
+        """Return the active rules for the branch, or None if they cannot be determined locally.
+
+        Organization rulesets are retrieved once for all repositories in the organization, so
+        requests for each repository are only made for the rulesets defined by the repository itself.
+        """
+        organization_rulesets = GetOrganizationRulesets(module_data["organization_session"])
+        if organization_rulesets is None:
+            return None
+
+        repository_rulesets = GetRepositoryRulesets(module_data["session"])
+        if repository_rulesets is None:
+            return None
+
+        rules: list[dict[str, Any]] = []
+
+        for ruleset in organization_rulesets + repository_rulesets:
+            applies = ruleset.AppliesTo(repository_listing, branch)
+
+            if applies is None:
+                return None
+
+            if applies:
+                rules += ruleset.CreateRules()
+
+        return rules
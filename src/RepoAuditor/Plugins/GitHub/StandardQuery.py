@@ -164,12 +164,18 @@ RESPONSE:
     "network_count": <not used>,
     "subscribers_count": <not used>
 }
+
+When auditing the repositories of an organization, the data returned when listing the repositories
+(available in `module_data["repository_listing"]`) contains many of these values. That data is used
+when it contains all of the values required by the remaining requirements, so that the request above
+is only made when necessary (for example, to retrieve merge settings or `security_and_analysis`).
 """
 
 from typing import Any, Optional
 
 from dbrownell_Common.Types import override  # type: ignore[import-untyped]
 
+from RepoAuditor.Plugins.GitHub.Impl.Common import CreateFingerprintData
 from RepoAuditor.Plugins.GitHub.StandardRequirements.AutoMerge import AutoMerge
 from RepoAuditor.Plugins.GitHub.StandardRequirements.DefaultBranch import DefaultBranch
 from RepoAuditor.Plugins.GitHub.StandardRequirements.DeleteHeadBranches import DeleteHeadBranches
@@ -240,6 +246,7 @@ class StandardQuery(Query):
                 SecretScanning(),
                 SecretScanningPushProtection(),
             ],
+            events=("repository", "security_and_analysis"),
         )
 
     # ----------------------------------------------------------------------
@@ -249,6 +256,12 @@ class StandardQuery(Query):
         module_data: dict[str, Any],
     ) -> Optional[dict[str, Any]]:
         """Get the data from an API session."""
+        listing_data = module_data.get("repository_listing")
+
+        if listing_data is not None and self._CanUseListingData(listing_data):
+            module_data["standard"] = listing_data
+            return module_data
+
         response = module_data["session"].get("")
 
         response.raise_for_status()
@@ -257,3 +270,84 @@ class StandardQuery(Query):
         module_data["standard"] = response
 
         return module_data
+
+    # ----------------------------------------------------------------------
+    @override
+    def GetFingerprintData(
+        self,
+        query_data: dict[str, Any],
+    ) -> Optional[dict[str, Any]]:
+        """Return the values that determine the results of the requirements.
+
+        Only the values read by the requirements are included, so that changes to other values (such
+        as `pushed_at`) do not invalidate cached results.
+        """
+        fingerprint_data = CreateFingerprintData(query_data)
+
+        fields: set[str] = set()
+
+        for requirement in self.requirements:
+            requirement_fields = _REQUIREMENT_FIELDS.get(requirement.name)
+
+            # Requirements without known fields may read anything
+            if requirement_fields is None:
+                fingerprint_data["standard"] = query_data["standard"]
+                return fingerprint_data
+
+            fields.update(requirement_fields)
+
+        standard = query_data["standard"]
+
+        fingerprint_data["standard"] = {field: standard.get(field) for field in sorted(fields)}
+        return fingerprint_data
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _CanUseListingData(
+        self,
+        listing_data: dict[str, Any],
+    ) -> bool:
+        """Return True if the listing data contains all of the values read by the remaining requirements."""
+        for requirement in self.requirements:
+            fields = _REQUIREMENT_FIELDS.get(requirement.name)
+
+            # Requirements without known fields may read anything
+            if fields is None:
+                return False
+
+            if any(field not in listing_data for field in fields):
+                return False
+
+        return True
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+# The top-level values read by each requirement
+_REQUIREMENT_FIELDS: dict[str, tuple[str, ...]] = {
+    "Description": ("description",),
+    "License": ("license",),
+    "TemplateRepository": ("is_template",),
+    "WebCommitSignoff": ("web_commit_signoff_required",),
+    "DefaultBranch": ("default_branch",),
+    "SupportWikis": ("has_wiki",),
+    "SupportIssues": ("has_issues",),
+    "SupportDiscussions": ("has_discussions",),
+    "SupportProjects": ("has_projects",),
+    "MergeCommit": ("allow_merge_commit",),
+    "MergeCommitMessage": ("allow_merge_commit", "merge_commit_message"),
+    "SquashCommitMerge": ("allow_squash_merge",),
+    "SquashMergeCommitMessage": ("allow_squash_merge", "squash_merge_commit_message"),
+    "RebaseMergeCommit": ("allow_rebase_merge",),
+    "SuggestUpdatingPullRequestBranches": ("allow_update_branch",),
+    "AutoMerge": ("allow_auto_merge",),
+    "DeleteHeadBranches": ("delete_branch_on_merge",),
+    "Private": ("private",),
+    "DependabotSecurityUpdates": ("security_and_analysis",),
+    "SecretScanning": ("security_and_analysis",),
+    "SecretScanningPushProtection": ("security_and_analysis",),
+}
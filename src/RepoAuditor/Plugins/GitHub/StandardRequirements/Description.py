@@ -7,6 +7,7 @@
 """Contains the Description object."""
 
 import textwrap
+from collections.abc import MutableMapping
 from typing import Any
 
 import typer
@@ -67,7 +68,7 @@ class Description(Requirement):
     @override
     def _EvaluateImpl(
         self,
-        query_data: dict[str, Any],
+        query_data: MutableMapping[str, Any],
         requirement_args: dict[str, Any],
     ) -> Requirement.EvaluateImplResult:
         standard_data = query_data["standard"]
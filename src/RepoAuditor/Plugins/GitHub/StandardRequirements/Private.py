@@ -7,6 +7,7 @@
 """Contains the Private object."""
 
 import textwrap
+from collections.abc import MutableMapping
 from typing import Any
 
 import typer
@@ -68,7 +69,7 @@ class Private(Requirement):
     @override
     def _EvaluateImpl(
         self,
-        query_data: dict[str, Any],
+        query_data: MutableMapping[str, Any],
         requirement_args: dict[str, Any],
     ) -> Requirement.EvaluateImplResult:
         expect_private = requirement_args.get("yes", False)
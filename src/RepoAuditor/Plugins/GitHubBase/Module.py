@@ -6,8 +6,15 @@
 # -------------------------------------------------------------------------------
 """Contains the GitHubBaseModule object."""
 
+import contextlib
+import os
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional, cast
 from urllib.parse import urlparse
 
 import requests
@@ -15,6 +22,9 @@ import typer
 from dbrownell_Common.TyperEx import TypeDefinitionItemType  # type: ignore[import-untyped]
 from dbrownell_Common.Types import override  # type: ignore[import-untyped]
 
+from RepoAuditor.Impl.ConditionalRequestCache import ConditionalRequestCache
+from RepoAuditor.Impl.Deadline import Deadline, DeadlineExceededError
+from RepoAuditor.Impl.ResourceLimits import AdaptiveLimiter, ResourceLimits
 from RepoAuditor.Module import Module
 
 
@@ -26,16 +36,56 @@ class GitHubBaseModule(Module):
     # The __init__ method is inherited from the Module class
     # and does not need to be overriden.
 
+    # Names of the queries whose data does not depend on the evaluated branch. When multiple branches
+    # are evaluated, these queries are evaluated once for each repository and the other queries are
+    # evaluated for each branch.
+    REPOSITORY_QUERY_NAMES: ClassVar[frozenset[str]] = frozenset()
+
     # ----------------------------------------------------------------------
     @override
     def GetDynamicArgDefinitions(self) -> dict[str, TypeDefinitionItemType]:
         """Get the definitions for the arguments to this requirement."""
         return {
             "url": (
+                list[str],
+                typer.Option(
+                    None,
+                    help="Github URL (e.g. https://github.com/gt-sse-center/RepoAuditor) or path to a local file containing URLs (one per line). This value can be provided multiple times to audit multiple repositories. Either this value or 'org' must be provided.",
+                ),
+            ),
+            "org": (
+                str,
+                typer.Option(
+                    None,
+                    help="GitHub organization or user (e.g. https://github.com/gt-sse-center) whose repositories should be audited. Repositories are audited as they are enumerated.",
+                ),
+            ),
+            "archived": (
+                bool,
+                typer.Option(
+                    False,
+                    help="Include archived repositories when enumerating the repositories of an organization.",
+                ),
+            ),
+            "forks": (
+                bool,
+                typer.Option(
+                    False,
+                    help="Include forked repositories when enumerating the repositories of an organization.",
+                ),
+            ),
+            "visibility": (
                 str,
                 typer.Option(
-                    ...,
-                    help="[REQUIRED] Github URL (e.g. https://github.com/gt-sse-center/RepoAuditor)",
+                    None,
+                    help="Only include repositories with this visibility ('public', 'private', or 'internal') when enumerating the repositories of an organization.",
+                ),
+            ),
+            "topic": (
+                list[str],
+                typer.Option(
+                    None,
+                    help="Only include repositories with this topic when enumerating the repositories of an organization. This value can be provided multiple times; repositories must have all of the provided topics.",
                 ),
             ),
             "pat": (
@@ -46,47 +96,312 @@ class GitHubBaseModule(Module):
                 ),
             ),
             "branch": (
-                str,
+                list[str],
                 typer.Option(
                     None,
-                    help="Branch to evaluate. The default branch will be used if not specified.",
+                    help="Branch to evaluate, or a pattern of branches to evaluate (e.g. 'release/*'). This value can be provided multiple times to evaluate multiple branches. The default branch will be used if not specified.",
                 ),
             ),
         }
 
+    # ----------------------------------------------------------------------
+    @override
+    def GetRepositories(
+        self,
+        dynamic_args: dict[str, Any],
+        *,
+        repository_filter: Optional[Callable[[Optional[str]], bool]] = None,
+    ) -> Iterable[Module.RepositoryInfo]:
+        """Get the repositories associated with the provided URLs, files of URLs, and organization.
+
+        The repositories of an organization are returned lazily, as each page of repositories is
+        received from GitHub. Repositories are filtered before they are expanded into their branches,
+        so the branches of repositories that are not evaluated are not retrieved.
+        """
+        urls = dynamic_args.get("url") or []
+        if isinstance(urls, str):
+            urls = [urls]
+
+        org = dynamic_args.get("org")
+
+        if not urls and not org:
+            msg = "A GitHub URL or organization must be provided."
+            raise ValueError(msg)
+
+        visibility = dynamic_args.get("visibility")
+        if visibility is not None and visibility not in _VISIBILITY_VALUES:
+            msg = f"'{visibility}' is not a valid visibility; valid values are {', '.join(repr(value) for value in _VISIBILITY_VALUES)}."
+            raise ValueError(msg)
+
+        branch_patterns = _GetBranchPatterns(dynamic_args)
+        is_multi_branch = _IsMultiBranch(branch_patterns)
+
+        if "branch" in dynamic_args:
+            # Queries expect the name of a single branch (if any)
+            dynamic_args = {
+                **dynamic_args,
+                "branch": None if is_multi_branch or not branch_patterns else branch_patterns[0],
+            }
+
+        repository_urls = _GetRepositoryUrls(urls)
+
+        repositories: Iterable[Module.RepositoryInfo]
+
+        if not org:
+            repositories = [
+                Module.RepositoryInfo(url, {**dynamic_args, "url": url}) for url in repository_urls
+            ]
+        else:
+            repositories = self._EnumerateRepositories(dynamic_args, repository_urls, org)
+
+        if repository_filter is not None:
+            if isinstance(repositories, list):
+                repositories = [
+                    repository for repository in repositories if repository_filter(repository.name)
+                ]
+            else:
+                repositories = (
+                    repository for repository in repositories if repository_filter(repository.name)
+                )
+
+        if is_multi_branch:
+            repositories = self._ExpandBranches(repositories, branch_patterns)
+
+        return repositories
+
+    # ----------------------------------------------------------------------
+    @override
+    def GetRepositoryState(
+        self,
+        dynamic_args: dict[str, Any],
+        previous_state: Optional[dict[str, Any]],
+    ) -> Optional[dict[str, Any]]:
+        """Get the state of a repository enumerated from an organization.
+
+        `updated_at` changes when the repository's settings change and `pushed_at` changes when
+        commits are pushed to any branch. The head commit of the evaluated branch is only requested
+        when `pushed_at` has changed, so that pushes to other branches do not cause the repository to
+        be evaluated again.
+        """
+        repository_listing = dynamic_args.get("repository_listing")
+        organization_session = dynamic_args.get("organization_session")
+
+        if repository_listing is None or organization_session is None:
+            return None
+
+        branch = dynamic_args.get("branch") or repository_listing.get("default_branch")
+
+        state: dict[str, Any] = {
+            "updated_at": repository_listing.get("updated_at"),
+            "pushed_at": repository_listing.get("pushed_at"),
+            "branch": branch,
+            # Results are incomplete when a PAT is not provided
+            "has_pat": bool(dynamic_args.get("pat")),
+        }
+
+        if (
+            previous_state is not None
+            and previous_state.get("pushed_at") == state["pushed_at"]
+            and previous_state.get("branch") == branch
+            and "head_sha" in previous_state
+        ):
+            state["head_sha"] = previous_state["head_sha"]
+        else:
+            state["head_sha"] = _GetHeadSha(organization_session, repository_listing.get("full_name"), branch)
+
+        return state
+
+    # ----------------------------------------------------------------------
+    @override
+    def GetEventRepository(
+        self,
+        dynamic_args: dict[str, Any],
+        event: str,
+        payload: dict[str, Any],
+    ) -> Optional[Module.RepositoryInfo]:
+        """Get the repository of a GitHub webhook event when it is one of the repositories provided by URL or enumerated from the organization.
+
+        Pushes only affect the repository when they update an evaluated branch. When multiple branches
+        are evaluated, pushes affect the branch that was updated and other events affect the
+        repository (see `REPOSITORY_QUERY_NAMES`).
+        """
+        repository = payload.get("repository")
+        if not isinstance(repository, dict) or not isinstance(repository.get("html_url"), str):
+            return None
+
+        if event == "repository" and payload.get("action") == "deleted":
+            return None
+
+        branch_patterns = _GetBranchPatterns(dynamic_args)
+        is_multi_branch = _IsMultiBranch(branch_patterns)
+
+        branch = None if is_multi_branch or not branch_patterns else branch_patterns[0]
+        pushed_branch: Optional[str] = None
+
+        if event == "push":
+            ref = payload.get("ref")
+            if not isinstance(ref, str) or not ref.startswith("refs/heads/"):
+                return None
+
+            pushed_branch = ref.removeprefix("refs/heads/")
+
+            if not _IsEvaluatedBranch(pushed_branch, branch_patterns, repository.get("default_branch")):
+                return None
+
+        url = repository["html_url"].removesuffix("/")
+
+        urls = dynamic_args.get("url") or []
+        if isinstance(urls, str):
+            urls = [urls]
+
+        if url.lower() not in (repository_url.lower() for repository_url in _GetRepositoryUrls(urls)):
+            org = dynamic_args.get("org")
+
+            if (
+                not org
+                or not _IsOrganizationRepository(org, url)
+                or not _IsIncluded(dynamic_args, repository)
+            ):
+                return None
+
+        dynamic_args = {**dynamic_args, "url": url}
+
+        if "branch" in dynamic_args:
+            dynamic_args["branch"] = branch
+
+        if not is_multi_branch:
+            return Module.RepositoryInfo(url, dynamic_args)
+
+        repository_query_names, branch_query_names = self._GetQueryNames()
+
+        if pushed_branch is not None:
+            if not branch_query_names:
+                return None
+
+            return Module.RepositoryInfo(
+                f"{url}/tree/{pushed_branch}",
+                {**dynamic_args, "branch": pushed_branch},
+                query_names=branch_query_names,
+            )
+
+        if not repository_query_names:
+            return None
+
+        return Module.RepositoryInfo(url, dynamic_args, query_names=repository_query_names)
+
     # ----------------------------------------------------------------------
     @override
     def GenerateInitialData(self, dynamic_args: dict[str, Any]) -> Optional[dict[str, Any]]:
         """Generate the initial data to be used in the `dynamic_args`, such as session info, etc."""
         # Read the PAT (if provided) as a filename or a value.
         # This also decouples the PAT reading logic from the GitHubSession class (which may be mocked for testing).
-        github_pat = dynamic_args.get("pat")
-        if github_pat:
-            potential_file = Path(github_pat)
-            if potential_file.is_file():
-                with potential_file.open("r") as f:
-                    github_pat = f.read().strip()
-        # Re-assign github_pat so it can be used within the subclassed modules.
-        dynamic_args["pat"] = github_pat
+        # Re-assign the PAT so it can be used within the subclassed modules.
+        dynamic_args["pat"] = _ReadPat(dynamic_args.get("pat"))
 
-        # Create a GitHub API session
-        dynamic_args["session"] = _GitHubSession(dynamic_args["url"], dynamic_args.get("pat"))
+        # Create a GitHub API session; the branches of a repository share its session
+        dynamic_args["session"] = dynamic_args.get("repository_session") or _GitHubSession(
+            dynamic_args["url"],
+            dynamic_args.get("pat"),
+        )
 
         return dynamic_args
 
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    def _GetQueryNames(self) -> tuple[frozenset[str], frozenset[str]]:
+        """Return the names of the queries evaluated for each repository and the names of the queries evaluated for each branch."""
+        query_names = frozenset(query.name for query in self.queries)
+
+        return query_names & self.REPOSITORY_QUERY_NAMES, query_names - self.REPOSITORY_QUERY_NAMES
+
+    # ----------------------------------------------------------------------
+    def _ExpandBranches(
+        self,
+        repositories: Iterable[Module.RepositoryInfo],
+        branch_patterns: list[str],
+    ) -> Iterator[Module.RepositoryInfo]:
+        """Expand each repository into the repository (evaluated by the queries that do not depend on the branch) and each of its matching branches (evaluated by the other queries)."""
+        repository_query_names, branch_query_names = self._GetQueryNames()
+
+        for repository in repositories:
+            # The session is shared by the repository and its branches so that information about the
+            # repository (for example, its rulesets) is retrieved once rather than for each branch.
+            session = _GetRepositorySession(
+                repository.dynamic_args["url"],
+                _ReadPat(repository.dynamic_args.get("pat")),
+            )
+
+            dynamic_args = {**repository.dynamic_args, "repository_session": session}
+
+            if repository_query_names:
+                yield Module.RepositoryInfo(repository.name, dynamic_args, query_names=repository_query_names)
+
+            if not branch_query_names:
+                continue
+
+            for branch in _GetBranches(session, branch_patterns):
+                yield Module.RepositoryInfo(
+                    f"{repository.name}/tree/{branch}",
+                    {**dynamic_args, "branch": branch},
+                    query_names=branch_query_names,
+                )
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _EnumerateRepositories(
+        dynamic_args: dict[str, Any],
+        urls: list[str],
+        org: str,
+    ) -> Iterator[Module.RepositoryInfo]:
+        repository_urls: set[str] = set()
+
+        for url in urls:
+            repository_urls.add(url)
+            yield Module.RepositoryInfo(url, {**dynamic_args, "url": url})
+
+        # The organization session is shared by all of the repositories so that queries can retrieve
+        # (and cache) organization-level information once rather than for each repository.
+        organization_session = _GitHubOrganizationSession(org, _ReadPat(dynamic_args.get("pat")))
+
+        for repository in organization_session.EnumerateRepositories():
+            if not _IsIncluded(dynamic_args, repository):
+                continue
+
+            url = repository["html_url"].removesuffix("/")
+
+            if url in repository_urls:
+                continue
+
+            repository_urls.add(url)
+
+            # The listing contains many of the values that would otherwise be retrieved for each
+            # repository; queries can use this data to avoid requests.
+            yield Module.RepositoryInfo(
+                url,
+                {
+                    **dynamic_args,
+                    "url": url,
+                    "repository_listing": repository,
+                    "organization_session": organization_session,
+                },
+            )
+
 
 # ----------------------------------------------------------------------
 # |
 # |  Private Types
 # |
 # ----------------------------------------------------------------------
-class _GitHubSession(requests.Session):
-    """Session used to communicate with GitHub APIs."""
+class _GitHubApiSession(requests.Session):
+    """Session used to communicate with GitHub APIs rooted at a specific URL."""
+
+    PAGE_SIZE = 100
 
     # ----------------------------------------------------------------------
     def __init__(
         self,
-        github_url: str,
+        api_url: str,
         github_pat: Optional[str],
         *args,
         **kwargs,
@@ -103,6 +418,112 @@ class _GitHubSession(requests.Session):
         if github_pat:
             self.headers["Authorization"] = f"Bearer {github_pat}"
 
+        self.api_url = api_url
+
+        # Reuse connections across all sessions that communicate with the same server
+        api_url_parts = urlparse(api_url)
+        self.mount(
+            f"{api_url_parts.scheme}://{api_url_parts.netloc}/",
+            _GetHttpAdapter(api_url_parts.scheme, api_url_parts.netloc),
+        )
+
+    # ----------------------------------------------------------------------
+    def request(
+        self,
+        method: str,
+        url: str,
+        *args,
+        **kwargs,
+    ) -> requests.Response:
+        if url and not url.startswith("/"):
+            url = f"/{url}"
+
+        # Bound the time spent waiting on the server by the deadline of the active query (if any)
+        deadline = Deadline.GetActive()
+        has_deadline_timeout = deadline is not None and kwargs.get("timeout") is None
+
+        full_url = f"{self.api_url}{url}"
+
+        # GET requests are conditional when responses are cached (for example, when repositories are
+        # audited repeatedly), so that unchanged content is not transferred again.
+        cache = ConditionalRequestCache.GetActive() if method.upper() == "GET" else None
+        cache_key: Optional[tuple[str, Optional[str]]] = None
+
+        if cache is not None:
+            prepared_request = requests.PreparedRequest()
+            prepared_request.prepare_url(full_url, kwargs.get("params"))
+
+            assert prepared_request.url is not None
+            cache_key = (prepared_request.url, cast(Optional[str], self.headers.get("Authorization")))
+
+            conditional_headers = cache.GetRequestHeaders(cache_key)
+            if conditional_headers:
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **conditional_headers}
+
+        try:
+            with ResourceLimits.GetActive().AcquireHttp(urlparse(self.api_url).netloc) as operation:
+                if has_deadline_timeout:
+                    # The time spent waiting for the slot counts against the deadline
+                    assert deadline is not None
+                    kwargs["timeout"] = deadline.GetTimeout()
+
+                response = super().request(
+                    method,
+                    full_url,
+                    *args,
+                    **kwargs,
+                )
+
+                if _IsThrottled(response):
+                    operation.MarkThrottled()
+
+                _RecordRateLimit(response, operation)
+
+                if cache is not None:
+                    assert cache_key is not None
+                    response = cache.ProcessResponse(cache_key, response)
+
+                return response
+        except requests.Timeout as ex:
+            if deadline is None:
+                raise
+
+            msg = f"The request to '{url}' timed out."
+            raise DeadlineExceededError(msg) from ex
+
+    # ----------------------------------------------------------------------
+    def GetAll(
+        self,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> Iterator[Any]:
+        """Yield the items of a paginated list, requesting each page as it is needed."""
+        page = 1
+
+        while True:
+            response = self.get(url, params={**(params or {}), "per_page": self.PAGE_SIZE, "page": page})
+            response.raise_for_status()
+
+            yield from response.json()
+
+            if "next" not in response.links:
+                break
+
+            page += 1
+
+
+# ----------------------------------------------------------------------
+class _GitHubSession(_GitHubApiSession):
+    """Session used to communicate with the GitHub APIs of a repository."""
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        github_url: str,
+        github_pat: Optional[str],
+        *args,
+        **kwargs,
+    ) -> None:
         github_url = github_url.removesuffix("/")
 
         url_parts = urlparse(github_url)
@@ -115,35 +536,413 @@ class _GitHubSession(requests.Session):
 
         _, username, repo = path_parts
 
-        if url_parts.netloc.lower() in ["github.com", "www.github.com"]:
-            api_url = f"https://api.github.com/repos/{username}/{repo}"
-            is_enterprise = False
-        else:
-            api_url = f"{url_parts.scheme}://{url_parts.netloc}/api/v3/repos/{username}/{repo}"
-            is_enterprise = True
+        api_root_url, is_enterprise = _GetApiRootUrl(url_parts.scheme, url_parts.netloc)
+
+        super().__init__(f"{api_root_url}/repos/{username}/{repo}", github_pat, *args, **kwargs)
 
         self.github_url = github_url
         self.github_pat = github_pat
         self.github_username = username
         self.github_repository = repo
-        self.api_url = api_url
         self.is_enterprise = is_enterprise
         self.has_pat = bool(github_pat)
 
     # ----------------------------------------------------------------------
-    def request(
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Recreate the session when it is sent to another process (for example, when `--processes` is used).
+
+        The branches of a repository received by that process share the same session.
+        """
+        return _GetRepositorySession, (self.github_url, self.github_pat)
+
+
+# ----------------------------------------------------------------------
+class _GitHubOrganizationSession(_GitHubApiSession):
+    """Session used to enumerate the repositories of a GitHub organization or user."""
+
+    # ----------------------------------------------------------------------
+    def __init__(
         self,
-        method: str,
-        url: str,
+        org: str,  # Organization URL (e.g. https://github.com/gt-sse-center) or name (e.g. gt-sse-center)
+        github_pat: Optional[str],
         *args,
         **kwargs,
-    ) -> requests.Response:
-        if url and not url.startswith("/"):
-            url = f"/{url}"
+    ) -> None:
+        # Used to recreate the session in other processes
+        self._reduce_args = (org, github_pat)
+
+        org = org.removesuffix("/")
+
+        if "://" in org:
+            url_parts = urlparse(org)
+            path_parts = url_parts.path.split("/")
+
+            # The URL should be of the form <github_server>/<org>
+            if len(path_parts) != 2 or not path_parts[1]:  # noqa: PLR2004
+                msg = f"'{org}' is not a valid GitHub organization URL."
+                raise ValueError(msg)
 
-        return super().request(
-            method,
-            f"{self.api_url}{url}",
-            *args,
-            **kwargs,
+            scheme = url_parts.scheme
+            netloc = url_parts.netloc
+            org_name = path_parts[1]
+        else:
+            scheme = "https"
+            netloc = "github.com"
+            org_name = org
+
+        api_root_url, _ = _GetApiRootUrl(scheme, netloc)
+
+        super().__init__(api_root_url, github_pat, *args, **kwargs)
+
+        self.org_name = org_name
+
+    # ----------------------------------------------------------------------
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Recreate the session when it is sent to another process (for example, when `--processes` is used).
+
+        Connections and cached organization information cannot be shared with other processes, so
+        the session is created again in the process that receives it; all of the repositories
+        received by that process share the same session.
+        """
+        return _GetOrganizationSession, self._reduce_args
+
+    # ----------------------------------------------------------------------
+    def EnumerateRepositories(self) -> Iterator[dict[str, Any]]:
+        """Enumerate the repositories of the organization (or user), requesting each page as it is needed."""
+        try:
+            yield from self.GetAll(f"/orgs/{self.org_name}/repos", {"type": "all"})
+        except requests.HTTPError as ex:
+            # The name may refer to a user rather than an organization
+            if ex.response is None or ex.response.status_code != 404:  # noqa: PLR2004
+                raise
+
+            yield from self.GetAll(f"/users/{self.org_name}/repos", {"type": "owner"})
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _IsThrottled(
+    response: requests.Response,
+) -> bool:
+    """Return True if the response indicates that GitHub has limited the rate of requests.
+
+    GitHub responds with 429 or with 403 when a primary or secondary rate limit has been exceeded
+    (see https://docs.github.com/en/rest/using-the-rest-api/rate-limits-for-the-rest-api).
+    """
+    if response.status_code == 429:  # noqa: PLR2004
+        return True
+
+    if response.status_code == 403:  # noqa: PLR2004
+        return (
+            "retry-after" in response.headers
+            or response.headers.get("x-ratelimit-remaining") == "0"
+            or "rate limit" in response.text.lower()
         )
+
+    return False
+
+
+# ----------------------------------------------------------------------
+def _RecordRateLimit(
+    response: requests.Response,
+    operation: AdaptiveLimiter.Operation,
+) -> None:
+    """Record the rate limit reported by the server so that requests to it are paused once the limit is exhausted.
+
+    Each server (github.com and each GitHub Enterprise Server instance) has its own rate limit, so
+    exhausting the limit of one server does not delay requests sent to others. Servers that do not
+    enforce rate limits do not return these headers.
+    """
+    retry_after = response.headers.get("retry-after")
+    if retry_after is not None and retry_after.isdigit():
+        operation.PauseFor(float(retry_after))
+
+    remaining = response.headers.get("x-ratelimit-remaining")
+    if remaining is None or not remaining.isdigit():
+        return
+
+    operation.SetRateLimitRemaining(int(remaining))
+
+    reset = response.headers.get("x-ratelimit-reset")
+    if int(remaining) == 0 and reset is not None and reset.isdigit():
+        # The reset time is expressed in UTC epoch seconds
+        operation.PauseFor(max(0.0, int(reset) - time.time()))
+
+
+# ----------------------------------------------------------------------
+def _ReadPat(
+    github_pat: Optional[str],
+) -> Optional[str]:
+    """Return the PAT, which may be provided as a value or the name of a file that contains the value."""
+    if github_pat:
+        potential_file = Path(github_pat)
+        if potential_file.is_file():
+            with potential_file.open("r") as f:
+                github_pat = f.read().strip()
+
+    return github_pat
+
+
+# ----------------------------------------------------------------------
+def _GetHeadSha(
+    organization_session: _GitHubOrganizationSession,
+    full_name: Optional[str],
+    branch: Optional[str],
+) -> Optional[str]:
+    """Return the SHA of the head commit of the branch, or None if it is not available (for example, because the repository is empty)."""
+    if full_name is None or branch is None:
+        return None
+
+    response = organization_session.get(f"/repos/{full_name}/branches/{branch}")
+    if response.status_code != requests.codes.OK:
+        return None
+
+    return response.json().get("commit", {}).get("sha")
+
+
+# ----------------------------------------------------------------------
+def _GetBranchPatterns(
+    dynamic_args: dict[str, Any],
+) -> list[str]:
+    """Return the names or patterns of the branches to evaluate, which may be provided as a single value or a list."""
+    branches = dynamic_args.get("branch") or []
+    if isinstance(branches, str):
+        branches = [branches]
+
+    return list(dict.fromkeys(branches))
+
+
+# ----------------------------------------------------------------------
+def _IsMultiBranch(
+    branch_patterns: list[str],
+) -> bool:
+    """Return True if the patterns may match multiple branches."""
+    return len(branch_patterns) > 1 or any(_IsPattern(pattern) for pattern in branch_patterns)
+
+
+# ----------------------------------------------------------------------
+def _IsEvaluatedBranch(
+    branch: str,
+    branch_patterns: list[str],
+    default_branch: Optional[str],
+) -> bool:
+    """Return True if the branch is evaluated (the default branch is evaluated when no branches are provided)."""
+    if not branch_patterns:
+        return branch == default_branch
+
+    return any(fnmatchcase(branch, pattern) for pattern in branch_patterns)
+
+
+# ----------------------------------------------------------------------
+def _IsPattern(
+    branch: str,
+) -> bool:
+    """Return True if the branch name contains wildcards."""
+    return any(char in branch for char in "*?[")
+
+
+# ----------------------------------------------------------------------
+def _GetBranches(
+    session: _GitHubApiSession,
+    branch_patterns: list[str],
+) -> list[str]:
+    """Return the names of the branches that match the patterns, in the order in which the patterns were provided.
+
+    The branches of the repository are only retrieved when a pattern is provided; names are used as
+    is (so that a branch that does not exist is reported when it is evaluated).
+    """
+    branch_names: list[str] = []
+
+    if any(_IsPattern(pattern) for pattern in branch_patterns):
+        # The branches may not be available (for example, because the repository does not exist);
+        # the branches provided by name are still evaluated so that the error is reported.
+        with contextlib.suppress(requests.HTTPError):
+            branch_names = [branch["name"] for branch in session.GetAll("branches")]
+
+    branches: dict[str, None] = {}  # Use a dict to remove duplicates while preserving order
+
+    for pattern in branch_patterns:
+        if not _IsPattern(pattern):
+            branches[pattern] = None
+            continue
+
+        for branch_name in branch_names:
+            if fnmatchcase(branch_name, pattern):
+                branches[branch_name] = None
+
+    return list(branches)
+
+
+# ----------------------------------------------------------------------
+def _GetRepositoryUrls(
+    urls: list[str],
+) -> list[str]:
+    """Return the repository URLs provided directly or within files of URLs (one per line)."""
+    repository_urls: dict[str, None] = {}  # Use a dict to remove duplicates while preserving order
+
+    for url in urls:
+        potential_file = Path(url)
+
+        if potential_file.is_file():
+            with potential_file.open("r") as f:
+                for line in f:
+                    line = line.strip()  # noqa: PLW2901
+
+                    if line and not line.startswith("#"):
+                        repository_urls[line.removesuffix("/")] = None
+        else:
+            repository_urls[url.removesuffix("/")] = None
+
+    return list(repository_urls)
+
+
+# ----------------------------------------------------------------------
+def _IsIncluded(
+    dynamic_args: dict[str, Any],
+    repository: dict[str, Any],
+) -> bool:
+    """Return True if a repository of an organization (as returned by the GitHub APIs) should be audited."""
+    if repository.get("archived") and not dynamic_args.get("archived"):
+        return False
+    if repository.get("fork") and not dynamic_args.get("forks"):
+        return False
+    if dynamic_args.get("visibility") and _GetVisibility(repository) != dynamic_args["visibility"]:
+        return False
+
+    return set(dynamic_args.get("topic") or []).issubset(repository.get("topics") or [])
+
+
+# ----------------------------------------------------------------------
+def _IsOrganizationRepository(
+    org: str,  # Organization URL (e.g. https://github.com/gt-sse-center) or name (e.g. gt-sse-center)
+    url: str,
+) -> bool:
+    """Return True if the repository URL belongs to the organization (or user)."""
+    org = org.removesuffix("/")
+
+    if "://" not in org:
+        org = f"https://github.com/{org}"
+
+    org_parts = urlparse(org.lower())
+    url_parts = urlparse(url.lower())
+
+    return (
+        org_parts.netloc == url_parts.netloc
+        and url_parts.path.rpartition("/")[0] == org_parts.path
+        and bool(url_parts.path.rpartition("/")[2])
+    )
+
+
+# ----------------------------------------------------------------------
+def _GetApiRootUrl(
+    scheme: str,
+    netloc: str,
+) -> tuple[str, bool]:
+    """Return the root URL of the GitHub APIs for the server and a value indicating whether the server is GitHub Enterprise."""
+    if netloc.lower() in ["github.com", "www.github.com"]:
+        return "https://api.github.com", False
+
+    return f"{scheme}://{netloc}/api/v3", True
+
+
+# ----------------------------------------------------------------------
+def _GetVisibility(
+    repository: dict[str, Any],
+) -> str:
+    """Return the visibility of a repository returned by the GitHub APIs."""
+    visibility = repository.get("visibility")
+    if visibility:
+        return visibility
+
+    return "private" if repository.get("private") else "public"
+
+
+# ----------------------------------------------------------------------
+def _GetHttpAdapter(
+    scheme: str,
+    netloc: str,
+) -> requests.adapters.HTTPAdapter:
+    """Return the adapter (and its connection pool) shared by all sessions that communicate with the server."""
+    key = f"{scheme}://{netloc.lower()}"
+
+    with _http_adapters_lock:
+        adapter = _http_adapters.get(key)
+
+        if adapter is None:
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=AdaptiveLimiter.DEFAULT_MAX_VALUE)
+            _http_adapters[key] = adapter
+
+    return adapter
+
+
+# ----------------------------------------------------------------------
+def _GetOrganizationSession(
+    org: str,
+    github_pat: Optional[str],
+) -> _GitHubOrganizationSession:
+    """Return the organization session shared by all of the repositories received by this process."""
+    with _organization_sessions_lock:
+        session = _organization_sessions.get((org, github_pat))
+
+        if session is None:
+            session = _GitHubOrganizationSession(org, github_pat)
+            _organization_sessions[(org, github_pat)] = session
+
+    return session
+
+
+# ----------------------------------------------------------------------
+def _GetRepositorySession(
+    github_url: str,
+    github_pat: Optional[str],
+) -> _GitHubSession:
+    """Return the session shared by the branches of a repository that are being evaluated by this process."""
+    with _repository_sessions_lock:
+        session = _repository_sessions.get((github_url, github_pat))
+
+        if session is None:
+            session = _GitHubSession(github_url, github_pat)
+            _repository_sessions[(github_url, github_pat)] = session
+
+    return session
+
+
+# ----------------------------------------------------------------------
+def _OnForkInChild() -> None:
+    """Ensure that forked processes do not use connections created by the parent process."""
+    global _http_adapters_lock, _organization_sessions_lock, _repository_sessions_lock  # noqa: PLW0603
+
+    _http_adapters.clear()
+    _http_adapters_lock = threading.Lock()
+
+    _organization_sessions.clear()
+    _organization_sessions_lock = threading.Lock()
+
+    _repository_sessions.clear()
+    _repository_sessions_lock = threading.Lock()
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_VISIBILITY_VALUES = ("public", "private", "internal")
+
+_http_adapters: dict[str, requests.adapters.HTTPAdapter] = {}
+_http_adapters_lock = threading.Lock()
+
+# Organization sessions received from other processes
+_organization_sessions: dict[tuple[str, Optional[str]], _GitHubOrganizationSession] = {}
+_organization_sessions_lock = threading.Lock()
+
+# Sessions shared by the branches of a repository; sessions are released once the branches have been
+# evaluated
+_repository_sessions: weakref.WeakValueDictionary[tuple[str, Optional[str]], _GitHubSession] = (
+    weakref.WeakValueDictionary()
+)
+_repository_sessions_lock = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_OnForkInChild)
@@ -21,4 +21,6 @@ class ScientificSoftwareQuery(CloneRepositoryMixin, Query):
             [
                 Citation(),
             ],
+            cost_hint=self.CLONE_COST_HINT,
+            events=("repository", "push"),
         )
@@ -6,13 +6,18 @@
 # -------------------------------------------------------------------------------
 """Contains the Query object and types used in its definition."""
 
+import hashlib
+import json
+import string
 import threading
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, Optional, Protocol
 
+from RepoAuditor import __version__
 from RepoAuditor.Impl.ParallelSequentialProcessor import ParallelSequentialProcessor
+from RepoAuditor.Impl.ResultCache import ResultCache
 from RepoAuditor.Requirement import EvaluateResult, ExecutionStyle, Requirement, ReturnCode
 
 
@@ -55,10 +60,17 @@ class Query(ABC):
         name: str,
         style: ExecutionStyle,
         requirements: Sequence[Requirement],
+        *,
+        cost_hint: float = 1.0,  # Estimated number of seconds required to retrieve the data; used to schedule work when durations from previous runs are not available
+        events: Optional[
+            Sequence[str]
+        ] = None,  # Names of the webhook events that may change the data retrieved by the query; None if any event may change it
     ) -> None:
         self.name = name
         self.style = style
         self.requirements = requirements
+        self.cost_hint = cost_hint
+        self.events = events
 
     # ----------------------------------------------------------------------
     @abstractmethod
@@ -68,6 +80,21 @@ class Query(ABC):
     ) -> Optional[dict[str, Any]]:
         """Return the data object augmented with information required by the Requirements associated with this Query."""
 
+    # ----------------------------------------------------------------------
+    def GetFingerprintData(
+        self,
+        query_data: dict[str, Any],
+    ) -> Optional[Any]:  # noqa: ANN401
+        """Return the values in the query data that determine the results of the Requirements, or None if the results cannot be cached.
+
+        When a result cache is active, the result of a Requirement is reused if these values, the
+        Requirement's arguments, and the values referenced by its templates are unchanged. The value
+        must be serializable as JSON. Results are not cached by default, as Requirements may read
+        values that are not serializable (for example, the files of a cloned repository).
+        """
+        del query_data
+        return None
+
     # ----------------------------------------------------------------------
     def Evaluate(
         self,
@@ -83,14 +110,56 @@ class Query(ABC):
 
         status_func(*status_info.__dict__.values())
 
+        result_cache = ResultCache.GetActive()
+        fingerprint_data = None if result_cache is None else self.GetFingerprintData(query_data)
+
         # ----------------------------------------------------------------------
         def EvaluateRequirement(
             requirement: Requirement,
         ) -> tuple[int, Query.EvaluateInfo]:
-            result_info = requirement.Evaluate(
-                query_data,
-                requirement_args.get(requirement.name, {}),
+            this_requirement_args = requirement_args.get(requirement.name, {})
+
+            fingerprint = (
+                None
+                if fingerprint_data is None
+                else self._CalcFingerprint(requirement, query_data, fingerprint_data, this_requirement_args)
             )
+
+            cached_values = None if fingerprint is None else result_cache.Get(fingerprint)  # type: ignore[union-attr]
+
+            if cached_values is not None:
+                result_info = Requirement.EvaluateInfo(
+                    EvaluateResult[cached_values["result"]],
+                    cached_values["context"],
+                    cached_values["resolution"],
+                    cached_values["rationale"],
+                    requirement,
+                    description=cached_values["description"],
+                )
+            else:
+                result_info = requirement.Evaluate(query_data, this_requirement_args)
+
+            evaluate_info = Query.EvaluateInfo(
+                **{
+                    "query": self,
+                    **result_info.__dict__,
+                },
+            )
+
+            if cached_values is None and fingerprint is not None:
+                # The resolution and rationale are rendered when the cache is saved rather than now,
+                # as they are often not displayed; they are only rendered once if they are displayed.
+                result_cache.Record(  # type: ignore[union-attr]
+                    fingerprint,
+                    {
+                        "result": evaluate_info.result.name,
+                        "context": evaluate_info.context,
+                        "resolution": lambda: evaluate_info.resolution,
+                        "rationale": lambda: evaluate_info.rationale,
+                        "description": evaluate_info.description,
+                    },
+                )
+
             return_code = ReturnCode.SUCCESS
 
             with status_info_lock:
@@ -112,15 +181,7 @@ class Query(ABC):
 
                 status_func(*status_info.__dict__.values())
 
-            return (
-                return_code,
-                Query.EvaluateInfo(
-                    **{
-                        "query": self,
-                        **result_info.__dict__,
-                    },
-                ),
-            )
+            return return_code, evaluate_info
 
         # ----------------------------------------------------------------------
 
@@ -138,6 +199,53 @@ class Query(ABC):
         """Clean up any resources created during execution."""
         del module_data
 
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _CalcFingerprint(
+        self,
+        requirement: Requirement,
+        query_data: dict[str, Any],
+        fingerprint_data: Any,  # noqa: ANN401
+        requirement_args: dict[str, Any],
+    ) -> Optional[str]:
+        """Return the fingerprint of the values that determine the result of the requirement, or None if they cannot be serialized."""
+        # Templates may reference any value in the query data. Values whose names begin with "__" are
+        # populated by requirements during evaluation (and are derived from the other values), so
+        # they are not included.
+        formatter = string.Formatter()
+        template_values: dict[str, Any] = {}
+
+        for field_name in requirement.template_field_names:
+            if field_name.startswith("__"):
+                continue
+
+            try:
+                template_values[field_name] = formatter.get_field(field_name, (), query_data)[0]
+            except (AttributeError, IndexError, KeyError, TypeError):
+                template_values[field_name] = None
+
+        try:
+            content = json.dumps(
+                [
+                    __version__,
+                    f"{type(self).__module__}.{type(self).__qualname__}",
+                    self.name,
+                    f"{type(requirement).__module__}.{type(requirement).__qualname__}",
+                    requirement.name,
+                    fingerprint_data,
+                    template_values,
+                    requirement_args,
+                ],
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            return None
+
+        return hashlib.sha256(content.encode("UTF-8")).hexdigest()
+
 
 # ----------------------------------------------------------------------
 class StatusInfo:
@@ -7,14 +7,18 @@
 """Contains types used when creating Requirements."""
 
 from abc import ABC, abstractmethod
+from collections import ChainMap
+from collections.abc import Callable, Mapping, MutableMapping
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum, auto
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Optional, Union
 
 from dbrownell_Common.TyperEx import TypeDefinitionItemType  # type: ignore[import-untyped]
 from dbrownell_Common.Types import extension  # type: ignore[import-untyped]
 
 from RepoAuditor.Impl.ParallelSequentialProcessor import ExecutionStyle
+from RepoAuditor.Impl.Template import Template
 
 
 # ----------------------------------------------------------------------
@@ -25,6 +29,7 @@ class EvaluateResult(Enum):
     Success = auto()
     Warning = auto()
     Error = auto()
+    Timeout = auto()  # The data required to evaluate the Requirement could not be retrieved in time
 
 
 class ReturnCode(IntEnum):
@@ -36,6 +41,48 @@ class ReturnCode(IntEnum):
     DOESNOTAPPLY = 2
 
 
+# ----------------------------------------------------------------------
+class _LazyText:
+    """Dataclass field whose value is a string or a function that renders the string the first time that the value is accessed.
+
+    Defined before `Requirement`, as it is used when `Requirement.EvaluateInfo` is created.
+    """
+
+    # ----------------------------------------------------------------------
+    def __set_name__(
+        self,
+        owner: type,
+        name: str,
+    ) -> None:
+        self._name = name
+
+    # ----------------------------------------------------------------------
+    def __get__(
+        self,
+        instance: Any,  # noqa: ANN401
+        owner: Optional[type] = None,
+    ) -> Optional[str]:
+        if instance is None:
+            # The field does not have a default value
+            raise AttributeError(self._name)
+
+        value = instance.__dict__[self._name]
+
+        if callable(value):
+            value = value()
+            instance.__dict__[self._name] = value
+
+        return value
+
+    # ----------------------------------------------------------------------
+    def __set__(
+        self,
+        instance: Any,  # noqa: ANN401
+        value: Union[str, Callable[[], str], None],
+    ) -> None:
+        instance.__dict__[self._name] = value
+
+
 # ----------------------------------------------------------------------
 class Requirement(ABC):
     """A single requirement that can be evaluated against a set of data."""
@@ -52,11 +99,16 @@ class Requirement(ABC):
         result: EvaluateResult
         context: Optional[str]
 
-        resolution: Optional[str]
-        rationale: Optional[str]
+        # The resolution and rationale may be provided as functions that render them, in which case
+        # they are only rendered if they are accessed (they are often not displayed).
+        resolution: _LazyText = _LazyText()
+        rationale: _LazyText = _LazyText()
 
         requirement: "Requirement"
 
+        # The description of the requirement, populated with values specific to this evaluation
+        description: Optional[str] = field(kw_only=True, default=None)
+
     # ----------------------------------------------------------------------
     @dataclass(frozen=True)
     class EvaluateImplResult:
@@ -87,17 +139,49 @@ class Requirement(ABC):
         If `requires_explicit_include` is True, the requirement must be explicitly included on the command line.
         """
         self.name = name
-        # Use description template so we can update this description for each requirement
-        self.description_template = description
+        # Use description template so that the description can be populated for each evaluation; the
+        # populated description is returned in the EvaluateInfo and never stored on the instance.
+        # Templates are parsed once so that each evaluation only uses the values that they reference.
+        self._description_template = Template(description)
         # Use the description as is as backup
         self.description = description
         self.style = style
 
-        self.resolution_template = resolution_template
-        self.rationale_template = rationale_template
+        self._resolution_template = Template(resolution_template)
+        self._rationale_template = Template(rationale_template)
 
         self.requires_explicit_include = requires_explicit_include
 
+    # ----------------------------------------------------------------------
+    @property
+    def description_template(self) -> str:
+        """Template used to populate the description for each evaluation."""
+        return self._description_template.text
+
+    # ----------------------------------------------------------------------
+    @property
+    def resolution_template(self) -> str:
+        """Template used to populate the resolution when the requirement is not met."""
+        return self._resolution_template.text
+
+    # ----------------------------------------------------------------------
+    @property
+    def rationale_template(self) -> str:
+        """Template used to populate the rationale when the requirement is not met."""
+        return self._rationale_template.text
+
+    # ----------------------------------------------------------------------
+    @property
+    def template_field_names(self) -> tuple[str, ...]:
+        """Fields (for example, "repo.name") referenced by the description, resolution, and rationale templates."""
+        return tuple(
+            dict.fromkeys(
+                self._description_template.field_names
+                + self._resolution_template.field_names
+                + self._rationale_template.field_names,
+            ),
+        )
+
     # ----------------------------------------------------------------------
     @extension
     def GetDynamicArgDefinitions(self, argument_separator: str) -> dict[str, TypeDefinitionItemType]:  # noqa: ARG002
@@ -109,25 +193,40 @@ class Requirement(ABC):
     # ----------------------------------------------------------------------
     def Evaluate(
         self,
-        query_data: dict[str, Any],
+        query_data: Mapping[str, Any],
         requirement_args: dict[str, Any],
     ) -> "Requirement.EvaluateInfo":
-        """Evaluate the requirements given the query data and specific arguments."""
-        result_info = self._EvaluateImpl(query_data, requirement_args)
+        """Evaluate the requirements given the query data and specific arguments.
+
+        The query data is shared by all requirements associated with a query (which may be evaluated
+        in parallel) and is never modified. Values written by a requirement during its evaluation
+        are stored in an overlay that is only visible to that evaluation.
+        """
+        context: ChainMap[str, Any] = ChainMap({}, MappingProxyType(query_data))  # type: ignore[arg-type]
+
+        result_info = self._EvaluateImpl(context, requirement_args)
 
         # Fill in templates in description string
-        self.description = self.description_template.format(**query_data)
+        description = self._description_template.Render(context)
 
         if result_info.result == EvaluateResult.Error:
             return Requirement.EvaluateInfo(
                 result_info.result,
                 result_info.context,
-                (self.resolution_template.format(**query_data) if result_info.provide_resolution else None),
-                (self.rationale_template.format(**query_data) if result_info.provide_rationale else None),
+                (self._resolution_template.Bind(context) if result_info.provide_resolution else None),
+                (self._rationale_template.Bind(context) if result_info.provide_rationale else None),
                 self,
+                description=description,
             )
 
-        return Requirement.EvaluateInfo(result_info.result, result_info.context, None, None, self)
+        return Requirement.EvaluateInfo(
+            result_info.result,
+            result_info.context,
+            None,
+            None,
+            self,
+            description=description,
+        )
 
     # ----------------------------------------------------------------------
     # |
@@ -137,7 +236,10 @@ class Requirement(ABC):
     @abstractmethod
     def _EvaluateImpl(
         self,
-        query_data: dict[str, Any],
+        query_data: MutableMapping[str, Any],
         requirement_args: dict[str, Any],
     ) -> "Requirement.EvaluateImplResult":
-        """Perform the actual evaluation."""
+        """Perform the actual evaluation.
+
+        Values written to `query_data` are only visible to this evaluation of the requirement.
+        """
@@ -0,0 +1,370 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Contains the ResultStore object."""
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from RepoAuditor import __version__
+from RepoAuditor.ExecuteModules import ModuleResult
+from RepoAuditor.Module import EvaluateResult
+
+
+# ----------------------------------------------------------------------
+class ResultStore:
+    """SQLite database containing the results of each audit, used to answer questions about audits over time.
+
+    Each audit is recorded as a run, and the outcome of each requirement for each repository is
+    recorded as soon as the module that evaluates it completes. Results are indexed by repository,
+    requirement, and run so that the history of a repository or requirement can be queried without
+    reading the results of every audit.
+    """
+
+    VERSION = 1
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class RunSummary:
+        """The number of each outcome recorded by a run."""
+
+        run_id: int
+        started: datetime
+        completed: Optional[
+            datetime
+        ]  # None if the audit did not complete (for example, because it was interrupted)
+        num_repositories: int
+        num_results: dict[EvaluateResult, int]
+
+        # ----------------------------------------------------------------------
+        @property
+        def num_applicable(self) -> int:
+            """Number of outcomes where the requirement applies."""
+            return sum(self.num_results.values()) - self.num_results[EvaluateResult.DoesNotApply]
+
+        # ----------------------------------------------------------------------
+        @property
+        def pass_rate(self) -> Optional[float]:
+            """Percentage of the outcomes where the requirement applies that are successful, or None if none apply."""
+            num_applicable = self.num_applicable
+            if num_applicable == 0:
+                return None
+
+            return self.num_results[EvaluateResult.Success] / num_applicable
+
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class Regression:
+        """A requirement whose outcome is more severe than its outcome when it was previously recorded."""
+
+        run_id: int
+        recorded: datetime
+        repository: Optional[str]
+        module_name: str
+        query_name: str
+        requirement_name: str
+        previous_result: EvaluateResult
+        result: EvaluateResult
+        context: Optional[str]
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+    ) -> None:
+        self._connection = connection
+        self._run_id: Optional[int] = None
+
+        with self._connection:
+            version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+
+            if version == 0:
+                self._connection.executescript(_SCHEMA)
+                self._connection.execute(f"PRAGMA user_version = {self.VERSION}")
+            elif version != self.VERSION:
+                msg = f"The results database was written by an incompatible version of RepoAuditor (version {version})."
+                raise ValueError(msg)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    @contextmanager
+    def Open(
+        cls,
+        filename: Path,
+    ) -> Iterator["ResultStore"]:
+        """Open the database, creating it if it does not exist."""
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(sqlite3.connect(filename)) as connection:
+            yield cls(connection)
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def Run(self) -> Iterator[int]:
+        """Record a run that contains the results recorded within the context, yielding the run's id.
+
+        The run is marked as complete only if the context exits without an exception.
+        """
+        assert self._run_id is None, "Runs cannot be nested."
+
+        with self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO runs (started, version) VALUES (?, ?)",
+                (_Now(), __version__),
+            )
+
+        assert cursor.lastrowid is not None
+        self._run_id = cursor.lastrowid
+
+        try:
+            yield self._run_id
+
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE runs SET completed = ? WHERE id = ?",
+                    (_Now(), self._run_id),
+                )
+
+        finally:
+            self._run_id = None
+
+    # ----------------------------------------------------------------------
+    def Record(
+        self,
+        module_result: ModuleResult,
+    ) -> None:
+        """Record the results of a module in the current run.
+
+        The duration of the module's evaluation is recorded with each of its results (the module's
+        requirements are evaluated together, so they do not have durations of their own).
+        """
+        assert self._run_id is not None, "Results must be recorded within a run."
+
+        recorded = _Now()
+
+        with self._connection:
+            self._connection.executemany(
+                """
+                INSERT INTO results (
+                    run_id, recorded, repository, module, query, requirement, result, context, duration
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        self._run_id,
+                        recorded,
+                        module_result.module_info.repository,
+                        module_result.module_info.module.name,
+                        result.query.name,
+                        result.requirement.name,
+                        result.result.name,
+                        result.context,
+                        module_result.duration,
+                    )
+                    for result in module_result.results
+                ],
+            )
+
+    # ----------------------------------------------------------------------
+    def GetRunSummaries(
+        self,
+        num_runs: int,
+        *,
+        repository: Optional[str] = None,  # Glob pattern
+        requirement: Optional[str] = None,  # Glob pattern
+    ) -> list["ResultStore.RunSummary"]:
+        """Return summaries of the most recent runs (in the order in which they were started), counting only the results that match the patterns."""
+        filter_clause, filter_params = _CreateFilter(repository, requirement)
+
+        rows = self._connection.execute(
+            f"""
+            SELECT runs.id, runs.started, runs.completed, results.result, COUNT(*)
+            FROM runs JOIN results ON results.run_id = runs.id
+            WHERE runs.id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?){filter_clause}
+            GROUP BY runs.id, results.result
+            ORDER BY runs.id
+            """,  # noqa: S608
+            (num_runs, *filter_params),
+        ).fetchall()
+
+        repository_rows = self._connection.execute(
+            f"""
+            SELECT runs.id, COUNT(DISTINCT results.repository)
+            FROM runs JOIN results ON results.run_id = runs.id
+            WHERE runs.id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?){filter_clause}
+            GROUP BY runs.id
+            """,  # noqa: S608
+            (num_runs, *filter_params),
+        ).fetchall()
+
+        num_repositories = dict(repository_rows)
+
+        summaries: dict[int, ResultStore.RunSummary] = {}
+
+        for run_id, started, completed, result, num_results in rows:
+            summary = summaries.get(run_id)
+
+            if summary is None:
+                summary = ResultStore.RunSummary(
+                    run_id,
+                    datetime.fromisoformat(started),
+                    None if completed is None else datetime.fromisoformat(completed),
+                    num_repositories[run_id],
+                    dict.fromkeys(EvaluateResult, 0),
+                )
+
+                summaries[run_id] = summary
+
+            summary.num_results[EvaluateResult[result]] = num_results
+
+        return list(summaries.values())
+
+    # ----------------------------------------------------------------------
+    def GetRegressions(
+        self,
+        num_runs: int,
+        *,
+        repository: Optional[str] = None,  # Glob pattern
+        requirement: Optional[str] = None,  # Glob pattern
+    ) -> list["ResultStore.Regression"]:
+        """Return the requirements that regressed in the most recent runs (most recent first).
+
+        Each result is compared to the previous result recorded for the same requirement and
+        repository, which may have been recorded by an earlier run than the runs returned (for
+        example, when a run only audited some of the repositories). Only the results of the most
+        recent runs are read; the previous result of each is found with the `results_repository`
+        index.
+        """
+        filter_clause, filter_params = _CreateFilter(repository, requirement)
+
+        rows = self._connection.execute(
+            f"""
+            SELECT run_id, recorded, repository, module, query, requirement, previous_result, result, context
+            FROM (
+                SELECT
+                    results.*,
+                    (
+                        SELECT previous.result
+                        FROM results AS previous
+                        WHERE
+                            previous.repository IS results.repository
+                            AND previous.module = results.module
+                            AND previous.query = results.query
+                            AND previous.requirement = results.requirement
+                            AND previous.run_id < results.run_id
+                        ORDER BY previous.run_id DESC
+                        LIMIT 1
+                    ) AS previous_result
+                FROM results
+                WHERE results.run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?){filter_clause}
+            )
+            WHERE
+                previous_result IS NOT NULL
+                AND {_SEVERITY_EXPRESSION.format("result")} > {_SEVERITY_EXPRESSION.format("previous_result")}
+            ORDER BY run_id DESC, repository, module, requirement
+            """,  # noqa: S608
+            (num_runs, *filter_params),
+        ).fetchall()
+
+        return [
+            ResultStore.Regression(
+                run_id,
+                datetime.fromisoformat(recorded),
+                repository_name,
+                module_name,
+                query_name,
+                requirement_name,
+                EvaluateResult[previous_result],
+                EvaluateResult[result],
+                context,
+            )
+            for (
+                run_id,
+                recorded,
+                repository_name,
+                module_name,
+                query_name,
+                requirement_name,
+                previous_result,
+                result,
+                context,
+            ) in rows
+        ]
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+# ----------------------------------------------------------------------
+def _CreateFilter(
+    repository: Optional[str],
+    requirement: Optional[str],
+) -> tuple[str, list[Any]]:
+    """Return the clause (appended to a WHERE clause) and parameters that filter results."""
+    clause = ""
+    params: list[Any] = []
+
+    if repository is not None:
+        clause += " AND results.repository GLOB ?"
+        params.append(repository)
+
+    if requirement is not None:
+        clause += " AND results.requirement GLOB ?"
+        params.append(requirement)
+
+    return clause, params
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_SCHEMA = """
+CREATE TABLE runs (
+    id INTEGER PRIMARY KEY,
+    started TEXT NOT NULL,
+    completed TEXT,
+    version TEXT NOT NULL
+);
+
+CREATE TABLE results (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    recorded TEXT NOT NULL,
+    repository TEXT,
+    module TEXT NOT NULL,
+    query TEXT NOT NULL,
+    requirement TEXT NOT NULL,
+    result TEXT NOT NULL,
+    context TEXT,
+    duration REAL -- Seconds taken to evaluate the module (the same for each of the module's results)
+);
+
+CREATE INDEX results_run ON results (run_id);
+CREATE INDEX results_repository ON results (repository, module, query, requirement, run_id);
+CREATE INDEX results_requirement ON results (requirement, run_id);
+"""
+
+# Errors (and timeouts) are more severe than warnings, which are more severe than other outcomes
+_SEVERITY_EXPRESSION = "(CASE {0} WHEN 'Error' THEN 2 WHEN 'Timeout' THEN 2 WHEN 'Warning' THEN 1 ELSE 0 END)"
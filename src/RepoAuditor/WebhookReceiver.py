@@ -0,0 +1,204 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Contains the WebhookReceiver object."""
+
+import hashlib
+import hmac
+import json
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import replace
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+from RepoAuditor.ExecuteModules import ModuleInfo
+
+
+# ----------------------------------------------------------------------
+class WebhookReceiver:
+    """Receives GitHub webhook deliveries and collects the modules that must be evaluated again.
+
+    Each delivery is converted into module information by `create_module_infos_func` (for example,
+    `CommandLineProcessor.CreateEventModuleInfos`). Deliveries that affect the same module and
+    repository are combined until none have been received for `debounce` seconds, so that a burst of
+    events (for example, a push followed by changes to branch protection rules) results in a single
+    evaluation of the queries affected by any of them.
+
+    When a secret is provided, deliveries must be signed with it (see
+    https://docs.github.com/en/webhooks/using-webhooks/validating-webhook-deliveries).
+    """
+
+    EVENT_HEADER = "X-GitHub-Event"
+    SIGNATURE_HEADER = "X-Hub-Signature-256"
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        create_module_infos_func: Callable[[str, dict[str, Any]], list[ModuleInfo]],
+        *,
+        secret: Optional[str] = None,
+        debounce: float = 10.0,  # Seconds
+    ) -> None:
+        self._create_module_infos_func = create_module_infos_func
+        self._secret = secret
+        self._debounce = debounce
+
+        # Module information waiting to be evaluated and the time at which the most recent delivery
+        # that affects it was received, keyed by (module name, repository)
+        self._pending: dict[tuple[str, Optional[str]], tuple[ModuleInfo, float]] = {}
+        self._condition = threading.Condition()
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_pending(self) -> int:
+        """Number of modules waiting to be evaluated."""
+        with self._condition:
+            return len(self._pending)
+
+    # ----------------------------------------------------------------------
+    def ProcessDelivery(
+        self,
+        event: Optional[str],  # Value of the `X-GitHub-Event` header
+        body: bytes,
+        signature: Optional[str],  # Value of the `X-Hub-Signature-256` header
+    ) -> HTTPStatus:
+        """Process a webhook delivery, returning the status code of the response."""
+        if self._secret is not None:
+            expected_signature = "sha256={}".format(
+                hmac.new(self._secret.encode("UTF-8"), body, hashlib.sha256).hexdigest(),
+            )
+
+            if signature is None or not hmac.compare_digest(expected_signature, signature):
+                return HTTPStatus.UNAUTHORIZED
+
+        if not event:
+            return HTTPStatus.BAD_REQUEST
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST
+
+        if not isinstance(payload, dict):
+            return HTTPStatus.BAD_REQUEST
+
+        module_infos = self._create_module_infos_func(event, payload)
+        if not module_infos:
+            # The event does not affect any of the audited repositories (for example, a ping)
+            return HTTPStatus.OK
+
+        now = time.monotonic()
+
+        with self._condition:
+            for module_info in module_infos:
+                key = (module_info.module.name, module_info.repository)
+
+                pending = self._pending.get(key)
+                if pending is not None:
+                    module_info = _Merge(pending[0], module_info)  # noqa: PLW2901
+
+                self._pending[key] = (module_info, now)
+
+            self._condition.notify_all()
+
+        return HTTPStatus.ACCEPTED
+
+    # ----------------------------------------------------------------------
+    def WaitForModuleInfos(
+        self,
+        timeout: Optional[float] = None,  # Seconds
+    ) -> list[ModuleInfo]:
+        """Wait for modules that have not been affected by deliveries for the debounce period; an empty list is returned if there are none before the timeout expires."""
+        end_time = None if timeout is None else time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                now = time.monotonic()
+
+                ready_keys = [
+                    key
+                    for key, (_, last_delivery) in self._pending.items()
+                    if now - last_delivery >= self._debounce
+                ]
+
+                if ready_keys:
+                    return [self._pending.pop(key)[0] for key in ready_keys]
+
+                wait_time: Optional[float] = None
+
+                if self._pending:
+                    wait_time = min(
+                        self._debounce - (now - last_delivery) for _, last_delivery in self._pending.values()
+                    )
+
+                if end_time is not None:
+                    remaining = end_time - now
+                    if remaining <= 0:
+                        return []
+
+                    wait_time = remaining if wait_time is None else min(wait_time, remaining)
+
+                self._condition.wait(wait_time)
+
+    # ----------------------------------------------------------------------
+    def CreateServer(
+        self,
+        host: str,
+        port: int,  # 0 to use any available port
+    ) -> ThreadingHTTPServer:
+        """Create a server that provides deliveries posted to any path to this receiver; call `serve_forever` to process requests."""
+        receiver = self
+
+        # ----------------------------------------------------------------------
+        class RequestHandler(BaseHTTPRequestHandler):
+            # ----------------------------------------------------------------------
+            def do_POST(self) -> None:
+                try:
+                    content_length = int(self.headers.get("Content-Length") or 0)
+                except ValueError:
+                    status = HTTPStatus.BAD_REQUEST
+                else:
+                    status = receiver.ProcessDelivery(
+                        self.headers.get(receiver.EVENT_HEADER),
+                        self.rfile.read(content_length),
+                        self.headers.get(receiver.SIGNATURE_HEADER),
+                    )
+
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            # ----------------------------------------------------------------------
+            def log_message(self, *args, **kwargs) -> None:
+                # Requests are not written to stderr
+                pass
+
+        # ----------------------------------------------------------------------
+
+        return ThreadingHTTPServer((host, port), RequestHandler)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _Merge(
+    module_info: ModuleInfo,
+    other: ModuleInfo,
+) -> ModuleInfo:
+    """Combine information about a module that was affected by multiple deliveries, so that all of the affected queries are evaluated."""
+    if module_info.query_names is None or other.query_names is None:
+        query_names = None
+    else:
+        query_names = module_info.query_names | other.query_names
+
+    return replace(other, query_names=query_names)
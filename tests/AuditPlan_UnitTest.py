@@ -0,0 +1,218 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for AuditPlan.py"""
+
+import pickle
+import re
+from typing import Any, Optional
+
+import pytest
+from dbrownell_Common.Types import override
+
+from RepoAuditor.AuditPlan import *
+from RepoAuditor.Module import TypeDefinitionItemType
+from RepoAuditor.Query import Query
+from RepoAuditor.Requirement import EvaluateResult, ExecutionStyle, Requirement
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Types
+# |
+# ----------------------------------------------------------------------
+class MyModule(Module):
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        name: str = "MyModule",
+    ):
+        super().__init__(
+            name,
+            "",
+            ExecutionStyle.Parallel,
+            [
+                MyQuery(
+                    "QueryA",
+                    ExecutionStyle.Parallel,
+                    [
+                        MyRequirement("RequirementA1", requires_explicit_include=True),
+                        MyRequirement("RequirementA2", has_dynamic_args=True),
+                    ],
+                ),
+                MyQuery("QueryB", ExecutionStyle.Parallel, [MyRequirement("RequirementB1")]),
+            ],
+        )
+
+    # ----------------------------------------------------------------------
+    @override
+    def GetDynamicArgDefinitions(self) -> dict[str, TypeDefinitionItemType]:
+        return {"url": str}
+
+    # ----------------------------------------------------------------------
+    @override
+    def GenerateInitialData(
+        self,
+        dynamic_args: dict[str, Any],
+    ) -> Optional[dict[str, Any]]:
+        return dynamic_args
+
+
+# ----------------------------------------------------------------------
+class MyQuery(Query):
+    # ----------------------------------------------------------------------
+    @override
+    def GetData(
+        self,
+        module_data: dict[str, Any],
+    ) -> Optional[dict[str, Any]]:
+        return module_data
+
+
+# ----------------------------------------------------------------------
+class MyRequirement(Requirement):
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        name: str,
+        *,
+        requires_explicit_include: bool = False,
+        has_dynamic_args: bool = False,
+    ):
+        super().__init__(
+            name,
+            "",
+            ExecutionStyle.Parallel,
+            "",
+            "",
+            requires_explicit_include=requires_explicit_include,
+        )
+
+        self._has_dynamic_args = has_dynamic_args
+
+    # ----------------------------------------------------------------------
+    @override
+    def GetDynamicArgDefinitions(self, _) -> dict[str, TypeDefinitionItemType]:
+        if not self._has_dynamic_args:
+            return {}
+
+        return {"foo": int}
+
+    # ----------------------------------------------------------------------
+    @override
+    def _EvaluateImpl(
+        self,
+        query_data: dict[str, Any],
+        requirement_args: dict[str, Any],
+    ) -> Requirement.EvaluateImplResult:
+        return Requirement.EvaluateImplResult(EvaluateResult.Success, None)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+def test_Compile():
+    module = MyModule()
+    definitions: list[dict[str, Any]] = []
+
+    # ----------------------------------------------------------------------
+    def GetDynamicArgs(
+        dynamic_arg_definitions: dict[str, Any],
+    ) -> dict[str, Any]:
+        definitions.append(dynamic_arg_definitions)
+        return {"MyModule-url": "repo1", "MyModule-RequirementA2-foo": 10}
+
+    # ----------------------------------------------------------------------
+
+    plan = AuditPlan.Compile(GetDynamicArgs, [module], [], [], set(), set(), all_warnings_as_error=True)
+
+    assert plan == AuditPlan(
+        (
+            AuditPlan.ModulePlan(
+                "MyModule",
+                (("QueryA", ("RequirementA2",)), ("QueryB", ("RequirementB1",))),
+                {"url": "repo1"},
+                {"RequirementA2": {"foo": 10}},
+            ),
+        ),
+        frozenset(["MyModule"]),
+        frozenset(),
+    )
+
+    assert list(definitions[0]) == ["MyModule-url", "MyModule-foo"]
+
+    # The module is not modified
+    assert module.GetNumRequirements() == 3
+
+
+# ----------------------------------------------------------------------
+def test_CompileIncludesAndExcludes():
+    module = MyModule()
+
+    plan = AuditPlan.Compile(
+        lambda *args: {},
+        [module, MyModule("Other")],
+        ["MyModule-RequirementA1"],
+        ["MyModule-RequirementA2", "MyModule-RequirementB1", "Other"],
+        set(),
+        set(),
+        ignore_all_warnings=True,
+    )
+
+    assert [module_plan.name for module_plan in plan.modules] == ["MyModule"]
+    assert plan.modules[0].requirement_names == (("QueryA", ("RequirementA1",)),)
+    assert plan.ignore_warnings_module_names == frozenset(["MyModule"])
+
+    # Arguments cannot be provided for excluded modules
+    with pytest.raises(Exception, match=re.escape("'Other' is not a recognized module name.")):
+        AuditPlan.Compile(
+            lambda *args: {"Other-url": "repo1"},
+            [module, MyModule("Other")],
+            [],
+            ["Other"],
+            set(),
+            set(),
+        )
+
+    assert module.GetNumRequirements() == 3
+
+
+# ----------------------------------------------------------------------
+def test_CreateModules():
+    module = MyModule()
+
+    plan = AuditPlan.Compile(lambda *args: {}, [module], [], ["MyModule-RequirementB1"], set(), set())
+
+    # The plan can be used any number of times
+    for _ in range(2):
+        modules = plan.CreateModules([module])
+
+        assert len(modules) == 1
+        assert modules[0] is not module
+        assert isinstance(modules[0], MyModule)
+        assert [query.name for query in modules[0].queries] == ["QueryA"]
+        assert [requirement.name for requirement in modules[0].queries[0].requirements] == ["RequirementA2"]
+
+    assert module.GetNumRequirements() == 3
+
+    with pytest.raises(ValueError, match=re.escape("The module 'MyModule' is not available.")):
+        plan.CreateModules([MyModule("Other")])
+
+
+# ----------------------------------------------------------------------
+def test_Pickle():
+    plan = AuditPlan.Compile(
+        lambda *args: {"MyModule-url": "repo1", "MyModule-RequirementA2-foo": 10},
+        [MyModule()],
+        [],
+        [],
+        {"MyModule"},
+        set(),
+    )
+
+    assert pickle.loads(pickle.dumps(plan)) == plan
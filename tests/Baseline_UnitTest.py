@@ -0,0 +1,162 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for Baseline.py"""
+
+import re
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from RepoAuditor.Baseline import *
+from RepoAuditor.JsonOutput import WriteRecord
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def module(create_module) -> MagicMock:
+    return create_module("Requirement1", "Requirement2", "Requirement3", "Requirement4")
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def write_baseline(create_module_result):
+    """Return a function that writes the results of each repository to a baseline file."""
+
+    # ----------------------------------------------------------------------
+    def Write(
+        module: MagicMock,
+        filename: Path,
+        all_results: dict[str, list[EvaluateResult]],
+    ) -> None:
+        with filename.open("w") as f:
+            for index, (repository, results) in enumerate(all_results.items()):
+                WriteRecord(f, create_module_result(module, repository, *results, index=index))
+
+    # ----------------------------------------------------------------------
+
+    return Write
+
+
+# ----------------------------------------------------------------------
+def test_Compare(module, write_baseline, create_results, tmp_path: Path):
+    filename = tmp_path / "baseline.jsonl"
+
+    write_baseline(
+        module,
+        filename,
+        {
+            "repo1": [
+                EvaluateResult.Success,
+                EvaluateResult.Error,
+                EvaluateResult.Warning,
+                EvaluateResult.Success,
+            ],
+        },
+    )
+
+    baseline = Baseline.Load(filename)
+
+    changes = baseline.Compare(
+        create_results(
+            module,
+            "repo1",
+            EvaluateResult.Error,
+            EvaluateResult.Success,
+            EvaluateResult.Warning,
+            EvaluateResult.DoesNotApply,
+        ),
+    )
+
+    assert [
+        (change.result.requirement.name, change.baseline_result, change.is_regression, change.is_fix)
+        for change in changes
+    ] == [
+        ("Requirement1", EvaluateResult.Success, True, False),
+        ("Requirement2", EvaluateResult.Error, False, True),
+        ("Requirement4", EvaluateResult.Success, False, False),
+    ]
+
+    assert baseline.num_regressions == 1
+    assert baseline.num_fixes == 1
+
+
+# ----------------------------------------------------------------------
+def test_NotInBaseline(module, write_baseline, create_results, tmp_path: Path):
+    filename = tmp_path / "baseline.jsonl"
+
+    write_baseline(module, filename, {"repo1": [EvaluateResult.Success]})
+
+    baseline = Baseline.Load(filename)
+
+    # Requirements that are not in the baseline are only reported when they are not successful
+    changes = baseline.Compare(
+        create_results(
+            module,
+            "repo2",
+            EvaluateResult.Success,
+            EvaluateResult.Timeout,
+            EvaluateResult.DoesNotApply,
+        ),
+    )
+
+    assert [(change.result.requirement.name, change.baseline_result) for change in changes] == [
+        ("Requirement2", None),
+    ]
+
+    assert changes[0].is_regression
+    assert baseline.num_regressions == 1
+
+
+# ----------------------------------------------------------------------
+def test_LoadConcatenated(module, write_baseline, create_results, tmp_path: Path):
+    filename1 = tmp_path / "shard1.jsonl"
+    filename2 = tmp_path / "shard2.jsonl"
+
+    write_baseline(module, filename1, {"repo1": [EvaluateResult.Error]})
+    write_baseline(module, filename2, {"repo2": [EvaluateResult.Error]})
+
+    filename = tmp_path / "baseline.jsonl"
+    filename.write_text(filename1.read_text() + "\n" + filename2.read_text())
+
+    baseline = Baseline.Load(filename)
+
+    assert not baseline.Compare(create_results(module, "repo1", EvaluateResult.Error))
+    assert not baseline.Compare(create_results(module, "repo2", EvaluateResult.Error))
+
+
+# ----------------------------------------------------------------------
+def test_LoadInvalid(tmp_path: Path):
+    filename = tmp_path / "baseline.jsonl"
+
+    filename.write_text('{"module": "MyModule", "requirements": []}\nthis is not json\n')
+
+    with pytest.raises(
+        ValueError,
+        match=re.escape(f"'{filename}' does not contain valid results (line 2)."),
+    ):
+        Baseline.Load(filename)
+
+    filename.write_text('{"module": "MyModule", "requirements": [{"query": "MyQuery"}]}\n')
+
+    with pytest.raises(ValueError, match=re.escape("(line 1)")):
+        Baseline.Load(filename)
+
+
+# ----------------------------------------------------------------------
+def test_Add(module, create_results):
+    baseline = Baseline()
+
+    assert not baseline.Compare(create_results(module, "repo1", EvaluateResult.Success))
+
+    baseline.Add(create_results(module, "repo1", EvaluateResult.Success, EvaluateResult.Error))
+
+    changes = baseline.Compare(create_results(module, "repo1", EvaluateResult.Error, EvaluateResult.Error))
+
+    assert [(change.result.requirement.name, change.baseline_result) for change in changes] == [
+        ("Requirement1", EvaluateResult.Success),
+    ]
@@ -6,8 +6,11 @@
 # -------------------------------------------------------------------------------
 """Unit test for CommandLineProcessor.py"""
 
+import itertools
 import re
 import textwrap
+from collections.abc import Callable, Iterator
+from pathlib import Path
 from typing import Optional, cast
 from unittest.mock import patch
 
@@ -142,7 +145,7 @@ def test_Standard():
     assert not clp.module_infos[0].requirement_args
     assert clp.warnings_as_error_module_names == set()
     assert clp.ignore_warnings_module_names == set()
-    assert clp.single_threaded is False
+    assert clp.options.single_threaded is False
 
     dm_and_content = GenerateDoneManagerAndContent()
 
@@ -154,12 +157,24 @@ def test_Standard():
     args = mock_execute.call_args_list[0].args
     kwargs = mock_execute.call_args_list[0].kwargs
 
-    assert len(args) == 2
+    assert len(args) == 4
 
     assert isinstance(args[0], DoneManager)
     assert args[1] == clp.module_infos
-
-    assert kwargs == {}
+    assert args[2] == set()
+    assert args[3] == set()
+
+    assert kwargs == {
+        "single_threaded": False,
+        "timeout": None,
+        "query_timeout": None,
+        "max_threads": None,
+        "max_http_concurrency": None,
+        "max_clones": None,
+        "duration_history_filename": None,
+        "num_processes": None,
+        "result_cache_filename": None,
+    }
 
     assert cast(str, next(dm_and_content)) == textwrap.dedent(
         """\
@@ -168,6 +183,52 @@ def test_Standard():
     )
 
 
+# ----------------------------------------------------------------------
+def test_ExecutionSettings():
+    clp = CommandLineProcessor.Create(
+        lambda *args: {},
+        [MyModule()],
+        [],
+        [],
+        set(),
+        set(),
+        CommandLineProcessor.Options(
+            single_threaded=True,
+            timeout=10.0,
+            max_threads=2,
+            max_http_concurrency=3,
+            max_clones=4,
+            duration_history_filename=Path("history.json"),
+            num_processes=5,
+            result_cache_filename=Path("results.json"),
+        ),
+        all_warnings_as_error=True,
+    )
+
+    with patch("RepoAuditor.CommandLineProcessor.Execute") as mock_execute:
+        clp(next(GenerateDoneManagerAndContent()))
+
+    assert len(mock_execute.call_args_list) == 1
+
+    args = mock_execute.call_args_list[0].args
+    kwargs = mock_execute.call_args_list[0].kwargs
+
+    assert args[2] == {"MyModule"}
+    assert args[3] == set()
+
+    assert kwargs == {
+        "single_threaded": True,
+        "timeout": 10.0,
+        "query_timeout": None,
+        "max_threads": 2,
+        "max_http_concurrency": 3,
+        "max_clones": 4,
+        "duration_history_filename": Path("history.json"),
+        "num_processes": 5,
+        "result_cache_filename": Path("results.json"),
+    }
+
+
 # ----------------------------------------------------------------------
 def test_WithDynamicArgs():
     clp = CommandLineProcessor.Create(
@@ -197,7 +258,106 @@ def test_WithDynamicArgs():
     }
     assert clp.warnings_as_error_module_names == set()
     assert clp.ignore_warnings_module_names == set()
-    assert clp.single_threaded is False
+    assert clp.options.single_threaded is False
+
+
+# ----------------------------------------------------------------------
+def test_MultipleRepositories():
+    # ----------------------------------------------------------------------
+    class MultipleRepositoriesModule(MyModule):
+        # ----------------------------------------------------------------------
+        @override
+        def GetRepositories(
+            self,
+            dynamic_args: dict[str, Any],
+        ) -> list[Module.RepositoryInfo]:
+            return [Module.RepositoryInfo(url, {**dynamic_args, "url": url}) for url in dynamic_args["url"]]
+
+    # ----------------------------------------------------------------------
+
+    clp = CommandLineProcessor.Create(
+        lambda *args: {
+            "One-url": ["repo1", "repo2"],
+            "Two-url": ["repo2"],
+        },
+        [MultipleRepositoriesModule("One"), MultipleRepositoriesModule("Two")],
+        [],
+        [],
+        set(),
+        set(),
+    )
+
+    # Module information is grouped by repository
+    assert [
+        (module_info.repository, module_info.module.name, module_info.dynamic_args)
+        for module_info in clp.module_infos
+    ] == [
+        ("repo1", "One", {"url": "repo1"}),
+        ("repo2", "One", {"url": "repo2"}),
+        ("repo2", "Two", {"url": "repo2"}),
+    ]
+
+    # Repositories are not associated with module information when a single repository is audited
+    clp = CommandLineProcessor.Create(
+        lambda *args: {"One-url": ["repo1"]},
+        [MultipleRepositoriesModule("One")],
+        [],
+        [],
+        set(),
+        set(),
+    )
+
+    assert len(clp.module_infos) == 1
+    assert clp.module_infos[0].repository is None
+    assert clp.module_infos[0].dynamic_args == {"url": "repo1"}
+
+
+# ----------------------------------------------------------------------
+def test_DiscoveredRepositories():
+    # ----------------------------------------------------------------------
+    class DiscoveredRepositoriesModule(MyModule):
+        # ----------------------------------------------------------------------
+        @override
+        def GetRepositories(
+            self,
+            dynamic_args: dict[str, Any],
+        ) -> Iterator[Module.RepositoryInfo]:
+            for url in dynamic_args["url"]:
+                discovered.append((self.name, url))
+                yield Module.RepositoryInfo(url, {"url": url})
+
+    # ----------------------------------------------------------------------
+
+    discovered: list[tuple[str, str]] = []
+
+    clp = CommandLineProcessor.Create(
+        lambda *args: {
+            "One-url": ["repo1", "repo2"],
+            "Two-url": ["repo1", "repo2", "repo3"],
+        },
+        [DiscoveredRepositoriesModule("One"), DiscoveredRepositoriesModule("Two")],
+        [],
+        [],
+        set(),
+        set(),
+    )
+
+    # Repositories are not discovered until the module information is consumed
+    assert isinstance(clp.module_infos, Iterator)
+    assert not discovered
+
+    module_info = next(clp.module_infos)
+
+    assert (module_info.repository, module_info.module.name) == ("repo1", "One")
+    assert discovered == [("One", "repo1"), ("Two", "repo1")]
+
+    # Module information for each repository is generated together
+    assert [(module_info.repository, module_info.module.name) for module_info in clp.module_infos] == [
+        ("repo1", "Two"),
+        ("repo2", "One"),
+        ("repo2", "Two"),
+        ("repo3", "Two"),
+    ]
 
 
 # ----------------------------------------------------------------------
@@ -214,7 +374,7 @@ def test_IncludeModule():
     assert not clp.module_infos
     assert clp.warnings_as_error_module_names == set()
     assert clp.ignore_warnings_module_names == set()
-    assert clp.single_threaded is False
+    assert clp.options.single_threaded is False
 
     clp = CommandLineProcessor.Create(
         lambda *args: {},
@@ -228,7 +388,7 @@ def test_IncludeModule():
     assert len(clp.module_infos) == 1
     assert clp.warnings_as_error_module_names == set()
     assert clp.ignore_warnings_module_names == set()
-    assert clp.single_threaded is False
+    assert clp.options.single_threaded is False
 
 
 # ----------------------------------------------------------------------
@@ -245,7 +405,7 @@ def test_ExcludeModule():
     assert not clp.module_infos
     assert clp.warnings_as_error_module_names == set()
     assert clp.ignore_warnings_module_names == set()
-    assert clp.single_threaded is False
+    assert clp.options.single_threaded is False
 
 
 # ----------------------------------------------------------------------
@@ -265,7 +425,7 @@ def test_IncludeRequirement(sep):
     assert clp.module_infos[0].module.GetNumRequirements() == 2
     assert clp.warnings_as_error_module_names == set()
     assert clp.ignore_warnings_module_names == set()
-    assert clp.single_threaded is False
+    assert clp.options.single_threaded is False
 
 
 # ----------------------------------------------------------------------
@@ -284,7 +444,7 @@ def test_ExcludeRequirement(sep):
     assert not clp.module_infos
     assert clp.warnings_as_error_module_names == set()
     assert clp.ignore_warnings_module_names == set()
-    assert clp.single_threaded is False
+    assert clp.options.single_threaded is False
 
 
 # ----------------------------------------------------------------------
@@ -301,7 +461,7 @@ def test_ExcludeAllRequirements():
     assert not clp.module_infos
     assert clp.warnings_as_error_module_names == set()
     assert clp.ignore_warnings_module_names == set()
-    assert clp.single_threaded is False
+    assert clp.options.single_threaded is False
 
 
 # ----------------------------------------------------------------------
@@ -324,7 +484,7 @@ def test_CommandLineArgs(sep):
     assert clp.module_infos[0].dynamic_args == {"arg1": True}
     assert clp.warnings_as_error_module_names == set()
     assert clp.ignore_warnings_module_names == set()
-    assert clp.single_threaded is False
+    assert clp.options.single_threaded is False
 
 
 # ----------------------------------------------------------------------
@@ -342,7 +502,7 @@ def test_AllWarningsAsError():
     assert len(clp.module_infos) == 1
     assert clp.warnings_as_error_module_names == {"MyModule"}
     assert clp.ignore_warnings_module_names == set()
-    assert clp.single_threaded is False
+    assert clp.options.single_threaded is False
 
 
 # ----------------------------------------------------------------------
@@ -360,7 +520,7 @@ def test_IgnoreAllWarnings():
     assert len(clp.module_infos) == 1
     assert clp.warnings_as_error_module_names == set()
     assert clp.ignore_warnings_module_names == {"MyModule"}
-    assert clp.single_threaded is False
+    assert clp.options.single_threaded is False
 
 
 # ----------------------------------------------------------------------
@@ -463,3 +623,350 @@ def test_InvalidArgs():
             warnings_as_error_module_names=set(),
             ignore_warnings_module_names=set(),
         )
+
+
+# ----------------------------------------------------------------------
+def test_Iterate():
+    clp = CommandLineProcessor.Create(
+        lambda *args: {},
+        [MyModule()],
+        [],
+        [],
+        set(),
+        set(),
+        CommandLineProcessor.Options(max_threads=2),
+    )
+
+    with patch("RepoAuditor.CommandLineProcessor.ExecuteIter") as mock_execute_iter:
+        clp.Iterate(next(GenerateDoneManagerAndContent()))
+
+    assert len(mock_execute_iter.call_args_list) == 1
+
+    args = mock_execute_iter.call_args_list[0].args
+    kwargs = mock_execute_iter.call_args_list[0].kwargs
+
+    assert args[1] == clp.module_infos
+    assert kwargs["max_threads"] == 2
+
+
+# ----------------------------------------------------------------------
+def test_FromPlan():
+    module = MyModule()
+
+    plan = AuditPlan.Compile(lambda *args: {"MyModule-arg1": True}, [module], [], [], set(), set())
+
+    clp1 = CommandLineProcessor.FromPlan(plan, [module], CommandLineProcessor.Options(max_threads=2))
+    clp2 = CommandLineProcessor.FromPlan(plan, [module])
+
+    for clp in [clp1, clp2]:
+        assert len(clp.module_infos) == 1
+        assert clp.module_infos[0].module.GetNumRequirements() == 1
+        assert clp.module_infos[0].dynamic_args == {"arg1": True}
+
+    assert clp1.options.max_threads == 2
+    assert clp1.module_infos[0].module is not clp2.module_infos[0].module
+
+    # The module is not modified
+    assert module.GetNumRequirements() == 2
+
+    with pytest.raises(ValueError, match=re.escape("A journal can be created or resumed, but not both.")):
+        CommandLineProcessor.Options(
+            journal_filename=Path("journal.jsonl"),
+            resume_journal_filename=Path("journal.jsonl"),
+        )
+
+
+# ----------------------------------------------------------------------
+def test_EventModuleInfos():
+    module1 = MyModule("ModuleA")
+    module2 = MyModule("ModuleB")
+
+    module1.queries[0].events = ("push",)
+
+    def GetEventRepository(dynamic_args, event, payload):
+        return Module.RepositoryInfo(payload["url"], {**dynamic_args, "url": payload["url"]})
+
+    module1.GetEventRepository = GetEventRepository
+
+    clp = CommandLineProcessor.Create(
+        lambda *args: {},
+        [module1, module2],
+        [],
+        [],
+        set(),
+        set(),
+    )
+
+    module_infos = clp.CreateEventModuleInfos("push", {"url": "https://github.com/owner/repo"})
+
+    # ModuleB ignores events
+    assert len(module_infos) == 1
+    assert module_infos[0].module.name == "ModuleA"
+
+    assert module_infos == [
+        ModuleInfo(
+            module_infos[0].module,
+            {"url": "https://github.com/owner/repo"},
+            {},
+            repository="https://github.com/owner/repo",
+            query_names=frozenset(["MyQuery"]),
+        ),
+    ]
+
+    # The event does not affect the query
+    assert clp.CreateEventModuleInfos("repository", {"url": "https://github.com/owner/repo"}) == []
+
+    with patch("RepoAuditor.CommandLineProcessor.ExecuteIter") as mock_execute_iter:
+        clp.IterateModules(next(GenerateDoneManagerAndContent()), module_infos)
+
+    assert mock_execute_iter.call_args_list[0].args[1] == module_infos
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("discovered", [False, True])
+def test_Shard(discovered):
+    repositories = [f"https://github.com/gt-sse-center/repo{index}" for index in range(20)]
+
+    # ----------------------------------------------------------------------
+    class ShardModule(MyModule):
+        # ----------------------------------------------------------------------
+        @override
+        def GetRepositories(
+            self,
+            dynamic_args: dict[str, Any],
+            *,
+            repository_filter: Optional[Callable[[Optional[str]], bool]] = None,
+        ) -> Iterable[Module.RepositoryInfo]:
+            # The repositories are filtered even if the module does not use the filter
+            assert repository_filter is not None
+
+            repository_infos = (Module.RepositoryInfo(url, {}) for url in repositories)
+
+            return repository_infos if discovered else list(repository_infos)
+
+    # ----------------------------------------------------------------------
+
+    shard_repositories: list[list[str]] = []
+
+    for index in range(1, 4):
+        clp = CommandLineProcessor.Create(
+            lambda *args: {},
+            [ShardModule("One"), ShardModule("Two")],
+            [],
+            [],
+            set(),
+            set(),
+            CommandLineProcessor.Options(shard=f"{index}/3"),
+        )
+
+        assert isinstance(clp.module_infos, Sequence) is not discovered
+
+        module_infos = list(clp.module_infos)
+
+        # Every module evaluates the same repositories within a shard
+        assert [
+            module_info.repository for module_info in module_infos if module_info.module.name == "One"
+        ] == [module_info.repository for module_info in module_infos if module_info.module.name == "Two"]
+
+        shard_repositories.append(
+            [
+                cast(str, module_info.repository)
+                for module_info in module_infos
+                if module_info.module.name == "One"
+            ]
+        )
+
+    # Each repository is assigned to exactly one shard
+    assert all(shard_repositories)
+    assert sorted(itertools.chain(*shard_repositories)) == sorted(repositories)
+
+
+# ----------------------------------------------------------------------
+def test_InvalidShard():
+    with pytest.raises(ValueError, match=re.escape("'3' is not a valid shard")):
+        CommandLineProcessor.Create(
+            lambda *args: {}, [MyModule()], [], [], set(), set(), CommandLineProcessor.Options(shard="3")
+        )
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("discovered", [False, True])
+def test_Journal(discovered, tmp_path):
+    repositories = [f"repo{index}" for index in range(5)]
+
+    # ----------------------------------------------------------------------
+    class JournalModule(MyModule):
+        # ----------------------------------------------------------------------
+        @override
+        def GetRepositories(
+            self,
+            dynamic_args: dict[str, Any],
+        ) -> Iterable[Module.RepositoryInfo]:
+            repository_infos = (Module.RepositoryInfo(url, {}) for url in repositories)
+
+            return repository_infos if discovered else list(repository_infos)
+
+    # ----------------------------------------------------------------------
+
+    evaluated: list[Optional[str]] = []
+
+    # ----------------------------------------------------------------------
+    def CreateExecuteIter(max_num_results: Optional[int]):
+        def ExecuteIter(dm, module_infos, *args, **kwargs):
+            for index, module_info in enumerate(module_infos):
+                if max_num_results is not None and len(evaluated) == max_num_results:
+                    raise RuntimeError("The audit was interrupted")
+
+                evaluated.append(module_info.repository)
+                yield ModuleResult(index, module_info, [])
+
+        return ExecuteIter
+
+    # ----------------------------------------------------------------------
+    def CreateCommandLineProcessor(**kwargs) -> CommandLineProcessor:
+        return CommandLineProcessor.Create(
+            lambda *args: {},
+            [JournalModule()],
+            [],
+            [],
+            set(),
+            set(),
+            CommandLineProcessor.Options(**kwargs),
+        )
+
+    # ----------------------------------------------------------------------
+
+    journal_filename = tmp_path / "journal.jsonl"
+
+    # The audit is interrupted after 2 repositories are evaluated
+    with (
+        patch("RepoAuditor.CommandLineProcessor.ExecuteIter", CreateExecuteIter(2)),
+        pytest.raises(RuntimeError, match="The audit was interrupted"),
+    ):
+        list(
+            CreateCommandLineProcessor(journal_filename=journal_filename).Iterate(
+                next(GenerateDoneManagerAndContent())
+            )
+        )
+
+    assert evaluated == ["repo0", "repo1"]
+    assert len(journal_filename.read_text().splitlines()) == 2
+
+    # Resume the audit
+    evaluated.clear()
+
+    dm_and_content = GenerateDoneManagerAndContent()
+
+    with patch("RepoAuditor.CommandLineProcessor.ExecuteIter", CreateExecuteIter(None)):
+        all_results = CreateCommandLineProcessor(resume_journal_filename=journal_filename)(
+            cast(DoneManager, next(dm_and_content))
+        )
+
+    assert evaluated == ["repo2", "repo3", "repo4"]
+    assert all_results == [[]] * 5
+    assert len(journal_filename.read_text().splitlines()) == 5
+    assert "Results for 2 modules were restored from" in cast(str, next(dm_and_content))
+
+    # Nothing is evaluated when the audit is resumed after it completed
+    evaluated.clear()
+
+    with patch("RepoAuditor.CommandLineProcessor.ExecuteIter", CreateExecuteIter(None)):
+        module_results = list(
+            CreateCommandLineProcessor(resume_journal_filename=journal_filename).Iterate(
+                next(GenerateDoneManagerAndContent())
+            )
+        )
+
+    assert evaluated == []
+    assert sorted(module_result.index for module_result in module_results) == list(range(5))
+    assert [module_result.module_info.repository for module_result in module_results] == repositories
+
+
+# ----------------------------------------------------------------------
+def test_JournalAndResume(tmp_path):
+    with pytest.raises(ValueError, match=re.escape("A journal can be created or resumed, but not both.")):
+        CommandLineProcessor.Options(
+            journal_filename=tmp_path / "journal1.jsonl",
+            resume_journal_filename=tmp_path / "journal2.jsonl",
+        )
+
+
+# ----------------------------------------------------------------------
+def test_Incremental(tmp_path):
+    repository_states = {f"repo{index}": {"updated_at": "1"} for index in range(3)}
+
+    # ----------------------------------------------------------------------
+    class IncrementalModule(MyModule):
+        # ----------------------------------------------------------------------
+        @override
+        def GetRepositories(
+            self,
+            dynamic_args: dict[str, Any],
+        ) -> Iterable[Module.RepositoryInfo]:
+            return (Module.RepositoryInfo(url, {"url": url}) for url in repository_states)
+
+        # ----------------------------------------------------------------------
+        @override
+        def GetRepositoryState(
+            self,
+            dynamic_args: dict[str, Any],
+            previous_state: Optional[dict[str, Any]],
+        ) -> Optional[dict[str, Any]]:
+            return repository_states[dynamic_args["url"]]
+
+    # ----------------------------------------------------------------------
+
+    evaluated: list[Optional[str]] = []
+
+    # ----------------------------------------------------------------------
+    def ExecuteIter(dm, module_infos, *args, **kwargs):
+        for index, module_info in enumerate(module_infos):
+            evaluated.append(module_info.repository)
+            yield ModuleResult(index, module_info, [])
+
+    # ----------------------------------------------------------------------
+    def Audit(**kwargs) -> str:
+        evaluated.clear()
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        with patch("RepoAuditor.CommandLineProcessor.ExecuteIter", ExecuteIter):
+            all_results = CommandLineProcessor.Create(
+                lambda *args: {},
+                [IncrementalModule()],
+                [],
+                [],
+                set(),
+                set(),
+                CommandLineProcessor.Options(incremental_filename=incremental_filename, **kwargs),
+            )(cast(DoneManager, next(dm_and_content)))
+
+        assert all_results == [[]] * len(repository_states)
+
+        return cast(str, next(dm_and_content))
+
+    # ----------------------------------------------------------------------
+
+    incremental_filename = tmp_path / "incremental.json"
+
+    Audit()
+    assert evaluated == ["repo0", "repo1", "repo2"]
+
+    # Only the repositories that changed are evaluated
+    repository_states["repo1"] = {"updated_at": "2"}
+
+    output = Audit()
+    assert evaluated == ["repo1"]
+    assert "Results for 2 modules were reused from" in output
+
+    output = Audit()
+    assert evaluated == []
+    assert "Results for 3 modules were reused from" in output
+
+    # All repositories are evaluated when requested
+    Audit(full=True)
+    assert evaluated == ["repo0", "repo1", "repo2"]
+
+    # Results that are too old are not reused
+    Audit(max_staleness=0)
+    assert evaluated == ["repo0", "repo1", "repo2"]
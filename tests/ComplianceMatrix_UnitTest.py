@@ -0,0 +1,103 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for ComplianceMatrix.py"""
+
+import io
+
+import pytest
+
+from RepoAuditor.ComplianceMatrix import *
+from RepoAuditor.Module import EvaluateResult
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def matrix(create_module, create_results) -> ComplianceMatrix:
+    module = create_module("A", "B", "C")
+
+    matrix = ComplianceMatrix()
+
+    matrix.Add(
+        create_results(
+            module,
+            "repo1",
+            EvaluateResult.Success,
+            EvaluateResult.Error,
+            EvaluateResult.DoesNotApply,
+        )
+    )
+    matrix.Add(
+        create_results(
+            module,
+            "repo2",
+            EvaluateResult.Success,
+            EvaluateResult.Success,
+            EvaluateResult.DoesNotApply,
+        )
+    )
+    matrix.Add(
+        create_results(
+            module,
+            "repo3",
+            EvaluateResult.Warning,
+            EvaluateResult.Timeout,
+            EvaluateResult.DoesNotApply,
+        )
+    )
+    matrix.Add(create_results(create_module("D", name="OtherModule"), "repo3", EvaluateResult.Error))
+
+    return matrix
+
+
+# ----------------------------------------------------------------------
+def test_Repositories(matrix):
+    assert matrix.repositories == ["repo1", "repo2", "repo3"]
+
+    # Modules without results do not add repositories
+    matrix.Add([])
+    assert matrix.repositories == ["repo1", "repo2", "repo3"]
+
+
+# ----------------------------------------------------------------------
+def test_RequirementSummaries(matrix):
+    summaries = matrix.GetRequirementSummaries()
+
+    assert [
+        (summary.module_name, summary.requirement_name, summary.pass_rate, summary.num_applicable)
+        for summary in summaries
+    ] == [
+        ("OtherModule", "D", 0.0, 1),
+        ("MyModule", "B", 1 / 3, 3),
+        ("MyModule", "A", 2 / 3, 3),
+        ("MyModule", "C", None, 0),
+    ]
+
+    assert summaries[1].num_results[EvaluateResult.Timeout] == 1
+
+
+# ----------------------------------------------------------------------
+def test_WorstOffenders(matrix):
+    assert matrix.GetWorstOffenders(10) == [
+        ComplianceMatrix.RepositorySummary("repo3", 2, 1),
+        ComplianceMatrix.RepositorySummary("repo1", 1, 0),
+    ]
+
+    assert matrix.GetWorstOffenders(1) == [ComplianceMatrix.RepositorySummary("repo3", 2, 1)]
+
+
+# ----------------------------------------------------------------------
+def test_WriteCsv(matrix):
+    sink = io.StringIO()
+
+    matrix.WriteCsv(sink)
+
+    assert sink.getvalue().splitlines() == [
+        "Repository,MyModule/A,MyModule/B,MyModule/C,OtherModule/D",
+        "repo1,Success,Error,DoesNotApply,",
+        "repo2,Success,Success,DoesNotApply,",
+        "repo3,Warning,Timeout,DoesNotApply,Error",
+    ]
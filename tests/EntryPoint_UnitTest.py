@@ -6,18 +6,139 @@
 # -------------------------------------------------------------------------------
 """Unit tests for EntryPoint.py"""
 
+import contextlib
+import io
+import json
+import threading
+import urllib.request
+from collections.abc import Iterator
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Optional, cast
+from unittest.mock import MagicMock
+
 import pytest
 import typer
-from dbrownell_Common.TestHelpers.StreamTestHelpers import InitializeStreamCapabilities
-from dbrownell_Common.TyperEx import TypeDefinitionItem  # type: ignore [import-untyped]
+from click.exceptions import UsageError
+from dbrownell_Common.Streams.DoneManager import DoneManager
+from dbrownell_Common.TestHelpers.StreamTestHelpers import (
+    GenerateDoneManagerAndContent,
+    InitializeStreamCapabilities,
+)
+from dbrownell_Common.TyperEx import TypeDefinitionItem, TypeDefinitionItemType  # type: ignore [import-untyped]
+from dbrownell_Common.Types import override
 from typer.testing import CliRunner
 
 from RepoAuditor import __version__
-from RepoAuditor.EntryPoint import TypeInfoToString, app
+from RepoAuditor.Baseline import Baseline
+from RepoAuditor.EntryPoint import (
+    TypeInfoToString,
+    _ActivateMemoryCaches,
+    _AuditDeliveries,
+    _ContinueAuditing,
+    _OutputOptions,
+    _Watch,
+    _WebhookOptions,
+    app,
+)
+from RepoAuditor.ExecuteModules import ModuleInfo
+from RepoAuditor.Impl.ConditionalRequestCache import ConditionalRequestCache
+from RepoAuditor.Impl.ResultCache import ResultCache
+from RepoAuditor.Module import EvaluateResult, ExecutionStyle, Module
+from RepoAuditor.Query import Query
+from RepoAuditor.Requirement import Requirement
+from RepoAuditor.ResultStore import ResultStore
+from RepoAuditor.WebhookReceiver import WebhookReceiver
 
 from .Plugins.utilities import GetGithubUrl
 
 
+# ----------------------------------------------------------------------
+class MyModule(Module):
+    """Module that evaluates 'repo1' and 'repo2' without accessing the network."""
+
+    # ----------------------------------------------------------------------
+    @override
+    def GetDynamicArgDefinitions(self) -> dict[str, TypeDefinitionItemType]:
+        return {}
+
+    # ----------------------------------------------------------------------
+    @override
+    def GetRepositories(
+        self,
+        dynamic_args: dict[str, Any],
+        *,
+        repository_filter=None,  # noqa: ARG002
+    ) -> list[Module.RepositoryInfo]:
+        return [
+            Module.RepositoryInfo(repository, {**dynamic_args, "repository": repository})
+            for repository in ["repo1", "repo2"]
+        ]
+
+    # ----------------------------------------------------------------------
+    @override
+    def GenerateInitialData(self, dynamic_args: dict[str, Any]) -> Optional[dict[str, Any]]:
+        return dict(dynamic_args)
+
+
+# ----------------------------------------------------------------------
+class MyQuery(Query):
+    # ----------------------------------------------------------------------
+    @override
+    def GetData(self, module_data: dict[str, Any]) -> Optional[dict[str, Any]]:
+        return module_data
+
+
+# ----------------------------------------------------------------------
+class MyRequirement(Requirement):
+    """Requirement that is met by 'repo1' but not by other repositories."""
+
+    # ----------------------------------------------------------------------
+    @override
+    def _EvaluateImpl(
+        self,
+        query_data: dict[str, Any],
+        requirement_args: dict[str, Any],  # noqa: ARG002
+    ) -> Requirement.EvaluateImplResult:
+        return Requirement.EvaluateImplResult(
+            EvaluateResult.Success if query_data["repository"] == "repo1" else EvaluateResult.Error,
+            None,
+            provide_resolution=True,
+            provide_rationale=True,
+        )
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def all_modules(monkeypatch) -> None:
+    """Audit `MyModule` rather than the modules provided by the installed plugins."""
+    monkeypatch.setattr(
+        "RepoAuditor.EntryPoint._all_modules",
+        [
+            MyModule(
+                "MyModule",
+                "Module used for testing.",
+                ExecutionStyle.Sequential,
+                [
+                    MyQuery(
+                        "MyQuery",
+                        ExecutionStyle.Sequential,
+                        [
+                            MyRequirement(
+                                "MyRequirement",
+                                "Requirement used for testing.",
+                                ExecutionStyle.Sequential,
+                                "The resolution.",
+                                "The rationale.",
+                            ),
+                        ],
+                    ),
+                ],
+            ),
+        ],
+    )
+
+
 # ----------------------------------------------------------------------
 @pytest.fixture(InitializeStreamCapabilities(), scope="session", autouse=True)
 # ----------------------------------------------------------------------
@@ -95,3 +216,332 @@ def test_TypeInfoToString() -> None:
     )
     expected_string = "    test_none                                          bool    "
     assert expected_string == result
+
+
+# ----------------------------------------------------------------------
+def test_WatchAndWebhooks() -> None:
+    result = CliRunner().invoke(app, ["--watch", "5", "--webhook-port", "8080"])
+
+    assert isinstance(result.exception, UsageError)
+    assert str(result.exception) == "'--watch' and '--webhook-port' cannot be used together."
+
+
+# ----------------------------------------------------------------------
+def test_HistoryWithoutDatabase(tmp_path: Path) -> None:
+    result = CliRunner().invoke(app, ["--history", "--results-db", str(tmp_path / "results.db")])
+
+    assert isinstance(result.exception, UsageError)
+    assert str(result.exception) == "'--history' requires an existing database provided by '--results-db'."
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.usefixtures("all_modules")
+def test_Terminal() -> None:
+    result = CliRunner().invoke(app, ["--single-threaded"])
+
+    assert result.exit_code != 0, result.output
+    assert "MyRequirement" in result.output
+    assert "repo1" in result.output
+    assert "repo2" in result.output
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.usefixtures("all_modules")
+def test_Outputs(tmp_path: Path) -> None:
+    output = tmp_path / "output.txt"
+    json_output = tmp_path / "output.json"
+    matrix_output = tmp_path / "matrix.csv"
+    results_db = tmp_path / "results.db"
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "--single-threaded",
+            "--output",
+            str(output),
+            "--json-output",
+            str(json_output),
+            "--matrix-output",
+            str(matrix_output),
+            "--results-db",
+            str(results_db),
+        ],
+    )
+
+    assert result.exit_code != 0, result.output
+
+    assert "MyRequirement" in output.read_text()
+    assert sorted(json.loads(line)["repository"] for line in json_output.read_text().splitlines()) == [
+        "repo1",
+        "repo2",
+    ]
+
+    matrix = matrix_output.read_text()
+
+    assert "repo1" in matrix
+    assert "repo2" in matrix
+
+    with ResultStore.Open(results_db) as result_store:
+        (summary,) = result_store.GetRunSummaries(10)
+
+    assert summary.num_repositories == 2
+    assert summary.num_results[EvaluateResult.Success] == 1
+    assert summary.num_results[EvaluateResult.Error] == 1
+
+    # The audit recorded in the database is displayed as history
+    result = CliRunner().invoke(app, ["--history", "--results-db", str(results_db)])
+
+    assert result.exit_code == 0, result.output
+    assert "History" in result.output
+    assert "50.00%" in result.output
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.usefixtures("all_modules")
+def test_ResultsDatabase(tmp_path: Path) -> None:
+    result = CliRunner().invoke(app, ["--single-threaded", "--results-db", str(tmp_path / "results.db")])
+
+    # Results are displayed in the terminal once all modules have completed
+    assert result.exit_code != 0, result.output
+    assert result.output.index("repo1") < result.output.index("repo2")
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.usefixtures("all_modules")
+def test_Baseline(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+
+    result = CliRunner().invoke(app, ["--single-threaded", "--json-output", str(baseline)])
+
+    assert result.exit_code != 0, result.output
+
+    # Errors that are in the baseline do not cause the audit to fail
+    result = CliRunner().invoke(app, ["--single-threaded", "--baseline", str(baseline)])
+
+    assert result.exit_code == 0, result.output
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("include_result_cache", [True, False])
+def test_ActivateMemoryCaches(include_result_cache: bool) -> None:  # noqa: FBT001
+    with contextlib.ExitStack() as exit_stack:
+        _ActivateMemoryCaches(exit_stack, include_result_cache=include_result_cache)
+
+        assert ConditionalRequestCache.GetActive() is not None
+        assert (ResultCache.GetActive() is not None) == include_result_cache
+
+    assert ConditionalRequestCache.GetActive() is None
+    assert ResultCache.GetActive() is None
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def output_options(tmp_path: Path) -> Iterator[_OutputOptions]:
+    with ResultStore.Open(tmp_path / "results.db") as result_store:
+        yield _OutputOptions(
+            io.StringIO(),
+            io.StringIO(),
+            tmp_path / "matrix.csv",
+            result_store,
+            display_resolution=True,
+            display_rationale=True,
+            panel_width=None,
+        )
+
+
+# ----------------------------------------------------------------------
+def test_Watch(module, create_module_result, output_options) -> None:
+    # ----------------------------------------------------------------------
+    def CreateExecutor(
+        result: EvaluateResult,
+    ) -> MagicMock:
+        executor = MagicMock()
+        executor.Iterate.return_value = [create_module_result(module, "repo1", result)]
+
+        return executor
+
+    # ----------------------------------------------------------------------
+
+    outcomes = Baseline()
+    outcomes.Add(create_module_result(module, "repo1", EvaluateResult.Success).results)
+
+    create_executor_func = MagicMock(
+        side_effect=[
+            # An audit that fails does not end the watch
+            RuntimeError("The server is unavailable."),
+            CreateExecutor(EvaluateResult.Error),
+            CreateExecutor(EvaluateResult.Error),
+        ],
+    )
+
+    dm_and_content = GenerateDoneManagerAndContent()
+
+    _Watch(
+        cast(DoneManager, next(dm_and_content)),
+        create_executor_func,
+        outcomes,
+        0,
+        output_options,
+        num_audits=3,
+    )
+
+    assert create_executor_func.call_count == 3
+    assert "The server is unavailable." in cast(str, next(dm_and_content))
+
+    # The second audit is compared to the initial audit (as the first audit failed) and the third
+    # audit is compared to the second.
+    output = cast(io.StringIO, output_options.output_file).getvalue()
+
+    assert output.count("Changes at") == 1
+    assert "Success" in output
+    assert "Error" in output
+
+    # The outputs contain the results of the last audit
+    json_lines = cast(io.StringIO, output_options.json_output_file).getvalue().splitlines()
+
+    assert len(json_lines) == 1
+    assert json.loads(json_lines[0])["repository"] == "repo1"
+
+    assert "repo1" in cast(Path, output_options.matrix_output).read_text()
+
+    assert len(cast(ResultStore, output_options.result_store).GetRunSummaries(10)) == 2
+
+
+# ----------------------------------------------------------------------
+def test_ContinueAuditingWatch(output_options) -> None:
+    # Simulate Ctrl+C during the first audit
+    create_executor_func = MagicMock(side_effect=KeyboardInterrupt)
+
+    dm_and_content = GenerateDoneManagerAndContent()
+
+    _ContinueAuditing(
+        cast(DoneManager, next(dm_and_content)),
+        create_executor_func,
+        MagicMock(),
+        Baseline(),
+        output_options,
+        watch=0,
+        webhook_options=None,
+    )
+
+    assert create_executor_func.call_count == 1
+
+
+# ----------------------------------------------------------------------
+def test_AuditDeliveries(module, create_module_result, output_options) -> None:
+    executor = MagicMock()
+    executor.CreateEventModuleInfos.side_effect = lambda event, payload: [  # noqa: ARG005
+        ModuleInfo(module, {}, {}, repository=payload["repository"]),
+    ]
+
+    receiver = WebhookReceiver(executor.CreateEventModuleInfos, debounce=0)
+
+    server = receiver.CreateServer("127.0.0.1", 0)
+
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+
+    # ----------------------------------------------------------------------
+    def Post(
+        repository: str,
+    ) -> None:
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{server.server_port}/webhook",
+            data=json.dumps({"repository": repository}).encode("UTF-8"),
+            headers={"X-GitHub-Event": "push", "Content-Type": "application/json"},
+            method="POST",
+        )
+
+        with urllib.request.urlopen(request, timeout=10) as response:  # noqa: S310
+            assert response.status == HTTPStatus.ACCEPTED
+
+    # ----------------------------------------------------------------------
+    def IterateModules(
+        dm: DoneManager,  # noqa: ARG001
+        module_infos: list[ModuleInfo],
+    ):
+        # Deliveries received during an audit are audited next
+        if executor.IterateModules.call_count == 1:
+            Post("repo2")
+
+            # An audit that fails does not stop the deliveries from being received
+            msg = "The server is unavailable."
+            raise RuntimeError(msg)
+
+        if executor.IterateModules.call_count == 2:
+            Post("repo1")
+
+        for module_info in module_infos:
+            yield create_module_result(
+                module,
+                module_info.repository,
+                EvaluateResult.Error,
+                module_info=module_info,
+            )
+
+    # ----------------------------------------------------------------------
+
+    executor.IterateModules.side_effect = IterateModules
+
+    outcomes = Baseline()
+    outcomes.Add(create_module_result(module, "repo1", EvaluateResult.Success).results)
+
+    dm_and_content = GenerateDoneManagerAndContent()
+
+    try:
+        Post("repo1")
+
+        _AuditDeliveries(
+            cast(DoneManager, next(dm_and_content)),
+            executor,
+            outcomes,
+            receiver,
+            output_options,
+            num_audits=3,
+        )
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert [
+        [module_info.repository for module_info in call.args[1]]
+        for call in executor.IterateModules.call_args_list
+    ] == [["repo1"], ["repo2"], ["repo1"]]
+
+    assert "The server is unavailable." in cast(str, next(dm_and_content))
+
+    # The results of each audit are appended to the JSON output
+    assert [
+        json.loads(line)["repository"]
+        for line in cast(io.StringIO, output_options.json_output_file).getvalue().splitlines()
+    ] == ["repo2", "repo1"]
+
+    # The new repository is a change, as is the requirement that regressed since the initial audit
+    assert cast(io.StringIO, output_options.output_file).getvalue().count("Changes at") == 2
+
+    # The outcomes are updated with the results of each audit
+    assert outcomes.Compare(create_module_result(module, "repo1", EvaluateResult.Error).results) == []
+    assert outcomes.Compare(create_module_result(module, "repo2", EvaluateResult.Error).results) == []
+
+    assert len(cast(ResultStore, output_options.result_store).GetRunSummaries(10)) == 2
+
+
+# ----------------------------------------------------------------------
+def test_ContinueAuditingWebhooks(output_options, monkeypatch) -> None:
+    # Simulate Ctrl+C while waiting for deliveries
+    monkeypatch.setattr(WebhookReceiver, "WaitForModuleInfos", MagicMock(side_effect=KeyboardInterrupt))
+
+    dm_and_content = GenerateDoneManagerAndContent()
+
+    _ContinueAuditing(
+        cast(DoneManager, next(dm_and_content)),
+        MagicMock(),
+        MagicMock(),
+        Baseline(),
+        output_options,
+        watch=None,
+        webhook_options=_WebhookOptions(0, "127.0.0.1", None, 0),
+    )
+
+    assert "Receiving webhook deliveries at http://127.0.0.1:" in cast(str, next(dm_and_content))
@@ -8,7 +8,13 @@
 
 import sys
 import textwrap
+import threading
+import json
+import os
+import re
 import time
+from collections.abc import Iterator
+from pathlib import Path
 from typing import cast
 
 import pytest
@@ -18,6 +24,7 @@ from dbrownell_Common.TestHelpers.StreamTestHelpers import (
 )
 from dbrownell_Common.Types import override
 
+from RepoAuditor.Baseline import Baseline
 from RepoAuditor.Display import *
 from RepoAuditor.ExecuteModules import *
 from RepoAuditor.Module import *
@@ -107,6 +114,30 @@ class MyRequirement(Requirement):
         )
 
 
+# ----------------------------------------------------------------------
+class ProcessRequirement(MyRequirement):
+    """Requirement that provides the id of the process that evaluated it as its context."""
+
+    # ----------------------------------------------------------------------
+    @override
+    def _EvaluateImpl(self, *args, **kwargs) -> Requirement.EvaluateImplResult:
+        return Requirement.EvaluateImplResult(self.result, str(os.getpid()))
+
+
+# ----------------------------------------------------------------------
+class ErrorModule(MyModule):
+    """Module that raises an exception when the dynamic arg `raise` is True."""
+
+    # ----------------------------------------------------------------------
+    @override
+    def GenerateInitialData(self, dynamic_args: dict[str, Any]) -> Optional[dict[str, Any]]:
+        if dynamic_args.get("raise"):
+            msg = "This is the error."
+            raise ValueError(msg)
+
+        return super().GenerateInitialData({})
+
+
 # ----------------------------------------------------------------------
 class TestExecute:
     # ----------------------------------------------------------------------
@@ -302,6 +333,151 @@ class TestExecute:
         # No queries, so no results
         assert all_results == [[]]
 
+    # ----------------------------------------------------------------------
+    def test_DurationHistory(self, tmp_path: Path):
+        history_filename = tmp_path / "history.json"
+
+        modules = [
+            MyModule(
+                f"Module{index}",
+                "",
+                ExecutionStyle.Parallel,
+                [
+                    MyQuery(
+                        f"Query{index}",
+                        ExecutionStyle.Parallel,
+                        [
+                            MyRequirement(
+                                EvaluateResult.Success,
+                                f"Requirement{index}",
+                                "",
+                                ExecutionStyle.Parallel,
+                                "",
+                                "",
+                            )
+                        ],
+                    ),
+                ],
+            )
+            for index in range(2)
+        ]
+
+        with DoneManager.Create(sys.stdout, "", line_prefix="") as dm:
+            Execute(
+                dm,
+                [ModuleInfo(module, {}, {}) for module in modules],
+                duration_history_filename=history_filename,
+            )
+
+        content = json.loads(history_filename.read_text(encoding="UTF-8"))
+
+        assert set(content["durations"]) == {"Module0", "Module0/Query0", "Module1", "Module1/Query1"}
+        assert all(value > 0 for value in content["durations"].values())
+
+    # ----------------------------------------------------------------------
+    def test_Repositories(self):
+        module = MyModule(
+            "MyModule",
+            "",
+            ExecutionStyle.Parallel,
+            [
+                MyQuery(
+                    "MyQuery",
+                    ExecutionStyle.Parallel,
+                    [
+                        MyRequirement(
+                            EvaluateResult.Success,
+                            "MyRequirement",
+                            "",
+                            ExecutionStyle.Parallel,
+                            "",
+                            "",
+                        )
+                    ],
+                ),
+            ],
+        )
+
+        module_infos = [
+            ModuleInfo(module, {}, {}, repository=repository) for repository in ["repo1", "repo2"]
+        ]
+
+        assert [module_info.display_name for module_info in module_infos] == [
+            "MyModule (repo1)",
+            "MyModule (repo2)",
+        ]
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        all_results = Execute(cast(DoneManager, next(dm_and_content)), module_infos)
+
+        assert [[result.repository for result in results] for results in all_results] == [
+            ["repo1"],
+            ["repo2"],
+        ]
+
+        assert "Processing 2 modules across 2 repositories..." in cast(str, next(dm_and_content))
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("style", [ExecutionStyle.Parallel, ExecutionStyle.Sequential])
+    def test_Iterator(self, style):
+        module = MyModule(
+            "MyModule",
+            "",
+            style,
+            [
+                MyQuery(
+                    "MyQuery",
+                    ExecutionStyle.Parallel,
+                    [
+                        MyRequirement(
+                            EvaluateResult.Warning,
+                            "MyRequirement",
+                            "",
+                            ExecutionStyle.Parallel,
+                            "",
+                            "",
+                        )
+                    ],
+                ),
+            ],
+        )
+
+        generated: list[str] = []
+
+        # ----------------------------------------------------------------------
+        def GenerateModuleInfos() -> Iterator[ModuleInfo]:
+            for repository in ["repo1", "repo2", "repo3"]:
+                generated.append(repository)
+                yield ModuleInfo(module, {}, {}, repository=repository)
+
+        # ----------------------------------------------------------------------
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        all_results = Execute(cast(DoneManager, next(dm_and_content)), GenerateModuleInfos())
+
+        assert generated == ["repo1", "repo2", "repo3"]
+
+        # Results are returned in the order in which the modules were generated
+        assert [[result.repository for result in results] for results in all_results] == [
+            ["repo1"],
+            ["repo2"],
+            ["repo3"],
+        ]
+
+        content = cast(str, next(dm_and_content))
+
+        assert "Processing modules as repositories are discovered..." in content
+        assert "MyModule (repo2): ✅: 0 ❌: 0 ⚠️: 1 🚫: 0" in content
+
+    # ----------------------------------------------------------------------
+    def test_EmptyIterator(self):
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        assert Execute(cast(DoneManager, next(dm_and_content)), iter([])) == []
+        assert "There are no modules to process." in cast(str, next(dm_and_content))
+
     # ----------------------------------------------------------------------
     def test_NoInitialData(self):
         dm_and_content = GenerateDoneManagerAndContent()
@@ -350,6 +526,410 @@ class TestExecute:
 
         assert cast(str, next(dm_and_content)) == expected_content
 
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("style", [ExecutionStyle.Parallel, ExecutionStyle.Sequential])
+    def test_ModuleError(self, style):
+        module = ErrorModule(
+            "MyModule",
+            "",
+            style,
+            _CreateIterModule().queries,
+        )
+
+        module_infos = [
+            ModuleInfo(module, {"raise": index == 1}, {}, repository=f"repo{index}") for index in range(3)
+        ]
+
+        dm_and_content = GenerateDoneManagerAndContent(expected_result=-1)
+
+        all_results = Execute(cast(DoneManager, next(dm_and_content)), module_infos)
+
+        # The module that raised an exception does not prevent the evaluation of the others
+        assert [[result.result for result in results] for results in all_results] == [
+            [EvaluateResult.Success],
+            [EvaluateResult.Error],
+            [EvaluateResult.Success],
+        ]
+
+        assert [results[0].repository for results in all_results] == ["repo0", "repo1", "repo2"]
+        assert "This is the error." in cast(str, all_results[1][0].context)
+        assert "This is the error." in cast(str, next(dm_and_content))
+
+
+# ----------------------------------------------------------------------
+def _CreateIterModule(
+    style: ExecutionStyle = ExecutionStyle.Parallel,
+) -> MyModule:
+    return MyModule(
+        "MyModule",
+        "",
+        style,
+        [
+            MyQuery(
+                "MyQuery",
+                ExecutionStyle.Parallel,
+                [
+                    MyRequirement(
+                        EvaluateResult.Success,
+                        "MyRequirement",
+                        "",
+                        ExecutionStyle.Parallel,
+                        "",
+                        "",
+                    )
+                ],
+            ),
+        ],
+    )
+
+
+# ----------------------------------------------------------------------
+class TestExecuteIter:
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        module = _CreateIterModule()
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        module_results = list(
+            ExecuteIter(
+                cast(DoneManager, next(dm_and_content)),
+                [ModuleInfo(module, {}, {}, repository=f"repo{index}") for index in range(4)],
+            ),
+        )
+
+        assert sorted(module_result.index for module_result in module_results) == [0, 1, 2, 3]
+
+        for module_result in module_results:
+            assert module_result.module_info.repository == f"repo{module_result.index}"
+            assert [result.repository for result in module_result.results] == [f"repo{module_result.index}"]
+            assert [result.result for result in module_result.results] == [EvaluateResult.Success]
+
+        content = cast(str, next(dm_and_content))
+
+        assert "Processing 4 modules across 4 repositories..." in content
+        assert "MyModule (repo3): ✅: 1 ❌: 0 ⚠️: 0 🚫: 0" in content
+
+    # ----------------------------------------------------------------------
+    def test_BoundedPending(self):
+        module = _CreateIterModule()
+
+        num_generated = 0
+
+        # ----------------------------------------------------------------------
+        def GenerateModuleInfos() -> Iterator[ModuleInfo]:
+            nonlocal num_generated
+
+            for index in range(10):
+                num_generated += 1
+                yield ModuleInfo(module, {}, {}, repository=f"repo{index}")
+
+        # ----------------------------------------------------------------------
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        results_iter = ExecuteIter(
+            cast(DoneManager, next(dm_and_content)),
+            GenerateModuleInfos(),
+            max_threads=2,
+            max_pending=3,
+        )
+
+        # Results are available before all of the modules have been generated, and modules are
+        # only generated as results are consumed.
+        first_result = next(results_iter)
+
+        assert first_result.results
+        assert num_generated <= 4
+
+        num_results = 1 + sum(1 for _ in results_iter)
+
+        assert num_results == 10
+        assert num_generated == 10
+
+    # ----------------------------------------------------------------------
+    def test_StopEarly(self):
+        module = _CreateIterModule(ExecutionStyle.Sequential)
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        results_iter = ExecuteIter(
+            cast(DoneManager, next(dm_and_content)),
+            iter([ModuleInfo(module, {}, {}, repository=f"repo{index}") for index in range(20)]),
+            max_threads=1,
+        )
+
+        assert next(results_iter).index == 0
+
+        # Modules that have not been started are not evaluated once iteration stops
+        results_iter.close()
+
+        assert cast(str, next(dm_and_content)).count("MyModule (repo") == 1
+
+    # ----------------------------------------------------------------------
+    def test_SlowHostDoesNotStarveOtherHosts(self):
+        release_slow_host = threading.Event()
+
+        # ----------------------------------------------------------------------
+        class SlowRequirement(MyRequirement):
+            @override
+            def _EvaluateImpl(self, *args, **kwargs) -> Requirement.EvaluateImplResult:
+                assert release_slow_host.wait(5)
+                return super()._EvaluateImpl(*args, **kwargs)
+
+        # ----------------------------------------------------------------------
+
+        module = _CreateIterModule()
+        slow_module = MyModule(
+            "SlowModule",
+            "",
+            ExecutionStyle.Parallel,
+            [
+                MyQuery(
+                    "MyQuery",
+                    ExecutionStyle.Parallel,
+                    [
+                        SlowRequirement(
+                            EvaluateResult.Success, "MyRequirement", "", ExecutionStyle.Parallel, "", ""
+                        )
+                    ],
+                ),
+            ],
+        )
+
+        # Without per-host scheduling, modules for the slow host would gradually occupy every worker
+        module_infos: list[ModuleInfo] = []
+
+        for index in range(8):
+            module_infos.append(
+                ModuleInfo(slow_module, {}, {}, repository=f"https://slow.example.com/owner/repo{index}"),
+            )
+            module_infos.append(
+                ModuleInfo(module, {}, {}, repository=f"https://github.com/owner/repo{index}")
+            )
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        results_iter = ExecuteIter(
+            cast(DoneManager, next(dm_and_content)),
+            module_infos,
+            max_threads=4,
+        )
+
+        try:
+            for _ in range(8):
+                assert next(results_iter).module_info.host == "github.com"
+        finally:
+            release_slow_host.set()
+
+        assert sorted(module_result.index for module_result in results_iter) == list(range(0, 16, 2))
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize(
+        "repository, expected_host",
+        [
+            (None, None),
+            ("repo", None),
+            ("https://GitHub.com/owner/repo", "github.com"),
+            ("https://github.example.com/owner/repo", "github.example.com"),
+        ],
+    )
+    def test_Host(self, repository, expected_host):
+        assert ModuleInfo(_CreateIterModule(), {}, {}, repository=repository).host == expected_host
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("style", [ExecutionStyle.Parallel, ExecutionStyle.Sequential])
+    @pytest.mark.parametrize("discovered", [False, True])
+    def test_Processes(self, discovered, style):
+        module = MyModule(
+            "MyModule",
+            "",
+            style,
+            [
+                MyQuery(
+                    "MyQuery",
+                    ExecutionStyle.Parallel,
+                    [
+                        ProcessRequirement(
+                            EvaluateResult.Success, "Requirement1", "", ExecutionStyle.Parallel, "", ""
+                        ),
+                        ProcessRequirement(
+                            EvaluateResult.Warning, "Requirement2", "", ExecutionStyle.Parallel, "", ""
+                        ),
+                    ],
+                ),
+            ],
+        )
+
+        module_infos = [ModuleInfo(module, {}, {}, repository=f"repo{index}") for index in range(6)]
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        module_results = list(
+            ExecuteIter(
+                cast(DoneManager, next(dm_and_content)),
+                iter(module_infos) if discovered else module_infos,
+                max_threads=2,
+                num_processes=2,
+            ),
+        )
+
+        assert sorted(module_result.index for module_result in module_results) == list(range(6))
+
+        process_ids: set[str] = set()
+
+        for module_result in module_results:
+            # Results refer to the objects in this process
+            assert module_result.module_info is module_infos[module_result.index]
+            assert [result.module for result in module_result.results] == [module, module]
+            assert [result.requirement for result in module_result.results] == module.queries[0].requirements
+            assert [result.result for result in module_result.results] == [
+                EvaluateResult.Success,
+                EvaluateResult.Warning,
+            ]
+            assert {result.repository for result in module_result.results} == {f"repo{module_result.index}"}
+
+            process_ids.update(cast(str, result.context) for result in module_result.results)
+
+        assert str(os.getpid()) not in process_ids
+        assert len(process_ids) == (1 if style == ExecutionStyle.Sequential else 2)
+
+        content = cast(str, next(dm_and_content))
+
+        assert "MyModule (repo5): ✅: 1 ❌: 0 ⚠️: 1 🚫: 0" in content
+
+    # ----------------------------------------------------------------------
+    def test_ProcessesError(self):
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        module_results = list(
+            ExecuteIter(
+                cast(DoneManager, next(dm_and_content)),
+                [
+                    ModuleInfo(
+                        ErrorModule("MyModule", "", ExecutionStyle.Parallel, []),
+                        {"raise": True},
+                        {},
+                        repository="repo0",
+                    )
+                ],
+                num_processes=2,
+            ),
+        )
+
+        assert len(module_results) == 1
+        assert module_results[0].results == []
+        assert not module_results[0].is_complete
+        assert re.match(
+            r"(?s)An error was encountered while evaluating MyModule \(repo0\) in a worker process\..*This is the error\.",
+            cast(str, module_results[0].error),
+        )
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("num_processes", [None, 2])
+    def test_ModuleError(self, num_processes):
+        module = ErrorModule(
+            "MyModule",
+            "",
+            ExecutionStyle.Parallel,
+            _CreateIterModule().queries,
+        )
+
+        module_infos = [
+            ModuleInfo(module, {"raise": index == 2}, {}, repository=f"repo{index}") for index in range(5)
+        ]
+
+        dm_and_content = GenerateDoneManagerAndContent(expected_result=-1)
+
+        module_results = sorted(
+            ExecuteIter(
+                cast(DoneManager, next(dm_and_content)),
+                module_infos,
+                max_threads=2,
+                num_processes=num_processes,
+            ),
+            key=lambda module_result: module_result.index,
+        )
+
+        # The module that raised an exception does not prevent the evaluation of the others
+        assert [module_result.index for module_result in module_results] == list(range(5))
+
+        for module_result in module_results:
+            if module_result.index == 2:
+                assert not module_result.is_complete
+                assert "This is the error." in cast(str, module_result.error)
+                assert [result.result for result in module_result.results] == [EvaluateResult.Error]
+                assert module_result.results[0].repository == "repo2"
+                assert "This is the error." in cast(str, module_result.results[0].context)
+            else:
+                assert module_result.is_complete
+                assert module_result.error is None
+                assert [result.result for result in module_result.results] == [EvaluateResult.Success]
+
+        content = cast(str, next(dm_and_content))
+
+        assert "MyModule (repo2): ✅: 0 ❌: 1 ⚠️: 0 🚫: 0" in content
+        assert "MyModule (repo4): ✅: 1 ❌: 0 ⚠️: 0 🚫: 0" in content
+
+    # ----------------------------------------------------------------------
+    def test_ProcessesUnpicklable(self):
+        # ----------------------------------------------------------------------
+        class LocalRequirement(ProcessRequirement):
+            pass
+
+        # ----------------------------------------------------------------------
+
+        modules = [
+            MyModule(
+                name,
+                "",
+                ExecutionStyle.Parallel,
+                [
+                    MyQuery(
+                        "MyQuery",
+                        ExecutionStyle.Parallel,
+                        [
+                            requirement_type(
+                                EvaluateResult.Success, "Requirement1", "", ExecutionStyle.Parallel, "", ""
+                            ),
+                        ],
+                    ),
+                ],
+            )
+            for name, requirement_type in [("Picklable", ProcessRequirement), ("Local", LocalRequirement)]
+        ]
+
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        module_results = list(
+            ExecuteIter(
+                cast(DoneManager, next(dm_and_content)),
+                [ModuleInfo(module, {}, {}, repository="repo0") for module in modules],
+                num_processes=2,
+            ),
+        )
+
+        process_ids = {
+            module_result.module_info.module.name: module_result.results[0].context
+            for module_result in module_results
+        }
+
+        # The module that cannot be pickled is evaluated in this process
+        assert process_ids["Local"] == str(os.getpid())
+        assert process_ids["Picklable"] != str(os.getpid())
+
+    # ----------------------------------------------------------------------
+    def test_InvalidProcesses(self):
+        with pytest.raises(ValueError, match=r"The number of processes must be greater than 0 \(0\)\."):
+            list(ExecuteIter(cast(DoneManager, None), [], num_processes=0))
+
+    # ----------------------------------------------------------------------
+    def test_NoModules(self):
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        assert list(ExecuteIter(cast(DoneManager, next(dm_and_content)), [])) == []
+        assert "There are no modules to process." in cast(str, next(dm_and_content))
+
 
 # ----------------------------------------------------------------------
 class TestDisplayResults:
@@ -475,3 +1055,123 @@ class TestDisplayResults:
         content = capsys.readouterr().out
 
         assert content == snapshot
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("repository", [None, "repo1"])
+    def test_ModuleResults(self, repository, modules, capsys):
+        dm_and_content = GenerateDoneManagerAndContent()
+
+        DisplayModuleResults(
+            cast(DoneManager, next(dm_and_content)),
+            [
+                Module.EvaluateInfo(
+                    EvaluateResult.Error,
+                    "Context 1",
+                    "resolution",
+                    "rationale",
+                    modules[1].queries[0].requirements[0],
+                    modules[1].queries[0],
+                    modules[1],
+                    repository=repository,
+                ),
+            ],
+            display_resolution=True,
+            display_rationale=True,
+        )
+
+        content = capsys.readouterr().out
+
+        assert "Module2" in content
+        assert "[Error] Requirement2A" in content
+        assert ("repo1" in content) == (repository is not None)
+
+        # Modules without results are not displayed
+        DisplayModuleResults(
+            cast(DoneManager, next(GenerateDoneManagerAndContent())),
+            [],
+            display_resolution=True,
+            display_rationale=True,
+        )
+
+        assert capsys.readouterr().out == ""
+
+    # ----------------------------------------------------------------------
+    def test_ComplianceMatrix(self, modules, capsys):
+        matrix = ComplianceMatrix()
+
+        for repository, result in [("repo1", EvaluateResult.Success), ("repo2", EvaluateResult.Error)]:
+            matrix.Add(
+                [
+                    Module.EvaluateInfo(
+                        result,
+                        None,
+                        None,
+                        None,
+                        modules[1].queries[0].requirements[0],
+                        modules[1].queries[0],
+                        modules[1],
+                        repository=repository,
+                    ),
+                ],
+            )
+
+        DisplayComplianceMatrix(matrix, panel_width=120)
+
+        content = capsys.readouterr().out
+
+        assert "Compliance Summary (2 repositories)" in content
+        assert "Module2 / Requirement2A" in content
+        assert "50.00%" in content
+        assert "Repositories with the most errors" in content
+        assert "repo2" in content
+
+    # ----------------------------------------------------------------------
+    def test_BaselineChanges(self, modules, capsys):
+        requirement = modules[1].queries[0].requirements[0]
+
+        # ----------------------------------------------------------------------
+        def CreateResult(
+            result: EvaluateResult,
+            repository: str,
+        ) -> Module.EvaluateInfo:
+            return Module.EvaluateInfo(
+                result,
+                "The context",
+                None,
+                None,
+                requirement,
+                modules[1].queries[0],
+                modules[1],
+                repository=repository,
+            )
+
+        # ----------------------------------------------------------------------
+
+        baseline = Baseline(
+            {
+                ("repo1", "Module2", modules[1].queries[0].name, requirement.name): EvaluateResult.Error,
+                ("repo2", "Module2", modules[1].queries[0].name, requirement.name): EvaluateResult.Success,
+            },
+        )
+
+        changes = baseline.Compare([CreateResult(EvaluateResult.Success, "repo1")])
+        changes += baseline.Compare([CreateResult(EvaluateResult.Error, "repo2")])
+
+        DisplayBaselineChanges(changes, panel_width=120)
+
+        content = capsys.readouterr().out
+
+        assert "Changes from Baseline (1 regressions, 1 fixed)" in content
+        assert "Module2 / Requirement2A" in content
+        assert "The context" in content
+
+        # Regressions are displayed first
+        assert content.index("repo2") < content.index("repo1")
+
+        DisplayBaselineChanges(changes, title="Changes at 2024-01-01 00:00:00", panel_width=120)
+
+        assert "Changes at 2024-01-01 00:00:00 (1 regressions, 1 fixed)" in capsys.readouterr().out
+
+        DisplayBaselineChanges([], panel_width=120)
+
+        assert "The outcomes of all requirements are unchanged." in capsys.readouterr().out
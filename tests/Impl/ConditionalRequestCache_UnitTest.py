@@ -0,0 +1,100 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for ConditionalRequestCache.py"""
+
+from typing import Optional
+
+import requests
+
+from RepoAuditor.Impl.ConditionalRequestCache import *
+
+
+# ----------------------------------------------------------------------
+def _CreateResponse(
+    status_code: int,
+    content: bytes = b"",
+    etag: Optional[str] = None,
+) -> requests.Response:
+    response = requests.Response()
+
+    response.status_code = status_code
+    response._content = content
+    response.url = "https://api.github.com/test"
+
+    if etag is not None:
+        response.headers["ETag"] = etag
+
+    return response
+
+
+# ----------------------------------------------------------------------
+KEY = ("https://api.github.com/test", None)
+
+
+# ----------------------------------------------------------------------
+def test_NotCached():
+    cache = ConditionalRequestCache()
+
+    assert cache.GetRequestHeaders(KEY) == {}
+
+    response = _CreateResponse(304)
+    assert cache.ProcessResponse(KEY, response) is response
+
+    assert cache.num_not_modified == 0
+
+
+# ----------------------------------------------------------------------
+def test_NotModified():
+    cache = ConditionalRequestCache()
+
+    cache.ProcessResponse(KEY, _CreateResponse(200, b'{"value": 1}', '"etag1"'))
+
+    assert cache.GetRequestHeaders(KEY) == {"If-None-Match": '"etag1"'}
+    assert cache.GetRequestHeaders(("https://api.github.com/test", "Bearer pat")) == {}
+
+    response = cache.ProcessResponse(KEY, _CreateResponse(304))
+
+    assert response.status_code == 200
+    assert response.json() == {"value": 1}
+    assert response.headers["etag"] == '"etag1"'
+    assert cache.num_not_modified == 1
+
+
+# ----------------------------------------------------------------------
+def test_Modified():
+    cache = ConditionalRequestCache()
+
+    cache.ProcessResponse(KEY, _CreateResponse(200, b'{"value": 1}', '"etag1"'))
+    cache.ProcessResponse(KEY, _CreateResponse(200, b'{"value": 2}', '"etag2"'))
+
+    assert cache.GetRequestHeaders(KEY) == {"If-None-Match": '"etag2"'}
+    assert cache.ProcessResponse(KEY, _CreateResponse(304)).json() == {"value": 2}
+
+
+# ----------------------------------------------------------------------
+def test_Removed():
+    cache = ConditionalRequestCache()
+
+    cache.ProcessResponse(KEY, _CreateResponse(200, b'{"value": 1}', '"etag1"'))
+
+    # Responses without ETags (and errors) are not cached
+    cache.ProcessResponse(KEY, _CreateResponse(200, b'{"value": 2}'))
+    assert cache.GetRequestHeaders(KEY) == {}
+
+    cache.ProcessResponse(KEY, _CreateResponse(200, b'{"value": 1}', '"etag1"'))
+    cache.ProcessResponse(KEY, _CreateResponse(404))
+    assert cache.GetRequestHeaders(KEY) == {}
+
+
+# ----------------------------------------------------------------------
+def test_Activate():
+    assert ConditionalRequestCache.GetActive() is None
+
+    with ConditionalRequestCache().Activate() as cache:
+        assert ConditionalRequestCache.GetActive() is cache
+
+    assert ConditionalRequestCache.GetActive() is None
@@ -0,0 +1,110 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for Deadline.py"""
+
+import pickle
+import threading
+import time
+
+import pytest
+
+from RepoAuditor.Impl.Deadline import *
+
+
+# ----------------------------------------------------------------------
+def test_NoExpiration():
+    deadline = Deadline.Create(None)
+
+    assert deadline.expiration is None
+    assert deadline.remaining is None
+    assert deadline.is_expired is False
+    assert deadline.GetTimeout() is None
+
+
+# ----------------------------------------------------------------------
+def test_Expiration():
+    deadline = Deadline.Create(60)
+
+    assert deadline.is_expired is False
+    assert 0 < deadline.remaining <= 60
+    assert 0 < deadline.GetTimeout() <= 60
+
+
+# ----------------------------------------------------------------------
+def test_Expired():
+    deadline = Deadline.Create(0)
+
+    assert deadline.is_expired
+    assert deadline.remaining == 0
+
+    with pytest.raises(DeadlineExceededError):
+        deadline.GetTimeout()
+
+
+# ----------------------------------------------------------------------
+def test_Pickle():
+    assert pickle.loads(pickle.dumps(Deadline.Create(None))).expiration is None
+
+    deadline = Deadline.Create(60)
+    time.sleep(0.01)
+
+    # The deadline is recreated from the number of seconds remaining
+    unpickled_deadline = pickle.loads(pickle.dumps(deadline))
+
+    assert unpickled_deadline.expiration is not None
+    assert deadline.expiration is not None
+    assert abs(unpickled_deadline.expiration - deadline.expiration) < 1
+
+
+# ----------------------------------------------------------------------
+def test_CreateChild():
+    assert Deadline.Create(None).CreateChild(None).expiration is None
+
+    parent = Deadline.Create(60)
+    assert parent.CreateChild(None).expiration == parent.expiration
+    assert parent.CreateChild(1000).expiration == parent.expiration
+    assert parent.CreateChild(1).expiration < parent.expiration
+
+    child = Deadline.Create(None).CreateChild(10)
+    assert child.expiration is not None
+    assert 0 < child.remaining <= 10
+
+
+# ----------------------------------------------------------------------
+def test_Activate():
+    assert Deadline.GetActive() is None
+
+    outer = Deadline.Create(60)
+    inner = Deadline.Create(30)
+
+    with outer.Activate():
+        assert Deadline.GetActive() is outer
+
+        with inner.Activate():
+            assert Deadline.GetActive() is inner
+
+            # Deadlines are only active for the thread that activated them
+            other_thread_deadlines = []
+
+            thread = threading.Thread(target=lambda: other_thread_deadlines.append(Deadline.GetActive()))
+            thread.start()
+            thread.join()
+
+            assert other_thread_deadlines == [None]
+
+        assert Deadline.GetActive() is outer
+
+    assert Deadline.GetActive() is None
+
+
+# ----------------------------------------------------------------------
+def test_ExpiresOverTime():
+    deadline = Deadline.Create(0.05)
+    assert deadline.is_expired is False
+
+    time.sleep(0.1)
+    assert deadline.is_expired
@@ -0,0 +1,112 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for DurationHistory.py"""
+
+import json
+import pickle
+from pathlib import Path
+
+from RepoAuditor.Impl.DurationHistory import *
+
+
+# ----------------------------------------------------------------------
+def test_Empty():
+    history = DurationHistory()
+
+    assert history.filename is None
+    assert history.GetEstimate("key") is None
+
+
+# ----------------------------------------------------------------------
+def test_Record():
+    history = DurationHistory()
+
+    history.Record("key", 10.0)
+    assert history.GetEstimate("key") == 10.0
+
+    # Subsequent durations are smoothed
+    history.Record("key", 20.0)
+    assert history.GetEstimate("key") == 15.0
+
+
+# ----------------------------------------------------------------------
+def test_GetEstimateFallback():
+    history = DurationHistory({"general": 1.0, "specific": 2.0})
+
+    assert history.GetEstimate("specific", "general") == 2.0
+    assert history.GetEstimate("missing", "general") == 1.0
+    assert history.GetEstimate("missing") is None
+
+
+# ----------------------------------------------------------------------
+def test_SaveAndLoad(tmp_path: Path):
+    filename = tmp_path / "history" / "durations.json"
+
+    history = DurationHistory.Load(filename)
+
+    assert history.filename == filename
+    assert history.GetEstimate("key") is None
+
+    history.Record("key", 3.0)
+    history.Save()
+
+    assert json.loads(filename.read_text(encoding="UTF-8")) == {
+        "version": DurationHistory.VERSION,
+        "durations": {"key": 3.0},
+    }
+
+    assert DurationHistory.Load(filename).GetEstimate("key") == 3.0
+
+
+# ----------------------------------------------------------------------
+def test_LoadInvalid(tmp_path: Path):
+    filename = tmp_path / "durations.json"
+
+    filename.write_text("this is not json", encoding="UTF-8")
+    assert DurationHistory.Load(filename).GetEstimate("key") is None
+
+    filename.write_text(json.dumps({"version": 0, "durations": {"key": 1.0}}), encoding="UTF-8")
+    assert DurationHistory.Load(filename).GetEstimate("key") is None
+
+    filename.write_text(
+        json.dumps({"version": DurationHistory.VERSION, "durations": {"key": "one", "other": -1}}),
+        encoding="UTF-8",
+    )
+    assert DurationHistory.Load(filename).GetEstimate("key", "other") is None
+
+
+# ----------------------------------------------------------------------
+def test_Pickle(tmp_path: Path):
+    history = DurationHistory(filename=tmp_path / "durations.json")
+    history.Record("key", 10.0)
+
+    unpickled_history = pickle.loads(pickle.dumps(history))
+
+    assert unpickled_history.GetEstimate("key") == 10.0
+
+    # The copy is not saved
+    assert unpickled_history.filename is None
+
+    unpickled_history.Record("other", 5.0)
+    assert history.GetEstimate("other") is None
+
+
+# ----------------------------------------------------------------------
+def test_SaveInMemory():
+    # Saving a history without a filename does nothing
+    DurationHistory({"key": 1.0}).Save()
+
+
+# ----------------------------------------------------------------------
+def test_Activate():
+    prev_history = DurationHistory.GetActive()
+    history = DurationHistory()
+
+    with history.Activate():
+        assert DurationHistory.GetActive() is history
+
+    assert DurationHistory.GetActive() is prev_history
@@ -0,0 +1,415 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for ResourceLimits.py"""
+
+import threading
+import time
+
+import pytest
+
+from RepoAuditor.Impl.Deadline import Deadline, DeadlineExceededError
+from RepoAuditor.Impl.ResourceLimits import *
+
+
+# ----------------------------------------------------------------------
+def _CalcMaxConcurrency(
+    acquire_func,
+    num_threads: int = 8,
+) -> int:
+    lock = threading.Lock()
+    current = 0
+    max_current = 0
+
+    # ----------------------------------------------------------------------
+    def Worker() -> None:
+        nonlocal current, max_current
+
+        with acquire_func():
+            with lock:
+                current += 1
+                max_current = max(max_current, current)
+
+            time.sleep(0.02)
+
+            with lock:
+                current -= 1
+
+    # ----------------------------------------------------------------------
+
+    threads = [threading.Thread(target=Worker) for _ in range(num_threads)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    return max_current
+
+
+# ----------------------------------------------------------------------
+class TestLimiter:
+    # ----------------------------------------------------------------------
+    def test_Unlimited(self):
+        limiter = Limiter("test", None)
+
+        assert limiter.max_value is None
+        assert _CalcMaxConcurrency(limiter.Acquire) > 1
+
+    # ----------------------------------------------------------------------
+    def test_Limited(self):
+        limiter = Limiter("test", 2)
+
+        assert _CalcMaxConcurrency(limiter.Acquire) <= 2
+
+    # ----------------------------------------------------------------------
+    def test_InvalidValue(self):
+        with pytest.raises(ValueError, match="The maximum value for 'test' must be greater than 0."):
+            Limiter("test", 0)
+
+    # ----------------------------------------------------------------------
+    def test_Deadline(self):
+        limiter = Limiter("test", 1)
+
+        with limiter.Acquire(), Deadline.Create(0.01).Activate():
+            with (
+                pytest.raises(
+                    DeadlineExceededError,
+                    match="A slot for 'test' was not available before the deadline expired.",
+                ),
+                limiter.Acquire(),
+            ):
+                pass
+
+    # ----------------------------------------------------------------------
+    def test_Suspend(self):
+        limiter = Limiter("test", 1)
+
+        # Threads that do not hold a slot are not affected
+        with limiter.Suspend():
+            pass
+
+        with limiter.Acquire():
+            # The slot can be used for other work while it is suspended
+            with limiter.Suspend(), Deadline.Create(0.01).Activate(), limiter.Acquire():
+                pass
+
+            # The slot is held again once the suspension ends
+            with Deadline.Create(0.01).Activate():
+                with pytest.raises(DeadlineExceededError), limiter.Acquire():
+                    pass
+
+        with limiter.Acquire():
+            pass
+
+    # ----------------------------------------------------------------------
+    def test_SuspendDeadline(self):
+        limiter = Limiter("test", 1)
+        acquired = threading.Event()
+        release = threading.Event()
+
+        # ----------------------------------------------------------------------
+        def Hold() -> None:
+            with limiter.Acquire():
+                acquired.set()
+                release.wait(5)
+
+        # ----------------------------------------------------------------------
+        def Suspend() -> None:
+            with limiter.Acquire(), limiter.Suspend():
+                thread.start()
+                assert acquired.wait(5)
+
+        # ----------------------------------------------------------------------
+
+        thread = threading.Thread(target=Hold)
+
+        with Deadline.Create(0.05).Activate(), pytest.raises(DeadlineExceededError):
+            Suspend()
+
+        release.set()
+        thread.join()
+
+        # The slot that could not be acquired again was not released
+        with limiter.Acquire(), Deadline.Create(0.01).Activate():
+            with pytest.raises(DeadlineExceededError), limiter.Acquire():
+                pass
+
+
+# ----------------------------------------------------------------------
+class TestAdaptiveLimiter:
+    # ----------------------------------------------------------------------
+    def test_Initial(self):
+        limiter = AdaptiveLimiter("test", None)
+
+        assert limiter.max_value == AdaptiveLimiter.DEFAULT_MAX_VALUE
+        assert limiter.limit == AdaptiveLimiter.INITIAL_VALUE
+
+        # The limit increases as operations complete without incident
+        assert _CalcMaxConcurrency(limiter.Acquire, 16) <= limiter.limit
+        assert limiter.limit > AdaptiveLimiter.INITIAL_VALUE
+
+        # The initial value never exceeds the maximum value
+        assert AdaptiveLimiter("test", 2).limit == 2
+
+    # ----------------------------------------------------------------------
+    def test_InvalidValue(self):
+        with pytest.raises(ValueError, match="The maximum value for 'test' must be greater than 0."):
+            AdaptiveLimiter("test", 0)
+
+    # ----------------------------------------------------------------------
+    def test_AdditiveIncrease(self, monkeypatch):
+        limiter = AdaptiveLimiter("test", 6)
+
+        # Use a constant latency so that a slow operation is not mistaken for a latency spike
+        monkeypatch.setattr("RepoAuditor.Impl.ResourceLimits.time.monotonic", lambda: 0.0)
+
+        for _ in range(20):
+            with limiter.Acquire():
+                pass
+
+        assert limiter.limit == 6
+
+        summary = limiter.GetSummary()
+
+        assert summary.limit == 6
+        assert summary.max_in_flight == 1
+        assert summary.num_operations == 20
+        assert summary.num_throttled == 0
+
+    # ----------------------------------------------------------------------
+    def test_MultiplicativeDecrease(self):
+        limiter = AdaptiveLimiter("test", 16)
+
+        with limiter.Acquire() as operation:
+            operation.MarkThrottled()
+
+        assert limiter.limit == AdaptiveLimiter.INITIAL_VALUE // 2
+
+        with limiter.Acquire() as operation:
+            operation.MarkThrottled()
+
+        assert limiter.limit == 1
+
+        # The limit never drops below 1
+        with limiter.Acquire() as operation:
+            operation.MarkThrottled()
+
+        assert limiter.limit == 1
+        assert limiter.GetSummary().num_throttled == 3
+
+    # ----------------------------------------------------------------------
+    def test_StaleThrottleSignalsIgnored(self):
+        limiter = AdaptiveLimiter("test", 16)
+
+        # Both operations are started before the limit is decreased, so only one decrease is applied
+        with limiter.Acquire() as operation1, limiter.Acquire() as operation2:
+            operation1.MarkThrottled()
+            operation2.MarkThrottled()
+
+        assert limiter.limit == AdaptiveLimiter.INITIAL_VALUE // 2
+
+    # ----------------------------------------------------------------------
+    def test_LatencySpike(self, monkeypatch):
+        limiter = AdaptiveLimiter("test", 4)
+
+        now = [0.0]
+        monkeypatch.setattr("RepoAuditor.Impl.ResourceLimits.time.monotonic", lambda: now[0])
+
+        for _ in range(AdaptiveLimiter.MIN_LATENCY_SAMPLES):
+            with limiter.Acquire():
+                now[0] += 1.0
+
+        assert limiter.limit == 4
+
+        with limiter.Acquire():
+            now[0] += 1.0 * AdaptiveLimiter.LATENCY_SPIKE_FACTOR * 2
+
+        assert limiter.limit == 2
+        assert limiter.GetSummary().num_throttled == 0
+
+    # ----------------------------------------------------------------------
+    def test_ExceptionsDoNotAdjust(self):
+        limiter = AdaptiveLimiter("test", 16)
+
+        with pytest.raises(RuntimeError), limiter.Acquire():
+            raise RuntimeError()
+
+        assert limiter.limit == AdaptiveLimiter.INITIAL_VALUE
+        assert limiter.GetSummary().num_operations == 0
+
+    # ----------------------------------------------------------------------
+    def test_Deadline(self):
+        limiter = AdaptiveLimiter("test", 1)
+
+        with limiter.Acquire(), Deadline.Create(0.01).Activate():
+            with (
+                pytest.raises(
+                    DeadlineExceededError,
+                    match="A slot for 'test' was not available before the deadline expired.",
+                ),
+                limiter.Acquire(),
+            ):
+                pass
+
+    # ----------------------------------------------------------------------
+    def test_RateLimitPause(self):
+        limiter = AdaptiveLimiter("test", 4)
+
+        with limiter.Acquire() as operation:
+            operation.SetRateLimitRemaining(0)
+            operation.PauseFor(0.1)
+
+        summary = limiter.GetSummary()
+
+        assert summary.rate_limit_remaining == 0
+        assert summary.num_paused == 1
+
+        # New operations wait until the pause has ended
+        start = time.monotonic()
+
+        with limiter.Acquire() as operation:
+            operation.SetRateLimitRemaining(100)
+
+        assert time.monotonic() - start >= 0.09
+
+        summary = limiter.GetSummary()
+
+        assert summary.rate_limit_remaining == 100
+        assert summary.num_paused == 1
+
+    # ----------------------------------------------------------------------
+    def test_RateLimitPauseDeadline(self):
+        limiter = AdaptiveLimiter("test", 4)
+
+        with limiter.Acquire() as operation:
+            operation.PauseFor(60)
+
+        with (
+            Deadline.Create(0.01).Activate(),
+            pytest.raises(
+                DeadlineExceededError,
+                match="A slot for 'test' was not available before the deadline expired.",
+            ),
+            limiter.Acquire(),
+        ):
+            pass
+
+
+# ----------------------------------------------------------------------
+class TestResourceLimits:
+    # ----------------------------------------------------------------------
+    def test_Default(self):
+        limits = ResourceLimits.GetActive()
+
+        assert limits.max_threads is None
+        assert limits.max_http_concurrency is None
+        assert limits.max_clones is None
+        assert (
+            limits.GetDescription()
+            == "Threads per level: unlimited, HTTP requests per host: adaptive (maximum of 32), Clones: unlimited"
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Activate(self):
+        prev_limits = ResourceLimits.GetActive()
+        limits = ResourceLimits(max_threads=1, max_http_concurrency=2, max_clones=3)
+
+        assert (
+            limits.GetDescription()
+            == "Threads per level: 1, HTTP requests per host: adaptive (maximum of 2), Clones: 3"
+        )
+
+        with limits.Activate():
+            assert ResourceLimits.GetActive() is limits
+
+            # The limits are visible to other threads
+            active_limits = []
+
+            thread = threading.Thread(target=lambda: active_limits.append(ResourceLimits.GetActive()))
+            thread.start()
+            thread.join()
+
+            assert active_limits == [limits]
+
+        assert ResourceLimits.GetActive() is prev_limits
+
+    # ----------------------------------------------------------------------
+    def test_Limits(self):
+        limits = ResourceLimits(max_threads=1, max_http_concurrency=2, max_clones=3)
+
+        assert _CalcMaxConcurrency(limits.AcquireWorker) == 1
+        assert _CalcMaxConcurrency(limits.AcquireClone) <= 3
+        assert _CalcMaxConcurrency(lambda: limits.AcquireHttp("api.github.com")) <= 2
+
+    # ----------------------------------------------------------------------
+    def test_HttpLimitsArePerHost(self):
+        limits = ResourceLimits(max_http_concurrency=1)
+
+        with limits.AcquireHttp("api.github.com"), limits.AcquireHttp("github.example.com"):
+            pass
+
+        with pytest.raises(DeadlineExceededError), limits.AcquireHttp("API.github.com"):
+            with Deadline.Create(0.01).Activate(), limits.AcquireHttp("api.github.com"):
+                pass
+
+    # ----------------------------------------------------------------------
+    def test_PausedHostReleasesWorker(self):
+        limits = ResourceLimits(max_threads=1)
+
+        with limits.AcquireHttp("slow.example.com") as operation:
+            operation.PauseFor(0.5)
+
+        is_waiting = threading.Event()
+        completion_times: dict[str, float] = {}
+
+        # ----------------------------------------------------------------------
+        def Slow() -> None:
+            with limits.AcquireWorker():
+                is_waiting.set()
+
+                with limits.AcquireHttp("slow.example.com"):
+                    completion_times["slow"] = time.monotonic()
+
+        # ----------------------------------------------------------------------
+
+        thread = threading.Thread(target=Slow)
+        thread.start()
+
+        assert is_waiting.wait(5)
+        time.sleep(0.05)
+
+        # The worker slot is available while the slow host is paused
+        with Deadline.Create(0.3).Activate(), limits.AcquireWorker(), limits.AcquireHttp("github.com"):
+            completion_times["fast"] = time.monotonic()
+
+        thread.join()
+
+        assert completion_times["fast"] < completion_times["slow"]
+
+        # The worker slot was acquired again once the pause ended
+        with limits.AcquireWorker():
+            pass
+
+    # ----------------------------------------------------------------------
+    def test_HttpSummaries(self):
+        limits = ResourceLimits()
+
+        assert limits.GetHttpSummaries() == {}
+
+        with limits.AcquireHttp("API.github.com") as operation:
+            operation.MarkThrottled()
+
+        summaries = limits.GetHttpSummaries()
+
+        assert list(summaries) == ["api.github.com"]
+        assert summaries["api.github.com"].num_throttled == 1
+
+    # ----------------------------------------------------------------------
+    def test_InvalidHttpConcurrency(self):
+        with pytest.raises(ValueError, match="The maximum value for 'HTTP requests' must be greater than 0."):
+            ResourceLimits(max_http_concurrency=0)
@@ -0,0 +1,182 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for ResultCache.py"""
+
+import json
+import pickle
+import time
+from pathlib import Path
+
+from RepoAuditor.Impl.ResultCache import *
+
+
+# ----------------------------------------------------------------------
+def test_Empty():
+    cache = ResultCache()
+
+    assert cache.filename is None
+    assert cache.num_hits == 0
+    assert cache.Get("fingerprint") is None
+
+
+# ----------------------------------------------------------------------
+def test_Record():
+    cache = ResultCache()
+
+    cache.Record("fingerprint", {"result": "Success"})
+
+    assert cache.Get("fingerprint") == {"result": "Success"}
+    assert cache.Get("other") is None
+    assert cache.num_hits == 1
+
+
+# ----------------------------------------------------------------------
+def test_SaveAndLoad(tmp_path: Path):
+    filename = tmp_path / "cache" / "results.json"
+
+    cache = ResultCache.Load(filename)
+
+    assert cache.filename == filename
+    assert cache.Get("fingerprint") is None
+
+    cache.Record("fingerprint", {"result": "Success"})
+    cache.Save()
+
+    content = json.loads(filename.read_text(encoding="UTF-8"))
+
+    assert content["version"] == ResultCache.VERSION
+    assert list(content["entries"]) == ["fingerprint"]
+    assert content["entries"]["fingerprint"]["values"] == {"result": "Success"}
+
+    assert ResultCache.Load(filename).Get("fingerprint") == {"result": "Success"}
+
+
+# ----------------------------------------------------------------------
+def test_SavePrunesUnused(tmp_path: Path):
+    filename = tmp_path / "results.json"
+
+    cache = ResultCache(
+        {
+            "old": {
+                "values": {"result": "Error"},
+                "last_used": time.time() - ResultCache.MAX_UNUSED_SECONDS - 60,
+            },
+            "new": {
+                "values": {"result": "Success"},
+                "last_used": time.time(),
+            },
+        },
+        filename,
+    )
+
+    cache.Save()
+
+    cache = ResultCache.Load(filename)
+
+    assert cache.Get("old") is None
+    assert cache.Get("new") == {"result": "Success"}
+
+
+# ----------------------------------------------------------------------
+def test_LoadInvalid(tmp_path: Path):
+    filename = tmp_path / "results.json"
+
+    filename.write_text("this is not json", encoding="UTF-8")
+    assert ResultCache.Load(filename).Get("fingerprint") is None
+
+    filename.write_text(
+        json.dumps(
+            {"version": 0, "entries": {"fingerprint": {"values": {}, "last_used": 0}}},
+        ),
+        encoding="UTF-8",
+    )
+    assert ResultCache.Load(filename).Get("fingerprint") is None
+
+    filename.write_text(
+        json.dumps(
+            {
+                "version": ResultCache.VERSION,
+                "entries": {
+                    "fingerprint": {"values": "one", "last_used": 0},
+                    "other": {"values": {}},
+                },
+            },
+        ),
+        encoding="UTF-8",
+    )
+
+    cache = ResultCache.Load(filename)
+
+    assert cache.Get("fingerprint") is None
+    assert cache.Get("other") is None
+
+
+# ----------------------------------------------------------------------
+def test_RecordFunctions(tmp_path: Path):
+    filename = tmp_path / "results.json"
+
+    calls: list[str] = []
+
+    # ----------------------------------------------------------------------
+    def Create() -> str:
+        calls.append("Create")
+        return "The value"
+
+    # ----------------------------------------------------------------------
+
+    cache = ResultCache(filename=filename)
+    cache.Record("fingerprint", {"result": "Success", "resolution": Create})
+
+    # Functions are not called until the values are needed
+    assert cache.Get("fingerprint") == {"result": "Success", "resolution": Create}
+    assert calls == []
+
+    assert pickle.loads(pickle.dumps(cache)).Get("fingerprint") == {
+        "result": "Success",
+        "resolution": "The value",
+    }
+    assert calls == ["Create"]
+
+    cache.Save()
+    assert calls == ["Create", "Create"]
+
+    assert ResultCache.Load(filename).Get("fingerprint") == {"result": "Success", "resolution": "The value"}
+
+
+# ----------------------------------------------------------------------
+def test_Pickle(tmp_path: Path):
+    cache = ResultCache(filename=tmp_path / "results.json")
+    cache.Record("fingerprint", {"result": "Success"})
+
+    unpickled_cache = pickle.loads(pickle.dumps(cache))
+
+    assert unpickled_cache.Get("fingerprint") == {"result": "Success"}
+    assert cache.num_hits == 0
+
+    # Results cached by the copy are not saved
+    assert unpickled_cache.filename is None
+
+    unpickled_cache.Record("other", {"result": "Error"})
+    assert cache.Get("other") is None
+
+
+# ----------------------------------------------------------------------
+def test_SaveInMemory():
+    # Saving a cache without a filename does nothing
+    ResultCache().Save()
+
+
+# ----------------------------------------------------------------------
+def test_Activate():
+    assert ResultCache.GetActive() is None
+
+    cache = ResultCache()
+
+    with cache.Activate():
+        assert ResultCache.GetActive() is cache
+
+    assert ResultCache.GetActive() is None
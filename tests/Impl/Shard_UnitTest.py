@@ -0,0 +1,95 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for Shard.py"""
+
+import re
+
+import pytest
+
+from RepoAuditor.Impl.Shard import *
+
+
+# ----------------------------------------------------------------------
+class TestShard:
+    # ----------------------------------------------------------------------
+    def test_FromString(self):
+        assert Shard.FromString("2/4") == Shard(2, 4)
+        assert Shard.FromString(" 1 / 1 ") == Shard(1, 1)
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("value", ["", "2", "a/4", "2/4/6", "-1/4"])
+    def test_FromStringInvalid(self, value):
+        with pytest.raises(ValueError, match=re.escape(f"'{value}' is not a valid shard")):
+            Shard.FromString(value)
+
+    # ----------------------------------------------------------------------
+    def test_Invalid(self):
+        with pytest.raises(ValueError, match=re.escape("The number of shards must be greater than 0 (0).")):
+            Shard(1, 0)
+
+        with pytest.raises(ValueError, match=re.escape("The shard index must be between 1 and 4 (5).")):
+            Shard.FromString("5/4")
+
+        with pytest.raises(ValueError, match=re.escape("The shard index must be between 1 and 4 (0).")):
+            Shard.FromString("0/4")
+
+    # ----------------------------------------------------------------------
+    def test_Contains(self):
+        repositories = [f"https://github.com/gt-sse-center/repo{index}" for index in range(100)]
+        shards = [Shard(index, 4) for index in range(1, 5)]
+
+        # Each repository is assigned to exactly one shard
+        for repository in repositories:
+            assert sum(shard.Contains(repository) for shard in shards) == 1
+
+        # The repositories are distributed across all of the shards
+        assert all(any(shard.Contains(repository) for repository in repositories) for shard in shards)
+
+        # The assignment is stable
+        assert [repository for repository in repositories if shards[0].Contains(repository)] == [
+            repository for repository in repositories if Shard(1, 4).Contains(repository)
+        ]
+
+        # Modules that don't evaluate a named repository are assigned to the first shard
+        assert [shard.Contains(None) for shard in shards] == [True, False, False, False]
+
+    # ----------------------------------------------------------------------
+    def test_ContainsIsCaseInsensitive(self):
+        shards = [Shard(index, 7) for index in range(1, 8)]
+
+        assert [shard.Contains("https://github.com/gt-sse-center/RepoAuditor") for shard in shards] == [
+            shard.Contains("http://GitHub.com/GT-SSE-Center/repoauditor.git/") for shard in shards
+        ]
+
+    # ----------------------------------------------------------------------
+    def test_ContainsBranches(self):
+        shards = [Shard(index, 4) for index in range(1, 5)]
+
+        for index in range(50):
+            repository = f"https://github.com/gt-sse-center/repo{index}"
+
+            # The repository and each of its branches are assigned to the same shard
+            expected = [shard.Contains(repository) for shard in shards]
+
+            for branch in ["main", "release/1.0", "tree/feature"]:
+                assert [shard.Contains(f"{repository}/tree/{branch}") for shard in shards] == expected
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "repository, expected",
+    [
+        ("https://github.com/gt-sse-center/RepoAuditor", "gt-sse-center/repoauditor"),
+        ("https://github.com/gt-sse-center/RepoAuditor.git", "gt-sse-center/repoauditor"),
+        ("https://github.example.com/Org/Repo/", "org/repo"),
+        ("gt-sse-center/RepoAuditor", "gt-sse-center/repoauditor"),
+        ("https://github.com/gt-sse-center/RepoAuditor/tree/release/1.0", "gt-sse-center/repoauditor"),
+        ("gt-sse-center/RepoAuditor/tree/main", "gt-sse-center/repoauditor"),
+    ],
+)
+def test_GetShardKey(repository, expected):
+    assert GetShardKey(repository) == expected
@@ -0,0 +1,113 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for Template.py"""
+
+import re
+from collections import ChainMap
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from RepoAuditor.Impl.Template import *
+
+
+# ----------------------------------------------------------------------
+def test_Parse():
+    template = Template("{{literal}} {repo.name} {items[0]!r} {repo.owner:>{width}} {repo.name}")
+
+    assert template.field_names == ("repo.name", "items[0]", "repo.owner", "width")
+    assert template.root_names == ("repo", "items", "width")
+
+    template = Template("No fields {{here}}")
+
+    assert template.field_names == ()
+    assert template.Render({}) == "No fields {here}"
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("text", ["{}", "{0}", "{1.name}", "{name:{}}"])
+def test_PositionalFields(text):
+    with pytest.raises(ValueError, match=re.escape(f"The template '{text}' contains positional fields.")):
+        Template(text)
+
+
+# ----------------------------------------------------------------------
+def test_Render():
+    template = Template("{repo.name} ({items[1]!r}) [{value:>{width}}]")
+    values = {
+        "repo": SimpleNamespace(name="RepoAuditor"),
+        "items": ["a", "b"],
+        "value": 1,
+        "width": 3,
+    }
+
+    assert template.Render(values) == "RepoAuditor ('b') [  1]"
+    assert template.Render(ChainMap({"value": 10}, values)) == "RepoAuditor ('b') [ 10]"
+
+    # Only the referenced values are accessed
+    query_data = MagicMock()
+    query_data.__getitem__.side_effect = values.__getitem__
+
+    template.Render(query_data)
+
+    assert [call.args[0] for call in query_data.__getitem__.call_args_list] == [
+        "repo",
+        "items",
+        "value",
+        "width",
+    ]
+
+
+# ----------------------------------------------------------------------
+def test_Bind():
+    template = Template("{name}")
+    values = {"name": "before"}
+
+    render_func = template.Bind(values)
+
+    # Values are retrieved when the template is bound
+    values["name"] = "after"
+
+    assert render_func() == "before"
+
+    with pytest.raises(KeyError, match="name"):
+        template.Bind({})
+
+
+# ----------------------------------------------------------------------
+def test_Errors():
+    template = Template("{name} {repo.owner}")
+
+    with pytest.raises(KeyError, match="name"):
+        template.Render({"repo": SimpleNamespace(owner="Owner")})
+
+    with pytest.raises(AttributeError):
+        template.Render({"name": "Name", "repo": SimpleNamespace()})
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        Template("{name!x}").Render({"name": "Name"})
+
+
+# ----------------------------------------------------------------------
+def test_Memoization():
+    template = Template("{name}: {value}")
+
+    assert template.Render({"name": "A", "value": 1}) == "A: 1"
+    assert template.Render({"name": "A", "value": True}) == "A: True"
+    assert template.Render({"name": "A", "value": 1}) == "A: 1"
+    assert template.Render({"name": "A", "value": 0.0}) == "A: 0.0"
+    assert template.Render({"name": "A", "value": -0.0}) == "A: -0.0"
+    assert template.Render({"name": "A", "value": [1]}) == "A: [1]"
+
+    # Floats and lists are not memoized
+    assert len(template._rendered) == 2
+
+    for index in range(Template.MAX_NUM_RENDERED + 1):
+        template.Render({"name": "A", "value": index})
+
+    assert len(template._rendered) <= Template.MAX_NUM_RENDERED
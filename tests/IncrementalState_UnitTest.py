@@ -0,0 +1,242 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for IncrementalState.py"""
+
+import json
+import time
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from RepoAuditor.ExecuteModules import ModuleInfo
+from RepoAuditor.IncrementalState import *
+from RepoAuditor.Module import EvaluateResult, Module
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def module(module) -> MagicMock:
+    module.GetRepositoryState.side_effect = lambda dynamic_args, previous_state: dynamic_args.get("state")
+
+    return module
+
+
+# ----------------------------------------------------------------------
+def _CreateModuleInfo(
+    module: MagicMock,
+    repository: str,
+    state: Optional[dict[str, Any]],
+    requirement_args: Optional[dict[str, Any]] = None,
+) -> ModuleInfo:
+    return ModuleInfo(module, {"state": state}, requirement_args or {}, repository=repository)
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def audit(create_module_result):
+    """Return a function that simulates an audit, recording the results if the module must be evaluated."""
+
+    # ----------------------------------------------------------------------
+    def Audit(
+        state: IncrementalState,
+        module_info: ModuleInfo,
+        **kwargs,
+    ) -> Optional[list[Module.EvaluateInfo]]:
+        results = state.GetUnchangedResults(module_info, **kwargs)
+
+        if results is None:
+            state.Record(
+                create_module_result(
+                    module_info.module,
+                    module_info.repository,
+                    EvaluateResult.Error,
+                    module_info=module_info,
+                ),
+            )
+
+        return results
+
+    # ----------------------------------------------------------------------
+
+    return Audit
+
+
+# ----------------------------------------------------------------------
+def test_Unchanged(module, audit, tmp_path: Path):
+    filename = tmp_path / "state" / "incremental.json"
+
+    state = IncrementalState.Load(filename)
+
+    assert audit(state, _CreateModuleInfo(module, "repo1", {"updated_at": "1"})) is None
+    assert audit(state, _CreateModuleInfo(module, "repo2", {"updated_at": "1"})) is None
+
+    state.Save()
+
+    state = IncrementalState.Load(filename)
+
+    results = audit(state, _CreateModuleInfo(module, "repo1", {"updated_at": "1"}))
+
+    assert results is not None
+    assert len(results) == 1
+    assert results[0].result == EvaluateResult.Error
+    assert results[0].context == "Context 0"
+    assert results[0].requirement is module.queries[0].requirements[0]
+    assert results[0].repository == "repo1"
+
+    # The repository has changed
+    assert audit(state, _CreateModuleInfo(module, "repo2", {"updated_at": "2"})) is None
+
+    # The repository has not been audited
+    assert audit(state, _CreateModuleInfo(module, "repo3", {"updated_at": "1"})) is None
+
+    # The arguments have changed
+    assert audit(state, _CreateModuleInfo(module, "repo1", {"updated_at": "1"}, {"arg": 1})) is None
+
+
+# ----------------------------------------------------------------------
+def test_PreviousState(module, audit, tmp_path: Path):
+    state = IncrementalState(tmp_path / "incremental.json")
+
+    module_info = _CreateModuleInfo(module, "repo1", {"updated_at": "1"})
+
+    audit(state, module_info)
+    assert module.GetRepositoryState.call_args.args == (module_info.dynamic_args, None)
+
+    audit(state, module_info)
+    assert module.GetRepositoryState.call_args.args == (module_info.dynamic_args, {"updated_at": "1"})
+
+
+# ----------------------------------------------------------------------
+def test_Full(module, audit, tmp_path: Path):
+    state = IncrementalState(tmp_path / "incremental.json")
+
+    audit(state, _CreateModuleInfo(module, "repo1", {"updated_at": "1"}))
+
+    assert audit(state, _CreateModuleInfo(module, "repo1", {"updated_at": "1"}), full=True) is None
+
+    # The state is still recorded
+    assert audit(state, _CreateModuleInfo(module, "repo1", {"updated_at": "1"})) is not None
+
+
+# ----------------------------------------------------------------------
+def test_MaxStaleness(module, audit, tmp_path: Path):
+    state = IncrementalState(tmp_path / "incremental.json")
+
+    module_info = _CreateModuleInfo(module, "repo1", {"updated_at": "1"})
+
+    audit(state, module_info)
+
+    assert audit(state, module_info, max_staleness=60) is not None
+
+    # Simulate results recorded in the past
+    state._entries[("MyModule", "repo1")]["audited"] -= 120  # noqa: SLF001
+
+    assert audit(state, module_info, max_staleness=60) is None
+    assert audit(state, module_info, max_staleness=60) is not None
+
+
+# ----------------------------------------------------------------------
+def test_UnknownState(module, audit, tmp_path: Path):
+    filename = tmp_path / "incremental.json"
+
+    state = IncrementalState(filename)
+
+    module_info = _CreateModuleInfo(module, "repo1", {"updated_at": "1"})
+    audit(state, module_info)
+
+    # Changes cannot be detected, so the results are not recorded
+    assert audit(state, _CreateModuleInfo(module, "repo1", None)) is None
+    assert audit(state, module_info) is None
+
+    # Errors while determining the state are not errors
+    module.GetRepositoryState.side_effect = Exception("The state is not available")
+    assert audit(state, module_info) is None
+
+    state.Save()
+    assert json.loads(filename.read_text())["repositories"] == []
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("is_error", [False, True])
+def test_Incomplete(module, audit, create_module_result, tmp_path: Path, is_error):
+    filename = tmp_path / "incremental.json"
+
+    state = IncrementalState.Load(filename)
+
+    module_info = _CreateModuleInfo(module, "repo1", {"updated_at": "1"})
+
+    # The first audit times out (or raises an exception)
+    assert state.GetUnchangedResults(module_info) is None
+
+    if is_error:
+        state.Record(
+            replace(
+                create_module_result(module, "repo1", EvaluateResult.Error, module_info=module_info),
+                error="The error",
+            )
+        )
+    else:
+        state.Record(create_module_result(module, "repo1", EvaluateResult.Timeout, module_info=module_info))
+
+    state.Save()
+
+    # The unchanged repository is evaluated again by the second audit
+    state = IncrementalState.Load(filename)
+
+    assert audit(state, module_info) is None
+    assert audit(state, module_info) is not None
+
+    # Incomplete results replace results recorded by a previous audit
+    state._entries[("MyModule", "repo1")]["audited"] -= 120  # noqa: SLF001
+
+    assert state.GetUnchangedResults(module_info, max_staleness=60) is None
+    state.Record(create_module_result(module, "repo1", EvaluateResult.Timeout, module_info=module_info))
+
+    assert audit(state, module_info) is None
+
+
+# ----------------------------------------------------------------------
+def test_SaveRemovesUnseen(module, audit, tmp_path: Path):
+    filename = tmp_path / "incremental.json"
+
+    state = IncrementalState(filename)
+
+    audit(state, _CreateModuleInfo(module, "repo1", {"updated_at": "1"}))
+    audit(state, _CreateModuleInfo(module, "repo2", {"updated_at": "1"}))
+
+    state._entries[("MyModule", "repo2")]["last_seen"] = (  # noqa: SLF001
+        time.time() - IncrementalState.MAX_UNSEEN_SECONDS - 60
+    )
+
+    state.Save()
+
+    assert [entry["repository"] for entry in json.loads(filename.read_text())["repositories"]] == ["repo1"]
+
+
+# ----------------------------------------------------------------------
+def test_LoadInvalid(module, audit, tmp_path: Path):
+    filename = tmp_path / "incremental.json"
+    module_info = _CreateModuleInfo(module, "repo1", {"updated_at": "1"})
+
+    filename.write_text("this is not json", encoding="UTF-8")
+    assert IncrementalState.Load(filename).GetUnchangedResults(module_info) is None
+
+    state = IncrementalState(filename)
+    audit(state, module_info)
+    state.Save()
+
+    content = json.loads(filename.read_text())
+    assert IncrementalState.Load(filename).GetUnchangedResults(module_info) is not None
+
+    filename.write_text(json.dumps({**content, "version": 0}), encoding="UTF-8")
+    assert IncrementalState.Load(filename).GetUnchangedResults(module_info) is None
+
+    content["repositories"][0]["state"] = "invalid"
+    filename.write_text(json.dumps(content), encoding="UTF-8")
+    assert IncrementalState.Load(filename).GetUnchangedResults(module_info) is None
@@ -0,0 +1,135 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for Journal.py"""
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+from RepoAuditor.ExecuteModules import ModuleInfo
+from RepoAuditor.Journal import *
+from RepoAuditor.Module import EvaluateResult
+
+
+# ----------------------------------------------------------------------
+def test_RecordAndLoad(module, create_module_result, tmp_path: Path):
+    filename = tmp_path / "journal.jsonl"
+
+    journal = Journal.Create(filename)
+
+    with journal.Open():
+        journal.Record(create_module_result(module, "repo1", EvaluateResult.Error))
+        journal.Record(create_module_result(module, "repo2", EvaluateResult.Error))
+
+        # Later records replace earlier ones
+        journal.Record(
+            create_module_result(module, "repo2", EvaluateResult.Success, description="The description"),
+        )
+
+    assert journal.num_records == 2
+
+    journal = Journal.Load(filename)
+
+    assert journal.num_records == 2
+    assert journal.GetResults(ModuleInfo(module, {}, {}, repository="repo3")) is None
+
+    results = journal.GetResults(ModuleInfo(module, {}, {}, repository="repo2"))
+
+    assert results is not None
+    assert len(results) == 1
+    assert results[0].result == EvaluateResult.Success
+    assert results[0].context == "Context 0"
+    assert results[0].description == "The description"
+    assert results[0].requirement is module.queries[0].requirements[0]
+    assert results[0].repository == "repo2"
+
+
+# ----------------------------------------------------------------------
+def test_Create(module, create_module_result, tmp_path: Path):
+    filename = tmp_path / "journal.jsonl"
+
+    with Journal.Create(filename).Open() as journal:
+        journal.Record(create_module_result(module, "repo1", EvaluateResult.Error))
+
+    # Creating a journal replaces the existing journal
+    assert Journal.Create(filename).num_records == 0
+    assert filename.read_text() == ""
+
+
+# ----------------------------------------------------------------------
+def test_LoadMissing(tmp_path: Path):
+    filename = tmp_path / "journal.jsonl"
+
+    assert Journal.Load(filename).num_records == 0
+    assert filename.is_file()
+
+
+# ----------------------------------------------------------------------
+def test_PartialRecord(module, create_module_result, tmp_path: Path):
+    filename = tmp_path / "journal.jsonl"
+
+    with Journal.Create(filename).Open() as journal:
+        journal.Record(create_module_result(module, "repo1", EvaluateResult.Error))
+
+    # Simulate a process that was terminated while writing a record
+    with filename.open("a") as f:
+        f.write('{"repository": "repo2", "modu')
+
+    journal = Journal.Load(filename)
+
+    assert journal.num_records == 1
+
+    with journal.Open():
+        journal.Record(create_module_result(module, "repo2", EvaluateResult.Error))
+
+    assert [json.loads(line)["repository"] for line in filename.read_text().splitlines()] == [
+        "repo1",
+        "repo2",
+    ]
+
+
+# ----------------------------------------------------------------------
+def test_Incomplete(module, create_module_result, tmp_path: Path):
+    filename = tmp_path / "journal.jsonl"
+
+    with Journal.Create(filename).Open() as journal:
+        journal.Record(create_module_result(module, "repo1", EvaluateResult.Error))
+        journal.Record(create_module_result(module, "repo2", EvaluateResult.Timeout))
+        journal.Record(
+            replace(create_module_result(module, "repo3", EvaluateResult.Error), error="The error")
+        )
+
+        assert journal.num_records == 1
+
+    journal = Journal.Load(filename)
+
+    assert journal.num_records == 1
+
+    # Modules that timed out or raised an exception are evaluated again when the audit is resumed
+    assert journal.GetResults(ModuleInfo(module, {}, {}, repository="repo1")) is not None
+    assert journal.GetResults(ModuleInfo(module, {}, {}, repository="repo2")) is None
+    assert journal.GetResults(ModuleInfo(module, {}, {}, repository="repo3")) is None
+
+
+# ----------------------------------------------------------------------
+def test_ChangedRequirements(module, create_module_result, tmp_path: Path):
+    filename = tmp_path / "journal.jsonl"
+
+    with Journal.Create(filename).Open() as journal:
+        journal.Record(create_module_result(module, "repo1", EvaluateResult.Error))
+
+    module_info = ModuleInfo(module, {}, {}, repository="repo1")
+
+    assert Journal.Load(filename).GetResults(module_info) is not None
+
+    # The module must be evaluated again if its requirements have changed
+    module.GetNumRequirements.return_value = 2
+    assert Journal.Load(filename).GetResults(module_info) is None
+
+    module.GetNumRequirements.return_value = 1
+    module.queries[0].requirements[0].name = "OtherRequirement"
+    assert Journal.Load(filename).GetResults(module_info) is None
@@ -0,0 +1,48 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for JsonOutput.py"""
+
+import io
+import json
+
+from RepoAuditor.JsonOutput import *
+from RepoAuditor.Module import EvaluateResult
+
+
+# ----------------------------------------------------------------------
+def test_CreateRecord(module, create_module_result):
+    module_result = create_module_result(module, "repo1", EvaluateResult.Error, resolution="The resolution")
+
+    assert CreateRecord(module_result) == {
+        "repository": "repo1",
+        "module": "MyModule",
+        "requirements": [
+            {
+                "query": "MyQuery",
+                "requirement": "MyRequirement",
+                "result": "Error",
+                "description": None,
+                "context": "Context 0",
+                "resolution": "The resolution",
+                "rationale": None,
+            },
+        ],
+    }
+
+
+# ----------------------------------------------------------------------
+def test_WriteRecord(module, create_module_result):
+    shard1 = io.StringIO()
+    shard2 = io.StringIO()
+
+    WriteRecord(shard1, create_module_result(module, "repo1", EvaluateResult.Error))
+    WriteRecord(shard2, create_module_result(module, "repo2", EvaluateResult.Error))
+
+    # Output from multiple shards can be merged by concatenation
+    merged = shard1.getvalue() + shard2.getvalue()
+
+    assert [json.loads(line)["repository"] for line in merged.splitlines()] == ["repo1", "repo2"]
@@ -15,6 +15,8 @@ from dbrownell_Common.Streams.DoneManager import DoneManager
 from dbrownell_Common.TestHelpers.StreamTestHelpers import GenerateDoneManagerAndContent
 from dbrownell_Common.Types import override
 
+from RepoAuditor.Impl.Deadline import Deadline, DeadlineExceededError
+from RepoAuditor.Impl.DurationHistory import DurationHistory
 from RepoAuditor.Module import *
 from RepoAuditor.Requirement import EvaluateResult, Requirement
 
@@ -434,6 +436,44 @@ def test_Module_SingleParallel():
     assert results[0][0].module is module
 
 
+# ----------------------------------------------------------------------
+def test_EvaluateQueryNames():
+    module = MyModule(
+        "MyModule",
+        "The module",
+        ExecutionStyle.Sequential,
+        [queryA, queryB, queryC],
+        produce_data=True,
+    )
+
+    results = module.Evaluate(
+        module.GenerateInitialData({}),
+        {},
+        Mock(),
+        query_names={queryB.name},
+    )
+
+    assert {result.query.name for query_results in results for result in query_results} == {queryB.name}
+
+
+# ----------------------------------------------------------------------
+def test_Events():
+    query1 = MyQuery("Query1", ExecutionStyle.Sequential, [], produce_data=True)
+    query2 = MyQuery("Query2", ExecutionStyle.Sequential, [], produce_data=True)
+    query3 = MyQuery("Query3", ExecutionStyle.Sequential, [], produce_data=True)
+
+    query1.events = ("push",)
+    query2.events = ("repository", "push")
+
+    module = MyModule("MyModule", "", ExecutionStyle.Sequential, [query1, query2, query3], produce_data=True)
+
+    assert module.GetEventQueries("push") == [query1, query2, query3]
+    assert module.GetEventQueries("repository") == [query2, query3]
+
+    # Events are ignored by default
+    assert module.GetEventRepository({}, "push", {"repository": {}}) is None
+
+
 # ----------------------------------------------------------------------
 def test_ProvidedDoneManager():
     """Test for when a DoneManager is provided to the ParallelSequentialProcessor."""
@@ -450,6 +490,173 @@ def test_ProvidedDoneManager():
     assert isinstance(result, list)
 
 
+# ----------------------------------------------------------------------
+class TimeoutQuery(Query):
+    # ----------------------------------------------------------------------
+    def __init__(self) -> None:
+        super().__init__("TimeoutQuery", ExecutionStyle.Sequential, [requirementA2, requirementA3])
+
+    # ----------------------------------------------------------------------
+    def GetData(
+        self,
+        module_data: dict[str, Any],
+    ) -> Optional[dict[str, Any]]:
+        deadline = Deadline.GetActive()
+        assert deadline is not None
+
+        # Simulate a blocking operation that honors the deadline
+        raise DeadlineExceededError(f"remaining: {deadline.remaining is not None}")
+
+
+# ----------------------------------------------------------------------
+class TestTimeout:
+    # ----------------------------------------------------------------------
+    def test_QueryTimeout(self):
+        module = MyModule(
+            "MyModule",
+            "",
+            ExecutionStyle.Sequential,
+            [TimeoutQuery(), queryB],
+            produce_data=True,
+        )
+
+        status_func = Mock()
+
+        results = module.Evaluate(
+            module.GenerateInitialData({}),
+            {},
+            status_func,
+            max_num_threads=1,
+            query_timeout=60,
+        )
+
+        assert [result.result for result in results[0]] == [EvaluateResult.Timeout, EvaluateResult.Timeout]
+        assert results[0][0].context == (
+            "TimeoutQuery did not complete before the deadline expired (remaining: True)."
+        )
+        assert results[0][0].requirement is requirementA2
+        assert results[0][1].requirement is requirementA3
+
+        # Other queries are not impacted
+        assert all(result.result == EvaluateResult.Success for result in results[1])
+
+        # Timeouts are reported as errors
+        assert status_func.call_args_list[0].args == (2, 0, 2, 0, 0)
+
+    # ----------------------------------------------------------------------
+    def test_ExpiredDeadline(self):
+        module = MyModule(
+            "MyModule",
+            "",
+            ExecutionStyle.Sequential,
+            [queryA, queryB],
+            produce_data=True,
+        )
+
+        results = module.Evaluate(
+            module.GenerateInitialData({}),
+            {},
+            Mock(),
+            max_num_threads=1,
+            deadline=Deadline.Create(0),
+        )
+
+        assert len(results) == 2
+
+        for query_results in results:
+            for result in query_results:
+                assert result.result == EvaluateResult.Timeout
+                assert result.context.endswith("was not started before the deadline expired.")
+
+
+# ----------------------------------------------------------------------
+class OrderedQuery(Query):
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        name: str,
+        cost_hint: float,
+        data_order: list[str],
+    ) -> None:
+        super().__init__(
+            name,
+            ExecutionStyle.Parallel,
+            [
+                MyRequirement(
+                    f"{name}Requirement", "", ExecutionStyle.Parallel, "", "", EvaluateResult.Success
+                )
+            ],
+            cost_hint=cost_hint,
+        )
+
+        self._data_order = data_order
+
+    # ----------------------------------------------------------------------
+    def GetData(
+        self,
+        module_data: dict[str, Any],
+    ) -> Optional[dict[str, Any]]:
+        self._data_order.append(self.name)
+        return module_data
+
+
+# ----------------------------------------------------------------------
+class TestScheduling:
+    # ----------------------------------------------------------------------
+    def test_EstimateCost(self):
+        queries = [OrderedQuery("Fast", 1.0, []), OrderedQuery("Slow", 30.0, [])]
+        module = MyModule("MyModule", "", ExecutionStyle.Parallel, queries, produce_data=True)
+
+        with DurationHistory().Activate() as history:
+            # Cost hints are used when there is no history
+            assert module.EstimateQueryCost(queries[0]) == 1.0
+            assert module.EstimateQueryCost(queries[1]) == 30.0
+            assert module.EstimateCost() == 31.0
+
+            history.Record("MyModule/Fast", 100.0)
+            assert module.EstimateQueryCost(queries[0]) == 100.0
+            assert module.EstimateCost() == 130.0
+
+            history.Record("MyModule", 5.0)
+            assert module.EstimateCost() == 5.0
+
+    # ----------------------------------------------------------------------
+    def test_LongestFirst(self):
+        data_order: list[str] = []
+
+        module = MyModule(
+            "MyModule",
+            "",
+            ExecutionStyle.Parallel,
+            [
+                OrderedQuery("Fast", 1.0, data_order),
+                OrderedQuery("Slow", 30.0, data_order),
+                OrderedQuery("Medium", 5.0, data_order),
+            ],
+            produce_data=True,
+        )
+
+        with DurationHistory().Activate() as history:
+            results = module.Evaluate(module.GenerateInitialData({}), {}, Mock(), max_num_threads=1)
+
+            assert data_order == ["Slow", "Medium", "Fast"]
+
+            # Results are returned in the original order
+            assert [query_results[0].query.name for query_results in results] == ["Fast", "Slow", "Medium"]
+
+            # Durations are recorded
+            assert history.GetEstimate("MyModule/Fast") is not None
+
+            # History takes precedence over cost hints
+            history.Record("MyModule/Fast", 1000.0)
+            history.Record("MyModule/Slow", 1000.0)
+
+            data_order.clear()
+            module.Evaluate(module.GenerateInitialData({}), {}, Mock(), max_num_threads=1)
+
+            assert data_order[-1] == "Medium"
+
+
 # ----------------------------------------------------------------------
 class TestProcessRequriements:
     # ----------------------------------------------------------------------
@@ -510,3 +717,32 @@ class TestProcessRequriements:
 
         assert module.GetNumRequirements() == 2
         assert module.queries
+
+    # ----------------------------------------------------------------------
+    def test_SelectRequirementsAndCreateView(self):
+        module = MyModule(
+            "MyModule",
+            "",
+            ExecutionStyle.Sequential,
+            [copy.deepcopy(queryA), copy.deepcopy(queryB)],
+            produce_data=False,
+        )
+
+        selection = module.SelectRequirements(set(), {"RequirementA2", "RequirementA3", "RequirementA4"})
+
+        # Requirements that must be explicitly included are omitted, as are queries without requirements
+        assert selection == {"QueryB": ("RequirementB2", "RequirementB3", "RequirementB4")}
+
+        view = module.CreateView({"QueryA": ["RequirementA3", "RequirementA1"], "QueryB": []})
+
+        assert isinstance(view, MyModule)
+        assert [query.name for query in view.queries] == ["QueryA"]
+
+        # Requirements are in the order in which they are defined
+        assert [requirement.name for requirement in view.queries[0].requirements] == [
+            "RequirementA1",
+            "RequirementA3",
+        ]
+
+        # The module is not modified
+        assert module.GetNumRequirements() == 8
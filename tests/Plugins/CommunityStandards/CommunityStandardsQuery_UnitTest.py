@@ -6,8 +6,13 @@
 # -------------------------------------------------------------------------------
 """Unit tests for CommunityStandardsQuery.py"""
 
+import sys
+import time
+
 import pytest
-from git import Repo
+from git import Git, GitCommandError, Repo
+
+from RepoAuditor.Impl.Deadline import Deadline, DeadlineExceededError
 
 from RepoAuditor.Plugins.CommunityStandards.CommunityStandardsQuery import (
     CommunityStandardsQuery,
@@ -118,6 +123,34 @@ class TestCommunityStandardsQuery:
             _ = self.query.GetData(module_data)
         assert gitpython_error_msg in str(e_info)
 
+    def test_GetData_timeout(self, module_data, monkeypatch):
+        """Test the GetData method bounds the clone by the active deadline."""
+        monkeypatch.setattr(
+            TemporaryDirectory,
+            "__init__",
+            MockTemporaryDirectory.__init__,
+        )
+        monkeypatch.setattr(TemporaryDirectory, "cleanup", MockTemporaryDirectory.cleanup)
+
+        timeouts = []
+
+        def mock_clone(self, github_url, repo_dirname, branch="main", kill_after_timeout=None):
+            timeouts.append(kill_after_timeout)
+            time.sleep(0.2)
+            raise GitCommandError("clone", "timed out")
+
+        monkeypatch.setattr(Git, "clone", mock_clone, raising=False)
+        monkeypatch.setattr(sys, "platform", "linux")
+
+        with Deadline.Create(0.1).Activate(), pytest.raises(DeadlineExceededError):
+            _ = self.query.GetData(module_data)
+
+        assert len(timeouts) == 1
+        assert 0 < timeouts[0] <= 0.1
+
+        with Deadline.Create(0).Activate(), pytest.raises(DeadlineExceededError):
+            _ = self.query.GetData(module_data)
+
     def test_Cleanup(self, module_data):
         """Test the Cleanup method."""
         module_data["repo_dir"] = MockTemporaryDirectory()
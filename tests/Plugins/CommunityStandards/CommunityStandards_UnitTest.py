@@ -75,7 +75,19 @@ class TestCommunityStandardsModule:
         module = GetModule()
         dynamic_args = module.GetDynamicArgDefinitions()
         # dynamic_args should be empty dict
-        assert dynamic_args.keys() == {"url": "", "pat": "", "branch": ""}.keys()
+        assert (
+            dynamic_args.keys()
+            == {
+                "url": "",
+                "org": "",
+                "archived": "",
+                "forks": "",
+                "visibility": "",
+                "topic": "",
+                "pat": "",
+                "branch": "",
+            }.keys()
+        )
 
     def test_GenerateInitialData(self):
         """Test GenerateInitialData method."""
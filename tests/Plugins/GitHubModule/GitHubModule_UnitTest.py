@@ -6,12 +6,43 @@
 # -------------------------------------------------------------------------------
 """Unit tests for GitHub/Module.py"""
 
+import json
+import pickle
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
+import requests
+
+from RepoAuditor.Impl.Shard import Shard
 from RepoAuditor.Plugins.GitHub.Module import GitHubModule
 from RepoAuditor.Plugins.GitHubBase.Module import _GitHubSession
 
 
+def CreateResponse(status_code: int, content: list, next_page: bool = False) -> requests.Response:
+    """Create a response that contains a page of repositories."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(content).encode()  # noqa: SLF001
+
+    if next_page:
+        response.headers["Link"] = '<https://api.github.com/next>; rel="next"'
+
+    return response
+
+
+def CreateRepository(name: str, **kwargs) -> dict:
+    """Create the information for a repository returned when enumerating an organization."""
+    return {
+        "html_url": f"https://github.com/gt-sse-center/{name}",
+        "archived": False,
+        "fork": False,
+        "visibility": "public",
+        "topics": [],
+        **kwargs,
+    }
+
+
 class TestGitHubModule:
     """Unit tests for the Module class in the GitHub plugin."""
 
@@ -20,6 +51,30 @@ class TestGitHubModule:
         module = GitHubModule()
         assert isinstance(module, GitHubModule)
 
+    def test_Pickle(self):
+        """Test that modules sent to other processes recreate requirements that contain lambdas."""
+        module = GitHubModule()
+        module.ProcessRequirements(set(), {"SupportWikis"})
+
+        unpickled_module = pickle.loads(pickle.dumps(module))
+
+        assert [query.name for query in unpickled_module.queries] == [query.name for query in module.queries]
+
+        requirements = {
+            requirement.name: requirement
+            for query in unpickled_module.queries
+            for requirement in query.requirements
+        }
+
+        assert "SupportWikis" not in requirements
+        assert requirements["SupportIssues"].get_configuration_value_func({"standard": {"has_issues": True}})
+        assert (
+            requirements["DefaultBranch"].get_configuration_value_func(
+                {"standard": {"default_branch": "main"}},
+            )
+            == "main"
+        )
+
     def test_GenerateInitialData(self):
         """Test GenerateInitialData method."""
         dynamic_args = {
@@ -31,3 +86,439 @@ class TestGitHubModule:
 
         assert "session" in dynamic_args
         assert isinstance(dynamic_args["session"], _GitHubSession)
+
+    def test_GetRepositoriesSingle(self):
+        """Test GetRepositories with a single URL."""
+        dynamic_args = {"url": "https://github.com/gt-sse-center/RepoAuditor", "pat": None}
+
+        repositories = GitHubModule().GetRepositories(dynamic_args)
+
+        assert len(repositories) == 1
+        assert repositories[0].name == "https://github.com/gt-sse-center/RepoAuditor"
+        assert repositories[0].dynamic_args == dynamic_args
+
+    def test_GetRepositoriesMultiple(self, tmp_path):
+        """Test GetRepositories with multiple URLs and a file of URLs."""
+        url_file = tmp_path / "urls.txt"
+        url_file.write_text(
+            "# Repositories to audit\n"
+            "https://github.com/gt-sse-center/Two\n"
+            "\n"
+            "https://github.com/gt-sse-center/Three/\n"
+            "https://github.com/gt-sse-center/One\n",
+        )
+
+        repositories = GitHubModule().GetRepositories(
+            {
+                "url": ["https://github.com/gt-sse-center/One", str(url_file)],
+                "pat": "the_pat",
+            },
+        )
+
+        assert [repository.name for repository in repositories] == [
+            "https://github.com/gt-sse-center/One",
+            "https://github.com/gt-sse-center/Two",
+            "https://github.com/gt-sse-center/Three",
+        ]
+
+        for repository in repositories:
+            assert repository.dynamic_args == {"url": repository.name, "pat": "the_pat"}
+
+    def test_GetRepositoriesRequired(self):
+        """Test GetRepositories without a URL or organization."""
+        with pytest.raises(ValueError, match="A GitHub URL or organization must be provided."):
+            GitHubModule().GetRepositories({"url": None, "org": None})
+
+    def test_GetRepositoriesInvalidVisibility(self):
+        """Test GetRepositories with an invalid visibility filter."""
+        with pytest.raises(ValueError, match="'secret' is not a valid visibility"):
+            GitHubModule().GetRepositories({"org": "gt-sse-center", "visibility": "secret"})
+
+    def test_GetRepositoriesOrganization(self, monkeypatch):
+        """Test GetRepositories with an organization, which is enumerated lazily one page at a time."""
+        requests_made = []
+
+        pages = [
+            [
+                CreateRepository("One"),
+                CreateRepository("Archived", archived=True),
+                CreateRepository("Fork", fork=True),
+            ],
+            [
+                CreateRepository("Two", visibility="private", topics=["research"]),
+                CreateRepository("Three", topics=["research", "python"]),
+            ],
+        ]
+
+        def mock_request(self, method, url, *args, **kwargs):
+            requests_made.append((url, kwargs["params"]))
+
+            page = kwargs["params"]["page"]
+            return CreateResponse(200, pages[page - 1], next_page=page < len(pages))
+
+        monkeypatch.setattr(requests.Session, "request", mock_request)
+
+        repositories = GitHubModule().GetRepositories(
+            {"org": "https://github.com/gt-sse-center", "pat": None}
+        )
+
+        # Nothing is requested until the repositories are enumerated
+        assert isinstance(repositories, Iterator)
+        assert not requests_made
+
+        # The first repository is available after the first page is received
+        assert next(repositories).name == "https://github.com/gt-sse-center/One"
+        assert len(requests_made) == 1
+
+        assert [repository.name for repository in repositories] == [
+            "https://github.com/gt-sse-center/Two",
+            "https://github.com/gt-sse-center/Three",
+        ]
+
+        assert requests_made == [
+            ("https://api.github.com/orgs/gt-sse-center/repos", {"type": "all", "per_page": 100, "page": 1}),
+            ("https://api.github.com/orgs/gt-sse-center/repos", {"type": "all", "per_page": 100, "page": 2}),
+        ]
+
+        # Filters
+        def GetNames(**dynamic_args) -> list[str]:
+            return [
+                repository.name.rsplit("/", 1)[-1]
+                for repository in GitHubModule().GetRepositories({"org": "gt-sse-center", **dynamic_args})
+            ]
+
+        assert GetNames(archived=True, forks=True) == ["One", "Archived", "Fork", "Two", "Three"]
+        assert GetNames(visibility="private") == ["Two"]
+        assert GetNames(topic=["research"]) == ["Two", "Three"]
+        assert GetNames(topic=["research", "python"]) == ["Three"]
+
+        # Explicit URLs are evaluated first and are not repeated
+        repositories = list(
+            GitHubModule().GetRepositories(
+                {"url": ["https://github.com/gt-sse-center/Three"], "org": "gt-sse-center", "pat": None},
+            ),
+        )
+
+        assert [repository.name for repository in repositories] == [
+            "https://github.com/gt-sse-center/Three",
+            "https://github.com/gt-sse-center/One",
+            "https://github.com/gt-sse-center/Two",
+        ]
+
+        assert "repository_listing" not in repositories[0].dynamic_args
+        assert repositories[1].dynamic_args["url"] == "https://github.com/gt-sse-center/One"
+        assert repositories[1].dynamic_args["repository_listing"] == CreateRepository("One")
+
+    def test_GetRepositoriesUser(self, monkeypatch):
+        """Test GetRepositories with a user rather than an organization."""
+        requested_urls = []
+
+        def mock_request(self, method, url, *args, **kwargs):
+            requested_urls.append(url)
+
+            if "/orgs/" in url:
+                return CreateResponse(404, {"message": "Not Found"})
+
+            return CreateResponse(200, [CreateRepository("One")])
+
+        monkeypatch.setattr(requests.Session, "request", mock_request)
+
+        repositories = list(GitHubModule().GetRepositories({"org": "https://github.example.com/a_user/"}))
+
+        assert [repository.name for repository in repositories] == ["https://github.com/gt-sse-center/One"]
+        assert requested_urls == [
+            "https://github.example.com/api/v3/orgs/a_user/repos",
+            "https://github.example.com/api/v3/users/a_user/repos",
+        ]
+
+    def test_OrganizationSessionPickle(self, monkeypatch):
+        """Test that organization sessions sent to other processes are recreated and shared."""
+        monkeypatch.setattr(
+            requests.Session,
+            "request",
+            lambda *args, **kwargs: CreateResponse(200, [CreateRepository("One"), CreateRepository("Two")]),
+        )
+
+        repositories = list(GitHubModule().GetRepositories({"org": "gt-sse-center", "pat": None}))
+
+        organization_session = repositories[0].dynamic_args["organization_session"]
+        assert repositories[1].dynamic_args["organization_session"] is organization_session
+
+        unpickled_dynamic_args = [
+            pickle.loads(pickle.dumps(repository.dynamic_args)) for repository in repositories
+        ]
+
+        unpickled_session = unpickled_dynamic_args[0]["organization_session"]
+
+        assert unpickled_session is not organization_session
+        assert unpickled_session.org_name == "gt-sse-center"
+        assert unpickled_session.api_url == organization_session.api_url
+        assert unpickled_dynamic_args[1]["organization_session"] is unpickled_session
+
+    def test_GetRepositoryState(self, monkeypatch):
+        """Test the state used to detect repositories that have not changed since they were last audited."""
+        requested_urls = []
+
+        def mock_request(self, method, url, *args, **kwargs):
+            requested_urls.append(url)
+
+            if "/branches/" in url:
+                return CreateResponse(200, {"name": "main", "commit": {"sha": "abc123"}})
+
+            return CreateResponse(
+                200,
+                [
+                    CreateRepository(
+                        "One",
+                        full_name="gt-sse-center/One",
+                        default_branch="main",
+                        updated_at="2024-01-01T00:00:00Z",
+                        pushed_at="2024-01-02T00:00:00Z",
+                    ),
+                ],
+            )
+
+        monkeypatch.setattr(requests.Session, "request", mock_request)
+
+        module = GitHubModule()
+
+        repository = next(iter(module.GetRepositories({"org": "gt-sse-center", "pat": None})))
+        requested_urls.clear()
+
+        state = module.GetRepositoryState(repository.dynamic_args, None)
+
+        assert state == {
+            "updated_at": "2024-01-01T00:00:00Z",
+            "pushed_at": "2024-01-02T00:00:00Z",
+            "branch": "main",
+            "has_pat": False,
+            "head_sha": "abc123",
+        }
+        assert requested_urls == ["https://api.github.com/repos/gt-sse-center/One/branches/main"]
+
+        # The head commit is not requested when nothing has been pushed
+        requested_urls.clear()
+
+        assert module.GetRepositoryState(repository.dynamic_args, {**state, "head_sha": "def456"}) == {
+            **state,
+            "head_sha": "def456",
+        }
+        assert not requested_urls
+
+        # The head commit is requested when something has been pushed
+        assert (
+            module.GetRepositoryState(
+                repository.dynamic_args,
+                {**state, "pushed_at": "2023-12-31T00:00:00Z", "head_sha": "def456"},
+            )
+            == state
+        )
+        assert len(requested_urls) == 1
+
+        # Changes cannot be detected for repositories that were not enumerated from an organization
+        assert module.GetRepositoryState({"url": "https://github.com/gt-sse-center/One"}, None) is None
+
+    def test_GetEventRepository(self):
+        """Test the repositories affected by webhook events."""
+        module = GitHubModule()
+
+        def CreatePayload(name: str, **kwargs) -> dict:
+            return {"repository": CreateRepository(name, default_branch="main"), **kwargs}
+
+        # Repositories provided by URL
+        dynamic_args = {"url": ["https://github.com/gt-sse-center/One/"]}
+
+        repository = module.GetEventRepository(dynamic_args, "repository", CreatePayload("One"))
+
+        assert repository is not None
+        assert repository.name == "https://github.com/gt-sse-center/One"
+        assert repository.dynamic_args == {**dynamic_args, "url": "https://github.com/gt-sse-center/One"}
+
+        assert module.GetEventRepository(dynamic_args, "repository", CreatePayload("Two")) is None
+        assert module.GetEventRepository(dynamic_args, "repository", {}) is None
+
+        # Deleted repositories are not audited
+        assert (
+            module.GetEventRepository(dynamic_args, "repository", CreatePayload("One", action="deleted"))
+            is None
+        )
+
+        # Only pushes to the evaluated branch affect the repository
+        assert module.GetEventRepository(dynamic_args, "push", CreatePayload("One", ref="refs/heads/main"))
+        assert not module.GetEventRepository(
+            dynamic_args, "push", CreatePayload("One", ref="refs/heads/feature")
+        )
+        assert module.GetEventRepository(
+            {**dynamic_args, "branch": "feature"}, "push", CreatePayload("One", ref="refs/heads/feature")
+        )
+
+        # Repositories of an organization
+        for org in ["gt-sse-center", "https://github.com/gt-sse-center/"]:
+            dynamic_args = {"org": org}
+
+            assert module.GetEventRepository(dynamic_args, "repository_ruleset", CreatePayload("Two"))
+
+        dynamic_args = {"org": "gt-sse-center"}
+
+        payload = CreatePayload("Two")
+        payload["repository"]["html_url"] = "https://github.com/other/Two"
+
+        assert module.GetEventRepository(dynamic_args, "repository", payload) is None
+
+        # Repositories that are excluded from the audit of the organization
+        payload = CreatePayload("Two")
+        payload["repository"]["archived"] = True
+
+        assert module.GetEventRepository(dynamic_args, "repository", payload) is None
+        assert module.GetEventRepository({**dynamic_args, "archived": True}, "repository", payload)
+
+    def test_GetRepositoriesMultipleBranches(self, monkeypatch):
+        """Test GetRepositories with multiple branches, where repository-level queries are evaluated once."""
+        requested_urls = []
+
+        def mock_request(self, method, url, *args, **kwargs):
+            requested_urls.append(url)
+
+            return CreateResponse(
+                200,
+                [{"name": "main"}, {"name": "release/1.0"}, {"name": "release/2.0"}, {"name": "feature"}],
+            )
+
+        monkeypatch.setattr(requests.Session, "request", mock_request)
+
+        repositories = list(
+            GitHubModule().GetRepositories(
+                {
+                    "url": ["https://github.com/gt-sse-center/One"],
+                    "pat": None,
+                    "branch": ["main", "release/*", "main"],
+                },
+            ),
+        )
+
+        assert [(repository.name, repository.dynamic_args["branch"]) for repository in repositories] == [
+            ("https://github.com/gt-sse-center/One", None),
+            ("https://github.com/gt-sse-center/One/tree/main", "main"),
+            ("https://github.com/gt-sse-center/One/tree/release/1.0", "release/1.0"),
+            ("https://github.com/gt-sse-center/One/tree/release/2.0", "release/2.0"),
+        ]
+
+        assert repositories[0].query_names == frozenset(["StandardQuery", "DefaultBranchQuery"])
+        assert all(
+            repository.query_names == frozenset(["ClassicBranchProtectionQuery", "RulesetQuery"])
+            for repository in repositories[1:]
+        )
+
+        # The branches are listed once and the session is shared by the repository and its branches
+        assert requested_urls == ["https://api.github.com/repos/gt-sse-center/One/branches"]
+
+        session = repositories[0].dynamic_args["repository_session"]
+
+        assert all(repository.dynamic_args["repository_session"] is session for repository in repositories)
+        assert GitHubModule().GenerateInitialData(dict(repositories[1].dynamic_args))["session"] is session
+
+        # The session is shared in other processes as well
+        unpickled_dynamic_args = [
+            pickle.loads(pickle.dumps(repository.dynamic_args)) for repository in repositories
+        ]
+
+        unpickled_session = unpickled_dynamic_args[0]["repository_session"]
+
+        assert unpickled_session.github_url == "https://github.com/gt-sse-center/One"
+        assert unpickled_dynamic_args[1]["repository_session"] is unpickled_session
+
+        # Branches provided by name do not require the branches to be listed
+        requested_urls.clear()
+
+        repositories = list(
+            GitHubModule().GetRepositories(
+                {"url": "https://github.com/gt-sse-center/One", "branch": ["main", "develop"]},
+            ),
+        )
+
+        assert [repository.name for repository in repositories] == [
+            "https://github.com/gt-sse-center/One",
+            "https://github.com/gt-sse-center/One/tree/main",
+            "https://github.com/gt-sse-center/One/tree/develop",
+        ]
+        assert not requested_urls
+
+        # A single branch is evaluated like any other repository
+        repositories = GitHubModule().GetRepositories(
+            {"url": "https://github.com/gt-sse-center/One", "branch": ["develop"]},
+        )
+
+        assert len(repositories) == 1
+        assert repositories[0].query_names is None
+        assert repositories[0].dynamic_args["branch"] == "develop"
+
+    def test_GetRepositoriesMultipleBranchesShard(self, monkeypatch):
+        """Test that repositories are sharded before their branches are retrieved."""
+        requested_urls = []
+
+        def mock_request(self, method, url, *args, **kwargs):
+            requested_urls.append(url)
+
+            return CreateResponse(200, [{"name": "main"}, {"name": "release/1.0"}])
+
+        monkeypatch.setattr(requests.Session, "request", mock_request)
+
+        urls = [f"https://github.com/gt-sse-center/Repo{index}" for index in range(6)]
+        shards = [Shard(index, 2) for index in range(1, 3)]
+
+        all_names: list[str] = []
+
+        for shard in shards:
+            requested_urls.clear()
+
+            repositories = list(
+                GitHubModule().GetRepositories(
+                    {"url": urls, "pat": None, "branch": ["release/*", "main"]},
+                    repository_filter=shard.Contains,
+                ),
+            )
+
+            # The repository and its branches are assigned to the same shard
+            assert repositories
+            assert all(shard.Contains(repository.name) for repository in repositories)
+
+            # Only the branches of repositories in the shard are retrieved
+            assert requested_urls == [
+                f"https://api.github.com/repos/gt-sse-center/{url.rsplit('/', 1)[-1]}/branches"
+                for url in urls
+                if shard.Contains(url)
+            ]
+
+            all_names += [repository.name for repository in repositories]
+
+        assert sorted(all_names) == sorted(
+            name for url in urls for name in [url, f"{url}/tree/main", f"{url}/tree/release/1.0"]
+        )
+
+    def test_GetEventRepositoryMultipleBranches(self):
+        """Test the repositories affected by webhook events when multiple branches are evaluated."""
+        module = GitHubModule()
+        dynamic_args = {"url": ["https://github.com/gt-sse-center/One"], "branch": ["main", "release/*"]}
+
+        def CreatePayload(**kwargs) -> dict:
+            return {"repository": CreateRepository("One", default_branch="main"), **kwargs}
+
+        repository = module.GetEventRepository(
+            dynamic_args, "push", CreatePayload(ref="refs/heads/release/1.0")
+        )
+
+        assert repository is not None
+        assert repository.name == "https://github.com/gt-sse-center/One/tree/release/1.0"
+        assert repository.dynamic_args["branch"] == "release/1.0"
+        assert repository.query_names == frozenset(["ClassicBranchProtectionQuery", "RulesetQuery"])
+
+        assert (
+            module.GetEventRepository(dynamic_args, "push", CreatePayload(ref="refs/heads/feature")) is None
+        )
+
+        repository = module.GetEventRepository(dynamic_args, "repository", CreatePayload())
+
+        assert repository is not None
+        assert repository.name == "https://github.com/gt-sse-center/One"
+        assert repository.dynamic_args["branch"] is None
+        assert repository.query_names == frozenset(["StandardQuery", "DefaultBranchQuery"])
@@ -6,11 +6,16 @@
 # -------------------------------------------------------------------------------
 """Unit tests for GitHubSession"""
 
+import time
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
 import requests
 
+from RepoAuditor.Impl.ConditionalRequestCache import ConditionalRequestCache
+from RepoAuditor.Impl.Deadline import Deadline, DeadlineExceededError
+from RepoAuditor.Impl.ResourceLimits import AdaptiveLimiter, ResourceLimits
 from RepoAuditor.Plugins.GitHubBase.Module import _GitHubSession
 
 
@@ -87,3 +92,187 @@ class TestGitHubSession:
         r = session.request("GET", "/test")
 
         assert r.url == "https://api.github.com/repos/gt-sse-center/RepoAuditor/test"
+
+    def test_RequestWithDeadline(self, github_pat, monkeypatch):
+        """Test that the active deadline is used as the request timeout."""
+        session = _GitHubSession(github_url=self.github_url, github_pat=github_pat)
+
+        timeouts = []
+
+        def mock_request_with_timeout(self, method, url, *args, **kwargs):
+            timeouts.append(kwargs.get("timeout"))
+            return mock_request(self, method, url, *args, **kwargs)
+
+        monkeypatch.setattr(requests.Session, "request", mock_request_with_timeout)
+
+        session.request("GET", "test")
+
+        with Deadline.Create(60).Activate():
+            session.request("GET", "test")
+
+        assert timeouts[0] is None
+        assert 0 < timeouts[1] <= 60
+
+    def test_RequestWithDeadlineAfterSlot(self, github_pat, monkeypatch):
+        """Test that the time spent waiting for an HTTP slot is not included in the request timeout."""
+        session = _GitHubSession(github_url=self.github_url, github_pat=github_pat)
+
+        timeouts = []
+
+        def mock_request_with_timeout(self, method, url, *args, **kwargs):
+            timeouts.append(kwargs.get("timeout"))
+            return mock_request(self, method, url, *args, **kwargs)
+
+        @contextmanager
+        def SlowAcquireHttp(self, host):
+            time.sleep(0.3)
+            yield AdaptiveLimiter.Operation()
+
+        monkeypatch.setattr(requests.Session, "request", mock_request_with_timeout)
+        monkeypatch.setattr(ResourceLimits, "AcquireHttp", SlowAcquireHttp)
+
+        with Deadline.Create(1).Activate():
+            session.request("GET", "test")
+
+        assert 0 < timeouts[0] <= 0.7
+
+    def test_RequestTimeout(self, github_pat, monkeypatch):
+        """Test that requests that time out while a deadline is active raise DeadlineExceededError."""
+        session = _GitHubSession(github_url=self.github_url, github_pat=github_pat)
+
+        def mock_request_timeout(self, method, url, *args, **kwargs):
+            raise requests.Timeout()
+
+        monkeypatch.setattr(requests.Session, "request", mock_request_timeout)
+
+        with pytest.raises(requests.Timeout):
+            session.request("GET", "test")
+
+        with Deadline.Create(60).Activate(), pytest.raises(DeadlineExceededError):
+            session.request("GET", "test")
+
+        with Deadline.Create(0).Activate(), pytest.raises(DeadlineExceededError):
+            session.request("GET", "test")
+
+    @pytest.mark.parametrize(
+        "status_code, headers, text, is_throttled",
+        [
+            (200, {}, "", False),
+            (404, {}, "", False),
+            (429, {}, "", True),
+            (403, {"Retry-After": "60"}, "", True),
+            (403, {"X-RateLimit-Remaining": "0"}, "", True),
+            (403, {}, "You have exceeded a secondary rate limit.", True),
+            (403, {}, "Resource not accessible by personal access token", False),
+        ],
+    )
+    def test_RequestThrottled(self, github_pat, monkeypatch, status_code, headers, text, is_throttled):
+        """Test that throttled responses are reported to the HTTP limiter for the host."""
+        session = _GitHubSession(github_url=self.github_url, github_pat=github_pat)
+
+        def mock_request_throttled(self, method, url, *args, **kwargs):
+            r = mock_request(self, method, url, *args, **kwargs)
+            r.status_code = status_code
+            r.headers.update(headers)
+            r._content = text.encode("utf-8")
+            return r
+
+        monkeypatch.setattr(requests.Session, "request", mock_request_throttled)
+
+        with ResourceLimits().Activate() as limits:
+            session.request("GET", "test")
+
+        summary = limits.GetHttpSummaries()["api.github.com"]
+
+        assert summary.num_operations == 1
+        assert summary.num_throttled == (1 if is_throttled else 0)
+
+    @pytest.mark.parametrize(
+        "headers, rate_limit_remaining, num_paused",
+        [
+            ({}, None, 0),
+            ({"X-RateLimit-Remaining": "42"}, 42, 0),
+            ({"Retry-After": "60"}, None, 1),
+            ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "9999999999"}, 0, 1),
+            ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"}, 0, 0),
+        ],
+    )
+    def test_RequestRateLimit(self, github_pat, monkeypatch, headers, rate_limit_remaining, num_paused):
+        """Test that the rate limit reported by the server is recorded by the HTTP limiter for the host."""
+        session = _GitHubSession(github_url=self.github_url, github_pat=github_pat)
+
+        def mock_request_rate_limit(self, method, url, *args, **kwargs):
+            r = mock_request(self, method, url, *args, **kwargs)
+            r.headers.update(headers)
+            return r
+
+        monkeypatch.setattr(requests.Session, "request", mock_request_rate_limit)
+
+        with ResourceLimits().Activate() as limits:
+            session.request("GET", "test")
+
+        summary = limits.GetHttpSummaries()["api.github.com"]
+
+        assert summary.rate_limit_remaining == rate_limit_remaining
+        assert summary.num_paused == num_paused
+
+    def test_RequestConditional(self, github_pat, monkeypatch):
+        """Test that GET requests are conditional when a conditional request cache is active."""
+        session = _GitHubSession(github_url=self.github_url, github_pat=github_pat)
+
+        request_headers = []
+
+        def mock_request_etag(self, method, url, *args, **kwargs):
+            request_headers.append(kwargs.get("headers") or {})
+
+            r = mock_request(self, method, url, *args, **kwargs)
+
+            if "If-None-Match" in request_headers[-1]:
+                r.status_code = 304
+                r._content = b""
+            else:
+                r.headers["ETag"] = '"etag"'
+                r._content = b'{"value": 1}'
+
+            return r
+
+        monkeypatch.setattr(requests.Session, "request", mock_request_etag)
+
+        # Requests are not conditional by default
+        session.request("GET", "test")
+        session.request("GET", "test")
+
+        assert request_headers == [{}, {}]
+
+        request_headers.clear()
+
+        with ConditionalRequestCache().Activate() as cache:
+            assert session.get("test", params={"page": 1}).json() == {"value": 1}
+            assert session.get("test", params={"page": 2}).json() == {"value": 1}
+
+            response = session.get("test", params={"page": 1})
+
+            assert response.status_code == 200
+            assert response.json() == {"value": 1}
+
+            # Only GET requests are conditional
+            session.request("POST", "test")
+
+        assert request_headers == [{}, {}, {"If-None-Match": '"etag"'}, {}]
+        assert cache.num_not_modified == 1
+
+    def test_SharedConnections(self, github_pat):
+        """Test that sessions communicating with the same server share connections."""
+        session1 = _GitHubSession(github_url=self.github_url, github_pat=github_pat)
+        session2 = _GitHubSession(github_url="https://github.com/gt-sse-center/Other", github_pat=github_pat)
+        session3 = _GitHubSession(
+            github_url="https://github.gatech.edu/gt-sse-center/RepoAuditor",
+            github_pat=github_pat,
+        )
+
+        adapter1 = session1.get_adapter("https://api.github.com/repos/gt-sse-center/RepoAuditor")
+        adapter2 = session2.get_adapter("https://api.github.com/repos/gt-sse-center/Other")
+        adapter3 = session3.get_adapter("https://github.gatech.edu/api/v3/repos/gt-sse-center/RepoAuditor")
+
+        assert adapter1 is adapter2
+        assert adapter1 is not adapter3
@@ -0,0 +1,262 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for Rulesets.py"""
+
+import json
+
+import pytest
+import requests
+
+from RepoAuditor.Plugins.GitHub.Impl.Rulesets import (
+    CompiledRuleset,
+    GetOrganizationRulesets,
+    GetRepositoryRulesets,
+    GetRuleset,
+)
+from RepoAuditor.Plugins.GitHubBase.Module import _GitHubOrganizationSession, _GitHubSession
+
+
+def CreateRuleset(conditions: dict, **kwargs) -> dict:
+    """Create a ruleset as returned by the GitHub API."""
+    return {
+        "id": 42,
+        "name": "The Ruleset",
+        "target": "branch",
+        "source_type": "Organization",
+        "source": "gt-sse-center",
+        "enforcement": "active",
+        "conditions": conditions,
+        "rules": [{"type": "deletion"}, {"type": "pull_request", "parameters": {}}],
+        **kwargs,
+    }
+
+
+def CreateRepository(**kwargs) -> dict:
+    """Create repository information as returned when listing repositories."""
+    return {
+        "id": 1234,
+        "name": "RepoAuditor",
+        "default_branch": "main",
+        **kwargs,
+    }
+
+
+def CreateResponse(status_code: int, content) -> requests.Response:
+    """Create a response."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(content).encode()  # noqa: SLF001
+
+    return response
+
+
+class TestCompiledRuleset:
+    """Unit tests for CompiledRuleset."""
+
+    @pytest.mark.parametrize(
+        "ref_name, branch, expected",
+        [
+            ({"include": ["~ALL"], "exclude": []}, "feature/one", True),
+            ({"include": ["~DEFAULT_BRANCH"], "exclude": []}, "main", True),
+            ({"include": ["~DEFAULT_BRANCH"], "exclude": []}, "develop", False),
+            ({"include": ["refs/heads/release/*"], "exclude": []}, "release/1.0", True),
+            ({"include": ["refs/heads/release/*"], "exclude": []}, "release/1.0/hotfix", False),
+            ({"include": ["refs/heads/release/**"], "exclude": []}, "release/1.0/hotfix", True),
+            ({"include": ["release/?"], "exclude": []}, "release/1", True),
+            ({"include": ["~ALL"], "exclude": ["refs/heads/main"]}, "main", False),
+            ({"include": [], "exclude": []}, "main", False),
+        ],
+    )
+    def test_RefName(self, ref_name, branch, expected):
+        """Test ref_name conditions."""
+        ruleset = CompiledRuleset(CreateRuleset({"ref_name": ref_name}))
+
+        assert ruleset.AppliesTo(CreateRepository(), branch) is expected
+
+    @pytest.mark.parametrize(
+        "repository_name, expected",
+        [
+            ({"include": ["~ALL"], "exclude": []}, True),
+            ({"include": ["repo*"], "exclude": []}, True),
+            ({"include": ["Other*"], "exclude": []}, False),
+            ({"include": ["~ALL"], "exclude": ["RepoAuditor"]}, False),
+        ],
+    )
+    def test_RepositoryName(self, repository_name, expected):
+        """Test repository_name conditions."""
+        ruleset = CompiledRuleset(
+            CreateRuleset(
+                {
+                    "ref_name": {"include": ["~DEFAULT_BRANCH"], "exclude": []},
+                    "repository_name": repository_name,
+                },
+            ),
+        )
+
+        assert ruleset.AppliesTo(CreateRepository(), "main") is expected
+
+    def test_RepositoryId(self):
+        """Test repository_id conditions."""
+        ruleset = CompiledRuleset(
+            CreateRuleset(
+                {
+                    "ref_name": {"include": ["~ALL"], "exclude": []},
+                    "repository_id": {"repository_ids": [1234]},
+                },
+            ),
+        )
+
+        assert ruleset.AppliesTo(CreateRepository(), "main") is True
+        assert ruleset.AppliesTo(CreateRepository(id=5678), "main") is False
+
+    def test_RepositoryProperty(self):
+        """Test repository_property conditions."""
+        ruleset = CompiledRuleset(
+            CreateRuleset(
+                {
+                    "ref_name": {"include": ["~ALL"], "exclude": []},
+                    "repository_property": {
+                        "include": [{"name": "tier", "property_values": ["production"]}],
+                        "exclude": [{"name": "status", "property_values": ["deprecated"]}],
+                    },
+                },
+            ),
+        )
+
+        assert ruleset.AppliesTo(CreateRepository(custom_properties={"tier": "production"}), "main") is True
+        assert ruleset.AppliesTo(CreateRepository(custom_properties={"tier": "test"}), "main") is False
+        assert (
+            ruleset.AppliesTo(
+                CreateRepository(custom_properties={"tier": "production", "status": "deprecated"}),
+                "main",
+            )
+            is False
+        )
+
+        # The properties are not available, so applicability cannot be determined locally
+        assert ruleset.AppliesTo(CreateRepository(), "main") is None
+
+    def test_Inactive(self):
+        """Test rulesets that are not active or do not target branches."""
+        conditions = {"ref_name": {"include": ["~ALL"], "exclude": []}}
+
+        assert (
+            CompiledRuleset(CreateRuleset(conditions, enforcement="evaluate")).AppliesTo(
+                CreateRepository(), "main"
+            )
+            is False
+        )
+        assert (
+            CompiledRuleset(CreateRuleset(conditions, target="tag")).AppliesTo(CreateRepository(), "main")
+            is False
+        )
+
+    def test_CreateRules(self):
+        """Test CreateRules."""
+        ruleset_data = CreateRuleset({})
+        rules = CompiledRuleset(ruleset_data).CreateRules()
+
+        assert [rule["type"] for rule in rules] == ["deletion", "pull_request"]
+        assert all(rule["ruleset_id"] == 42 for rule in rules)
+        assert all(rule["ruleset_source_type"] == "Organization" for rule in rules)
+        assert all(rule["ruleset"] is ruleset_data for rule in rules)
+
+
+class TestGetRulesets:
+    """Unit tests for GetOrganizationRulesets and GetRepositoryRulesets."""
+
+    def test_Organization(self, monkeypatch):
+        """Test that organization rulesets are retrieved once."""
+        requested_urls = []
+
+        def mock_request(self, method, url, *args, **kwargs):
+            requested_urls.append(url)
+
+            if url.endswith("/rulesets"):
+                return CreateResponse(200, [{"id": 42}])
+
+            return CreateResponse(200, CreateRuleset({"ref_name": {"include": ["~ALL"], "exclude": []}}))
+
+        monkeypatch.setattr(requests.Session, "request", mock_request)
+
+        organization_session = _GitHubOrganizationSession("gt-sse-center", None)
+
+        rulesets = GetOrganizationRulesets(organization_session)
+
+        assert rulesets is not None
+        assert [ruleset.ruleset["id"] for ruleset in rulesets] == [42]
+        assert GetOrganizationRulesets(organization_session) is rulesets
+
+        assert requested_urls == [
+            "https://api.github.com/orgs/gt-sse-center/rulesets",
+            "https://api.github.com/orgs/gt-sse-center/rulesets/42",
+        ]
+
+    def test_OrganizationNotAvailable(self, monkeypatch):
+        """Test organization rulesets that cannot be retrieved."""
+        monkeypatch.setattr(
+            requests.Session,
+            "request",
+            lambda self, method, url, *args, **kwargs: CreateResponse(403, {"message": "Forbidden"}),
+        )
+
+        assert GetOrganizationRulesets(_GitHubOrganizationSession("gt-sse-center", None)) is None
+
+    def test_Repository(self, monkeypatch):
+        """Test repository rulesets."""
+        requests_made = []
+
+        def mock_request(self, method, url, *args, **kwargs):
+            requests_made.append((url, kwargs.get("params")))
+
+            if url.endswith("/rulesets"):
+                return CreateResponse(200, [{"id": 7}])
+
+            return CreateResponse(200, CreateRuleset({}, id=7, source_type="Repository"))
+
+        monkeypatch.setattr(requests.Session, "request", mock_request)
+
+        session = _GitHubSession("https://github.com/gt-sse-center/RepoAuditor", None)
+
+        rulesets = GetRepositoryRulesets(session)
+
+        assert rulesets is not None
+        assert [ruleset.ruleset["id"] for ruleset in rulesets] == [7]
+
+        # Rulesets are retrieved once for each session (which is shared by the branches of a repository)
+        assert GetRepositoryRulesets(session) is rulesets
+
+        assert requests_made == [
+            (
+                "https://api.github.com/repos/gt-sse-center/RepoAuditor/rulesets",
+                {"includes_parents": "false", "per_page": 100, "page": 1},
+            ),
+            ("https://api.github.com/repos/gt-sse-center/RepoAuditor/rulesets/7", None),
+        ]
+
+    def test_Ruleset(self, monkeypatch):
+        """Test that rulesets are retrieved once for each session."""
+        requested_urls = []
+
+        def mock_request(self, method, url, *args, **kwargs):
+            requested_urls.append(url)
+            return CreateResponse(200, CreateRuleset({}, id=int(url.rsplit("/", 1)[-1])))
+
+        monkeypatch.setattr(requests.Session, "request", mock_request)
+
+        session = _GitHubSession("https://github.com/gt-sse-center/RepoAuditor", None)
+
+        ruleset = GetRuleset(session, 7)
+
+        assert ruleset["id"] == 7
+        assert GetRuleset(session, 7) is ruleset
+        assert GetRuleset(session, 8)["id"] == 8
+
+        assert requested_urls == [
+            "https://api.github.com/repos/gt-sse-center/RepoAuditor/rulesets/7",
+            "https://api.github.com/repos/gt-sse-center/RepoAuditor/rulesets/8",
+        ]
@@ -60,3 +60,83 @@ class TestRulesetQuery:
         assert len(query_data["rules"]) == 1
         assert query_data["rules"][0]["ruleset_id"] == 117
         assert query_data["rules"][0]["ruleset"] == "valid-test-data"
+
+    def test_GetDataForOrganization(self, module_data, monkeypatch):
+        """Test the GetData method when the rules are determined from organization and repository rulesets."""
+        requested_urls = []
+
+        def mock_request(method, url, *args, **kwargs):
+            requested_urls.append(url)
+
+            class MockedResponse:
+                def __init__(self, data):
+                    self._data = data
+                    self.status_code = 200
+                    self.links = {}
+
+                def json(self):
+                    return self._data
+
+                @staticmethod
+                def raise_for_status():
+                    pass
+
+            if url == "rulesets":
+                return MockedResponse([{"id": 7}])
+            if url == "rulesets/7":
+                return MockedResponse(
+                    {
+                        "id": 7,
+                        "name": "Repository Ruleset",
+                        "source_type": "Repository",
+                        "enforcement": "active",
+                        "conditions": {"ref_name": {"include": ["~DEFAULT_BRANCH"], "exclude": []}},
+                        "rules": [{"type": "required_linear_history"}],
+                    }
+                )
+
+            raise AssertionError(url)
+
+        class MockedOrganizationRuleset:
+            ruleset = {"id": 42}
+
+            @staticmethod
+            def AppliesTo(repository, branch):
+                return True
+
+            @staticmethod
+            def CreateRules():
+                return [{"type": "deletion", "ruleset_id": 42}]
+
+        monkeypatch.setattr(module_data["session"], "request", mock_request)
+        monkeypatch.setattr(
+            "RepoAuditor.Plugins.GitHub.RulesetQuery.GetOrganizationRulesets",
+            lambda organization_session: [MockedOrganizationRuleset()],
+        )
+
+        module_data["repository_listing"] = {"name": "RepoAuditor", "default_branch": "main"}
+        module_data["organization_session"] = object()
+
+        query_data = RulesetQuery().GetData(module_data)
+
+        assert query_data["branch"] == "main"
+        assert [rule["type"] for rule in query_data["rules"]] == ["deletion", "required_linear_history"]
+        assert query_data["rules"][1]["ruleset"]["name"] == "Repository Ruleset"
+
+        # Neither the repository nor the active rules for the branch were requested
+        assert requested_urls == ["rulesets", "rulesets/7"]
+
+    def test_GetDataForOrganizationNotAvailable(self, module_data, monkeypatch):
+        """Test the GetData method when the organization rulesets are not available."""
+        monkeypatch.setattr(module_data["session"], "request", get_mock_request())
+        monkeypatch.setattr(
+            "RepoAuditor.Plugins.GitHub.RulesetQuery.GetOrganizationRulesets",
+            lambda organization_session: None,
+        )
+
+        module_data["repository_listing"] = {"name": "RepoAuditor", "default_branch": "main"}
+        module_data["organization_session"] = object()
+
+        query_data = RulesetQuery().GetData(module_data)
+
+        assert query_data["rules"][0]["ruleset"] == "valid-test-data"
@@ -49,3 +49,70 @@ class TestStandardQuery:
         query_data = query.GetData(module_data)
 
         assert query_data["standard"] == {"default_branch": "main"}
+
+    def test_GetDataFromListing(self, module_data, monkeypatch):
+        """Test GetData when the repository listing contains all of the required values"""
+        requests = []
+
+        def mock_request(method, url, *args, **kwargs):
+            requests.append(url)
+            return get_mock_request()(method, url, *args, **kwargs)
+
+        monkeypatch.setattr(module_data["session"], "request", mock_request)
+
+        query = StandardQuery()
+        query.requirements = [
+            requirement
+            for requirement in query.requirements
+            if requirement.name in ["Description", "DefaultBranch", "SupportIssues"]
+        ]
+
+        listing_data = {"description": None, "default_branch": "main", "has_issues": True}
+        module_data["repository_listing"] = listing_data
+
+        query_data = query.GetData(module_data)
+
+        assert query_data["standard"] is listing_data
+        assert not requests
+
+    def test_GetDataWithIncompleteListing(self, module_data, monkeypatch):
+        """Test GetData when the repository listing does not contain all of the required values"""
+        monkeypatch.setattr(module_data["session"], "request", get_mock_request())
+
+        # Merge settings are not included in the repository listing
+        module_data["repository_listing"] = {
+            "description": None,
+            "default_branch": "main",
+            "has_issues": True,
+        }
+
+        query = StandardQuery()
+        query_data = query.GetData(module_data)
+
+        assert query_data["standard"] == {"default_branch": "main"}
+
+    def test_GetFingerprintData(self, module_data):
+        """Test that the fingerprint data only includes the values read by the requirements"""
+        query = StandardQuery()
+        query.requirements = [
+            requirement
+            for requirement in query.requirements
+            if requirement.name in ["Description", "MergeCommitMessage"]
+        ]
+
+        module_data["standard"] = {
+            "description": "The description",
+            "allow_merge_commit": True,
+            "merge_commit_message": "PR_TITLE",
+            "pushed_at": "2024-01-01T00:00:00Z",
+        }
+
+        fingerprint_data = query.GetFingerprintData(module_data)
+
+        assert fingerprint_data["standard"] == {
+            "allow_merge_commit": True,
+            "description": "The description",
+            "merge_commit_message": "PR_TITLE",
+        }
+        assert fingerprint_data["has_pat"] is False
+        assert fingerprint_data["is_enterprise"] is False
@@ -6,11 +6,14 @@
 # -------------------------------------------------------------------------------
 """Unit test for Query.py"""
 
-from unittest.mock import Mock
+import json
+from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pytest
 from dbrownell_Common.Types import override
 
+from RepoAuditor.Impl.ResultCache import ResultCache
 from RepoAuditor.Query import *
 
 
@@ -223,3 +226,141 @@ def test_Evaluate(single_threaded):
             (4, 2, 0, 1, 1),
             (5, 2, 1, 1, 1),
         ]
+
+
+# ----------------------------------------------------------------------
+class MyCachedQuery(MyQuery):
+    # ----------------------------------------------------------------------
+    @override
+    def GetFingerprintData(
+        self,
+        query_data: dict[str, Any],
+    ) -> Optional[Any]:
+        return query_data["value"]
+
+
+# ----------------------------------------------------------------------
+def test_GetFingerprintData():
+    # Results are not cached by default
+    assert my_query.GetFingerprintData({"one": 1}) is None
+
+
+# ----------------------------------------------------------------------
+def test_EvaluateCached():
+    requirement = MyRequirement(
+        "MyRequirement",
+        "The requirement",
+        ExecutionStyle.Parallel,
+        "{one} -- {new_attribute}",
+        "{two}",
+        EvaluateResult.Error,
+        "The context",
+    )
+
+    query = MyCachedQuery("MyCachedQuery", ExecutionStyle.Parallel, [requirement])
+
+    # ----------------------------------------------------------------------
+    def Evaluate(
+        query_data: dict[str, Any],
+        requirement_args: Optional[dict[str, Any]] = None,
+    ) -> list[Query.EvaluateInfo]:
+        return query.Evaluate(
+            query.GetData(dict(query_data)),  # type: ignore[arg-type]
+            {"MyRequirement": requirement_args} if requirement_args else {},
+            lambda *args: None,
+        )
+
+    # ----------------------------------------------------------------------
+
+    cache = ResultCache()
+
+    with (
+        cache.Activate(),
+        patch.object(requirement, "_EvaluateImpl", wraps=requirement._EvaluateImpl) as evaluate_impl,
+    ):
+        results = Evaluate({"value": 1, "one": 1, "two": 2})
+
+        assert evaluate_impl.call_count == 1
+        assert cache.num_hits == 0
+
+        assert results[0].result == EvaluateResult.Error
+        assert results[0].context == "The context"
+        assert results[0].resolution == "1 -- NEW"
+        assert results[0].rationale == "2"
+
+        # The same data produces the same result without evaluating the requirement
+        cached_results = Evaluate({"value": 1, "one": 1, "two": 2, "unused": 3})
+
+        assert evaluate_impl.call_count == 1
+        assert cache.num_hits == 1
+
+        assert cached_results[0].result == results[0].result
+        assert cached_results[0].context == results[0].context
+        assert cached_results[0].resolution == results[0].resolution
+        assert cached_results[0].rationale == results[0].rationale
+        assert cached_results[0].description == results[0].description
+        assert cached_results[0].requirement is requirement
+        assert cached_results[0].query is query
+
+        # Changes to the fingerprint data, template values, or arguments invalidate the result
+        Evaluate({"value": 2, "one": 1, "two": 2})
+        assert evaluate_impl.call_count == 2
+
+        Evaluate({"value": 1, "one": 1, "two": 3})
+        assert evaluate_impl.call_count == 3
+
+        Evaluate({"value": 1, "one": 1, "two": 2}, {"arg": True})
+        assert evaluate_impl.call_count == 4
+
+        # Data that cannot be serialized is not cached
+        Evaluate({"value": object(), "one": 1, "two": 2})
+        Evaluate({"value": object(), "one": 1, "two": 2})
+        assert evaluate_impl.call_count == 6
+
+    # Results are not cached when a cache is not active
+    with patch.object(requirement, "_EvaluateImpl", wraps=requirement._EvaluateImpl) as evaluate_impl:
+        Evaluate({"value": 1, "one": 1, "two": 2})
+        assert evaluate_impl.call_count == 1
+
+
+# ----------------------------------------------------------------------
+def test_EvaluateCachedRendering(tmp_path: Path):
+    requirement = MyRequirement(
+        "MyRequirement",
+        "The requirement",
+        ExecutionStyle.Parallel,
+        "{one} -- {new_attribute}",
+        "{two}",
+        EvaluateResult.Error,
+        "The context",
+    )
+
+    query = MyCachedQuery("MyCachedQuery", ExecutionStyle.Parallel, [requirement])
+
+    filename = tmp_path / "results.json"
+    cache = ResultCache(filename=filename)
+
+    with (
+        cache.Activate(),
+        patch.object(
+            requirement._resolution_template,
+            "_Render",
+            wraps=requirement._resolution_template._Render,
+        ) as render,
+    ):
+        results = query.Evaluate(query.GetData({"value": 1, "one": 1, "two": 2}), {}, lambda *args: None)
+
+        # Caching the result does not render the resolution
+        assert render.call_count == 0
+
+        assert results[0].resolution == "1 -- NEW"
+        assert render.call_count == 1
+
+        # The resolution is not rendered again when the cache is saved
+        cache.Save()
+        assert render.call_count == 1
+
+    entries = json.loads(filename.read_text(encoding="UTF-8"))["entries"]
+
+    assert [entry["values"]["resolution"] for entry in entries.values()] == ["1 -- NEW"]
+    assert [entry["values"]["rationale"] for entry in entries.values()] == ["2"]
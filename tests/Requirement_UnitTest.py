@@ -65,8 +65,8 @@ def test_Construct():
     name = Mock()
     description = ""
     style = Mock()
-    resolution_template = Mock()
-    rationale_template = Mock()
+    resolution_template = "Resolution"
+    rationale_template = "Rationale"
     expected_result = Mock()
     context = Mock()
     requires_explicit_include = Mock()
@@ -94,7 +94,7 @@ def test_Construct():
 
 # ----------------------------------------------------------------------
 def test_Success():
-    requirement = MyRequirement(Mock(), Mock(), Mock(), Mock(), Mock(), EvaluateResult.Success, "testing")
+    requirement = MyRequirement(Mock(), "", Mock(), "", "", EvaluateResult.Success, "testing")
     result_info = requirement.Evaluate({"key": "value"}, {})
 
     assert result_info.result == EvaluateResult.Success
@@ -106,7 +106,7 @@ def test_Success():
 
 # ----------------------------------------------------------------------
 def test_DoesNotApply():
-    requirement = MyRequirement(Mock(), Mock(), Mock(), Mock(), Mock(), EvaluateResult.DoesNotApply, None)
+    requirement = MyRequirement(Mock(), "", Mock(), "", "", EvaluateResult.DoesNotApply, None)
     result_info = requirement.Evaluate({"key": "value"}, {})
 
     assert result_info.result == EvaluateResult.DoesNotApply
@@ -120,10 +120,10 @@ def test_DoesNotApply():
 def test_GetDynamicArgDefinitions():
     requirement = MyRequirement(
         Mock(),
+        "",
         Mock(),
-        Mock(),
-        Mock(),
-        Mock(),
+        "",
+        "",
         EvaluateResult.Success,
         "testing",
     )
@@ -137,7 +137,7 @@ def test_GetDynamicArgDefinitions():
 def test_Error(provide_rationale: bool):
     requirement = MyRequirement(
         Mock(),
-        Mock(),
+        "",
         Mock(),
         "{one} -- {two}",
         "{three} -- {four}",
@@ -159,7 +159,7 @@ def test_Error(provide_rationale: bool):
 def test_Warning():
     requirement = MyRequirement(
         Mock(),
-        Mock(),
+        "",
         Mock(),
         "{one} -- {two}",
         "{three} -- {four}",
@@ -177,3 +177,79 @@ def test_Warning():
 
 
 # ----------------------------------------------------------------------
+def test_EvaluationContext():
+    # ----------------------------------------------------------------------
+    class ContextRequirement(Requirement):
+        # ----------------------------------------------------------------------
+        def __init__(self, expected_value: str) -> None:
+            super().__init__(
+                "ContextRequirement",
+                "Expected '{__expected_value}' for {name}.",
+                ExecutionStyle.Parallel,
+                "Set to '{__expected_value}'.",
+                "Rationale",
+            )
+
+            self.expected_value = expected_value
+
+        # ----------------------------------------------------------------------
+        @override
+        def _EvaluateImpl(
+            self,
+            query_data: MutableMapping[str, Any],
+            requirement_args: dict[str, Any],
+        ) -> Requirement.EvaluateImplResult:
+            query_data["__expected_value"] = self.expected_value
+
+            return Requirement.EvaluateImplResult(EvaluateResult.Error, None, provide_resolution=True)
+
+    query_data = {"name": "the repo"}
+
+    requirement = ContextRequirement("one")
+
+    result1 = requirement.Evaluate(query_data, {})
+    result2 = ContextRequirement("two").Evaluate(query_data, {})
+
+    # Values written during evaluation do not modify the shared query data
+    assert query_data == {"name": "the repo"}
+
+    assert result1.description == "Expected 'one' for the repo."
+    assert result1.resolution == "Set to 'one'."
+    assert result2.description == "Expected 'two' for the repo."
+    assert result2.resolution == "Set to 'two'."
+
+    # The populated description is not stored on the requirement
+    assert requirement.description == "Expected '{__expected_value}' for {name}."
+
+
+# ----------------------------------------------------------------------
+def test_LazyResolutionAndRationale():
+    requirement = MyRequirement(
+        Mock(),
+        "",
+        Mock(),
+        "{one} -- {two}",
+        "{three}",
+        EvaluateResult.Error,
+        "testing",
+    )
+
+    result_info = requirement.Evaluate({"one": "1", "two": "2", "three": "3"}, {})
+
+    # The resolution and rationale are not rendered until they are accessed
+    assert callable(result_info.__dict__["resolution"])
+    assert callable(result_info.__dict__["rationale"])
+
+    assert result_info.resolution == "1 -- 2"
+    assert result_info.__dict__["resolution"] == "1 -- 2"
+    assert callable(result_info.__dict__["rationale"])
+
+    # Values are retrieved during evaluation
+    with pytest.raises(KeyError, match="three"):
+        requirement.Evaluate({"one": "1", "two": "2"}, {})
+
+    # Strings can be provided directly
+    result_info = Requirement.EvaluateInfo(EvaluateResult.Error, None, "resolution", None, requirement)
+
+    assert result_info.resolution == "resolution"
+    assert result_info.rationale is None
@@ -0,0 +1,210 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for ResultStore.py"""
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from RepoAuditor.Display import DisplayHistory
+from RepoAuditor.ExecuteModules import ModuleResult
+from RepoAuditor.ResultStore import *
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def module(create_module) -> MagicMock:
+    return create_module("Requirement1", "Requirement2")
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def record_runs(module, create_module_result):
+    """Return a function that records the results of 3 runs of the module (the last of which is a partial run)."""
+
+    # ----------------------------------------------------------------------
+    def Record(
+        filename: Path,
+    ) -> None:
+        # ----------------------------------------------------------------------
+        def Create(repository: str, *results: EvaluateResult) -> ModuleResult:
+            return create_module_result(module, repository, *results, duration=1.5)
+
+        # ----------------------------------------------------------------------
+
+        with ResultStore.Open(filename) as store:
+            with store.Run():
+                store.Record(Create("repo1", EvaluateResult.Success, EvaluateResult.Success))
+                store.Record(Create("repo2", EvaluateResult.Error, EvaluateResult.Warning))
+
+            with store.Run():
+                store.Record(Create("repo1", EvaluateResult.Error, EvaluateResult.Success))
+                store.Record(Create("repo2", EvaluateResult.Success, EvaluateResult.Error))
+
+            # A partial run (for example, when auditing repositories affected by a webhook delivery)
+            with store.Run():
+                store.Record(Create("repo2", EvaluateResult.Success, EvaluateResult.DoesNotApply))
+
+    # ----------------------------------------------------------------------
+
+    return Record
+
+
+# ----------------------------------------------------------------------
+def test_Record(record_runs, tmp_path):
+    filename = tmp_path / "results.db"
+
+    record_runs(filename)
+
+    with closing(sqlite3.connect(filename)) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM runs WHERE completed IS NOT NULL").fetchone() == (3,)
+        assert connection.execute(
+            "SELECT run_id, repository, module, query, requirement, result, context, duration FROM results WHERE run_id = 1 ORDER BY repository, requirement",
+        ).fetchall() == [
+            (1, "repo1", "MyModule", "MyQuery", "Requirement1", "Success", "Context 0", 1.5),
+            (1, "repo1", "MyModule", "MyQuery", "Requirement2", "Success", "Context 1", 1.5),
+            (1, "repo2", "MyModule", "MyQuery", "Requirement1", "Error", "Context 0", 1.5),
+            (1, "repo2", "MyModule", "MyQuery", "Requirement2", "Warning", "Context 1", 1.5),
+        ]
+
+        assert {
+            row[0]
+            for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+        } >= {"results_run", "results_repository", "results_requirement"}
+
+
+# ----------------------------------------------------------------------
+def test_IncompleteRun(module, create_module_result, tmp_path):
+    filename = tmp_path / "results.db"
+
+    with ResultStore.Open(filename) as store:
+        with pytest.raises(KeyboardInterrupt), store.Run():
+            store.Record(
+                create_module_result(module, "repo1", EvaluateResult.Success, EvaluateResult.Success)
+            )
+            raise KeyboardInterrupt
+
+        summaries = store.GetRunSummaries(10)
+
+    assert len(summaries) == 1
+    assert summaries[0].completed is None
+    assert summaries[0].num_results[EvaluateResult.Success] == 2
+
+
+# ----------------------------------------------------------------------
+def test_RunSummaries(record_runs, tmp_path):
+    filename = tmp_path / "results.db"
+
+    record_runs(filename)
+
+    with ResultStore.Open(filename) as store:
+        summaries = store.GetRunSummaries(10)
+
+        assert [summary.run_id for summary in summaries] == [1, 2, 3]
+        assert [summary.num_repositories for summary in summaries] == [2, 2, 1]
+        assert summaries[0].num_results == {
+            EvaluateResult.DoesNotApply: 0,
+            EvaluateResult.Success: 2,
+            EvaluateResult.Warning: 1,
+            EvaluateResult.Error: 1,
+            EvaluateResult.Timeout: 0,
+        }
+        assert summaries[0].pass_rate == 0.5
+        assert summaries[2].pass_rate == 1.0
+
+        # Most recent runs
+        assert [summary.run_id for summary in store.GetRunSummaries(2)] == [2, 3]
+
+        # Filters
+        summaries = store.GetRunSummaries(10, repository="repo1")
+
+        assert [summary.run_id for summary in summaries] == [1, 2]
+        assert summaries[1].num_results[EvaluateResult.Error] == 1
+
+        summaries = store.GetRunSummaries(10, repository="repo*", requirement="*2")
+
+        assert [summary.num_results[EvaluateResult.Success] for summary in summaries] == [1, 1, 0]
+
+
+# ----------------------------------------------------------------------
+def test_Regressions(record_runs, tmp_path):
+    filename = tmp_path / "results.db"
+
+    record_runs(filename)
+
+    with ResultStore.Open(filename) as store:
+        regressions = store.GetRegressions(10)
+
+        assert [
+            (
+                regression.run_id,
+                regression.repository,
+                regression.requirement_name,
+                regression.previous_result,
+                regression.result,
+            )
+            for regression in regressions
+        ] == [
+            (2, "repo1", "Requirement1", EvaluateResult.Success, EvaluateResult.Error),
+            (2, "repo2", "Requirement2", EvaluateResult.Warning, EvaluateResult.Error),
+        ]
+
+        assert regressions[0].context == "Context 0"
+
+        # Only regressions in the most recent runs are returned, but they are compared to results
+        # recorded by earlier runs.
+        assert [regression.run_id for regression in store.GetRegressions(2)] == [2, 2]
+        assert store.GetRegressions(1) == []
+
+        # Filters
+        assert [regression.repository for regression in store.GetRegressions(10, repository="repo2")] == [
+            "repo2",
+        ]
+        assert [
+            regression.repository for regression in store.GetRegressions(10, requirement="Requirement1")
+        ] == ["repo1"]
+
+
+# ----------------------------------------------------------------------
+def test_IncompatibleVersion(tmp_path):
+    filename = tmp_path / "results.db"
+
+    with closing(sqlite3.connect(filename)) as connection:
+        connection.execute("PRAGMA user_version = 1000")
+
+    with (
+        pytest.raises(
+            ValueError,
+            match=r"The results database was written by an incompatible version of RepoAuditor \(version 1000\)\.",
+        ),
+        ResultStore.Open(filename),
+    ):
+        pass
+
+
+# ----------------------------------------------------------------------
+def test_DisplayHistory(record_runs, tmp_path, capsys):
+    filename = tmp_path / "results.db"
+
+    record_runs(filename)
+
+    with ResultStore.Open(filename) as store:
+        DisplayHistory(store.GetRunSummaries(10), store.GetRegressions(10), panel_width=160)
+
+    content = capsys.readouterr().out
+
+    assert "History (3 runs)" in content
+    assert "50.00%" in content
+    assert "Regressions (2)" in content
+    assert "MyModule / Requirement1" in content
+
+    DisplayHistory([], [], panel_width=160)
+
+    assert "No results have been recorded." in capsys.readouterr().out
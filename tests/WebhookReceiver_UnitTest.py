@@ -0,0 +1,175 @@
+# -------------------------------------------------------------------------------
+# |
+# |  Copyright (c) 2024 Scientific Software Engineering Center at Georgia Tech
+# |  Distributed under the MIT License.
+# |
+# -------------------------------------------------------------------------------
+"""Unit tests for WebhookReceiver.py"""
+
+import hashlib
+import hmac
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from RepoAuditor.ExecuteModules import ModuleInfo
+from RepoAuditor.WebhookReceiver import *
+
+
+# ----------------------------------------------------------------------
+@pytest.fixture
+def module() -> MagicMock:
+    module = MagicMock()
+    module.name = "MyModule"
+
+    return module
+
+
+# ----------------------------------------------------------------------
+def _CreateFunc(
+    module: MagicMock,
+    event_queries: dict[str, set[str]],
+):
+    """Return a function that creates module information for the repository named in the payload."""
+
+    # ----------------------------------------------------------------------
+    def Func(
+        event: str,
+        payload: dict[str, Any],
+    ) -> list[ModuleInfo]:
+        query_names = event_queries.get(event)
+        if query_names is None:
+            return []
+
+        return [
+            ModuleInfo(
+                module,
+                {"url": payload["repository"]},
+                {},
+                repository=payload["repository"],
+                query_names=frozenset(query_names),
+            ),
+        ]
+
+    # ----------------------------------------------------------------------
+
+    return Func
+
+
+# ----------------------------------------------------------------------
+def _CreateBody(
+    repository: str,
+) -> bytes:
+    return json.dumps({"repository": repository}).encode("UTF-8")
+
+
+# ----------------------------------------------------------------------
+def test_Debounce(module):
+    receiver = WebhookReceiver(
+        _CreateFunc(module, {"push": {"Query1"}, "repository": {"Query2"}}),
+        debounce=0.2,
+    )
+
+    assert receiver.ProcessDelivery("push", _CreateBody("repo1"), None) == HTTPStatus.ACCEPTED
+    assert receiver.ProcessDelivery("repository", _CreateBody("repo1"), None) == HTTPStatus.ACCEPTED
+    assert receiver.ProcessDelivery("push", _CreateBody("repo2"), None) == HTTPStatus.ACCEPTED
+
+    assert receiver.num_pending == 2
+
+    # Modules are not provided until the debounce period has elapsed
+    assert receiver.WaitForModuleInfos(timeout=0.0) == []
+
+    start_time = time.perf_counter()
+
+    module_infos = receiver.WaitForModuleInfos(timeout=5.0)
+
+    assert time.perf_counter() - start_time >= 0.1
+    assert sorted((module_info.repository, module_info.query_names) for module_info in module_infos) == [
+        ("repo1", frozenset(["Query1", "Query2"])),
+        ("repo2", frozenset(["Query1"])),
+    ]
+
+    assert receiver.num_pending == 0
+
+
+# ----------------------------------------------------------------------
+def test_IgnoredEvent(module):
+    receiver = WebhookReceiver(_CreateFunc(module, {"push": {"Query1"}}), debounce=0)
+
+    assert receiver.ProcessDelivery("ping", _CreateBody("repo1"), None) == HTTPStatus.OK
+    assert receiver.num_pending == 0
+
+
+# ----------------------------------------------------------------------
+def test_InvalidDelivery(module):
+    receiver = WebhookReceiver(_CreateFunc(module, {"push": {"Query1"}}), debounce=0)
+
+    assert receiver.ProcessDelivery(None, _CreateBody("repo1"), None) == HTTPStatus.BAD_REQUEST
+    assert receiver.ProcessDelivery("push", b"not json", None) == HTTPStatus.BAD_REQUEST
+    assert receiver.ProcessDelivery("push", b"[]", None) == HTTPStatus.BAD_REQUEST
+
+    assert receiver.num_pending == 0
+
+
+# ----------------------------------------------------------------------
+def test_Signature(module):
+    receiver = WebhookReceiver(_CreateFunc(module, {"push": {"Query1"}}), secret="secret", debounce=0)
+
+    body = _CreateBody("repo1")
+    signature = "sha256={}".format(hmac.new(b"secret", body, hashlib.sha256).hexdigest())
+
+    assert receiver.ProcessDelivery("push", body, None) == HTTPStatus.UNAUTHORIZED
+    assert receiver.ProcessDelivery("push", body, "sha256=invalid") == HTTPStatus.UNAUTHORIZED
+    assert receiver.ProcessDelivery("push", body, signature) == HTTPStatus.ACCEPTED
+
+    assert [module_info.repository for module_info in receiver.WaitForModuleInfos()] == ["repo1"]
+
+
+# ----------------------------------------------------------------------
+def test_Server(module):
+    receiver = WebhookReceiver(_CreateFunc(module, {"push": {"Query1"}}), debounce=0)
+
+    server = receiver.CreateServer("127.0.0.1", 0)
+
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/webhook"
+
+        # ----------------------------------------------------------------------
+        def Post(
+            event: str,
+            body: bytes,
+        ) -> int:
+            request = urllib.request.Request(
+                url,
+                data=body,
+                headers={"X-GitHub-Event": event, "Content-Type": "application/json"},
+                method="POST",
+            )
+
+            try:
+                with urllib.request.urlopen(request, timeout=10) as response:  # noqa: S310
+                    return response.status
+            except urllib.error.HTTPError as ex:
+                return ex.code
+
+        # ----------------------------------------------------------------------
+
+        assert Post("push", _CreateBody("repo1")) == HTTPStatus.ACCEPTED
+        assert Post("push", b"not json") == HTTPStatus.BAD_REQUEST
+
+        assert [module_info.repository for module_info in receiver.WaitForModuleInfos(timeout=5.0)] == [
+            "repo1"
+        ]
+
+    finally:
+        server.shutdown()
+        server.server_close()
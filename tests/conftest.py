@@ -8,9 +8,15 @@
 
 import os
 import sys
+from collections.abc import Callable
+from typing import Optional
+from unittest.mock import MagicMock
 
 import pytest
 
+from RepoAuditor.ExecuteModules import ModuleInfo, ModuleResult
+from RepoAuditor.Module import EvaluateResult, Module
+
 
 @pytest.fixture(autouse=True)
 def fixed_terminal_size(monkeypatch):
@@ -22,3 +28,95 @@ def fixed_terminal_size(monkeypatch):
         "get_terminal_size",
         lambda fd=sys.stdout.fileno(): os.terminal_size((120, 100)),
     )
+
+
+@pytest.fixture
+def create_module() -> Callable[..., MagicMock]:
+    """Return a function that creates a mock module with a single query named 'MyQuery' that has requirements with the provided names."""
+
+    def Create(
+        *requirement_names: str,
+        name: str = "MyModule",
+    ) -> MagicMock:
+        query = MagicMock()
+        query.name = "MyQuery"
+        query.requirements = []
+
+        for requirement_name in requirement_names:
+            requirement = MagicMock()
+            requirement.name = requirement_name
+
+            query.requirements.append(requirement)
+
+        module = MagicMock()
+        module.name = name
+        module.queries = [query]
+        module.GetNumRequirements.return_value = len(requirement_names)
+
+        return module
+
+    return Create
+
+
+@pytest.fixture
+def module(create_module) -> MagicMock:
+    """Mock module with a single requirement named 'MyRequirement'; test modules override this fixture when other requirements are needed."""
+    return create_module("MyRequirement")
+
+
+@pytest.fixture
+def create_results() -> Callable[..., list[Module.EvaluateInfo]]:
+    """Return a function that creates the results of a mock module, one for each of the provided results (in the order of the module's requirements).
+
+    The context of each result is 'Context <index>'.
+    """
+
+    def Create(
+        module: MagicMock,
+        repository: Optional[str],
+        *results: EvaluateResult,
+        resolution: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> list[Module.EvaluateInfo]:
+        query = module.queries[0]
+
+        return [
+            Module.EvaluateInfo(
+                result,
+                f"Context {index}",
+                resolution,
+                None,
+                requirement,
+                query,
+                module,
+                description=description,
+                repository=repository,
+            )
+            for index, (result, requirement) in enumerate(zip(results, query.requirements, strict=False))
+        ]
+
+    return Create
+
+
+@pytest.fixture
+def create_module_result(create_results) -> Callable[..., ModuleResult]:
+    """Return a function that creates the ModuleResult of a mock module (see `create_results` for information about the results)."""
+
+    def Create(
+        module: MagicMock,
+        repository: Optional[str],
+        *results: EvaluateResult,
+        index: int = 0,
+        module_info: Optional[ModuleInfo] = None,
+        duration: Optional[float] = None,
+        resolution: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> ModuleResult:
+        return ModuleResult(
+            index,
+            module_info or ModuleInfo(module, {}, {}, repository=repository),
+            create_results(module, repository, *results, resolution=resolution, description=description),
+            duration=duration,
+        )
+
+    return Create